@@ -0,0 +1,87 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure row delivery by StreamedResultSet against rows per result set.
+
+Usage:
+
+  $ python benchmark/streamed_rows.py --rows 1000 2000 4000 8000 16000
+
+Each partial result set carries all rows of one run, so the time per row
+should stay flat as the number of rows grows:  a growing time per row
+means that delivering a batch of rows is worse than linear.  No Cloud
+Spanner instance is needed.
+"""
+from __future__ import print_function
+from __future__ import division
+from __future__ import unicode_literals
+from __future__ import absolute_import
+from builtins import range
+from future import standard_library
+standard_library.install_aliases()
+
+from google.cloud.spanner_v1 import PartialResultSet
+from google.cloud.spanner_v1 import ResultSetMetadata
+from google.cloud.spanner_v1 import StructType
+from google.cloud.spanner_v1 import Type
+from google.cloud.spanner_v1 import TypeCode
+from google.cloud.spanner_v1._helpers import _make_value_pb
+from google.cloud.spanner_v1.streamed import StreamedResultSet
+
+import argparse
+import timeit
+
+
+def make_result_set(num_rows):
+    """Build one partial result set holding ``num_rows`` two-column rows."""
+    metadata = ResultSetMetadata(
+        row_type=StructType(
+            fields=[
+                StructType.Field(name='id', type_=Type(code=TypeCode.INT64)),
+                StructType.Field(name='name', type_=Type(code=TypeCode.STRING)),
+            ]
+        )
+    )
+    result_set = PartialResultSet(metadata=metadata)
+    for i in range(num_rows):
+        result_set.values.append(_make_value_pb(i))
+        result_set.values.append(_make_value_pb(u'name-%d' % i))
+    return result_set
+
+
+def time_rows(result_set, repeat):
+    """Best time, in seconds, to iterate over all rows of ``result_set``."""
+    def run():
+        for _ in StreamedResultSet(iter([result_set])):
+            pass
+
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[1000, 2000, 4000, 8000, 16000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print('%10s %12s %14s' % ('rows', 'total (ms)', 'per row (us)'))
+    for num_rows in args.rows:
+        elapsed = time_rows(make_result_set(num_rows), args.repeat)
+        print('%10d %12.2f %14.3f' % (
+            num_rows, elapsed * 1e3, elapsed * 1e6 / num_rows))
+
+
+if __name__ == '__main__':
+    main()
@@ -97,7 +97,9 @@ def open_database(parameters):
     instance = spanner_client.instance(instance_id)
     database_id = parameters['cloudspanner.database']
     pool = spanner.BurstyPool(int(parameters['num_worker']))
-    database = instance.database(database_id, pool=pool)
+    channel_count = int(parameters.get('cloudspanner.channels', 1))
+    database = instance.database(
+        database_id, pool=pool, channel_count=channel_count)
 
     return database
 
@@ -265,9 +267,6 @@ def run_workload(database, keys, parameters):
 if __name__ == '__main__':
     parameters = parse_options()
     if parameters['command'] == 'run':
-        if 'cloudspanner.channels' in parameters:
-            assert parameters['cloudspanner.channels'] == 1, (
-                'Python doesn\'t support channels > 1.')
         database = open_database(parameters)
         keys = load_keys(database, parameters)
         run_workload(database, keys, parameters)
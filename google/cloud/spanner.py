@@ -26,6 +26,7 @@ from google.cloud.spanner_v1 import KeyRange
 from google.cloud.spanner_v1 import KeySet
 from google.cloud.spanner_v1 import AbstractSessionPool
 from google.cloud.spanner_v1 import BurstyPool
+from google.cloud.spanner_v1 import ElasticPool
 from google.cloud.spanner_v1 import FixedSizePool
 from google.cloud.spanner_v1 import PingingPool
 from google.cloud.spanner_v1 import TransactionPingingPool
@@ -44,6 +45,7 @@ __all__ = (
     # google.cloud.spanner_v1.pool
     "AbstractSessionPool",
     "BurstyPool",
+    "ElasticPool",
     "FixedSizePool",
     "PingingPool",
     "TransactionPingingPool",
@@ -21,11 +21,27 @@ from future import standard_library
 standard_library.install_aliases()
 from builtins import object
 
+import datetime
+import decimal
 import hashlib
+import marshal
 import pickle
 
 from google.cloud.spanner_dbapi.exceptions import RetryAborted
 
+# Version 2 of the marshal format writes equal values identically, whether
+# or not they are the same object (later versions, and pickle, write
+# back-references to objects seen before in the same row).
+_MARSHAL_VERSION = 2
+
+# Types which marshal writes as is;  marshal rejects subclasses of them.
+_MARSHAL_TYPES = frozenset((type(None), bool, int, float, str, bytes))
+
+_MISMATCH_MESSAGE = (
+    "The transaction was aborted and could not be retried due to a concurrent "
+    "modification."
+)
+
 
 class ResultsChecksum(object):
     """Cumulative checksum.
@@ -36,11 +52,20 @@ class ResultsChecksum(object):
     These checksums are used while retrying an aborted
     transaction to check if the results of a retried transaction
     are equal to the results of the original transaction.
+
+    Every :attr:`CHECKPOINT_INTERVAL` results, the checksum so far is
+    kept, so that a retry can stop at the first checkpoint which
+    differs, rather than after reading all the results.
     """
 
+    CHECKPOINT_INTERVAL = 256
+
     def __init__(self):
         self.checksum = hashlib.sha256()
         self.count = 0  # counter of consumed results
+        self._checkpoints = []
+        # False once a result needed converting before being marshalled
+        self._marshallable = True
 
     def __len__(self):
         """Return the number of consumed results.
@@ -58,14 +83,96 @@ class ResultsChecksum(object):
         """
         return self.checksum.digest() == other.checksum.digest()
 
+    def matches_prefix(self, other):
+        """Check if the results consumed by ``other`` so far may still
+        match this checksum.
+
+        :type other: :class:`google.cloud.spanner_dbapi.checksum.ResultsChecksum`
+        :param other: Checksum of results being retried.
+
+        :rtype: bool
+        :returns: False if ``other`` has more results, or differs at its
+                  latest checkpoint.
+        """
+        count = other.count
+        if count > self.count:
+            return False
+        checkpoints = count // self.CHECKPOINT_INTERVAL
+        if not checkpoints or count % self.CHECKPOINT_INTERVAL:
+            return True
+        return other._checkpoints[-1] == self._checkpoints[checkpoints - 1]
+
     def consume_result(self, result):
         """Add the given result into the checksum.
 
-        :type result: Union[int, list]
+        Rows are added as plain tuples, so that the checksum does not depend
+        on the row factory which built them.  Values are serialized with
+        :mod:`marshal`;  those of other types, such as ``NUMERIC`` and
+        ``TIMESTAMP`` values, are first converted to tagged tuples.
+
+        :type result: Union[int, list, tuple, dict]
         :param result: Streamed row or row count from an UPDATE operation.
         """
-        self.checksum.update(pickle.dumps(result))
+        if isinstance(result, dict):
+            result = tuple(result.values())
+        elif isinstance(result, (list, tuple)):
+            result = tuple(result)
+
+        data = None
+        if self._marshallable:
+            try:
+                data = marshal.dumps(result, _MARSHAL_VERSION)
+            except ValueError:
+                self._marshallable = False
+        if data is None:
+            data = marshal.dumps(_to_marshallable(result), _MARSHAL_VERSION)
+
+        self.checksum.update(data)
         self.count += 1
+        if not self.count % self.CHECKPOINT_INTERVAL:
+            self._checkpoints.append(self.checksum.digest())
+
+
+def _to_marshallable(value):
+    """Convert a result to values which :mod:`marshal` accepts.
+
+    Spanner values are never tuples, so values of other types are
+    converted to tuples tagged with their type.
+
+    :type value: Any
+    :param value: Row, row count, or value of a row.
+
+    :rtype: Any
+    :returns: The converted value.
+    """
+    type_ = type(value)
+    if type_ in _MARSHAL_TYPES:
+        return value
+    if isinstance(value, list):
+        return [_to_marshallable(item) for item in value]
+    if isinstance(value, tuple):
+        if type_ is tuple:
+            return tuple(_to_marshallable(item) for item in value)
+        return ("tuple", tuple(_to_marshallable(item) for item in value))
+    if type_ is dict:
+        return {key: _to_marshallable(item) for key, item in value.items()}
+    if isinstance(value, datetime.datetime):
+        if hasattr(value, "rfc3339"):
+            # DatetimeWithNanoseconds keeps more than microseconds.
+            return ("timestamp", value.rfc3339())
+        return ("datetime", value.isoformat())
+    if isinstance(value, datetime.date):
+        return ("date", value.isoformat())
+    if isinstance(value, decimal.Decimal):
+        return ("numeric", str(value))
+    for base in _MARSHAL_TYPES:
+        if isinstance(value, base):
+            return (base.__name__, base(value))
+    try:
+        marshal.dumps(value, _MARSHAL_VERSION)
+    except ValueError:
+        return ("pickle", pickle.dumps(value))
+    return value
 
 
 def _compare_checksums(original, retried):
@@ -82,6 +189,21 @@ def _compare_checksums(original, retried):
     :raises: :exc:`google.cloud.spanner_dbapi.exceptions.RetryAborted` in case if checksums are not equal.
     """
     if retried != original:
-        raise RetryAborted(
-            "The transaction was aborted and could not be retried due to a concurrent modification."
-        )
+        raise RetryAborted(_MISMATCH_MESSAGE)
+
+
+def _compare_checksum_prefixes(original, retried):
+    """Compare the results retried so far with the original ones.
+
+    Raise an error as soon as the retried results can no longer match.
+
+    :type original: :class:`~google.cloud.spanner_dbapi.checksum.ResultsChecksum`
+    :param original: results checksum of the original transaction.
+
+    :type retried: :class:`~google.cloud.spanner_dbapi.checksum.ResultsChecksum`
+    :param retried: checksum of the results retried so far.
+
+    :raises: :exc:`google.cloud.spanner_dbapi.exceptions.RetryAborted` in case if the results differ.
+    """
+    if not original.matches_prefix(retried):
+        raise RetryAborted(_MISMATCH_MESSAGE)
@@ -28,11 +28,13 @@ import warnings
 from google.api_core.exceptions import Aborted
 from google.api_core.gapic_v1.client_info import ClientInfo
 from google.cloud import spanner_v1 as spanner
-from google.cloud.spanner_v1.session import _get_retry_delay
+from google.cloud.spanner_v1.streamed import tuple_row_factory
 
 from google.cloud.spanner_dbapi._helpers import _execute_insert_heterogenous
 from google.cloud.spanner_dbapi._helpers import _execute_insert_homogenous
 from google.cloud.spanner_dbapi._helpers import parse_insert
+from google.cloud.spanner_dbapi import parse_utils
+from google.cloud.spanner_dbapi.checksum import _compare_checksum_prefixes
 from google.cloud.spanner_dbapi.checksum import _compare_checksums
 from google.cloud.spanner_dbapi.checksum import ResultsChecksum
 from google.cloud.spanner_dbapi.cursor import Cursor
@@ -75,6 +77,12 @@ class Connection(object):
         # this connection should be cleared on the
         # connection close
         self._own_pool = True
+        # row factory given to the cursors created by this connection;
+        # see google.cloud.spanner_v1.streamed for the available ones
+        self.row_factory = None
+        # when retrying an aborted transaction, skip the queries whose
+        # results were not fetched, and check only the fetched results
+        self.retry_consumed_only = False
 
     @property
     def autocommit(self):
@@ -148,6 +156,8 @@ class Connection(object):
 
         The session will be returned into the sessions pool.
         """
+        if self._session is None:
+            return
         self.database._pool.put(self._session)
         self._session = None
 
@@ -161,53 +171,77 @@ class Connection(object):
         :raises: :class:`google.cloud.spanner_dbapi.exceptions.RetryAborted`
             If results checksum of the retried statement is
             not equal to the checksum of the original one.
+
+        :raises: :class:`google.api_core.exceptions.Aborted`
+            If the retries keep being aborted, beyond the limits of
+            the database's retry policy.
         """
+        policy = self.database.retry_policy
+        stats = self.database.abort_stats
+        deadline = time.time() + policy.deadline
         attempt = 0
         while True:
             self._transaction = None
             attempt += 1
-            if attempt > MAX_INTERNAL_RETRIES:
-                raise
 
             try:
                 self._rerun_previous_statements()
                 break
             except Aborted as exc:
-                delay = _get_retry_delay(exc.errors[0], attempt)
-                if delay:
-                    time.sleep(delay)
+                stats.record_abort()
+                delay = None
+                if attempt < MAX_INTERNAL_RETRIES:
+                    delay = policy.retry_delay(exc, attempt, deadline, stats)
+                if delay is None:
+                    raise
+                time.sleep(delay)
 
     def _rerun_previous_statements(self):
         """
         Helper to run all the remembered statements
         from the last transaction.
+
+        Stops at the first result which makes the checksums differ.
+        With :attr:`retry_consumed_only`, skips the queries none of
+        whose results were fetched, and reads the results of the others
+        only as far as they were fetched.
         """
-        for statement in self._statements:
-            res_iter, retried_checksum = self.run_statement(statement, retried=True)
-            # executing all the completed statements
-            if statement != self._statements[-1]:
-                for res in res_iter:
-                    retried_checksum.consume_result(res)
+        last = len(self._statements) - 1
+        for index, statement in enumerate(self._statements):
+            original = statement.checksum
+            if (
+                index < last
+                and self.retry_consumed_only
+                and not len(original)
+                and _is_query(statement)
+            ):
+                continue
 
-                _compare_checksums(statement.checksum, retried_checksum)
-            # executing the failed statement
-            else:
+            res_iter, retried_checksum = self.run_statement(statement, retried=True)
+            if index == last or self.retry_consumed_only:
                 # streaming up to the failed result or
                 # to the end of the streaming iterator
-                while len(retried_checksum) < len(statement.checksum):
-                    try:
-                        res = next(iter(res_iter))
-                        retried_checksum.consume_result(res)
-                    except StopIteration:
-                        break
+                limit = len(original)
+            else:
+                limit = None
 
-                _compare_checksums(statement.checksum, retried_checksum)
+            res_iter = iter(res_iter)
+            while limit is None or len(retried_checksum) < limit:
+                try:
+                    res = next(res_iter)
+                except StopIteration:
+                    break
+                retried_checksum.consume_result(res)
+                _compare_checksum_prefixes(original, retried_checksum)
+
+            _compare_checksums(original, retried_checksum)
 
     def transaction_checkout(self):
         """Get a Cloud Spanner transaction.
 
-        Begin a new transaction, if there is no transaction in
-        this connection yet. Return the begun one otherwise.
+        Create a new transaction, if there is no transaction in
+        this connection yet. Return the existing one otherwise.
+        The transaction is begun inline, by its first statement.
 
         The method is non operational in autocommit mode.
 
@@ -217,7 +251,6 @@ class Connection(object):
         if not self.autocommit:
             if not self.inside_transaction:
                 self._transaction = self._session_checkout().transaction()
-                self._transaction.begin()
 
             return self._transaction
 
@@ -257,8 +290,11 @@ class Connection(object):
                 self._release_session()
                 self._statements = []
             except Aborted:
+                self.database.abort_stats.record_abort()
                 self.retry_transaction()
                 self.commit()
+            else:
+                self.database.abort_stats.record_commit()
 
     def rollback(self):
         """Rolls back any pending transaction.
@@ -277,7 +313,9 @@ class Connection(object):
         """Factory to create a DB-API Cursor."""
         self._raise_if_closed()
 
-        return Cursor(self)
+        cursor = Cursor(self)
+        cursor.row_factory = self.row_factory
+        return cursor
 
     def run_prior_DDL_statements(self):
         self._raise_if_closed()
@@ -288,7 +326,7 @@ class Connection(object):
 
             return self.database.update_ddl(ddl_statements).result()
 
-    def run_statement(self, statement, retried=False):
+    def run_statement(self, statement, retried=False, row_factory=tuple_row_factory):
         """Run single SQL statement in begun transaction.
 
         This method is never used in autocommit mode. In
@@ -298,6 +336,13 @@ class Connection(object):
         :type statement: :class:`dict`
         :param statement: SQL statement to execute.
 
+        :type retried: bool
+        :param retried: (Optional) True if the statement is being re-run
+                        while retrying an aborted transaction.
+
+        :type row_factory: callable
+        :param row_factory: (Optional) row factory for the statement results.
+
         :rtype: :class:`google.cloud.spanner_v1.streamed.StreamedResultSet`,
                 :class:`google.cloud.spanner_dbapi.checksum.ResultsChecksum`
         :returns: Streamed result set of the statement and a
@@ -327,7 +372,10 @@ class Connection(object):
 
         return (
             transaction.execute_sql(
-                statement.sql, statement.params, param_types=statement.param_types,
+                statement.sql,
+                statement.params,
+                param_types=statement.param_types,
+                row_factory=row_factory,
             ),
             ResultsChecksum() if retried else statement.checksum,
         )
@@ -340,6 +388,20 @@ class Connection(object):
         self.close()
 
 
+def _is_query(statement):
+    """Helper for :meth:`Connection._rerun_previous_statements`.
+
+    :type statement: :class:`google.cloud.spanner_dbapi.cursor.Statement`
+    :param statement: SQL statement executed in a transaction.
+
+    :rtype: bool
+    :returns: True if the statement only reads data.
+    """
+    if statement.is_insert:
+        return False
+    return parse_utils.classify_stmt(statement.sql) == parse_utils.STMT_NON_UPDATING
+
+
 def connect(
     instance_id,
     database_id,
@@ -31,6 +31,7 @@ from google.api_core.exceptions import InvalidArgument
 from collections import namedtuple
 
 from google.cloud import spanner_v1 as spanner
+from google.cloud.spanner_v1.streamed import tuple_row_factory
 from google.cloud.spanner_dbapi.checksum import ResultsChecksum
 from google.cloud.spanner_dbapi.exceptions import IntegrityError
 from google.cloud.spanner_dbapi.exceptions import InterfaceError
@@ -72,6 +73,18 @@ class Cursor(object):
         # the number of rows to fetch at a time with fetchmany()
         self.arraysize = 1
 
+        # builds result rows;  if None, rows are tuples
+        self.row_factory = None
+
+    @property
+    def _row_factory(self):
+        """Row factory used for query results.
+
+        :rtype: callable
+        :returns: :attr:`row_factory`, or one building tuples if not set.
+        """
+        return self.row_factory or tuple_row_factory
+
     @property
     def is_closed(self):
         """The cursor close indicator.
@@ -196,7 +209,7 @@ class Cursor(object):
                     classification == parse_utils.STMT_INSERT,
                 )
                 (self._result_set, self._checksum,) = self.connection.run_statement(
-                    statement
+                    statement, row_factory=self._row_factory
                 )
                 self._itr = PeekIterator(self._result_set)
                 return
@@ -327,7 +340,10 @@ class Cursor(object):
             #  https://googleapis.dev/python/spanner/latest/session-api.html#google.cloud.spanner_v1.session.Session.execute_sql
             sql, params = parse_utils.sql_pyformat_args_to_spanner(sql, params)
             res = snapshot.execute_sql(
-                sql, params=params, param_types=get_param_types(params)
+                sql,
+                params=params,
+                param_types=get_param_types(params),
+                row_factory=self._row_factory,
             )
             if type(res) == int:
                 self._row_count = res
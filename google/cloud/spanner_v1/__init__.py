@@ -69,6 +69,7 @@ from google.cloud.spanner_v1.keyset import KeyRange
 from google.cloud.spanner_v1.keyset import KeySet
 from google.cloud.spanner_v1.pool import AbstractSessionPool
 from google.cloud.spanner_v1.pool import BurstyPool
+from google.cloud.spanner_v1.pool import ElasticPool
 from google.cloud.spanner_v1.pool import FixedSizePool
 from google.cloud.spanner_v1.pool import PingingPool
 from google.cloud.spanner_v1.pool import TransactionPingingPool
@@ -93,6 +94,7 @@ __all__ = (
     # google.cloud.spanner_v1.pool
     "AbstractSessionPool",
     "BurstyPool",
+    "ElasticPool",
     "FixedSizePool",
     "PingingPool",
     "TransactionPingingPool",
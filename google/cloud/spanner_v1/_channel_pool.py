@@ -0,0 +1,211 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Spread Spanner RPCs over several gRPC channels, with session affinity."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+import itertools
+import threading
+import zlib
+
+import grpc
+import six
+
+
+def _session_name(request):
+    """Name of the session targeted by a request, if any.
+
+    :type request: :class:`proto.Message`
+    :param request: the outgoing request.
+
+    :rtype: str or None
+    :returns: the ``session`` field, if it names a session.  Requests which
+              create sessions have no such name.
+    """
+    name = getattr(request, "session", None)
+    if isinstance(name, six.string_types) and name:
+        return name
+    return None
+
+
+class ChannelPool(grpc.Channel):
+    """A :class:`grpc.Channel` made of several underlying channels.
+
+    Requests naming a session are always sent over the same channel, chosen
+    from a stable hash of the session name, so that all RPCs for a session
+    (including its streaming reads and queries) share one connection.  Other
+    requests, e.g. ``CreateSession`` and ``BatchCreateSessions``, and all
+    client-streaming calls, are spread over the channels in round-robin
+    order.
+
+    Pass an instance as the ``channel`` of a
+    :class:`~google.cloud.spanner_v1.services.spanner.transports.grpc.SpannerGrpcTransport`.
+
+    :type channels: list of :class:`grpc.Channel`
+    :param channels: the underlying channels.
+
+    :raises ValueError: if ``channels`` is empty.
+    """
+
+    def __init__(self, channels):
+        channels = list(channels)
+        if not channels:
+            raise ValueError("At least one channel is required.")
+        self._channels = channels
+        self._round_robin = itertools.cycle(range(len(channels)))
+        self._lock = threading.Lock()
+
+    @property
+    def channels(self):
+        """Underlying channels, in affinity order.
+
+        :rtype: list of :class:`grpc.Channel`
+        :returns: the channels passed to the constructor.
+        """
+        return list(self._channels)
+
+    def channel_index(self, request):
+        """Pick the channel for a request.
+
+        :type request: :class:`proto.Message`
+        :param request: the outgoing request.
+
+        :rtype: int
+        :returns: index into :attr:`channels`.
+        """
+        name = _session_name(request)
+        if name is not None:
+            return zlib.crc32(name.encode("utf-8")) % len(self._channels)
+        return self.next_channel_index()
+
+    def next_channel_index(self):
+        """Pick the next channel in round-robin order.
+
+        :rtype: int
+        :returns: index into :attr:`channels`.
+        """
+        with self._lock:
+            return next(self._round_robin)
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self._channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self._channels:
+            channel.unsubscribe(callback)
+
+    def unary_unary(self, method, *args, **kwargs):
+        callables = [
+            channel.unary_unary(method, *args, **kwargs) for channel in self._channels
+        ]
+        return _UnaryUnaryMultiCallable(self, callables)
+
+    def unary_stream(self, method, *args, **kwargs):
+        callables = [
+            channel.unary_stream(method, *args, **kwargs) for channel in self._channels
+        ]
+        return _UnaryStreamMultiCallable(self, callables)
+
+    def stream_unary(self, method, *args, **kwargs):
+        callables = [
+            channel.stream_unary(method, *args, **kwargs) for channel in self._channels
+        ]
+        return _StreamUnaryMultiCallable(self, callables)
+
+    def stream_stream(self, method, *args, **kwargs):
+        callables = [
+            channel.stream_stream(method, *args, **kwargs) for channel in self._channels
+        ]
+        return _StreamStreamMultiCallable(self, callables)
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
+    """Dispatch a unary-unary RPC to the channel picked by the pool."""
+
+    def __init__(self, pool, callables):
+        self._pool = pool
+        self._callables = callables
+
+    def _pick(self, request):
+        return self._callables[self._pool.channel_index(request)]
+
+    def __call__(self, request, *args, **kwargs):
+        return self._pick(request)(request, *args, **kwargs)
+
+    def with_call(self, request, *args, **kwargs):
+        return self._pick(request).with_call(request, *args, **kwargs)
+
+    def future(self, request, *args, **kwargs):
+        return self._pick(request).future(request, *args, **kwargs)
+
+
+class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
+    """Dispatch a unary-stream RPC to the channel picked by the pool."""
+
+    def __init__(self, pool, callables):
+        self._pool = pool
+        self._callables = callables
+
+    def __call__(self, request, *args, **kwargs):
+        callable_ = self._callables[self._pool.channel_index(request)]
+        return callable_(request, *args, **kwargs)
+
+
+class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
+    """Dispatch a stream-unary RPC to the next channel in round-robin order."""
+
+    def __init__(self, pool, callables):
+        self._pool = pool
+        self._callables = callables
+
+    def _pick(self):
+        return self._callables[self._pool.next_channel_index()]
+
+    def __call__(self, request_iterator, *args, **kwargs):
+        return self._pick()(request_iterator, *args, **kwargs)
+
+    def with_call(self, request_iterator, *args, **kwargs):
+        return self._pick().with_call(request_iterator, *args, **kwargs)
+
+    def future(self, request_iterator, *args, **kwargs):
+        return self._pick().future(request_iterator, *args, **kwargs)
+
+
+class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
+    """Dispatch a stream-stream RPC to the next channel in round-robin order."""
+
+    def __init__(self, pool, callables):
+        self._pool = pool
+        self._callables = callables
+
+    def __call__(self, request_iterator, *args, **kwargs):
+        callable_ = self._callables[self._pool.next_channel_index()]
+        return callable_(request_iterator, *args, **kwargs)
@@ -23,8 +23,10 @@ from builtins import str
 from future import standard_library
 standard_library.install_aliases()
 
+import binascii
 import datetime
 import decimal
+import functools
 import math
 
 import six
@@ -35,6 +37,7 @@ from google.protobuf.struct_pb2 import Value
 from google.api_core import datetime_helpers
 from google.cloud._helpers import _date_from_iso8601_date
 from google.cloud._helpers import _datetime_to_rfc3339
+from google.cloud._helpers import UTC
 from google.cloud.spanner_v1 import TypeCode
 from google.cloud.spanner_v1 import ExecuteSqlRequest
 
@@ -187,10 +190,9 @@ def _parse_value(value, field_type):
         else:
             result = value
     elif field_type.code == TypeCode.DATE:
-        result = _date_from_iso8601_date(value)
+        result = _parse_date(value)
     elif field_type.code == TypeCode.TIMESTAMP:
-        DatetimeWithNanoseconds = datetime_helpers.DatetimeWithNanoseconds
-        result = DatetimeWithNanoseconds.from_rfc3339(value)
+        result = _parse_timestamp(value)
     elif field_type.code == TypeCode.ARRAY:
         result = [_parse_value(item, field_type.array_element_type) for item in value]
     elif field_type.code == TypeCode.STRUCT:
@@ -205,6 +207,232 @@ def _parse_value(value, field_type):
     return result
 
 
+def _parse_unchanged(value):
+    """Helper for '_make_value_parser':  STRING / BOOL values."""
+    return value
+
+
+def _parse_bytes(value):
+    """Helper for '_make_value_parser':  base64-encoded bytes."""
+    if value is None:
+        return None
+    if isinstance(value, bytearray):  # merged from chunks
+        return bytes(value)
+    return value.encode("utf8")
+
+
+def _parse_bytes_decoded(value):
+    """Helper for '_make_value_parser':  decode base64 in a single pass."""
+    if value is None:
+        return None
+    return binascii.a2b_base64(value)
+
+
+def _parse_bytes_memoryview(value):
+    """Helper for '_make_value_parser':  view on the decoded bytes."""
+    if value is None:
+        return None
+    return memoryview(binascii.a2b_base64(value))
+
+
+def _parse_int64(value):
+    """Helper for '_make_value_parser'."""
+    if value is None:
+        return None
+    return int(value)
+
+
+def _parse_float64(value):
+    """Helper for '_make_value_parser'."""
+    if isinstance(value, str):
+        return float(value)
+    return value
+
+
+_PARSE_CACHE_SIZE = 4096
+"""Number of distinct DATE / TIMESTAMP values remembered by their parsers."""
+
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_date(value):
+    """Helper for '_make_value_parser'.
+
+    Spanner sends dates as ``YYYY-MM-DD``:  slice them, rather than going
+    through ``strptime``.  Recently seen values are cached.
+    """
+    if value is None:
+        return None
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return datetime.date(int(value[:4]), int(value[5:7]), int(value[8:]))
+    return _date_from_iso8601_date(value)
+
+
+def _timestamp_fields(value):
+    """Split a timestamp in Spanner's canonical RFC 3339 format.
+
+    Spanner sends timestamps as ``YYYY-MM-DDTHH:MM:SS[.fffffffff]Z``, with
+    zero to nine fractional digits.
+
+    :type value: str
+    :param value: the timestamp, as found in a result set
+
+    :rtype: tuple or None
+    :returns: year, month, day, hour, minute, second and nanoseconds, or
+              ``None`` if ``value`` is not in the canonical format.
+    """
+    length = len(value)
+    if (
+        length < 20
+        or value[4] != "-"
+        or value[7] != "-"
+        or value[10] != "T"
+        or value[13] != ":"
+        or value[16] != ":"
+        or value[-1] != "Z"
+    ):
+        return None
+    if length == 20:
+        nanos = 0
+    elif value[19] == "." and 22 <= length <= 30:
+        fraction = value[20:-1]
+        nanos = int(fraction) * 10 ** (9 - len(fraction))
+    else:
+        return None
+    return (
+        int(value[:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        nanos,
+    )
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_timestamp(value):
+    """Helper for '_make_value_parser'.
+
+    Timestamps in Spanner's canonical format are sliced, rather than
+    matched and parsed by ``strptime``.  Recently seen values are cached.
+    """
+    if value is None:
+        return None
+    fields = _timestamp_fields(value)
+    if fields is None:
+        return datetime_helpers.DatetimeWithNanoseconds.from_rfc3339(value)
+    year, month, day, hour, minute, second, nanos = fields
+    return datetime_helpers.DatetimeWithNanoseconds(
+        year, month, day, hour, minute, second, nanosecond=nanos, tzinfo=UTC
+    )
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_timestamp_nanoseconds(value):
+    """Helper for '_make_value_parser':  nanoseconds since the Unix epoch."""
+    if value is None:
+        return None
+    fields = _timestamp_fields(value)
+    if fields is None:
+        stamp = datetime_helpers.DatetimeWithNanoseconds.from_rfc3339(value)
+        fields = (
+            stamp.year,
+            stamp.month,
+            stamp.day,
+            stamp.hour,
+            stamp.minute,
+            stamp.second,
+            stamp.nanosecond,
+        )
+    year, month, day, hour, minute, second, nanos = fields
+    days = datetime.date(year, month, day).toordinal() - _EPOCH_ORDINAL
+    seconds = ((days * 24 + hour) * 60 + minute) * 60 + second
+    return seconds * 1000000000 + nanos
+
+
+def _parse_numeric(value):
+    """Helper for '_make_value_parser'."""
+    if value is None:
+        return None
+    return decimal.Decimal(value)
+
+
+_SCALAR_PARSERS = {
+    TypeCode.STRING: _parse_unchanged,
+    TypeCode.BYTES: _parse_bytes,
+    TypeCode.BOOL: _parse_unchanged,
+    TypeCode.INT64: _parse_int64,
+    TypeCode.FLOAT64: _parse_float64,
+    TypeCode.DATE: _parse_date,
+    TypeCode.TIMESTAMP: _parse_timestamp,
+    TypeCode.NUMERIC: _parse_numeric,
+}
+
+
+def _make_value_parser(field_type, scalar_parsers=None):
+    """Build a callable converting values of a given type to cell data.
+
+    Equivalent to binding ``field_type`` in :func:`_parse_value`, but the
+    type code is dispatched once, when the parser is built:  parsing each
+    value then only runs the conversion for its type.  Parsers for ARRAY and
+    STRUCT values are built from prebuilt parsers for their elements.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.Type`
+    :param field_type: type of the values to be parsed.
+
+    :type scalar_parsers: dict
+    :param scalar_parsers: (Optional) parsers for scalar values, keyed by
+                           :class:`~google.cloud.spanner_v1.TypeCode`,
+                           including those nested in ARRAY and STRUCT
+                           values.  Defaults to :data:`_SCALAR_PARSERS`.
+
+    :rtype: callable
+    :returns: function taking a value, as found in a result set, and
+              returning the corresponding cell data.
+    """
+    code = field_type.code
+
+    if code == TypeCode.ARRAY:
+        parse_element = _make_value_parser(
+            field_type.array_element_type, scalar_parsers
+        )
+
+        def parse_array(value):
+            if value is None:
+                return None
+            return [parse_element(item) for item in value]
+
+        return parse_array
+
+    if code == TypeCode.STRUCT:
+        parsers = [
+            _make_value_parser(field.type_, scalar_parsers)
+            for field in field_type.struct_type.fields
+        ]
+
+        def parse_struct(value):
+            if value is None:
+                return None
+            return [parse(item) for parse, item in zip(parsers, value)]
+
+        return parse_struct
+
+    if scalar_parsers is None:
+        scalar_parsers = _SCALAR_PARSERS
+    parser = scalar_parsers.get(code)
+    if parser is not None:
+        return parser
+
+    def parse_unknown(value):
+        if value is None:
+            return None
+        raise ValueError("Unknown type: %s" % (field_type,))
+
+    return parse_unknown
+
+
 def _parse_value_pb(value_pb, field_type):
     """Convert a Value protobuf to cell data.
 
@@ -255,6 +483,21 @@ def _parse_list_value_pbs(rows, row_type):
     return result
 
 
+_SESSION_NOT_FOUND_MESSAGE = "Session not found"
+
+
+def _session_not_found(exc):
+    """Check whether an error reports that the session was deleted.
+
+    :type exc: :class:`google.api_core.exceptions.NotFound`
+    :param exc: error raised by an API request made with a session.
+
+    :rtype: bool
+    :returns: True if the back-end no longer knows the session.
+    """
+    return _SESSION_NOT_FOUND_MESSAGE in exc.message
+
+
 class _SessionWrapper(object):
     """Base class for objects wrapping a session.
 
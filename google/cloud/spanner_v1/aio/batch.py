@@ -0,0 +1,74 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asynchronous context manager for Cloud Spanner batched writes."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+from google.cloud.spanner_v1 import TransactionOptions
+from google.cloud.spanner_v1._helpers import _metadata_with_prefix
+from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.batch import Batch
+
+
+class AsyncBatch(Batch):
+    """Accumulate mutations for transmission during :meth:`commit`.
+
+    Mutations are added as for :class:`~google.cloud.spanner_v1.batch.Batch`;
+    :meth:`commit` is a coroutine.  Use as an asynchronous context manager
+    to commit when the block exits without an exception.
+
+    :type session: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+    :param session: the session used to perform the commit
+    """
+
+    async def commit(self):
+        """Commit mutations to the database.
+
+        :rtype: datetime
+        :returns: timestamp of the committed changes.
+        """
+        self._check_state()
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        txn_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
+        trace_attributes = {"num_mutations": len(self._mutations)}
+        with trace_call("CloudSpanner.Commit", self._session, trace_attributes):
+            response = await api.commit(
+                session=self._session.name,
+                mutations=self._mutations,
+                single_use_transaction=txn_options,
+                metadata=metadata,
+            )
+        self.committed = response.commit_timestamp
+        return self.committed
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with an AsyncBatch.")
+
+    async def __aenter__(self):
+        """Begin ``async with`` block."""
+        self._check_state()
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """End ``async with`` block."""
+        if exc_type is None:
+            await self.commit()
@@ -0,0 +1,432 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""User-friendly container for Cloud Spanner Database, for asyncio."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+import asyncio
+
+import google.auth.credentials
+from grpc import aio as grpc_aio
+
+# pylint: disable=ungrouped-imports
+from google.cloud.spanner_v1.aio.batch import AsyncBatch
+from google.cloud.spanner_v1.aio.pool import AsyncFixedSizePool
+from google.cloud.spanner_v1.aio.session import AsyncSession
+from google.cloud.spanner_v1.aio.snapshot import AsyncSnapshot
+from google.cloud.spanner_v1.database import SPANNER_DATA_SCOPE
+from google.cloud.spanner_v1.database import Database
+from google.cloud.spanner_v1.services.spanner import SpannerAsyncClient
+from google.cloud.spanner_v1.services.spanner.transports.grpc_asyncio import (
+    SpannerGrpcAsyncIOTransport,
+)
+
+# pylint: enable=ungrouped-imports
+
+
+# ``asyncio.current_task`` is new in Python 3.7.
+_current_task = getattr(asyncio, "current_task", None) or asyncio.Task.current_task
+
+
+class AsyncDatabase(object):
+    """Representation of a Cloud Spanner Database, for asyncio.
+
+    Session-related API calls (reads, queries, DML and commits) are
+    coroutines, sent with a
+    :class:`~google.cloud.spanner_v1.services.spanner.SpannerAsyncClient`.
+
+    Administrative methods, such as :meth:`create` or :meth:`reload`, remain
+    synchronous:  they are delegated to a wrapped
+    :class:`~google.cloud.spanner_v1.database.Database`, available as
+    :attr:`sync_database`, which also holds the database's state, retry
+    policy and abort statistics.  Operations only offered by the
+    synchronous API, such as batch snapshots or partitioned DML, are not
+    methods of this class:  call them on :attr:`sync_database`, which has
+    its own pool of synchronous sessions.
+
+    :type database_id: str
+    :param database_id: The ID of the database.
+
+    :type instance: :class:`~google.cloud.spanner_v1.instance.Instance`
+    :param instance: The instance that owns the database.
+
+    :type ddl_statements: list of string
+    :param ddl_statements: (Optional) DDL statements, excluding the
+                           CREATE DATABASE statement.
+
+    :type pool: :class:`~google.cloud.spanner_v1.aio.pool.AsyncFixedSizePool`
+    :param pool: (Optional) session pool to be used by database.  If not
+                 passed, the database will construct an instance of
+                 :class:`~google.cloud.spanner_v1.aio.pool.AsyncFixedSizePool`.
+
+    :type retry_policy:
+        :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+    :param retry_policy: (Optional) policy for retrying aborted transactions
+                         in :meth:`run_in_transaction`.
+    """
+
+    _spanner_api = None
+
+    def __init__(
+        self, database_id, instance, ddl_statements=(), pool=None, retry_policy=None
+    ):
+        self._database = Database(
+            database_id,
+            instance,
+            ddl_statements=ddl_statements,
+            retry_policy=retry_policy,
+        )
+        self._transaction_tasks = set()
+
+        if pool is None:
+            pool = AsyncFixedSizePool()
+
+        self._pool = pool
+        pool.bind(self)
+
+    @property
+    def sync_database(self):
+        """Synchronous database wrapped by this one.
+
+        :rtype: :class:`~google.cloud.spanner_v1.database.Database`
+        :returns: the database used for administrative calls.
+        """
+        return self._database
+
+    @property
+    def database_id(self):
+        """The ID of the database.
+
+        :rtype: str
+        :returns: the ID passed to the constructor.
+        """
+        return self._database.database_id
+
+    @property
+    def _instance(self):
+        return self._database._instance
+
+    @property
+    def name(self):
+        """Database name used in requests.
+
+        See :attr:`~google.cloud.spanner_v1.database.Database.name`.
+
+        :rtype: str
+        :returns: The database name.
+        """
+        return self._database.name
+
+    @property
+    def state(self):
+        """State of this database, as of the last :meth:`reload`.
+
+        :rtype: :class:`~google.cloud.spanner_admin_database_v1.Database.State`
+        :returns: an enum describing the state of the database
+        """
+        return self._database.state
+
+    @property
+    def create_time(self):
+        """Create time of this database, as of the last :meth:`reload`.
+
+        :rtype: :class:`datetime.datetime`
+        :returns: a datetime object representing the create time of
+            this database
+        """
+        return self._database.create_time
+
+    @property
+    def restore_info(self):
+        """Restore info for this database, as of the last :meth:`reload`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.database.RestoreInfo`
+        :returns: an object representing the restore info for this database
+        """
+        return self._database.restore_info
+
+    @property
+    def ddl_statements(self):
+        """DDL Statements used to define database schema.
+
+        :rtype: sequence of string
+        :returns: the statements
+        """
+        return self._database.ddl_statements
+
+    @property
+    def retry_policy(self):
+        """Policy for retrying aborted transactions.
+
+        :rtype: :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+        :returns: the policy passed to the constructor, or the default one.
+        """
+        return self._database.retry_policy
+
+    @property
+    def abort_stats(self):
+        """Counts of aborted and committed read-write transaction attempts.
+
+        Shared with :attr:`sync_database`.
+
+        :rtype: :class:`~google.cloud.spanner_v1.retry_policy.AbortStats`
+        :returns: the statistics, shared by all sessions of the database.
+        """
+        return self._database.abort_stats
+
+    def create(self):
+        """Create this database within its instance.
+
+        See :meth:`~google.cloud.spanner_v1.database.Database.create`.
+
+        :rtype: :class:`~google.api_core.operation.Operation`
+        :returns: a future used to poll the status of the create request
+        """
+        return self._database.create()
+
+    def exists(self):
+        """Test whether this database exists.
+
+        :rtype: bool
+        :returns: True if the database exists, else false.
+        """
+        return self._database.exists()
+
+    def reload(self):
+        """Reload this database.
+
+        Refresh any configured schema into :attr:`ddl_statements`.
+        """
+        self._database.reload()
+
+    def update_ddl(self, ddl_statements, operation_id=""):
+        """Update DDL for this database.
+
+        See :meth:`~google.cloud.spanner_v1.database.Database.update_ddl`.
+
+        :rtype: :class:`google.api_core.operation.Operation`
+        :returns: an operation instance
+        """
+        return self._database.update_ddl(ddl_statements, operation_id=operation_id)
+
+    def drop(self):
+        """Drop this database."""
+        self._database.drop()
+
+    def restore(self, source):
+        """Restore from a backup to this database.
+
+        See :meth:`~google.cloud.spanner_v1.database.Database.restore`.
+
+        :rtype: :class:`~google.api_core.operation.Operation`
+        :returns: a future used to poll the status of the restore request
+        """
+        return self._database.restore(source)
+
+    def is_ready(self):
+        """Test whether this database is ready for use.
+
+        :rtype: bool
+        :returns: True if the database state is READY_OPTIMIZING or READY, else False.
+        """
+        return self._database.is_ready()
+
+    def is_optimized(self):
+        """Test whether this database has finished optimizing.
+
+        :rtype: bool
+        :returns: True if the database state is READY, else False.
+        """
+        return self._database.is_optimized()
+
+    def list_database_operations(self, filter_="", page_size=None):
+        """List database operations for the database.
+
+        See
+        :meth:`~google.cloud.spanner_v1.database.Database.list_database_operations`.
+
+        :type: :class:`~google.api_core.page_iterator.Iterator`
+        :returns:
+            Iterator of :class:`~google.api_core.operation.Operation`
+            resources within the current instance.
+        """
+        return self._database.list_database_operations(
+            filter_=filter_, page_size=page_size
+        )
+
+    @property
+    def spanner_api(self):
+        """Helper for session-related API calls."""
+        if self._spanner_api is None:
+            client_info = self._instance._client._client_info
+            client_options = self._instance._client._client_options
+            if self._instance.emulator_host is not None:
+                transport = SpannerGrpcAsyncIOTransport(
+                    channel=grpc_aio.insecure_channel(self._instance.emulator_host)
+                )
+                self._spanner_api = SpannerAsyncClient(
+                    client_info=client_info, transport=transport
+                )
+                return self._spanner_api
+            credentials = self._instance._client.credentials
+            if isinstance(credentials, google.auth.credentials.Scoped):
+                credentials = credentials.with_scopes((SPANNER_DATA_SCOPE,))
+            self._spanner_api = SpannerAsyncClient(
+                credentials=credentials,
+                client_info=client_info,
+                client_options=client_options,
+            )
+        return self._spanner_api
+
+    def session(self, labels=None):
+        """Factory to create a session for this database.
+
+        :type labels: dict (str -> str) or None
+        :param labels: (Optional) user-assigned labels for the session.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+        :returns: a session bound to this database.
+        """
+        return AsyncSession(self, labels=labels)
+
+    def snapshot(self, **kw):
+        """Return an object which wraps a snapshot.
+
+        The wrapper *must* be used as an asynchronous context manager, with
+        the snapshot as the value returned by the wrapper.
+
+        :type kw: dict
+        :param kw:
+            Passed through to
+            :class:`~google.cloud.spanner_v1.aio.snapshot.AsyncSnapshot`
+            constructor.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.database.AsyncSnapshotCheckout`
+        :returns: new wrapper
+        """
+        return AsyncSnapshotCheckout(self, **kw)
+
+    def batch(self):
+        """Return an object which wraps a batch.
+
+        The wrapper *must* be used as an asynchronous context manager, with
+        the batch as the value returned by the wrapper.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.database.AsyncBatchCheckout`
+        :returns: new wrapper
+        """
+        return AsyncBatchCheckout(self)
+
+    async def run_in_transaction(self, func, *args, **kw):
+        """Perform a unit of work in a transaction, retrying on abort.
+
+        :type func: callable
+        :param func: coroutine function taking a required positional
+                     argument, the transaction, and additional positional /
+                     keyword arguments as supplied by the caller.
+
+        :type args: tuple
+        :param args: additional positional arguments to be passed to ``func``.
+
+        :type kw: dict
+        :param kw: (Optional) keyword arguments to be passed to ``func``.
+                   If passed, "timeout_secs" will be removed and used to
+                   override the default retry timeout which defines maximum
+                   timestamp to continue retrying the transaction.
+
+        :rtype: Any
+        :returns: The return value of ``func``.
+
+        :raises Exception:
+            reraises any non-ABORT execptions raised by ``func``.
+        """
+        # Sanity check: Is there a transaction already running?  Tasks
+        # sharing the event loop may run transactions concurrently, each
+        # on its own session, so only nesting within a task is rejected.
+        task = _current_task()
+        if task in self._transaction_tasks:
+            raise RuntimeError("Spanner does not support nested transactions.")
+        self._transaction_tasks.add(task)
+
+        try:
+            async with self._pool.session() as session:
+                return await session.run_in_transaction(func, *args, **kw)
+        finally:
+            self._transaction_tasks.discard(task)
+
+
+class AsyncBatchCheckout(object):
+    """Asynchronous context manager for using a batch from a database.
+
+    Inside the context manager, checks out a session from the database,
+    creates a batch from it, making the batch available.  The batch is
+    committed when the block exits without an exception.
+
+    :type database: :class:`~google.cloud.spanner_v1.aio.database.AsyncDatabase`
+    :param database: database to use
+    """
+
+    def __init__(self, database):
+        self._database = database
+        self._session = self._batch = None
+
+    async def __aenter__(self):
+        """Begin ``async with`` block."""
+        session = self._session = await self._database._pool.get()
+        batch = self._batch = AsyncBatch(session)
+        return batch
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """End ``async with`` block."""
+        try:
+            if exc_type is None:
+                await self._batch.commit()
+        finally:
+            self._database._pool.put(self._session)
+
+
+class AsyncSnapshotCheckout(object):
+    """Asynchronous context manager for using a snapshot from a database.
+
+    Inside the context manager, checks out a session from the database,
+    creates a snapshot from it, making the snapshot available.
+
+    :type database: :class:`~google.cloud.spanner_v1.aio.database.AsyncDatabase`
+    :param database: database to use
+
+    :type kw: dict
+    :param kw:
+        Passed through to
+        :class:`~google.cloud.spanner_v1.aio.snapshot.AsyncSnapshot`
+        constructor.
+    """
+
+    def __init__(self, database, **kw):
+        self._database = database
+        self._session = None
+        self._kw = kw
+
+    async def __aenter__(self):
+        """Begin ``async with`` block."""
+        session = self._session = await self._database._pool.get()
+        return AsyncSnapshot(session, **self._kw)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """End ``async with`` block."""
+        self._database._pool.put(self._session)
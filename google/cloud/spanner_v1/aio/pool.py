@@ -0,0 +1,180 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pools managing shared asyncio Session objects."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+import asyncio
+
+from google.cloud.spanner_v1._helpers import _metadata_with_prefix
+from google.cloud.spanner_v1.pool import AbstractSessionPool
+from google.cloud.spanner_v1.pool import _MAX_SESSIONS_PER_BATCH
+from google.cloud.spanner_v1.pool import _NOW
+
+
+class AsyncFixedSizePool(AbstractSessionPool):
+    """Session pool for asyncio databases, holding a fixed number of sessions.
+
+    - Binding to a database makes no API request:  the sessions are created,
+      using ``BatchCreateSessions``, when the first one is checked out.
+
+    - Waits, with a timeout, when :meth:`get` is called on an empty pool.
+      Raises after timing out.
+
+    - Raises when :meth:`put` is called on a full pool.
+
+    :type size: int
+    :param size: fixed pool size
+
+    :type default_timeout: int
+    :param default_timeout: default timeout, in seconds, to wait for
+                            a returned session.
+
+    :type labels: dict (str -> str) or None
+    :param labels: (Optional) user-assigned labels for sessions created
+                    by the pool.
+    """
+
+    DEFAULT_SIZE = 10
+    DEFAULT_TIMEOUT = 10
+
+    def __init__(self, size=DEFAULT_SIZE, default_timeout=DEFAULT_TIMEOUT, labels=None):
+        super(AsyncFixedSizePool, self).__init__(labels=labels)
+        self.size = size
+        self.default_timeout = default_timeout
+        self._sessions = None
+        self._fill_lock = None
+        self._filled = False
+
+    def bind(self, database):
+        """Associate the pool with a database.
+
+        :type database: :class:`~google.cloud.spanner_v1.aio.database.AsyncDatabase`
+        :param database: database used by the pool:  used to create sessions
+                         when needed.
+        """
+        self._database = database
+
+    def _get_queue(self):
+        """Create the queue of sessions on first use, inside the event loop."""
+        if self._sessions is None:
+            self._sessions = asyncio.LifoQueue(self.size)
+        return self._sessions
+
+    async def _fill(self):
+        """Create the pool's sessions, unless already done."""
+        if self._filled:
+            return
+        if self._fill_lock is None:
+            self._fill_lock = asyncio.Lock()
+
+        async with self._fill_lock:
+            if self._filled:
+                return
+            sessions = self._get_queue()
+            api = self._database.spanner_api
+            metadata = _metadata_with_prefix(self._database.name)
+
+            while not sessions.full():
+                count = min(_MAX_SESSIONS_PER_BATCH, self.size - sessions.qsize())
+                resp = await api.batch_create_sessions(
+                    database=self._database.name,
+                    session_count=count,
+                    metadata=metadata,
+                )
+                for session_pb in resp.session:
+                    session = self._new_session()
+                    session._session_id = session_pb.name.split("/")[-1]
+                    session._last_use_time = _NOW()
+                    sessions.put_nowait(session)
+            self._filled = True
+
+    async def get(self, timeout=None):  # pylint: disable=arguments-differ
+        """Check a session out from the pool.
+
+        :type timeout: int
+        :param timeout: seconds to wait for an available session
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+        :returns: an existing session from the pool.
+        :raises: :exc:`asyncio.TimeoutError` if no session is returned to
+                 the pool in time.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        await self._fill()
+        return await asyncio.wait_for(self._get_queue().get(), timeout)
+
+    def put(self, session):
+        """Return a session to the pool.
+
+        Never waits:  if the pool is full, raises.
+
+        :type session: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+        :param session: the session being returned.
+
+        :raises: :exc:`asyncio.QueueFull` if the queue is full.
+        """
+        session._last_use_time = _NOW()
+        self._get_queue().put_nowait(session)
+
+    async def clear(self):
+        """Delete all sessions in the pool."""
+        sessions = self._get_queue()
+        while not sessions.empty():
+            session = sessions.get_nowait()
+            await session.delete()
+        self._filled = False
+
+    def session(self, **kwargs):
+        """Check out a session from the pool.
+
+        :param kwargs: (optional) keyword arguments, passed through to
+                       :meth:`get`.
+
+        :rtype: :class:`AsyncSessionCheckout`
+        :returns: a checkout instance, to be used as an asynchronous context
+                  manager for accessing the session and returning it to the
+                  pool.
+        """
+        return AsyncSessionCheckout(self, **kwargs)
+
+
+class AsyncSessionCheckout(object):
+    """Asynchronous context manager: hold session checked out from a pool.
+
+    :type pool: :class:`AsyncFixedSizePool`
+    :param pool: Pool from which to check out a session.
+
+    :param kwargs: extra keyword arguments to be passed to :meth:`pool.get`.
+    """
+
+    _session = None  # Not checked out until '__aenter__'.
+
+    def __init__(self, pool, **kwargs):
+        self._pool = pool
+        self._kwargs = kwargs.copy()
+
+    async def __aenter__(self):
+        self._session = await self._pool.get(**self._kwargs)
+        return self._session
+
+    async def __aexit__(self, *ignored):
+        self._pool.put(self._session)
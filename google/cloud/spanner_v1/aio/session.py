@@ -0,0 +1,287 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wrapper for Cloud Spanner Session objects, for asyncio."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+import asyncio
+import inspect
+import time
+
+# pylint: disable=ungrouped-imports
+from google.api_core.exceptions import Aborted
+from google.api_core.exceptions import GoogleAPICallError
+from google.api_core.exceptions import NotFound
+from google.cloud.spanner_v1 import CreateSessionRequest
+from google.cloud.spanner_v1 import ExecuteSqlRequest
+from google.cloud.spanner_v1._helpers import _metadata_with_prefix
+from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.aio.batch import AsyncBatch
+from google.cloud.spanner_v1.aio.snapshot import AsyncSnapshot
+from google.cloud.spanner_v1.aio.transaction import AsyncTransaction
+from google.cloud.spanner_v1.retry_policy import DEFAULT_RETRY_POLICY
+from google.cloud.spanner_v1.session import Session
+
+# pylint: enable=ungrouped-imports
+
+
+class AsyncSession(Session):
+    """Representation of a Cloud Spanner Session, for asyncio.
+
+    API requests are coroutines, sent with the
+    :class:`~google.cloud.spanner_v1.services.spanner.SpannerAsyncClient` of
+    the database.  Snapshots, batches and transactions created from the
+    session are their asyncio counterparts.
+
+    :type database: :class:`~google.cloud.spanner_v1.aio.database.AsyncDatabase`
+    :param database: The database to which the session is bound.
+
+    :type labels: dict (str -> str)
+    :param labels: (Optional) User-assigned labels for the session.
+    """
+
+    async def create(self):
+        """Create this session, bound to its database.
+
+        See
+        https://cloud.google.com/spanner/reference/rpc/google.spanner.v1#google.spanner.v1.Spanner.CreateSession
+
+        :raises: :exc:`ValueError` if :attr:`session_id` is already set.
+        """
+        if self._session_id is not None:
+            raise ValueError("Session ID already set by back-end")
+        api = self._database.spanner_api
+        metadata = _metadata_with_prefix(self._database.name)
+
+        request = CreateSessionRequest(database=self._database.name)
+
+        if self._labels:
+            request.session.labels = self._labels
+
+        with trace_call("CloudSpanner.CreateSession", self, self._labels):
+            session_pb = await api.create_session(request=request, metadata=metadata)
+        self._session_id = session_pb.name.split("/")[-1]
+
+    async def exists(self):
+        """Test for the existence of this session.
+
+        :rtype: bool
+        :returns: True if the session exists on the back-end, else False.
+        """
+        if self._session_id is None:
+            return False
+        api = self._database.spanner_api
+        metadata = _metadata_with_prefix(self._database.name)
+
+        with trace_call("CloudSpanner.GetSession", self) as span:
+            try:
+                await api.get_session(name=self.name, metadata=metadata)
+                if span:
+                    span.set_attribute("session_found", True)
+            except NotFound:
+                if span:
+                    span.set_attribute("session_found", False)
+                return False
+
+        return True
+
+    async def delete(self):
+        """Delete this session.
+
+        :raises ValueError: if :attr:`session_id` is not already set.
+        :raises NotFound: if the session does not exist
+        """
+        if self._session_id is None:
+            raise ValueError("Session ID not set by back-end")
+        api = self._database.spanner_api
+        metadata = _metadata_with_prefix(self._database.name)
+        with trace_call("CloudSpanner.DeleteSession", self):
+            await api.delete_session(name=self.name, metadata=metadata)
+
+    async def ping(self):
+        """Ping the session to keep it alive by executing "SELECT 1".
+
+        :raises: ValueError: if :attr:`session_id` is not already set.
+        """
+        if self._session_id is None:
+            raise ValueError("Session ID not set by back-end")
+        api = self._database.spanner_api
+        metadata = _metadata_with_prefix(self._database.name)
+        request = ExecuteSqlRequest(session=self.name, sql="SELECT 1")
+        await api.execute_sql(request=request, metadata=metadata)
+
+    async def _recreate(self):
+        """Replace this session, after the back-end deleted it.
+
+        Keeps this object, e.g. its place in a pool, but creates a new
+        back-end session for it, discarding any transaction state.
+        """
+        self._session_id = None
+        self._transaction = None
+        await self.create()
+
+    def snapshot(self, **kw):
+        """Create a snapshot to perform a set of reads with shared staleness.
+
+        :type kw: dict
+        :param kw: Passed through to
+                   :class:`~google.cloud.spanner_v1.aio.snapshot.AsyncSnapshot`
+                   ctor.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.snapshot.AsyncSnapshot`
+        :returns: a snapshot bound to this session
+        :raises ValueError: if the session has not yet been created.
+        """
+        if self._session_id is None:
+            raise ValueError("Session has not been created.")
+
+        return AsyncSnapshot(self, **kw)
+
+    def batch(self):
+        """Factory to create a batch for this session.
+
+        :rtype: :class:`~google.cloud.spanner_v1.aio.batch.AsyncBatch`
+        :returns: a batch bound to this session
+        :raises ValueError: if the session has not yet been created.
+        """
+        if self._session_id is None:
+            raise ValueError("Session has not been created.")
+
+        return AsyncBatch(self)
+
+    def transaction(self):
+        """Create a read-write transaction.
+
+        :rtype:
+            :class:`~google.cloud.spanner_v1.aio.transaction.AsyncTransaction`
+        :returns: a transaction bound to this session
+        :raises ValueError: if the session has not yet been created.
+        """
+        if self._session_id is None:
+            raise ValueError("Session has not been created.")
+
+        if self._transaction is not None:
+            self._transaction.rolled_back = True
+            del self._transaction
+
+        txn = self._transaction = AsyncTransaction(self)
+        return txn
+
+    async def run_in_transaction(self, func, *args, **kw):
+        """Perform a unit of work in a transaction, retrying on abort.
+
+        :type func: callable
+        :param func: coroutine function taking a required positional
+                     argument, the transaction, and additional positional /
+                     keyword arguments as supplied by the caller.  Plain
+                     functions are also accepted.
+
+        :type args: tuple
+        :param args: additional positional arguments to be passed to ``func``.
+
+        :type kw: dict
+        :param kw: (Optional) keyword arguments to be passed to ``func``.
+                   If passed, "timeout_secs" will be removed and used to
+                   override the default retry timeout which defines maximum
+                   timestamp to continue retrying the transaction.  If passed,
+                   "retry_policy" will be removed and used instead of the
+                   database's
+                   :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`.
+
+        :rtype: Any
+        :returns: The return value of ``func``.
+
+        :raises Exception:
+            reraises any non-ABORT execptions raised by ``func``.
+        """
+        policy = kw.pop("retry_policy", None) or self._database.retry_policy
+        stats = self._database.abort_stats
+        deadline = time.time() + kw.pop("timeout_secs", policy.deadline)
+        attempts = 0
+
+        while True:
+            if self._transaction is None:
+                txn = self.transaction()
+            else:
+                txn = self._transaction
+            if txn._transaction_id is None:
+                await txn.begin()
+
+            try:
+                attempts += 1
+                return_value = func(txn, *args, **kw)
+                if inspect.isawaitable(return_value):
+                    return_value = await return_value
+            except Aborted as exc:
+                del self._transaction
+                stats.record_abort()
+                await _delay_until_retry(exc, deadline, attempts, policy, stats)
+                continue
+            except GoogleAPICallError:
+                del self._transaction
+                raise
+            except Exception:
+                await txn.rollback()
+                raise
+
+            try:
+                await txn.commit()
+            except Aborted as exc:
+                del self._transaction
+                stats.record_abort()
+                await _delay_until_retry(exc, deadline, attempts, policy, stats)
+            except GoogleAPICallError:
+                del self._transaction
+                raise
+            else:
+                stats.record_commit()
+                return return_value
+
+
+async def _delay_until_retry(exc, deadline, attempts, retry_policy=None, stats=None):
+    """Helper for :meth:`AsyncSession.run_in_transaction`.
+
+    Detect retryable abort, and wait as long as the retry policy says,
+    without blocking the event loop.
+
+    :type exc: :class:`google.api_core.exceptions.Aborted`
+    :param exc: exception for aborted transaction
+
+    :type deadline: float
+    :param deadline: maximum timestamp to continue retrying the transaction.
+
+    :type attempts: int
+    :param attempts: number of call retries
+
+    :type retry_policy:
+        :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+    :param retry_policy: (Optional) policy deciding the delay;  defaults to
+                         :data:`~google.cloud.spanner_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+
+    :type stats: :class:`~google.cloud.spanner_v1.retry_policy.AbortStats`
+    :param stats: (Optional) abort statistics of the database.
+    """
+    if retry_policy is None:
+        retry_policy = DEFAULT_RETRY_POLICY
+
+    delay = retry_policy.retry_delay(exc, attempts, deadline, stats)
+    if delay is None:
+        raise exc
+
+    await asyncio.sleep(delay)
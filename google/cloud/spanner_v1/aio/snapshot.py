@@ -0,0 +1,359 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Model a set of read-only queries to a database as an asyncio snapshot."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+from google.api_core.exceptions import InternalServerError
+from google.api_core.exceptions import ServiceUnavailable
+import google.api_core.gapic_v1.method
+from google.cloud.spanner_v1._helpers import _metadata_with_prefix
+from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.aio.streamed import AsyncStreamedResultSet
+from google.cloud.spanner_v1.snapshot import BUFFER_OVERFLOW_FLUSH
+from google.cloud.spanner_v1.snapshot import BUFFER_OVERFLOW_RAISE
+from google.cloud.spanner_v1.snapshot import BufferExceeded
+from google.cloud.spanner_v1.snapshot import Snapshot
+from google.cloud.spanner_v1.snapshot import _BUFFER_OVERFLOW_POLICIES
+from google.cloud.spanner_v1.snapshot import _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES
+from google.cloud.spanner_v1.snapshot import _SnapshotBase
+from google.cloud.spanner_v1.snapshot import _item_size
+from google.cloud.spanner_v1.streamed import BYTES_AS_BASE64
+from google.cloud.spanner_v1.streamed import TIMESTAMP_AS_DATETIME
+
+
+def _resumable(method, request, **kw):
+    """Curry a streaming API method, for :func:`_restart_on_unavailable`.
+
+    :type method: callable
+    :param method: ``streaming_read`` or ``execute_streaming_sql`` of the
+                   asynchronous API client.
+
+    :type request: :class:`~google.cloud.spanner_v1.ReadRequest` or
+                   :class:`~google.cloud.spanner_v1.ExecuteSqlRequest`
+    :param request: the request to send
+
+    :rtype: callable
+    :returns: function taking an optional ``resume_token``, set on the
+              request before it is sent, and returning an awaitable which
+              resolves to the stream of partial result sets.
+    """
+
+    def restart(resume_token=b""):
+        request.resume_token = resume_token
+        return method(request=request, **kw)
+
+    return restart
+
+
+async def _restart_on_unavailable(
+    restart,
+    trace_name=None,
+    session=None,
+    attributes=None,
+    max_buffer_bytes=None,
+    buffer_overflow=BUFFER_OVERFLOW_FLUSH,
+):
+    """Restart iteration after :exc:`.ServiceUnavailable`, with asyncio.
+
+    Same semantics as
+    :func:`google.cloud.spanner_v1.snapshot._restart_on_unavailable`:  items
+    are held back until one carrying a resume token is received, and the
+    stream is restarted from the last resume token after
+    :exc:`.ServiceUnavailable`, or after an :exc:`.InternalServerError`
+    reporting a reset stream.
+
+    :type restart: callable
+    :param restart: curried function returning an awaitable, which resolves
+                    to the asynchronous stream of partial result sets.
+
+    :type max_buffer_bytes: int
+    :param max_buffer_bytes: (Optional) limit on the serialized size of the
+        items held back.  If not passed, the buffer is unbounded.
+
+    :type buffer_overflow: str
+    :param buffer_overflow: policy applied once ``max_buffer_bytes`` is
+        exceeded:  one of :data:`BUFFER_OVERFLOW_FLUSH` or
+        :data:`BUFFER_OVERFLOW_RAISE`.
+
+    :raises BufferExceeded:
+        if ``max_buffer_bytes`` is exceeded and ``buffer_overflow`` is
+        :data:`BUFFER_OVERFLOW_RAISE`.
+    """
+    resume_token = b""
+    item_buffer = []
+    buffer_bytes = 0
+    resumable = True
+    with trace_call(trace_name, session, attributes):
+        iterator = await restart()
+    while True:
+        try:
+            async for item in iterator:
+                item_buffer.append(item)
+                if item.resume_token:
+                    resume_token = item.resume_token
+                    resumable = True
+                    break
+                if max_buffer_bytes is not None:
+                    buffer_bytes += _item_size(item)
+                    if buffer_bytes > max_buffer_bytes:
+                        if buffer_overflow == BUFFER_OVERFLOW_RAISE:
+                            raise BufferExceeded(max_buffer_bytes)
+                        resumable = False
+                        break
+        except ServiceUnavailable:
+            if not resumable:
+                raise
+            del item_buffer[:]
+            buffer_bytes = 0
+            with trace_call(trace_name, session, attributes):
+                iterator = await restart(resume_token=resume_token)
+            continue
+        except InternalServerError as exc:
+            resumable_error = any(
+                resumable_message in exc.message
+                for resumable_message in _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES
+            )
+            if not resumable_error or not resumable:
+                raise
+            del item_buffer[:]
+            buffer_bytes = 0
+            with trace_call(trace_name, session, attributes):
+                iterator = await restart(resume_token=resume_token)
+            continue
+
+        if len(item_buffer) == 0:
+            break
+
+        for item in item_buffer:
+            yield item
+
+        del item_buffer[:]
+        buffer_bytes = 0
+
+
+def _make_result_iterator(
+    restart, trace_name, session, attributes, max_buffer_bytes, buffer_overflow
+):
+    """Helper for :meth:`_AsyncSnapshotBase.read` / :meth:`execute_sql`.
+
+    :rtype: async iterator
+    :returns: partial result sets, resumed after transient errors.
+
+    :raises ValueError: for an unknown ``buffer_overflow`` policy.
+    """
+    if buffer_overflow not in _BUFFER_OVERFLOW_POLICIES:
+        raise ValueError("Unknown buffer overflow policy: %r" % (buffer_overflow,))
+    return _restart_on_unavailable(
+        restart,
+        trace_name,
+        session,
+        attributes,
+        max_buffer_bytes=max_buffer_bytes,
+        buffer_overflow=buffer_overflow,
+    )
+
+
+class _AsyncSnapshotBase(_SnapshotBase):
+    """Base class for asyncio snapshots and transactions.
+
+    Requests are built as for the synchronous classes, then sent with the
+    :class:`~google.cloud.spanner_v1.services.spanner.SpannerAsyncClient` of
+    the session's database.
+
+    :type session: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+    :param session: the session used to perform the requests
+    """
+
+    def _make_result_set(
+        self, iterator, row_factory, bytes_decoding, timestamp_decoding
+    ):
+        """Helper for :meth:`read` / :meth:`execute_sql`."""
+        return AsyncStreamedResultSet(
+            iterator,
+            source=self if self._multi_use else None,
+            row_factory=row_factory,
+            bytes_decoding=bytes_decoding,
+            timestamp_decoding=timestamp_decoding,
+        )
+
+    def read(
+        self,
+        table,
+        columns,
+        keyset,
+        index="",
+        limit=0,
+        partition=None,
+        row_factory=None,
+        max_buffer_bytes=None,
+        buffer_overflow=BUFFER_OVERFLOW_FLUSH,
+        bytes_decoding=BYTES_AS_BASE64,
+        timestamp_decoding=TIMESTAMP_AS_DATETIME,
+    ):
+        """Perform a ``StreamingRead`` API request for rows in a table.
+
+        The request is sent when the result set is first iterated, and
+        resumed from the last resume token if the stream is interrupted.
+        See :meth:`google.cloud.spanner_v1.snapshot.Snapshot.read` for the
+        parameters.
+
+        :rtype:
+            :class:`~google.cloud.spanner_v1.aio.streamed.AsyncStreamedResultSet`
+        :returns: a result set instance which can be used to consume rows.
+
+        :raises ValueError:
+            for reuse of single-use snapshots, if a transaction ID is
+            already pending for multiple-use snapshots, or for an unknown
+            ``buffer_overflow`` policy.
+        """
+        request = self._make_read_request(
+            table, columns, keyset, index, limit, partition
+        )
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        restart = _resumable(api.streaming_read, request, metadata=metadata)
+
+        trace_attributes = {"table_id": table, "columns": columns}
+        iterator = _make_result_iterator(
+            restart,
+            "CloudSpanner.ReadOnlyTransaction",
+            self._session,
+            trace_attributes,
+            max_buffer_bytes,
+            buffer_overflow,
+        )
+
+        self._read_request_count += 1
+
+        return self._make_result_set(
+            iterator, row_factory, bytes_decoding, timestamp_decoding
+        )
+
+    def execute_sql(
+        self,
+        sql,
+        params=None,
+        param_types=None,
+        query_mode=None,
+        query_options=None,
+        partition=None,
+        retry=google.api_core.gapic_v1.method.DEFAULT,
+        timeout=google.api_core.gapic_v1.method.DEFAULT,
+        row_factory=None,
+        max_buffer_bytes=None,
+        buffer_overflow=BUFFER_OVERFLOW_FLUSH,
+        bytes_decoding=BYTES_AS_BASE64,
+        timestamp_decoding=TIMESTAMP_AS_DATETIME,
+    ):
+        """Perform an ``ExecuteStreamingSql`` API request.
+
+        The request is sent when the result set is first iterated, and
+        resumed from the last resume token if the stream is interrupted.
+        See :meth:`google.cloud.spanner_v1.snapshot.Snapshot.execute_sql`
+        for the parameters.
+
+        :rtype:
+            :class:`~google.cloud.spanner_v1.aio.streamed.AsyncStreamedResultSet`
+        :returns: a result set instance which can be used to consume rows.
+
+        :raises ValueError:
+            for reuse of single-use snapshots, if a transaction ID is
+            already pending for multiple-use snapshots, or for an unknown
+            ``buffer_overflow`` policy.
+        """
+        request = self._make_execute_sql_request(
+            sql, params, param_types, query_mode, query_options, partition
+        )
+        database = self._session._database
+        metadata = _metadata_with_prefix(database.name)
+        api = database.spanner_api
+        restart = _resumable(
+            api.execute_streaming_sql,
+            request,
+            metadata=metadata,
+            retry=retry,
+            timeout=timeout,
+        )
+
+        trace_attributes = {"db.statement": sql}
+        iterator = _make_result_iterator(
+            restart,
+            "CloudSpanner.ReadWriteTransaction",
+            self._session,
+            trace_attributes,
+            max_buffer_bytes,
+            buffer_overflow,
+        )
+
+        self._read_request_count += 1
+        self._execute_sql_count += 1
+
+        return self._make_result_set(
+            iterator, row_factory, bytes_decoding, timestamp_decoding
+        )
+
+    def partition_read(self, *args, **kw):
+        raise TypeError(
+            "Partitioned reads are not supported with asyncio:  use "
+            "'AsyncDatabase.sync_database.batch_snapshot()'."
+        )
+
+    def partition_query(self, *args, **kw):
+        raise TypeError(
+            "Partitioned queries are not supported with asyncio:  use "
+            "'AsyncDatabase.sync_database.batch_snapshot()'."
+        )
+
+
+class AsyncSnapshot(_AsyncSnapshotBase, Snapshot):
+    """Allow a set of reads / SQL statements with shared staleness.
+
+    Same options as :class:`~google.cloud.spanner_v1.snapshot.Snapshot`,
+    but result sets are consumed with ``async for``, and :meth:`begin` is a
+    coroutine.
+
+    :type session: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+    :param session: The session used to perform the reads.
+    """
+
+    async def begin(self):
+        """Begin a read-only transaction on the database.
+
+        :rtype: bytes
+        :returns: the ID for the newly-begun transaction.
+
+        :raises ValueError:
+            if the transaction is already begun, committed, or rolled back.
+        """
+        self._check_begin()
+
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        txn_selector = self._make_txn_selector()
+        with trace_call("CloudSpanner.BeginTransaction", self._session):
+            response = await api.begin_transaction(
+                session=self._session.name,
+                options=txn_selector.begin,
+                metadata=metadata,
+            )
+        self._transaction_id = response.id
+        return self._transaction_id
@@ -0,0 +1,153 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wrapper for streaming results, consumed with ``async for``."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+from google.cloud import exceptions
+from google.cloud.spanner_v1.streamed import StreamedResultSet
+
+
+class AsyncStreamedResultSet(StreamedResultSet):
+    """Process an asynchronous stream of partial result sets into rows.
+
+    Rows are parsed and chunked values merged exactly as by
+    :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`, but
+    responses are awaited:  iterate with ``async for``.
+
+    :type response_iterator:
+    :param response_iterator:
+        Asynchronous iterator yielding
+        :class:`~google.cloud.spanner_v1.PartialResultSet` instances.
+
+    See :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet` for
+    the other parameters.
+    """
+
+    async def _read_values(self):
+        """Await the next partial result set from the stream.
+
+        :rtype: list
+        :returns: see
+            :meth:`~google.cloud.spanner_v1.streamed.StreamedResultSet._read_values`.
+        :raises: :exc:`StopAsyncIteration` at the end of the stream.
+        """
+        response = await self._response_iterator.__anext__()
+        return self._process_response(response)
+
+    async def _consume_next(self):
+        """Consume the next partial result set from the stream.
+
+        Parse the result set into new/existing rows in :attr:`_rows`
+        """
+        self._merge_values(await self._read_values())
+
+    def __iter__(self):
+        raise TypeError("Use 'async for' to iterate an AsyncStreamedResultSet.")
+
+    def __aiter__(self):
+        return self._iter_rows()
+
+    async def _iter_rows(self):
+        """Helper for :meth:`__aiter__`."""
+        while True:
+            rows, self._rows = self._rows, []
+            for row in rows:
+                yield row
+            try:
+                await self._consume_next()
+            except StopAsyncIteration:
+                return
+
+    async def iter_column_batches(self, use_numpy=False):
+        """Iterate over the results, one batch of columns at a time.
+
+        Use with ``async for``.  See
+        :meth:`~google.cloud.spanner_v1.streamed.StreamedResultSet.iter_column_batches`.
+
+        :type use_numpy: bool
+        :param use_numpy: (Optional) return NumPy arrays for numeric and
+                          boolean columns.  Requires ``numpy``.
+        """
+        self._check_column_decoding(use_numpy)
+
+        while True:
+            try:
+                values = await self._read_values()
+            except StopAsyncIteration:
+                return
+            columns = self._decode_columns(values, use_numpy)
+            if columns and len(columns[0]):
+                yield columns
+
+    async def to_columns(self, use_numpy=False):
+        """Consume all results, returning them as columns.
+
+        See
+        :meth:`~google.cloud.spanner_v1.streamed.StreamedResultSet.to_columns`.
+
+        :type use_numpy: bool
+        :param use_numpy: (Optional) return NumPy arrays for numeric and
+                          boolean columns.  Requires ``numpy``.
+
+        :rtype: list
+        :returns: one column per entry in :attr:`fields`.
+        """
+        batches = []
+        async for batch in self.iter_column_batches(use_numpy=use_numpy):
+            batches.append(batch)
+        return self._join_column_batches(batches, use_numpy)
+
+    async def one(self):
+        """Return exactly one result, or raise an exception.
+
+        :raises: :exc:`NotFound`: If there are no results.
+        :raises: :exc:`ValueError`: If there are multiple results.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        answer = await self.one_or_none()
+        if answer is None:
+            raise exceptions.NotFound("No rows matched the given query.")
+        return answer
+
+    async def one_or_none(self):
+        """Return exactly one result, or None if there are no results.
+
+        :raises: :exc:`ValueError`: If there are multiple results.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        if self._metadata is not None:
+            raise RuntimeError(
+                "Can not call `.one` or `.one_or_none` after "
+                "stream consumption has already started."
+            )
+
+        iterator = self.__aiter__()
+        try:
+            answer = await iterator.__anext__()
+        except StopAsyncIteration:
+            return None
+
+        try:
+            await iterator.__anext__()
+        except StopAsyncIteration:
+            return answer
+        raise ValueError("Expected one result; got more.")
@@ -0,0 +1,187 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Spanner read-write transaction support for asyncio."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+from google.cloud.spanner_v1 import TransactionOptions
+from google.cloud.spanner_v1 import TransactionSelector
+from google.cloud.spanner_v1._helpers import _metadata_with_prefix
+from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.aio.snapshot import _AsyncSnapshotBase
+from google.cloud.spanner_v1.transaction import Transaction
+
+
+class AsyncTransaction(_AsyncSnapshotBase, Transaction):
+    """Implement read-write transaction semantics for a session, with asyncio.
+
+    Mutations are added as for
+    :class:`~google.cloud.spanner_v1.transaction.Transaction`;  API requests
+    are coroutines, and result sets are consumed with ``async for``.  Use as
+    an asynchronous context manager to begin the transaction, then commit it
+    when the block exits without an exception, or roll it back.
+
+    :type session: :class:`~google.cloud.spanner_v1.aio.session.AsyncSession`
+    :param session: the session used to perform the commit
+
+    :raises ValueError: if session has an existing transaction
+    """
+
+    def _make_txn_selector(self):
+        """Helper for :meth:`read` / :meth:`execute_sql`.
+
+        Unlike :class:`~google.cloud.spanner_v1.transaction.Transaction`, the
+        transaction must be begun explicitly with :meth:`begin`.
+
+        :rtype:
+            :class:`~.transaction_pb2.TransactionSelector`
+        :returns: a selector configured for read-write transaction semantics.
+        """
+        self._check_state()
+        return TransactionSelector(id=self._transaction_id)
+
+    async def begin(self):
+        """Begin a transaction on the database.
+
+        :rtype: bytes
+        :returns: the ID for the newly-begun transaction.
+        :raises ValueError:
+            if the transaction is already begun, committed, or rolled back.
+        """
+        self._check_begin()
+
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        txn_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
+        with trace_call("CloudSpanner.BeginTransaction", self._session):
+            response = await api.begin_transaction(
+                session=self._session.name, options=txn_options, metadata=metadata
+            )
+        self._transaction_id = response.id
+        return self._transaction_id
+
+    async def rollback(self):
+        """Roll back a transaction on the database."""
+        self._check_state()
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        with trace_call("CloudSpanner.Rollback", self._session):
+            await api.rollback(
+                session=self._session.name,
+                transaction_id=self._transaction_id,
+                metadata=metadata,
+            )
+        self.rolled_back = True
+        del self._session._transaction
+
+    async def commit(self):
+        """Commit mutations to the database.
+
+        :rtype: datetime
+        :returns: timestamp of the committed changes.
+        :raises ValueError: if the transaction is not begun, or already
+                            committed or rolled back.
+        """
+        self._check_state()
+
+        database = self._session._database
+        api = database.spanner_api
+        metadata = _metadata_with_prefix(database.name)
+        trace_attributes = {"num_mutations": len(self._mutations)}
+        with trace_call("CloudSpanner.Commit", self._session, trace_attributes):
+            response = await api.commit(
+                session=self._session.name,
+                mutations=self._mutations,
+                transaction_id=self._transaction_id,
+                metadata=metadata,
+            )
+        self.committed = response.commit_timestamp
+        del self._session._transaction
+        return self.committed
+
+    async def execute_update(
+        self, dml, params=None, param_types=None, query_mode=None, query_options=None
+    ):
+        """Perform an ``ExecuteSql`` API request with DML.
+
+        See
+        :meth:`google.cloud.spanner_v1.transaction.Transaction.execute_update`
+        for the parameters.
+
+        :rtype: int
+        :returns: Count of rows affected by the DML statement.
+        """
+        request = self._make_execute_update_request(
+            dml, params, param_types, query_mode, query_options
+        )
+        database = self._session._database
+        metadata = _metadata_with_prefix(database.name)
+        api = database.spanner_api
+
+        trace_attributes = {"db.statement": dml}
+        with trace_call(
+            "CloudSpanner.ReadWriteTransaction", self._session, trace_attributes
+        ):
+            response = await api.execute_sql(request=request, metadata=metadata)
+        return response.stats.row_count_exact
+
+    async def batch_update(self, statements):
+        """Perform a batch of DML statements via an ``ExecuteBatchDml`` request.
+
+        See
+        :meth:`google.cloud.spanner_v1.transaction.Transaction.batch_update`
+        for the parameters.
+
+        :rtype:
+            Tuple(status, Sequence[int])
+        :returns:
+            Status code, plus counts of rows affected by each completed DML
+            statement.
+        """
+        request = self._make_batch_update_request(statements)
+        database = self._session._database
+        metadata = _metadata_with_prefix(database.name)
+        api = database.spanner_api
+
+        # Get just the queries from the DML statement batch
+        queries = [statement.sql for statement in request.statements]
+        trace_attributes = {"db.statement": ";".join(queries)}
+        with trace_call("CloudSpanner.DMLTransaction", self._session, trace_attributes):
+            response = await api.execute_batch_dml(request=request, metadata=metadata)
+        row_counts = [
+            result_set.stats.row_count_exact for result_set in response.result_sets
+        ]
+        return response.status, row_counts
+
+    def __enter__(self):
+        raise TypeError("Use 'async with' with an AsyncTransaction.")
+
+    async def __aenter__(self):
+        """Begin ``async with`` block."""
+        await self.begin()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """End ``async with`` block."""
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
@@ -0,0 +1,557 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load large numbers of rows in concurrent, size-limited commits."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+from concurrent import futures
+import threading
+import time
+
+from google.api_core.exceptions import Aborted
+from google.api_core.retry import Retry
+from google.api_core.retry import if_exception_type
+
+from google.cloud.spanner_v1 import Mutation
+from google.cloud.spanner_v1 import param_types
+
+# pylint: disable=ungrouped-imports
+from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+# pylint: enable=ungrouped-imports
+
+DEFAULT_MAX_MUTATIONS = 20000
+"""Default maximum number of mutations per commit:  Cloud Spanner's limit.
+
+Each row written counts as one mutation per column."""
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+"""Default maximum (estimated) size of the mutations in a commit, in bytes."""
+
+DEFAULT_MAX_IN_FLIGHT = 4
+"""Default maximum number of commits in progress at once."""
+
+DEFAULT_BULK_RETRY = Retry(
+    predicate=if_exception_type(Aborted),
+    initial=0.1,
+    maximum=32.0,
+    multiplier=1.3,
+    deadline=600.0,
+)
+"""Default retry for the commits of a :class:`BulkWriter`.
+
+Only aborted commits are retried:  they are known not to have been applied,
+whereas retrying an insert which failed otherwise might find its rows
+already written."""
+
+_PRIMARY_KEY_SQL = """\
+SELECT COLUMN_NAME, COLUMN_ORDERING
+FROM INFORMATION_SCHEMA.INDEX_COLUMNS
+WHERE TABLE_SCHEMA = '' AND TABLE_NAME = @table AND INDEX_NAME = 'PRIMARY_KEY'
+ORDER BY ORDINAL_POSITION"""
+
+
+class BulkWriterStats(object):
+    """Progress of a :class:`BulkWriter`.
+
+    Counts cover committed writes only.
+
+    :type rows: int
+    :param rows: number of rows committed.
+
+    :type mutations: int
+    :param mutations: number of mutations committed, i.e. rows times
+                      columns.
+
+    :type bytes: int
+    :param bytes: estimated size of the committed mutations.
+
+    :type commits: int
+    :param commits: number of successful commits.
+
+    :type retries: int
+    :param retries: number of commits retried.
+
+    :type elapsed: float
+    :param elapsed: seconds since the first row was written, up to now or
+                    until the writer was closed.
+    """
+
+    def __init__(self, rows, mutations, bytes, commits, retries, elapsed):
+        self.rows = rows
+        self.mutations = mutations
+        self.bytes = bytes
+        self.commits = commits
+        self.retries = retries
+        self.elapsed = elapsed
+
+    @property
+    def rows_per_second(self):
+        """Throughput of the writer.
+
+        :rtype: float
+        :returns: rows committed per second, or 0 if nothing was written.
+        """
+        if not self.elapsed:
+            return 0.0
+        return self.rows / self.elapsed
+
+    def __repr__(self):
+        return (
+            "BulkWriterStats(rows=%d, mutations=%d, bytes=%d, commits=%d, "
+            "retries=%d, elapsed=%.3f)"
+            % (
+                self.rows,
+                self.mutations,
+                self.bytes,
+                self.commits,
+                self.retries,
+                self.elapsed,
+            )
+        )
+
+
+class BulkWriter(object):
+    """Write an unbounded stream of rows in concurrent commits.
+
+    Rows are packed into commits holding at most ``max_mutations``
+    mutations and ``max_bytes`` bytes, each committed as a batch on a
+    session from the database's pool.  Up to ``max_in_flight`` commits run
+    at once, in threads:  writing blocks while that many are in progress, so
+    that memory use stays bounded however many rows are written.  The
+    database's pool should thus hold at least ``max_in_flight`` sessions.
+
+    Commits are not atomic as a whole, and complete in any order.  The
+    first commit which fails is raised from the next call to a write
+    method, :meth:`flush` or :meth:`close`.
+
+    Use as a context manager, or call :meth:`close` when done:  rows are
+    only guaranteed to be committed once :meth:`flush` or :meth:`close`
+    returns.
+
+    With ``sort_buffer_rows``, rows written to a table are buffered, and
+    sorted by primary key before being packed:  each commit then holds rows
+    with contiguous keys, which usually live in few splits, making commits
+    cheaper than for rows in random key order.  The primary key of each table
+    is read from the database schema, unless given in ``key_columns``.  Rows
+    must include all key columns.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to write to.
+
+    :type max_mutations: int
+    :param max_mutations: (Optional) maximum number of mutations per commit.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) maximum size of the mutations in a commit,
+                      as estimated from their encoded values.  A single row
+                      larger than this is committed on its own.
+
+    :type max_in_flight: int
+    :param max_in_flight: (Optional) maximum number of commits in progress
+                          at once.
+
+    :type retry: :class:`~google.api_core.retry.Retry`
+    :param retry: (Optional) retry applied to each commit.  Pass ``None``
+                  to commit each batch only once.
+
+    :type sort_buffer_rows: int
+    :param sort_buffer_rows: (Optional) number of rows buffered per table,
+                             and sorted by primary key, before being packed
+                             into commits.  If not passed, rows are packed in
+                             the order they are written.
+
+    :type key_columns: dict
+    :param key_columns: (Optional) primary key columns, in key order, keyed
+                        by table name, for tables written with
+                        ``sort_buffer_rows``.  Key columns are assumed to be
+                        in ascending order.
+
+    :raises ValueError: if a limit is not positive.
+    """
+
+    def __init__(
+        self,
+        database,
+        max_mutations=DEFAULT_MAX_MUTATIONS,
+        max_bytes=DEFAULT_MAX_BYTES,
+        max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+        retry=DEFAULT_BULK_RETRY,
+        sort_buffer_rows=None,
+        key_columns=None,
+    ):
+        if max_mutations < 1 or max_bytes < 1 or max_in_flight < 1:
+            raise ValueError("Limits must be positive.")
+        if sort_buffer_rows is not None and sort_buffer_rows < 1:
+            raise ValueError("'sort_buffer_rows' must be positive.")
+        self._database = database
+        self._max_mutations = max_mutations
+        self._max_bytes = max_bytes
+        self._max_in_flight = max_in_flight
+        self._retry = retry
+        self._sort_buffer_rows = sort_buffer_rows
+        # Primary key, as (column name, descending) pairs, keyed by table.
+        self._primary_keys = {
+            table: [(column, False) for column in columns]
+            for table, columns in (key_columns or {}).items()
+        }
+        # Rows waiting to be sorted, keyed by (kind, table, columns).
+        self._sort_buffers = {}
+        self._executor = None
+        self._in_flight = set()
+        self._closed = False
+        # Commit being packed.
+        self._mutations = []
+        self._row_count = 0
+        self._mutation_count = 0
+        self._byte_count = 0
+        # Statistics, updated by the committing threads.
+        self._lock = threading.Lock()
+        self._committed_rows = 0
+        self._committed_mutations = 0
+        self._committed_bytes = 0
+        self._commits = 0
+        self._retries = 0
+        self._started = None
+        self._stopped = None
+
+    @property
+    def stats(self):
+        """Progress of the writer.
+
+        :rtype: :class:`BulkWriterStats`
+        :returns: counts of committed writes, and throughput.
+        """
+        if self._started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._stopped or time.monotonic()) - self._started
+        with self._lock:
+            return BulkWriterStats(
+                rows=self._committed_rows,
+                mutations=self._committed_mutations,
+                bytes=self._committed_bytes,
+                commits=self._commits,
+                retries=self._retries,
+                elapsed=elapsed,
+            )
+
+    def insert(self, table, columns, rows):
+        """Insert new table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type rows: iterable of lists
+        :param rows: Values to be modified;  consumed lazily.
+        """
+        self._write("insert", table, columns, rows)
+
+    def update(self, table, columns, rows):
+        """Update existing table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type rows: iterable of lists
+        :param rows: Values to be modified;  consumed lazily.
+        """
+        self._write("update", table, columns, rows)
+
+    def insert_or_update(self, table, columns, rows):
+        """Insert/update table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type rows: iterable of lists
+        :param rows: Values to be modified;  consumed lazily.
+        """
+        self._write("insert_or_update", table, columns, rows)
+
+    def replace(self, table, columns, rows):
+        """Replace table rows.
+
+        :type table: str
+        :param table: Name of the table to be modified.
+
+        :type columns: list of str
+        :param columns: Name of the table columns to be modified.
+
+        :type rows: iterable of lists
+        :param rows: Values to be modified;  consumed lazily.
+        """
+        self._write("replace", table, columns, rows)
+
+    def flush(self):
+        """Commit all rows written so far, waiting for all commits.
+
+        :raises ValueError: if the writer is closed.
+        :raises: the error of the first commit which failed.
+        """
+        self._check_state()
+        for buffer_key in list(self._sort_buffers):
+            self._pack_sorted(*buffer_key)
+        self._submit()
+        self._wait(futures.ALL_COMPLETED)
+
+    def close(self):
+        """Flush, then release the threads of the writer.
+
+        Does nothing if the writer is already closed.
+
+        :raises: the error of the first commit which failed.
+        """
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._shutdown()
+
+    def __enter__(self):
+        """Begin ``with`` block."""
+        self._check_state()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """End ``with`` block:  flush on success, else discard pending rows."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._shutdown()
+
+    def _check_state(self):
+        """Helper for public methods.
+
+        :raises ValueError: if the writer is closed.
+        """
+        if self._closed:
+            raise ValueError("BulkWriter is closed")
+
+    def _write(self, kind, table, columns, rows):
+        """Pack rows into commits, submitting each commit once full.
+
+        :type kind: str
+        :param kind: name of the :class:`~google.cloud.spanner_v1.Mutation`
+                     field, e.g. ``insert``.
+        """
+        self._check_state()
+        if self._started is None:
+            self._started = time.monotonic()
+        columns = tuple(columns)
+        if len(columns) > self._max_mutations:
+            raise ValueError(
+                "A row of %d columns exceeds 'max_mutations' (%d)."
+                % (len(columns), self._max_mutations)
+            )
+        if self._sort_buffer_rows is None:
+            self._pack(kind, table, columns, rows)
+            return
+
+        self._sort_key(table, columns)  # Fail early on missing key columns.
+        buffer_key = (kind, table, columns)
+        for row in rows:
+            buffer = self._sort_buffers.setdefault(buffer_key, [])
+            buffer.append(row)
+            if len(buffer) >= self._sort_buffer_rows:
+                self._pack_sorted(kind, table, columns)
+
+    def _pack_sorted(self, kind, table, columns):
+        """Sort the rows buffered for a write by key, then pack them.
+
+        The commit being packed is submitted first, so that commits hold
+        only rows from one sorted run.
+        """
+        rows = self._sort_buffers.pop((kind, table, columns))
+        rows.sort(key=self._sort_key(table, columns))
+        self._submit()
+        self._pack(kind, table, columns, rows)
+
+    def _sort_key(self, table, columns):
+        """Build a function returning the primary key of a row.
+
+        :rtype: callable
+        :raises ValueError: if ``columns`` lack a key column.
+        """
+        primary_key = self._primary_keys.get(table)
+        if primary_key is None:
+            primary_key = self._primary_keys[table] = self._read_primary_key(table)
+        try:
+            indexes = [
+                (columns.index(column), descending)
+                for column, descending in primary_key
+            ]
+        except ValueError:
+            raise ValueError(
+                "Sorting rows of %s requires key columns %s."
+                % (table, [column for column, _ in primary_key])
+            )
+
+        def sort_key(row):
+            key = []
+            for index, descending in indexes:
+                value = row[index]
+                # Spanner sorts NULL before any value.
+                part = (value is not None, value)
+                key.append(_Descending(part) if descending else part)
+            return key
+
+        return sort_key
+
+    def _read_primary_key(self, table):
+        """Read the primary key of a table from the database schema.
+
+        :rtype: list
+        :returns: ``(column name, descending)`` pairs, in key order.
+        :raises ValueError: if the table has no primary key.
+        """
+        with self._database.snapshot() as snapshot:
+            results = snapshot.execute_sql(
+                _PRIMARY_KEY_SQL,
+                params={"table": table},
+                param_types={"table": param_types.STRING},
+            )
+            primary_key = [(name, ordering == "DESC") for name, ordering in results]
+        if not primary_key:
+            raise ValueError("No primary key found for table %s." % (table,))
+        return primary_key
+
+    def _pack(self, kind, table, columns, rows):
+        """Pack rows into commits, submitting each commit once full."""
+        columns = list(columns)
+        width = len(columns)
+        overhead = len(table) + sum(len(column) for column in columns)
+        values = []
+
+        for row in rows:
+            value_pb = _make_list_value_pb(row)
+            size = value_pb.ByteSize()
+            if not values:
+                size += overhead
+            full = (
+                self._mutation_count + width > self._max_mutations
+                or self._byte_count + size > self._max_bytes
+            )
+            if full and self._mutation_count:
+                self._add_write(kind, table, columns, values)
+                self._submit()
+                if values:
+                    size += overhead
+                values = []
+            values.append(value_pb)
+            self._row_count += 1
+            self._mutation_count += width
+            self._byte_count += size
+
+        self._add_write(kind, table, columns, values)
+
+    def _add_write(self, kind, table, columns, values):
+        """Add a write of the given rows to the commit being packed."""
+        if values:
+            write = Mutation.Write(table=table, columns=columns, values=values)
+            self._mutations.append(Mutation(**{kind: write}))
+
+    def _submit(self):
+        """Submit the commit being packed, once fewer are in flight."""
+        if not self._mutations:
+            return
+        while len(self._in_flight) >= self._max_in_flight:
+            self._wait(futures.FIRST_COMPLETED)
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=self._max_in_flight
+            )
+        future = self._executor.submit(
+            self._commit,
+            self._mutations,
+            self._row_count,
+            self._mutation_count,
+            self._byte_count,
+        )
+        self._in_flight.add(future)
+        self._mutations = []
+        self._row_count = self._mutation_count = self._byte_count = 0
+
+    def _wait(self, return_when):
+        """Wait for commits in flight, raising the first error found."""
+        if not self._in_flight:
+            return
+        done, _ = futures.wait(self._in_flight, return_when=return_when)
+        self._in_flight -= done
+        for future in done:
+            future.result()
+
+    def _commit(self, mutations, row_count, mutation_count, byte_count):
+        """Commit a batch of mutations, in a worker thread."""
+        commit = self._commit_mutations
+        if self._retry is not None:
+            commit = self._retry(commit, on_error=self._on_retry)
+        commit(mutations)
+        with self._lock:
+            self._committed_rows += row_count
+            self._committed_mutations += mutation_count
+            self._committed_bytes += byte_count
+            self._commits += 1
+
+    def _commit_mutations(self, mutations):
+        """Helper for :meth:`_commit`."""
+        with self._database.batch() as batch:
+            batch._mutations.extend(mutations)
+
+    def _on_retry(self, exc):
+        """Count retried commits."""
+        with self._lock:
+            self._retries += 1
+
+    def _shutdown(self):
+        """Stop accepting rows, and release the worker threads."""
+        self._closed = True
+        if self._stopped is None and self._started is not None:
+            self._stopped = time.monotonic()
+        self._sort_buffers.clear()
+        for future in self._in_flight:
+            future.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class _Descending(object):
+    """Reverse the ordering of a key part, for descending key columns."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
@@ -20,17 +20,24 @@ from __future__ import absolute_import
 from future import standard_library
 standard_library.install_aliases()
 
+from concurrent import futures
 import copy
 import functools
 import grpc
+import itertools
+import os
 import re
 import threading
+import time
 
 import google.auth.credentials
 from google.api_core.retry import Retry
 from google.api_core.retry import if_exception_type
 from google.cloud.exceptions import NotFound
 from google.api_core.exceptions import Aborted
+from google.api_core.exceptions import DeadlineExceeded
+from google.api_core.exceptions import InternalServerError
+from google.api_core.exceptions import ServiceUnavailable
 import six
 
 # pylint: disable=ungrouped-imports
@@ -38,15 +45,27 @@ from google.cloud.spanner_admin_database_v1 import Database as DatabasePB
 from google.cloud.spanner_v1._helpers import (
     _merge_query_options,
     _metadata_with_prefix,
+    _session_not_found,
 )
+from google.cloud.spanner_v1._channel_pool import ChannelPool
 from google.cloud.spanner_v1.batch import Batch
+from google.cloud.spanner_v1.bulk_writer import BulkWriter
+from google.cloud.spanner_v1.bulk_writer import DEFAULT_BULK_RETRY
+from google.cloud.spanner_v1.bulk_writer import DEFAULT_MAX_BYTES
+from google.cloud.spanner_v1.bulk_writer import DEFAULT_MAX_IN_FLIGHT
+from google.cloud.spanner_v1.bulk_writer import DEFAULT_MAX_MUTATIONS
 from google.cloud.spanner_v1.keyset import KeySet
 from google.cloud.spanner_v1.pool import BurstyPool
 from google.cloud.spanner_v1.pool import SessionCheckout
+from google.cloud.spanner_v1.retry_policy import AbortStats
+from google.cloud.spanner_v1.retry_policy import DEFAULT_PDML_RETRY_POLICY
+from google.cloud.spanner_v1.retry_policy import DEFAULT_RETRY_POLICY
 from google.cloud.spanner_v1.session import Session
 from google.cloud.spanner_v1.snapshot import _restart_on_unavailable
 from google.cloud.spanner_v1.snapshot import Snapshot
 from google.cloud.spanner_v1.streamed import StreamedResultSet
+from google.cloud.spanner_v1.writers import FORMAT_CSV
+from google.cloud.spanner_v1.writers import get_writer_class
 from google.cloud.spanner_v1 import SpannerClient
 from google.cloud.spanner_v1.services.spanner.transports.grpc import (
     SpannerGrpcTransport,
@@ -54,6 +73,7 @@ from google.cloud.spanner_v1.services.spanner.transports.grpc import (
 from google.cloud.spanner_admin_database_v1 import CreateDatabaseRequest
 from google.cloud.spanner_admin_database_v1 import UpdateDatabaseDdlRequest
 from google.cloud.spanner_v1 import ExecuteSqlRequest
+from google.cloud.spanner_v1 import StructType
 from google.cloud.spanner_v1 import (
     TransactionSelector,
     TransactionOptions,
@@ -64,6 +84,11 @@ from google.cloud.spanner_v1 import (
 
 SPANNER_DATA_SCOPE = "https://www.googleapis.com/auth/spanner.data"
 
+_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+
 
 _DATABASE_NAME_RE = re.compile(
     r"^projects/(?P<project>[^/]+)/"
@@ -73,7 +98,18 @@ _DATABASE_NAME_RE = re.compile(
 
 _DATABASE_METADATA_FILTER = "name:{0}/operations/"
 
-DEFAULT_RETRY_BACKOFF = Retry(initial=0.02, maximum=32, multiplier=1.3)
+DEFAULT_PARTITION_RETRY = Retry(
+    predicate=if_exception_type(
+        DeadlineExceeded, InternalServerError, ServiceUnavailable
+    ),
+    initial=0.25,
+    maximum=32,
+    multiplier=1.3,
+    deadline=600,
+)
+"""Retry applied to each partition by :meth:`BatchSnapshot.run_partitions`."""
+
+DEFAULT_PARTITION_WORKERS = 4
 
 
 class Database(object):
@@ -101,12 +137,51 @@ class Database(object):
     :param pool: (Optional) session pool to be used by database.  If not
                  passed, the database will construct an instance of
                  :class:`~google.cloud.spanner_v1.pool.BurstyPool`.
+
+    :type channel_count: int
+    :param channel_count: (Optional) number of gRPC channels used for
+                          session-related API calls.  Each session's
+                          requests always use the same channel.
+
+    :type retry_policy:
+        :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+    :param retry_policy: (Optional) policy for retrying aborted transactions.
+                         If not passed, uses
+                         :data:`~google.cloud.spanner_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+
+    :type pdml_retry_policy:
+        :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+    :param pdml_retry_policy:
+        (Optional) policy for retrying aborted partitioned DML statements.
+        If not passed, uses
+        :data:`~google.cloud.spanner_v1.retry_policy.DEFAULT_PDML_RETRY_POLICY`.
     """
 
     _spanner_api = None
 
-    def __init__(self, database_id, instance, ddl_statements=(), pool=None):
+    def __init__(
+        self,
+        database_id,
+        instance,
+        ddl_statements=(),
+        pool=None,
+        channel_count=1,
+        retry_policy=None,
+        pdml_retry_policy=None,
+    ):
+        if channel_count < 1:
+            raise ValueError("'channel_count' must be positive.")
+
+        if retry_policy is None:
+            retry_policy = DEFAULT_RETRY_POLICY
+        if pdml_retry_policy is None:
+            pdml_retry_policy = DEFAULT_PDML_RETRY_POLICY
+
         self.database_id = database_id
+        self._channel_count = channel_count
+        self._retry_policy = retry_policy
+        self._pdml_retry_policy = pdml_retry_policy
+        self._abort_stats = AbortStats()
         self._instance = instance
         self._ddl_statements = _check_ddl_statements(ddl_statements)
         self._local = threading.local()
@@ -222,6 +297,44 @@ class Database(object):
         """
         return self._ddl_statements
 
+    @property
+    def channel_count(self):
+        """Number of gRPC channels used for session-related API calls.
+
+        :rtype: int
+        :returns: the channel count passed to the constructor.
+        """
+        return self._channel_count
+
+    @property
+    def retry_policy(self):
+        """Policy for retrying aborted transactions.
+
+        :rtype: :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+        :returns: the policy passed to the constructor, or the default one.
+        """
+        return self._retry_policy
+
+    @property
+    def pdml_retry_policy(self):
+        """Policy for retrying aborted partitioned DML statements.
+
+        :rtype: :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+        :returns: the policy passed to the constructor, or the default one.
+        """
+        return self._pdml_retry_policy
+
+    @property
+    def abort_stats(self):
+        """Counts of aborted and committed read-write transaction attempts.
+
+        Partitioned DML statements are not counted.
+
+        :rtype: :class:`~google.cloud.spanner_v1.retry_policy.AbortStats`
+        :returns: the statistics, shared by all sessions of the database.
+        """
+        return self._abort_stats
+
     @property
     def spanner_api(self):
         """Helper for session-related API calls."""
@@ -230,7 +343,9 @@ class Database(object):
             client_options = self._instance._client._client_options
             if self._instance.emulator_host is not None:
                 transport = SpannerGrpcTransport(
-                    channel=grpc.insecure_channel(self._instance.emulator_host)
+                    channel=self._make_channel(
+                        grpc.insecure_channel, self._instance.emulator_host
+                    )
                 )
                 self._spanner_api = SpannerClient(
                     client_info=client_info, transport=transport
@@ -239,6 +354,35 @@ class Database(object):
             credentials = self._instance._client.credentials
             if isinstance(credentials, google.auth.credentials.Scoped):
                 credentials = credentials.with_scopes((SPANNER_DATA_SCOPE,))
+            if self._channel_count > 1:
+                endpoint = SpannerClient.DEFAULT_ENDPOINT
+                channel_kw = {}
+                if client_options is not None:
+                    if client_options.api_endpoint:
+                        endpoint = client_options.api_endpoint
+                    if client_options.credentials_file:
+                        channel_kw["credentials_file"] = client_options.credentials_file
+                        credentials = None
+                    if client_options.quota_project_id:
+                        channel_kw["quota_project_id"] = client_options.quota_project_id
+                    if getattr(client_options, "scopes", None):
+                        channel_kw["scopes"] = client_options.scopes
+                if ":" not in endpoint:
+                    endpoint += ":443"
+                transport = SpannerGrpcTransport(
+                    channel=self._make_channel(
+                        SpannerGrpcTransport.create_channel,
+                        endpoint,
+                        credentials=credentials,
+                        options=_CHANNEL_OPTIONS,
+                        **channel_kw
+                    ),
+                    client_info=client_info,
+                )
+                self._spanner_api = SpannerClient(
+                    client_info=client_info, transport=transport
+                )
+                return self._spanner_api
             self._spanner_api = SpannerClient(
                 credentials=credentials,
                 client_info=client_info,
@@ -246,6 +390,31 @@ class Database(object):
             )
         return self._spanner_api
 
+    def _make_channel(self, create_channel, *args, **kwargs):
+        """Helper for :attr:`spanner_api`:  create the gRPC channel(s).
+
+        Channels created with the same target and options share their
+        connections, through gRPC's global subchannel pool.  Each channel
+        of a pool therefore uses its own, local subchannel pool.
+
+        :type create_channel: callable
+        :param create_channel: factory for a single channel, called with
+                               the remaining arguments.
+
+        :rtype: :class:`grpc.Channel`
+        :returns: a single channel, or a
+                  :class:`~google.cloud.spanner_v1._channel_pool.ChannelPool`
+                  if ``channel_count`` is greater than one.
+        """
+        if self._channel_count == 1:
+            return create_channel(*args, **kwargs)
+        kwargs["options"] = list(kwargs.get("options") or ()) + [
+            ("grpc.use_local_subchannel_pool", 1)
+        ]
+        return ChannelPool(
+            [create_channel(*args, **kwargs) for _ in range(self._channel_count)]
+        )
+
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
             return NotImplemented
@@ -406,35 +575,37 @@ class Database(object):
 
         metadata = _metadata_with_prefix(self.name)
 
-        def execute_pdml():
-            with SessionCheckout(self._pool) as session:
+        def execute_pdml_w_session(session):
+            txn = api.begin_transaction(
+                session=session.name, options=txn_options, metadata=metadata
+            )
 
-                txn = api.begin_transaction(
-                    session=session.name, options=txn_options, metadata=metadata
-                )
+            txn_selector = TransactionSelector(id=txn.id)
 
-                txn_selector = TransactionSelector(id=txn.id)
+            request = ExecuteSqlRequest(
+                session=session.name,
+                sql=dml,
+                transaction=txn_selector,
+                params=params_pb,
+                param_types=param_types,
+                query_options=query_options,
+            )
+            restart = functools.partial(
+                api.execute_streaming_sql, request=request, metadata=metadata,
+            )
 
-                request = ExecuteSqlRequest(
-                    session=session.name,
-                    sql=dml,
-                    transaction=txn_selector,
-                    params=params_pb,
-                    param_types=param_types,
-                    query_options=query_options,
-                )
-                restart = functools.partial(
-                    api.execute_streaming_sql, request=request, metadata=metadata,
-                )
+            iterator = _restart_on_unavailable(restart)
 
-                iterator = _restart_on_unavailable(restart)
+            result_set = StreamedResultSet(iterator)
+            list(result_set)  # consume all partials
 
-                result_set = StreamedResultSet(iterator)
-                list(result_set)  # consume all partials
+            return result_set.stats.row_count_lower_bound
 
-                return result_set.stats.row_count_lower_bound
+        def execute_pdml():
+            with SessionCheckout(self._pool) as session:
+                return _retry_on_session_not_found(execute_pdml_w_session, session)
 
-        return _retry_on_aborted(execute_pdml, DEFAULT_RETRY_BACKOFF)()
+        return _retry_on_aborted(execute_pdml, self._pdml_retry_policy)()
 
     def session(self, labels=None):
         """Factory to create a session for this database.
@@ -466,6 +637,24 @@ class Database(object):
         """
         return SnapshotCheckout(self, **kw)
 
+    def shared_snapshot(
+        self, session_count=1, read_timestamp=None, exact_staleness=None
+    ):
+        """Return a read-only transaction which several threads can share.
+
+        See :class:`~google.cloud.spanner_v1.database.SharedSnapshot` for the
+        parameters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.database.SharedSnapshot`
+        :returns: new wrapper
+        """
+        return SharedSnapshot(
+            self,
+            session_count=session_count,
+            read_timestamp=read_timestamp,
+            exact_staleness=exact_staleness,
+        )
+
     def batch(self):
         """Return an object which wraps a batch.
 
@@ -477,6 +666,33 @@ class Database(object):
         """
         return BatchCheckout(self)
 
+    def bulk_writer(
+        self,
+        max_mutations=DEFAULT_MAX_MUTATIONS,
+        max_bytes=DEFAULT_MAX_BYTES,
+        max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+        retry=DEFAULT_BULK_RETRY,
+        sort_buffer_rows=None,
+        key_columns=None,
+    ):
+        """Return an object which writes rows in concurrent, size-limited commits.
+
+        See :class:`~google.cloud.spanner_v1.bulk_writer.BulkWriter` for the
+        parameters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.bulk_writer.BulkWriter`
+        :returns: new writer
+        """
+        return BulkWriter(
+            self,
+            max_mutations=max_mutations,
+            max_bytes=max_bytes,
+            max_in_flight=max_in_flight,
+            retry=retry,
+            sort_buffer_rows=sort_buffer_rows,
+            key_columns=key_columns,
+        )
+
     def batch_snapshot(self, read_timestamp=None, exact_staleness=None):
         """Return an object which wraps a batch read / query.
 
@@ -494,6 +710,105 @@ class Database(object):
             self, read_timestamp=read_timestamp, exact_staleness=exact_staleness
         )
 
+    def export_table(
+        self,
+        table,
+        columns,
+        path,
+        format=FORMAT_CSV,
+        keyset=None,
+        index="",
+        partition_size_bytes=None,
+        max_partitions=None,
+        max_workers=DEFAULT_PARTITION_WORKERS,
+        retry=DEFAULT_PARTITION_RETRY,
+        read_timestamp=None,
+        exact_staleness=None,
+    ):
+        """Export a table to files, one per partition of a batch read.
+
+        All partitions are read at the same timestamp, and written
+        concurrently:  see :meth:`BatchSnapshot.export_partitions`.  Files
+        are named ``<table>-<partition number>.<format extension>``.
+
+        :type table: str
+        :param table: name of the table from which to fetch data
+
+        :type columns: list of str
+        :param columns: names of columns to be retrieved
+
+        :type path: str
+        :param path: directory in which to write the files;  created if
+                     needed.
+
+        :type format: str
+        :param format: (Optional) file format, one of
+                       :data:`~google.cloud.spanner_v1.writers.FORMAT_CSV`
+                       (the default),
+                       :data:`~google.cloud.spanner_v1.writers.FORMAT_NDJSON`
+                       or
+                       :data:`~google.cloud.spanner_v1.writers.FORMAT_PARQUET`.
+
+        :type keyset: :class:`~google.cloud.spanner_v1.keyset.KeySet`
+        :param keyset: (Optional) keys / ranges identifying rows to be
+                       retrieved.  Defaults to the whole table.
+
+        :type index: str
+        :param index: (Optional) name of index to use, rather than the
+                      table's primary key
+
+        :type partition_size_bytes: int
+        :param partition_size_bytes:
+            (Optional) desired size for each partition generated.
+
+        :type max_partitions: int
+        :param max_partitions:
+            (Optional) desired maximum number of partitions generated.
+
+        :type max_workers: int
+        :param max_workers: (Optional) maximum number of partitions processed
+                            at once.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) retry applied to each partition.  Pass
+                      ``None`` to process each partition only once.
+
+        :type read_timestamp: :class:`datetime.datetime`
+        :param read_timestamp: (Optional) read the table at the given
+                               timestamp.
+
+        :type exact_staleness: :class:`datetime.timedelta`
+        :param exact_staleness: (Optional) read the table at a timestamp
+                                that is ``exact_staleness`` old.
+
+        :rtype: list of str
+        :returns: names of the files written, in partition order.
+        :raises ValueError: for an unknown ``format``.
+        :raises ImportError: for Parquet, if ``pyarrow`` is not installed.
+        """
+        get_writer_class(format)
+        if keyset is None:
+            keyset = KeySet(all_=True)
+        with self.batch_snapshot(
+            read_timestamp=read_timestamp, exact_staleness=exact_staleness
+        ) as batch_snapshot:
+            batches = batch_snapshot.generate_read_batches(
+                table,
+                columns,
+                keyset,
+                index=index,
+                partition_size_bytes=partition_size_bytes,
+                max_partitions=max_partitions,
+            )
+            return batch_snapshot.export_partitions(
+                batches,
+                path,
+                format=format,
+                prefix=table,
+                max_workers=max_workers,
+                retry=retry,
+            )
+
     def run_in_transaction(self, func, *args, **kw):
         """Perform a unit of work in a transaction, retrying on abort.
 
@@ -509,7 +824,9 @@ class Database(object):
         :param kw: (Optional) keyword arguments to be passed to ``func``.
                    If passed, "timeout_secs" will be removed and used to
                    override the default retry timeout which defines maximum timestamp
-                   to continue retrying the transaction.
+                   to continue retrying the transaction.  If passed,
+                   "retry_policy" will be removed and used instead of
+                   :attr:`retry_policy`.
 
         :rtype: Any
         :returns: The return value of ``func``.
@@ -528,7 +845,10 @@ class Database(object):
         # done, flip the sanity check bit back.
         try:
             with SessionCheckout(self._pool) as session:
-                return session.run_in_transaction(func, *args, **kw)
+                return _retry_on_session_not_found(
+                    lambda session: session.run_in_transaction(func, *args, **kw),
+                    session,
+                )
         finally:
             self._local.transaction_running = False
 
@@ -630,7 +950,9 @@ class BatchCheckout(object):
         """End ``with`` block."""
         try:
             if exc_type is None:
-                self._batch.commit()
+                _retry_on_session_not_found(
+                    lambda session: self._batch.commit(), self._session
+                )
         finally:
             self._database._pool.put(self._session)
 
@@ -668,6 +990,149 @@ class SnapshotCheckout(object):
         self._database._pool.put(self._session)
 
 
+class SharedSnapshot(object):
+    """Multiple-use read-only transaction, shared by several threads.
+
+    All reads / queries see the database at the timestamp of the transaction,
+    and may be issued from several threads at once.  Requests are spread
+    round-robin over ``session_count`` sessions checked out from the
+    database's pool:  a transaction ID is only valid on the session which
+    began it, so the first session holds the transaction, and the others
+    perform single-use reads at its timestamp.
+
+    Use as a context manager, to begin the transaction and return the
+    sessions to the pool when done.
+
+    :type database: :class:`~google.cloud.spanner_v1.database.Database`
+    :param database: database to use
+
+    :type session_count: int
+    :param session_count: (Optional) number of sessions to spread requests
+                          over.  Defaults to 1.
+
+    :type read_timestamp: :class:`datetime.datetime`
+    :param read_timestamp: Execute all reads at the given timestamp.
+
+    :type exact_staleness: :class:`datetime.timedelta`
+    :param exact_staleness: Execute all reads at a timestamp that is
+                            ``exact_staleness`` old.
+
+    :raises ValueError: if ``session_count`` is less than 1.
+    """
+
+    def __init__(
+        self, database, session_count=1, read_timestamp=None, exact_staleness=None
+    ):
+        if session_count < 1:
+            raise ValueError("'session_count' must be at least 1")
+        self._database = database
+        self._session_count = session_count
+        self._read_timestamp = read_timestamp
+        self._exact_staleness = exact_staleness
+        self._sessions = []
+        self._snapshot = None
+        self._request_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def read_timestamp(self):
+        """Timestamp at which all reads are performed.
+
+        :rtype: :class:`datetime.datetime`
+        :returns: the timestamp, or None until a strong or stale transaction
+                  is begun.
+        """
+        return self._read_timestamp
+
+    def begin(self):
+        """Check out the sessions, and begin the read-only transaction.
+
+        :rtype: :class:`datetime.datetime`
+        :returns: the timestamp at which all reads are performed.
+        :raises ValueError: if the transaction is already begun.
+        """
+        if self._snapshot is not None:
+            raise ValueError("Read-only transaction already begun")
+
+        pool = self._database._pool
+        session = pool.get()
+        self._sessions.append(session)
+        try:
+            snapshot = Snapshot(
+                session,
+                read_timestamp=self._read_timestamp,
+                exact_staleness=self._exact_staleness,
+                multi_use=True,
+            )
+            snapshot._return_read_timestamp = True
+            snapshot.begin()
+            for _ in range(1, self._session_count):
+                self._sessions.append(pool.get())
+        except Exception:
+            self.close()
+            raise
+
+        self._snapshot = snapshot
+        self._read_timestamp = snapshot._transaction_read_timestamp
+        return self._read_timestamp
+
+    def _call(self, method, args, kw):
+        """Helper for :meth:`read` / :meth:`execute_sql`.
+
+        Picks the next session, round-robin.  Requests on the transaction's
+        own session are made while holding the lock, as the snapshot keeps
+        per-request state;  the request itself is only sent when the result
+        set is consumed.
+        """
+        if self._snapshot is None:
+            raise ValueError("Read-only transaction not begun")
+
+        with self._lock:
+            index = self._request_count % len(self._sessions)
+            self._request_count += 1
+            if index == 0:
+                return getattr(self._snapshot, method)(*args, **kw)
+
+        snapshot = Snapshot(self._sessions[index], read_timestamp=self._read_timestamp)
+        return getattr(snapshot, method)(*args, **kw)
+
+    def read(self, *args, **kw):
+        """Perform a read at the timestamp of the transaction.
+
+        Safe to call from several threads at once.  See
+        :meth:`~google.cloud.spanner_v1.snapshot.Snapshot.read`.
+
+        :raises ValueError: if the transaction is not begun.
+        """
+        return self._call("read", args, kw)
+
+    def execute_sql(self, *args, **kw):
+        """Perform a query at the timestamp of the transaction.
+
+        Safe to call from several threads at once.  See
+        :meth:`~google.cloud.spanner_v1.snapshot.Snapshot.execute_sql`.
+
+        :raises ValueError: if the transaction is not begun.
+        """
+        return self._call("execute_sql", args, kw)
+
+    def close(self):
+        """Return the sessions to the database's pool."""
+        sessions, self._sessions = self._sessions, []
+        self._snapshot = None
+        for session in sessions:
+            self._database._pool.put(session)
+
+    def __enter__(self):
+        """Begin ``with`` block:  begin the transaction."""
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """End ``with`` block:  return the sessions to the pool."""
+        self.close()
+
+
 class BatchSnapshot(object):
     """Wrapper for generating and processing read / query batches.
 
@@ -834,10 +1299,7 @@ class BatchSnapshot(object):
         :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
         :returns: a result set instance which can be used to consume rows.
         """
-        kwargs = copy.deepcopy(batch["read"])
-        keyset_dict = kwargs.pop("keyset")
-        kwargs["keyset"] = KeySet._from_dict(keyset_dict)
-        return self._get_snapshot().read(partition=batch["partition"], **kwargs)
+        return _process_read_batch(self._get_snapshot(), batch)
 
     def generate_query_batches(
         self,
@@ -929,9 +1391,7 @@ class BatchSnapshot(object):
         :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
         :returns: a result set instance which can be used to consume rows.
         """
-        return self._get_snapshot().execute_sql(
-            partition=batch["partition"], **batch["query"]
-        )
+        return _process_query_batch(self._get_snapshot(), batch)
 
     def process(self, batch):
         """Process a single, partitioned query or read.
@@ -951,6 +1411,347 @@ class BatchSnapshot(object):
             return self.process_read_batch(batch)
         raise ValueError("Invalid batch")
 
+    def run_partitioned_read(
+        self,
+        table,
+        columns,
+        keyset,
+        index="",
+        partition_size_bytes=None,
+        max_partitions=None,
+        max_workers=DEFAULT_PARTITION_WORKERS,
+        retry=DEFAULT_PARTITION_RETRY,
+        per_partition=False,
+    ):
+        """Partition a read, then process the partitions concurrently.
+
+        See :meth:`generate_read_batches` for the read parameters, and
+        :meth:`run_partitions` for the others.
+
+        :rtype: iterable
+        :returns: rows, or ``(batch, rows)`` pairs if ``per_partition``.
+        """
+        batches = self.generate_read_batches(
+            table,
+            columns,
+            keyset,
+            index=index,
+            partition_size_bytes=partition_size_bytes,
+            max_partitions=max_partitions,
+        )
+        return self.run_partitions(
+            batches, max_workers=max_workers, retry=retry, per_partition=per_partition
+        )
+
+    def run_partitioned_query(
+        self,
+        sql,
+        params=None,
+        param_types=None,
+        partition_size_bytes=None,
+        max_partitions=None,
+        query_options=None,
+        max_workers=DEFAULT_PARTITION_WORKERS,
+        retry=DEFAULT_PARTITION_RETRY,
+        per_partition=False,
+    ):
+        """Partition a query, then process the partitions concurrently.
+
+        See :meth:`generate_query_batches` for the query parameters, and
+        :meth:`run_partitions` for the others.
+
+        :rtype: iterable
+        :returns: rows, or ``(batch, rows)`` pairs if ``per_partition``.
+        """
+        batches = self.generate_query_batches(
+            sql,
+            params=params,
+            param_types=param_types,
+            partition_size_bytes=partition_size_bytes,
+            max_partitions=max_partitions,
+            query_options=query_options,
+        )
+        return self.run_partitions(
+            batches, max_workers=max_workers, retry=retry, per_partition=per_partition
+        )
+
+    def run_partitions(
+        self,
+        batches,
+        max_workers=DEFAULT_PARTITION_WORKERS,
+        retry=DEFAULT_PARTITION_RETRY,
+        per_partition=False,
+    ):
+        """Process partitioned reads / queries concurrently, in threads.
+
+        All partitions are read within this batch snapshot's transaction,
+        hence at the same timestamp, and no other session is created.  Each
+        partition is read in full by a worker thread, and retried on its own
+        if that fails, before its rows are handed over:  partitions are thus
+        returned in order of completion.
+
+        Memory use therefore grows with ``max_workers`` times the size of a
+        partition, as up to ``max_workers`` whole partitions are held at
+        once.  To stream large partitions instead, use
+        :meth:`process_partitions`.
+
+        Returns a generator:  partitions are processed as it is consumed.
+        If it is closed early, partitions not yet started are cancelled.
+
+        :type batches: iterable of mapping
+        :param batches:
+            mappings returned from :meth:`generate_read_batches` or
+            :meth:`generate_query_batches`.
+
+        :type max_workers: int
+        :param max_workers: (Optional) maximum number of partitions processed
+                            at once.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) retry applied to each partition.  Pass
+                      ``None`` to process each partition only once.
+
+        :type per_partition: bool
+        :param per_partition: (Optional) if True, yield a ``(batch, rows)``
+                              pair per partition, rather than the rows.
+
+        :rtype: iterable
+        :returns: rows, or ``(batch, rows)`` pairs if ``per_partition``.
+        :raises ValueError: if ``max_workers`` is not positive.
+        :raises: the error of a partition which could not be processed.
+        """
+        if max_workers < 1:
+            raise ValueError("'max_workers' must be positive.")
+        return self._run_partitions(batches, max_workers, retry, per_partition)
+
+    def process_partitions(
+        self,
+        batches,
+        handler,
+        max_workers=DEFAULT_PARTITION_WORKERS,
+        retry=DEFAULT_PARTITION_RETRY,
+    ):
+        """Stream partitioned reads / queries through a handler, in threads.
+
+        As :meth:`run_partitions`, but each worker thread calls ``handler``
+        with the result set of its partition, which streams rows as they
+        are consumed:  memory use is bounded by the size of a partial
+        result set rather than of a partition.  If a partition is retried,
+        ``handler`` is called again with a fresh result set, and must start
+        over.
+
+        Returns a generator:  partitions are processed as it is consumed.
+        If it is closed early, partitions not yet started are cancelled.
+
+        :type batches: iterable of mapping
+        :param batches:
+            mappings returned from :meth:`generate_read_batches` or
+            :meth:`generate_query_batches`.
+
+        :type handler: callable
+        :param handler:
+            called in a worker thread with the
+            :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet` of
+            a partition and the partition, returning a result;  e.g. an
+            aggregate of the rows, or the name of a file holding them.
+
+        :type max_workers: int
+        :param max_workers: (Optional) maximum number of partitions processed
+                            at once.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) retry applied to each partition.  Pass
+                      ``None`` to process each partition only once.
+
+        :rtype: iterable
+        :returns: ``(batch, result)`` pairs, in order of completion, where
+                  ``result`` is the value returned by ``handler``.
+        :raises ValueError: if ``max_workers`` is not positive.
+        :raises: the error of a partition which could not be processed.
+        """
+        if max_workers < 1:
+            raise ValueError("'max_workers' must be positive.")
+
+        def process(batch):
+            return handler(_process_batch(self._partition_snapshot(), batch), batch)
+
+        return self._map_partitions(batches, max_workers, retry, process)
+
+    def _run_partitions(self, batches, max_workers, retry, per_partition):
+        """Helper for :meth:`run_partitions`."""
+        pairs = self._map_partitions(
+            batches, max_workers, retry, self._process_partition
+        )
+        for batch, rows in pairs:
+            if per_partition:
+                yield batch, rows
+            else:
+                for row in rows:
+                    yield row
+
+    def _map_partitions(self, batches, max_workers, retry, process):
+        """Call ``process`` on each batch in a pool of threads.
+
+        :rtype: iterable
+        :returns: ``(batch, result)`` pairs, in order of completion.
+        """
+        # Begin the transaction on this thread, so that workers never race
+        # to create the session.
+        self._get_snapshot()
+        batches = iter(batches)
+        if retry is not None:
+            process = retry(process)
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+
+        def submit(count):
+            for batch in itertools.islice(batches, count):
+                pending[executor.submit(process, batch)] = batch
+
+        try:
+            submit(max_workers)
+            while pending:
+                done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    batch = pending.pop(future)
+                    result = future.result()
+                    submit(1)
+                    yield batch, result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _partition_snapshot(self):
+        """Return a new snapshot, bound to the shared session and transaction.
+
+        As in :meth:`from_dict`:  each worker thread uses its own snapshot,
+        so that threads share no request counters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.snapshot.Snapshot`
+        """
+        snapshot = self._session.snapshot(multi_use=True)
+        snapshot._transaction_id = self._snapshot._transaction_id
+        return snapshot
+
+    def _process_partition(self, batch):
+        """Read a partition in full, for :meth:`run_partitions`.
+
+        :rtype: list
+        :returns: the rows of the partition.
+        """
+        return list(_process_batch(self._partition_snapshot(), batch))
+
+    def export_partitions(
+        self,
+        batches,
+        path,
+        format=FORMAT_CSV,
+        prefix="part",
+        max_workers=DEFAULT_PARTITION_WORKERS,
+        retry=DEFAULT_PARTITION_RETRY,
+    ):
+        """Write partitioned reads / queries to files, one per partition.
+
+        Partitions are processed concurrently, as in :meth:`run_partitions`.
+        Each partition is written as it is streamed, one batch of decoded
+        columns at a time, so that memory use is bounded by the size of a
+        partial result set rather than of a partition.  The file of a
+        partition which fails is rewritten from scratch on retry, and
+        removed if the partition cannot be processed.
+
+        A partition whose stream returns no response at all carries no
+        metadata:  for a read, a file holding no rows is written for the
+        columns of the read;  for a query, or for Parquet (which needs the
+        column types), no file is written.
+
+        :type batches: iterable of mapping
+        :param batches:
+            mappings returned from :meth:`generate_read_batches` or
+            :meth:`generate_query_batches`.
+
+        :type path: str
+        :param path: directory in which to write the files;  created if
+                     needed.
+
+        :type format: str
+        :param format: (Optional) file format, one of
+                       :data:`~google.cloud.spanner_v1.writers.FORMAT_CSV`
+                       (the default),
+                       :data:`~google.cloud.spanner_v1.writers.FORMAT_NDJSON`
+                       or
+                       :data:`~google.cloud.spanner_v1.writers.FORMAT_PARQUET`.
+
+        :type prefix: str
+        :param prefix: (Optional) prefix of the file names, which are
+                       ``<prefix>-<partition number>.<format extension>``.
+
+        :type max_workers: int
+        :param max_workers: (Optional) maximum number of partitions processed
+                            at once.
+
+        :type retry: :class:`~google.api_core.retry.Retry`
+        :param retry: (Optional) retry applied to each partition.  Pass
+                      ``None`` to process each partition only once.
+
+        :rtype: list of str
+        :returns: names of the files written, in partition order.  Skipped
+                  partitions are left out.
+        :raises ValueError: for an unknown ``format``, or if ``max_workers``
+                            is not positive.
+        :raises ImportError: for Parquet, if ``pyarrow`` is not installed.
+        :raises: the error of a partition which could not be processed.
+        """
+        writer_class = get_writer_class(format)
+        if max_workers < 1:
+            raise ValueError("'max_workers' must be positive.")
+        os.makedirs(path, exist_ok=True)
+
+        def export_partition(numbered):
+            number, batch = numbered
+            filename = os.path.join(
+                path, "%s-%05d.%s" % (prefix, number, writer_class.extension)
+            )
+            try:
+                written = self._export_partition(batch, filename, writer_class)
+            except Exception:
+                if os.path.exists(filename):
+                    os.remove(filename)
+                raise
+            return filename if written else None
+
+        pairs = self._map_partitions(
+            enumerate(batches), max_workers, retry, export_partition
+        )
+        return [filename for _, filename in sorted(pairs) if filename is not None]
+
+    def _export_partition(self, batch, filename, writer_class):
+        """Stream a partition to a file, for :meth:`export_partitions`.
+
+        :rtype: bool
+        :returns: whether the file was written.
+        """
+        results = _process_batch(
+            self._partition_snapshot(),
+            batch,
+            bytes_decoding=writer_class.bytes_decoding,
+            timestamp_decoding=writer_class.timestamp_decoding,
+        )
+        column_batches = results.iter_column_batches()
+        first = next(column_batches, None)
+        if first is None and results.metadata is None:  # no response at all
+            fields = _batch_fields(batch, writer_class)
+            if fields is None:
+                return False
+        else:
+            fields = results.fields
+        with writer_class(filename, fields) as writer:
+            if first is not None:
+                writer.write(first)
+            for columns in column_batches:
+                writer.write(columns)
+        return True
+
     def close(self):
         """Clean up underlying session.
 
@@ -964,6 +1765,91 @@ class BatchSnapshot(object):
         if self._session is not None:
             self._session.delete()
 
+    def __enter__(self):
+        """Begin ``with`` block."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """End ``with`` block:  clean up the underlying session."""
+        self.close()
+
+
+def _batch_fields(batch, writer_class):
+    """Helper for :meth:`BatchSnapshot._export_partition`:  fields of a batch.
+
+    Used when the stream of a partition returns no metadata.  Only the
+    column names of a read are known, not their types.
+
+    :type batch: mapping
+    :param batch: the partition being exported.
+
+    :type writer_class: type
+    :param writer_class: class of the writer for the file.
+
+    :rtype: list of :class:`~google.cloud.spanner_v1.StructType.Field`
+    :returns: the fields, or ``None`` if they cannot be known.
+    """
+    if "read" not in batch or writer_class.needs_field_types:
+        return None
+    return [StructType.Field(name=name) for name in batch["read"]["columns"]]
+
+
+def _process_batch(snapshot, batch, **kw):
+    """Helper for :class:`BatchSnapshot`:  process a read or query batch.
+
+    :raises ValueError: if batch does not contain either 'read' or 'query'
+    """
+    if "query" in batch:
+        return _process_query_batch(snapshot, batch, **kw)
+    if "read" in batch:
+        return _process_read_batch(snapshot, batch, **kw)
+    raise ValueError("Invalid batch")
+
+
+def _process_read_batch(snapshot, batch, **kw):
+    """Helper for :meth:`BatchSnapshot.process_read_batch`.
+
+    :type snapshot: :class:`~google.cloud.spanner_v1.snapshot.Snapshot`
+    :param snapshot: multi-use snapshot within which the batch was generated
+
+    :type batch: mapping
+    :param batch: one of the mappings returned from
+                  :meth:`BatchSnapshot.generate_read_batches`.
+
+    :type kw: dict
+    :param kw: (Optional) additional arguments to
+               :meth:`~google.cloud.spanner_v1.snapshot.Snapshot.read`.
+
+    :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
+    :returns: a result set instance which can be used to consume rows.
+    """
+    kwargs = copy.deepcopy(batch["read"])
+    keyset_dict = kwargs.pop("keyset")
+    kwargs["keyset"] = KeySet._from_dict(keyset_dict)
+    kwargs.update(kw)
+    return snapshot.read(partition=batch["partition"], **kwargs)
+
+
+def _process_query_batch(snapshot, batch, **kw):
+    """Helper for :meth:`BatchSnapshot.process_query_batch`.
+
+    :type snapshot: :class:`~google.cloud.spanner_v1.snapshot.Snapshot`
+    :param snapshot: multi-use snapshot within which the batch was generated
+
+    :type batch: mapping
+    :param batch: one of the mappings returned from
+                  :meth:`BatchSnapshot.generate_query_batches`.
+
+    :type kw: dict
+    :param kw: (Optional) additional arguments to
+               :meth:`~google.cloud.spanner_v1.snapshot.Snapshot.execute_sql`.
+
+    :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
+    :returns: a result set instance which can be used to consume rows.
+    """
+    kwargs = dict(batch["query"], **kw)
+    return snapshot.execute_sql(partition=batch["partition"], **kwargs)
+
 
 def _check_ddl_statements(value):
     """Validate DDL Statements used to define database schema.
@@ -989,17 +1875,61 @@ def _check_ddl_statements(value):
     return tuple(value)
 
 
-def _retry_on_aborted(func, retry_config):
+def _retry_on_aborted(func, retry_policy):
     """Helper for :meth:`Database.execute_partitioned_dml`.
 
-    Wrap function in a Retry that will retry on Aborted exceptions
-    with the retry config specified.
+    Wrap function to retry it on Aborted exceptions, as the retry policy
+    says.
 
     :type func: callable
     :param func: the function to be retried on Aborted exceptions
 
-    :type retry_config: Retry
-    :param retry_config: retry object with the settings to be used
+    :type retry_policy:
+        :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+    :param retry_policy: policy deciding the delays and the deadline
+
+    :rtype: callable
+    :returns: wrapped ``func``
+    """
+
+    @functools.wraps(func)
+    def retry_on_aborted(*args, **kw):
+        deadline = time.time() + retry_policy.deadline
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                result = func(*args, **kw)
+            except Aborted as exc:
+                delay = retry_policy.retry_delay(exc, attempts, deadline)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            else:
+                return result
+
+    return retry_on_aborted
+
+
+def _retry_on_session_not_found(func, session):
+    """Helper for operations using a session checked out from the pool.
+
+    Pools only check sessions which have been idle for a while, so a
+    session may have been deleted on the back-end without the pool knowing.
+    In that case, recreate the session and retry the operation once.
+
+    :type func: callable
+    :param func: the operation, taking the session as its only argument
+
+    :type session: :class:`~google.cloud.spanner_v1.session.Session`
+    :param session: the checked-out session
+
+    :returns: the return value of ``func``
     """
-    retry = retry_config.with_predicate(if_exception_type(Aborted))
-    return retry(func)
+    try:
+        return func(session)
+    except NotFound as exc:
+        if not _session_not_found(exc):
+            raise
+    session._recreate()
+    return func(session)
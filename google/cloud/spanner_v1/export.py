@@ -0,0 +1,209 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process partitioned reads / queries in worker processes."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+import functools
+import multiprocessing
+
+from google.cloud.spanner_v1.client import Client
+from google.cloud.spanner_v1.database import BatchSnapshot
+from google.cloud.spanner_v1.database import DEFAULT_PARTITION_RETRY
+
+
+# Per-process state, set up by ``_init_worker``.
+_WORKER = {}
+
+
+def fetch_rows(results, batch):
+    """Partition handler returning the rows of a partition as a list.
+
+    :type results: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
+    :param results: result set of the partition.
+
+    :type batch: mapping
+    :param batch: the partition being processed.
+
+    :rtype: list
+    :returns: the rows of the partition.
+    """
+    return list(results)
+
+
+def fetch_columns(results, batch):
+    """Partition handler returning the rows of a partition as columns.
+
+    See :meth:`~google.cloud.spanner_v1.streamed.StreamedResultSet.to_columns`.
+
+    :type results: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
+    :param results: result set of the partition.
+
+    :type batch: mapping
+    :param batch: the partition being processed.
+
+    :rtype: list
+    :returns: one column per field of the result set.
+    """
+    return results.to_columns()
+
+
+def run_partitions_in_processes(
+    batch_snapshot,
+    batches,
+    processes=None,
+    handler=fetch_rows,
+    client_factory=None,
+    retry=True,
+    mp_context=None,
+):
+    """Process partitioned reads / queries in a pool of worker processes.
+
+    Each worker process opens its own client and database, and rebuilds the
+    batch snapshot from :meth:`~.database.BatchSnapshot.to_dict`:  every
+    partition is thus read within the same transaction, hence at the same
+    timestamp, and workers create no session of their own.  Rows are
+    decoded in the workers, and only the value returned by ``handler`` for
+    each partition is sent back to this process.
+
+    Returns a generator of ``(batch, result)`` pairs, in order of
+    completion.  If it is closed early, the worker processes are terminated.
+    The caller remains responsible for closing ``batch_snapshot`` once the
+    generator is exhausted.
+
+    :type batch_snapshot: :class:`~google.cloud.spanner_v1.database.BatchSnapshot`
+    :param batch_snapshot: snapshot which generated ``batches``.
+
+    :type batches: iterable of mapping
+    :param batches:
+        mappings returned from
+        :meth:`~.database.BatchSnapshot.generate_read_batches` or
+        :meth:`~.database.BatchSnapshot.generate_query_batches`.
+
+    :type processes: int
+    :param processes: (Optional) number of worker processes;  defaults to
+                      the number of CPUs.
+
+    :type handler: callable
+    :param handler:
+        (Optional) called in the worker with the result set of a partition
+        and the partition, returning a picklable result;  e.g. rows, columns,
+        or the name of a file holding them.  Must be importable by the
+        workers, i.e. defined at module level.  Defaults to
+        :func:`fetch_rows`.
+
+    :type client_factory: callable
+    :param client_factory:
+        (Optional) called without arguments in each worker to create its
+        :class:`~google.cloud.spanner_v1.client.Client`.  Must be picklable.
+        Defaults to a client for the project of ``batch_snapshot``'s
+        database, using the default credentials.
+
+    :type retry: bool
+    :param retry: (Optional) if true, retry each partition in full on
+                  transient errors, using
+                  :data:`~.database.DEFAULT_PARTITION_RETRY`.
+
+    :type mp_context: :class:`multiprocessing.context.BaseContext`
+    :param mp_context: (Optional) context used to start the workers.
+                       Defaults to the ``"spawn"`` start method:  this
+                       process already has open gRPC channels, which
+                       forked workers could not use safely.
+
+    :rtype: iterable
+    :returns: ``(batch, result)`` pairs, where ``result`` is the value
+              returned by ``handler``.
+    """
+    database = batch_snapshot._database
+    instance = database._instance
+    if client_factory is None:
+        client_factory = functools.partial(Client, project=instance._client.project)
+    if mp_context is None:
+        mp_context = multiprocessing.get_context("spawn")
+    initargs = (
+        client_factory,
+        instance.instance_id,
+        database.database_id,
+        batch_snapshot.to_dict(),
+        handler,
+        retry,
+    )
+    return _run_in_pool(mp_context, processes, initargs, batches)
+
+
+def _run_in_pool(mp_context, processes, initargs, batches):
+    """Helper for :func:`run_partitions_in_processes`."""
+    pool = mp_context.Pool(processes, initializer=_init_worker, initargs=initargs)
+    try:
+        for pair in pool.imap_unordered(_process_in_worker, batches):
+            yield pair
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        pool.close()
+    finally:
+        pool.join()
+
+
+def _init_worker(client_factory, instance_id, database_id, state, handler, retry):
+    """Set up the state of a worker process.
+
+    :type client_factory: callable
+    :param client_factory: creates the client of the worker.
+
+    :type instance_id: str
+    :param instance_id: ID of the instance.
+
+    :type database_id: str
+    :param database_id: ID of the database.
+
+    :type state: dict
+    :param state: batch snapshot state, from
+                  :meth:`~.database.BatchSnapshot.to_dict`.
+
+    :type handler: callable
+    :param handler: partition handler.
+
+    :type retry: bool
+    :param retry: whether to retry partitions on transient errors.
+    """
+    database = client_factory().instance(instance_id).database(database_id)
+    batch_snapshot = BatchSnapshot.from_dict(database, state)
+    process = functools.partial(_process_partition, batch_snapshot, handler)
+    if retry:
+        process = DEFAULT_PARTITION_RETRY(process)
+    _WORKER["process"] = process
+
+
+def _process_partition(batch_snapshot, handler, batch):
+    """Read a partition in full, then pass it to the handler."""
+    return handler(batch_snapshot.process(batch), batch)
+
+
+def _process_in_worker(batch):
+    """Process a partition in a worker process.
+
+    :type batch: mapping
+    :param batch: the partition to process.
+
+    :rtype: tuple
+    :returns: ``(batch, result)``.
+    """
+    return batch, _WORKER["process"](batch)
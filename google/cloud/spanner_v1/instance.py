@@ -362,7 +362,15 @@ class Instance(object):
 
         api.delete_instance(name=self.name, metadata=metadata)
 
-    def database(self, database_id, ddl_statements=(), pool=None):
+    def database(
+        self,
+        database_id,
+        ddl_statements=(),
+        pool=None,
+        channel_count=1,
+        retry_policy=None,
+        pdml_retry_policy=None,
+    ):
         """Factory to create a database within this instance.
 
         :type database_id: str
@@ -376,10 +384,32 @@ class Instance(object):
                     :class:`~google.cloud.spanner_v1.pool.AbstractSessionPool`.
         :param pool: (Optional) session pool to be used by database.
 
+        :type channel_count: int
+        :param channel_count: (Optional) number of gRPC channels used for
+                              session-related API calls.
+
+        :type retry_policy:
+            :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+        :param retry_policy: (Optional) policy for retrying aborted
+                             transactions.
+
+        :type pdml_retry_policy:
+            :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+        :param pdml_retry_policy: (Optional) policy for retrying aborted
+                                  partitioned DML statements.
+
         :rtype: :class:`~google.cloud.spanner_v1.database.Database`
         :returns: a database owned by this instance.
         """
-        return Database(database_id, self, ddl_statements=ddl_statements, pool=pool)
+        return Database(
+            database_id,
+            self,
+            ddl_statements=ddl_statements,
+            pool=pool,
+            channel_count=channel_count,
+            retry_policy=retry_policy,
+            pdml_retry_policy=pdml_retry_policy,
+        )
 
     def list_databases(self, page_size=None):
         """List databases for the instance.
@@ -21,7 +21,10 @@ from builtins import super
 from future import standard_library
 standard_library.install_aliases()
 
+import collections
 import datetime
+import logging
+import threading
 
 from six.moves import queue
 
@@ -29,8 +32,30 @@ from google.cloud.exceptions import NotFound
 from google.cloud.spanner_v1._helpers import _metadata_with_prefix
 
 
+_LOGGER = logging.getLogger(__name__)
+
 _NOW = datetime.datetime.utcnow  # unit tests may replace
 
+_MAX_SESSIONS_PER_BATCH = 100
+"""Most sessions requested in a single ``BatchCreateSessions`` call."""
+
+
+def _idle_longer_than(session, delta):
+    """Helper for pools checking idle sessions before returning them.
+
+    :type session: :class:`~google.cloud.spanner_v1.session.Session`
+    :param session: session about to be checked out.
+
+    :type delta: :class:`datetime.timedelta`
+    :param delta: maximum idle time before the session must be checked.
+
+    :rtype: bool
+    :returns: True if the session was last returned to the pool more than
+              ``delta`` ago, or if its last use is unknown.
+    """
+    last_use_time = session._last_use_time
+    return last_use_time is None or _NOW() - last_use_time > delta
+
 
 class AbstractSessionPool(object):
     """Specifies required API for concrete session pool implementations.
@@ -41,6 +66,11 @@ class AbstractSessionPool(object):
     """
 
     _database = None
+    maintenance_interval = None
+    _maintenance_thread = None
+    _maintenance_stop = None
+    _warmup_thread = None
+    _warmup_error = None
 
     def __init__(self, labels=None):
         if labels is None:
@@ -106,6 +136,156 @@ class AbstractSessionPool(object):
         """
         raise NotImplementedError()
 
+    def _maintain(self):
+        """Run one round of background maintenance.
+
+        Concrete implementations which accept a ``maintenance_interval``
+        must override.
+
+        :raises NotImplementedError: abstract method
+        """
+        raise NotImplementedError()
+
+    def _maintenance_loop(self, stop):
+        """Target for the pool's maintenance thread.
+
+        :type stop: :class:`threading.Event`
+        :param stop: event signalling the thread to exit.
+        """
+        while not stop.wait(self.maintenance_interval):
+            try:
+                self._maintain()
+            except Exception:  # pylint: disable=broad-except
+                # Keep the thread alive:  the next round retries.
+                _LOGGER.exception("Session pool maintenance failed")
+
+    def _start_maintenance(self):
+        """Start the pool's maintenance thread, unless already running."""
+        if self._maintenance_thread is not None:
+            return
+        stop = self._maintenance_stop = threading.Event()
+        thread = threading.Thread(
+            target=self._maintenance_loop,
+            args=(stop,),
+            name="spanner-pool-maintenance",
+        )
+        thread.daemon = True
+        self._maintenance_thread = thread
+        thread.start()
+
+    def _stop_maintenance(self):
+        """Signal the pool's maintenance thread to exit, and wait for it."""
+        thread, self._maintenance_thread = self._maintenance_thread, None
+        if self._maintenance_stop is not None:
+            self._maintenance_stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _warm_up(self, count, add_session, workers):
+        """Create sessions using concurrent ``BatchCreateSessions`` calls.
+
+        :type count: int
+        :param count: number of sessions to create.
+
+        :type add_session: callable
+        :param add_session: called with each created session;  must be
+                            thread-safe if ``workers`` is greater than one.
+
+        :type workers: int
+        :param workers: maximum number of requests in flight.
+
+        :raises: the first error encountered by any request.
+        """
+        api = self._database.spanner_api
+        database_name = self._database.name
+        metadata = _metadata_with_prefix(database_name)
+        batches = queue.Queue()
+        for start in range(0, count, _MAX_SESSIONS_PER_BATCH):
+            batches.put(min(_MAX_SESSIONS_PER_BATCH, count - start))
+        errors = []
+
+        def create_batches():
+            while not errors:
+                try:
+                    remaining = batches.get(block=False)
+                except queue.Empty:
+                    return
+                try:
+                    while remaining > 0:
+                        resp = api.batch_create_sessions(
+                            database=database_name,
+                            session_count=remaining,
+                            metadata=metadata,
+                        )
+                        for session_pb in resp.session:
+                            session = self._new_session()
+                            session._session_id = session_pb.name.split("/")[-1]
+                            add_session(session)
+                        remaining -= len(resp.session)
+                except Exception as exc:
+                    errors.append(exc)
+
+        threads = [
+            threading.Thread(target=create_batches, name="spanner-pool-warmup")
+            for _ in range(min(workers, batches.qsize()) - 1)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        create_batches()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def _start_warm_up(self, count, add_session, workers):
+        """Run :meth:`_warm_up` in a daemon thread.
+
+        Errors are kept, to be raised by :meth:`wait_for_warm_up`.
+        """
+
+        def warm_up():
+            try:
+                self._warm_up(count, add_session, workers)
+            except Exception as exc:
+                self._warmup_error = exc
+
+        self._warmup_error = None
+        thread = self._warmup_thread = threading.Thread(
+            target=warm_up, name="spanner-pool-warmup"
+        )
+        thread.daemon = True
+        thread.start()
+
+    def wait_for_warm_up(self, timeout=None):
+        """Block until the pool's background warm-up, if any, has finished.
+
+        :type timeout: float
+        :param timeout: (Optional) seconds to wait;  blocks indefinitely
+                        if not passed.
+
+        :rtype: bool
+        :returns: True if warm-up is complete, False if still running.
+        :raises: the error which stopped background warm-up, if any.
+        """
+        thread = self._warmup_thread
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                return False
+        if self._warmup_error is not None:
+            raise self._warmup_error
+        return True
+
+    def _raise_warm_up_error(self):
+        """Helper for :meth:`get` of pools whose queue ran dry.
+
+        :raises: the error which stopped background warm-up, if any.
+        """
+        if self._warmup_error is not None:
+            raise self._warmup_error
+
     def _new_session(self):
         """Helper for concrete methods creating session instances.
 
@@ -135,7 +315,8 @@ class FixedSizePool(AbstractSessionPool):
     - Pre-allocates / creates a fixed number of sessions.
 
     - "Pings" existing sessions via :meth:`session.exists` before returning
-      them, and replaces expired sessions.
+      them, if they have been idle for longer than ``max_idle_time``, and
+      replaces expired sessions.
 
     - Blocks, with a timeout, when :meth:`get` is called on an empty pool.
       Raises after timing out.
@@ -154,15 +335,44 @@ class FixedSizePool(AbstractSessionPool):
     :type labels: dict (str -> str) or None
     :param labels: (Optional) user-assigned labels for sessions created
                     by the pool.
+
+    :type max_idle_time: int
+    :param max_idle_time: (Optional) seconds a session may stay unused in
+                          the pool before :meth:`get` checks that it still
+                          exists.
+
+    :type warm_up_workers: int
+    :param warm_up_workers: (Optional) maximum number of concurrent
+                            ``BatchCreateSessions`` requests made by
+                            :meth:`bind`.
+
+    :type background_warm_up: bool
+    :param background_warm_up: (Optional) if True, :meth:`bind` returns
+                               immediately while sessions are created in a
+                               background thread;  :meth:`get` blocks only
+                               until a session is available.
     """
 
     DEFAULT_SIZE = 10
     DEFAULT_TIMEOUT = 10
-
-    def __init__(self, size=DEFAULT_SIZE, default_timeout=DEFAULT_TIMEOUT, labels=None):
+    DEFAULT_MAX_IDLE_TIME = 3000
+    DEFAULT_WARM_UP_WORKERS = 4
+
+    def __init__(
+        self,
+        size=DEFAULT_SIZE,
+        default_timeout=DEFAULT_TIMEOUT,
+        labels=None,
+        max_idle_time=DEFAULT_MAX_IDLE_TIME,
+        warm_up_workers=DEFAULT_WARM_UP_WORKERS,
+        background_warm_up=False,
+    ):
         super(FixedSizePool, self).__init__(labels=labels)
         self.size = size
         self.default_timeout = default_timeout
+        self.warm_up_workers = warm_up_workers
+        self.background_warm_up = background_warm_up
+        self._max_idle = datetime.timedelta(seconds=max_idle_time)
         self._sessions = queue.LifoQueue(size)
 
     def bind(self, database):
@@ -173,19 +383,17 @@ class FixedSizePool(AbstractSessionPool):
                          when needed.
         """
         self._database = database
-        api = database.spanner_api
-        metadata = _metadata_with_prefix(database.name)
-
-        while not self._sessions.full():
-            resp = api.batch_create_sessions(
-                database=database.name,
-                session_count=self.size - self._sessions.qsize(),
-                metadata=metadata,
-            )
-            for session_pb in resp.session:
-                session = self._new_session()
-                session._session_id = session_pb.name.split("/")[-1]
-                self._sessions.put(session)
+        count = self.size - self._sessions.qsize()
+
+        if self.background_warm_up:
+            self._start_warm_up(count, self._add_new_session, self.warm_up_workers)
+        else:
+            self._warm_up(count, self._add_new_session, self.warm_up_workers)
+
+    def _add_new_session(self, session):
+        """Helper for :meth:`bind`:  add a freshly created session."""
+        session._last_use_time = _NOW()
+        self._sessions.put(session)
 
     def get(self, timeout=None):  # pylint: disable=arguments-differ
         """Check a session out from the pool.
@@ -201,10 +409,14 @@ class FixedSizePool(AbstractSessionPool):
         if timeout is None:
             timeout = self.default_timeout
 
-        session = self._sessions.get(block=True, timeout=timeout)
+        try:
+            session = self._sessions.get(block=True, timeout=timeout)
+        except queue.Empty:
+            self._raise_warm_up_error()
+            raise
 
-        if not session.exists():
-            session = self._database.session()
+        if _idle_longer_than(session, self._max_idle) and not session.exists():
+            session = self._new_session()
             session.create()
 
         return session
@@ -219,6 +431,7 @@ class FixedSizePool(AbstractSessionPool):
 
         :raises: :exc:`six.moves.queue.Full` if the queue is full.
         """
+        session._last_use_time = _NOW()
         self._sessions.put_nowait(session)
 
     def clear(self):
@@ -237,7 +450,7 @@ class BurstyPool(AbstractSessionPool):
     """Concrete session pool implementation:
 
     - "Pings" existing sessions via :meth:`session.exists` before returning
-      them.
+      them, if they have been idle for longer than ``max_idle_time``.
 
     - Creates a new session, rather than blocking, when :meth:`get` is called
       on an empty pool.
@@ -251,12 +464,18 @@ class BurstyPool(AbstractSessionPool):
     :type labels: dict (str -> str) or None
     :param labels: (Optional) user-assigned labels for sessions created
                     by the pool.
+
+    :type max_idle_time: int
+    :param max_idle_time: (Optional) seconds a session may stay unused in
+                          the pool before :meth:`get` checks that it still
+                          exists.
     """
 
-    def __init__(self, target_size=10, labels=None):
+    def __init__(self, target_size=10, labels=None, max_idle_time=3000):
         super(BurstyPool, self).__init__(labels=labels)
         self.target_size = target_size
         self._database = None
+        self._max_idle = datetime.timedelta(seconds=max_idle_time)
         self._sessions = queue.LifoQueue(target_size)
 
     def bind(self, database):
@@ -281,7 +500,7 @@ class BurstyPool(AbstractSessionPool):
             session = self._new_session()
             session.create()
         else:
-            if not session.exists():
+            if _idle_longer_than(session, self._max_idle) and not session.exists():
                 session = self._new_session()
                 session.create()
         return session
@@ -295,6 +514,7 @@ class BurstyPool(AbstractSessionPool):
         :type session: :class:`~google.cloud.spanner_v1.session.Session`
         :param session: the session being returned.
         """
+        session._last_use_time = _NOW()
         try:
             self._sessions.put_nowait(session)
         except queue.Full:
@@ -332,8 +552,10 @@ class PingingPool(AbstractSessionPool):
       never expected in normal practice, as users should be calling
       :meth:`get` followed by :meth:`put` whenever in need of a session.
 
-    The application is responsible for calling :meth:`ping` at appropriate
-    times, e.g. from a background thread.
+    Unless ``maintenance_interval`` is passed, the application is responsible
+    for calling :meth:`ping` at appropriate times, e.g. from a background
+    thread.  If it is passed, the pool starts its own daemon thread when it
+    is bound to a database, and stops it in :meth:`clear`.
 
     :type size: int
     :param size: fixed pool size
@@ -348,12 +570,41 @@ class PingingPool(AbstractSessionPool):
     :type labels: dict (str -> str) or None
     :param labels: (Optional) user-assigned labels for sessions created
                     by the pool.
+
+    :type maintenance_interval: int
+    :param maintenance_interval:
+        (Optional) interval, in seconds, at which the pool's own background
+        thread refreshes sessions which would otherwise become due for a
+        ping before the next run.
+
+    :type warm_up_workers: int
+    :param warm_up_workers: (Optional) maximum number of concurrent
+                            ``BatchCreateSessions`` requests made by
+                            :meth:`bind`.
+
+    :type background_warm_up: bool
+    :param background_warm_up: (Optional) if True, :meth:`bind` returns
+                               immediately while sessions are created in a
+                               background thread;  :meth:`get` blocks only
+                               until a session is available.
     """
 
-    def __init__(self, size=10, default_timeout=10, ping_interval=3000, labels=None):
+    def __init__(
+        self,
+        size=10,
+        default_timeout=10,
+        ping_interval=3000,
+        labels=None,
+        maintenance_interval=None,
+        warm_up_workers=4,
+        background_warm_up=False,
+    ):
         super(PingingPool, self).__init__(labels=labels)
         self.size = size
         self.default_timeout = default_timeout
+        self.maintenance_interval = maintenance_interval
+        self.warm_up_workers = warm_up_workers
+        self.background_warm_up = background_warm_up
         self._delta = datetime.timedelta(seconds=ping_interval)
         self._sessions = queue.PriorityQueue(size)
 
@@ -365,21 +616,22 @@ class PingingPool(AbstractSessionPool):
                          when needed.
         """
         self._database = database
-        api = database.spanner_api
-        metadata = _metadata_with_prefix(database.name)
-        created_session_count = 0
-
-        while created_session_count < self.size:
-            resp = api.batch_create_sessions(
-                database=database.name,
-                session_count=self.size - created_session_count,
-                metadata=metadata,
-            )
-            for session_pb in resp.session:
-                session = self._new_session()
-                session._session_id = session_pb.name.split("/")[-1]
-                self.put(session)
-            created_session_count += len(resp.session)
+
+        add_session = self._add_created_session
+        if self.background_warm_up:
+            self._start_warm_up(self.size, add_session, self.warm_up_workers)
+        else:
+            self._warm_up(self.size, add_session, self.warm_up_workers)
+
+        if self.maintenance_interval is not None:
+            self._start_maintenance()
+
+    def _add_created_session(self, session):
+        """Add a session created by :meth:`bind` to the pool.
+
+        Called from the warm-up threads.
+        """
+        self.put(session)
 
     def get(self, timeout=None):  # pylint: disable=arguments-differ
         """Check a session out from the pool.
@@ -395,7 +647,11 @@ class PingingPool(AbstractSessionPool):
         if timeout is None:
             timeout = self.default_timeout
 
-        ping_after, session = self._sessions.get(block=True, timeout=timeout)
+        try:
+            ping_after, session = self._sessions.get(block=True, timeout=timeout)
+        except queue.Empty:
+            self._raise_warm_up_error()
+            raise
 
         if _NOW() > ping_after:
             # Using session.exists() guarantees the returned session exists.
@@ -420,7 +676,11 @@ class PingingPool(AbstractSessionPool):
         self._sessions.put_nowait((_NOW() + self._delta, session))
 
     def clear(self):
-        """Delete all sessions in the pool."""
+        """Delete all sessions in the pool.
+
+        Stops the pool's maintenance thread, if running, before deleting.
+        """
+        self._stop_maintenance()
         while True:
             try:
                 _, session = self._sessions.get(block=False)
@@ -435,23 +695,56 @@ class PingingPool(AbstractSessionPool):
         This method is designed to be called from a background thread,
         or during the "idle" phase of an event loop.
         """
+        self._ping_due_before(_NOW())
+
+    def _ping_due_before(self, deadline):
+        """Helper for :meth:`ping` and :meth:`_maintain`.
+
+        :type deadline: :class:`datetime.datetime`
+        :param deadline: sessions due to be pinged before this time are
+                         refreshed, each at most once per call.
+        """
+        # A refreshed session is due again after ``ping_interval``, which
+        # may still be before ``deadline``:  stop when it comes back round.
+        pinged = set()
         while True:
             try:
                 ping_after, session = self._sessions.get(block=False)
             except queue.Empty:  # all sessions in use
                 break
-            if ping_after > _NOW():  # oldest session is fresh
+            if ping_after > deadline or id(session) in pinged:
                 # Re-add to queue with existing expiration
                 self._sessions.put((ping_after, session))
                 break
             try:
                 session.ping()
             except NotFound:
-                session = self._new_session()
-                session.create()
+                replacement = self._new_session()
+                try:
+                    replacement.create()
+                except Exception:
+                    # Keep the stale session, to be re-created later.
+                    self._sessions.put((ping_after, session))
+                    raise
+                session = replacement
+            except Exception:
+                # Keep the session for a later attempt rather than
+                # dropping it from the pool.
+                self._sessions.put((ping_after, session))
+                raise
+            pinged.add(id(session))
             # Re-add to queue with new expiration
             self.put(session)
 
+    def _maintain(self):
+        """Run one round of background maintenance.
+
+        Pings sessions which would become due before the next round, so
+        that :meth:`get` does not have to check them on the request path.
+        """
+        interval = datetime.timedelta(seconds=self.maintenance_interval)
+        self._ping_due_before(_NOW() + interval)
+
 
 class TransactionPingingPool(PingingPool):
     """Concrete session pool implementation:
@@ -462,8 +755,10 @@ class TransactionPingingPool(PingingPool):
     When a session is returned to the pool, if its transaction has been
     committed or rolled back, the pool creates a new transaction for the
     session and pushes the transaction onto a separate queue of "transactions
-    to begin."  The application is responsible for flushing this queue
-    as appropriate via the pool's :meth:`begin_pending_transactions` method.
+    to begin."  Unless ``maintenance_interval`` is passed, the application is
+    responsible for flushing this queue as appropriate via the pool's
+    :meth:`begin_pending_transactions` method.  Otherwise, the pool's
+    maintenance thread flushes it along with pinging sessions.
 
     :type size: int
     :param size: fixed pool size
@@ -478,13 +773,46 @@ class TransactionPingingPool(PingingPool):
     :type labels: dict (str -> str) or None
     :param labels: (Optional) user-assigned labels for sessions created
                     by the pool.
+
+    :type maintenance_interval: int
+    :param maintenance_interval:
+        (Optional) interval, in seconds, at which the pool's own background
+        thread pings sessions and begins pending transactions.
+
+    :type warm_up_workers: int
+    :param warm_up_workers: (Optional) maximum number of concurrent
+                            ``BatchCreateSessions`` requests made by
+                            :meth:`bind`.  Each worker also begins the
+                            transactions of the sessions it creates.
+
+    :type background_warm_up: bool
+    :param background_warm_up: (Optional) if True, :meth:`bind` returns
+                               immediately while sessions are created, and
+                               their transactions begun, in a background
+                               thread;  :meth:`get` blocks only until a
+                               session is available.
     """
 
-    def __init__(self, size=10, default_timeout=10, ping_interval=3000, labels=None):
+    def __init__(
+        self,
+        size=10,
+        default_timeout=10,
+        ping_interval=3000,
+        labels=None,
+        maintenance_interval=None,
+        warm_up_workers=4,
+        background_warm_up=False,
+    ):
         self._pending_sessions = queue.Queue()
 
         super(TransactionPingingPool, self).__init__(
-            size, default_timeout, ping_interval, labels=labels
+            size,
+            default_timeout,
+            ping_interval,
+            labels=labels,
+            maintenance_interval=maintenance_interval,
+            warm_up_workers=warm_up_workers,
+            background_warm_up=background_warm_up,
         )
 
         self.begin_pending_transactions()
@@ -519,13 +847,321 @@ class TransactionPingingPool(PingingPool):
         else:
             super(TransactionPingingPool, self).put(session)
 
+    def _add_created_session(self, session):
+        """Begin a transaction for a session created by :meth:`bind`, and add it.
+
+        Beginning it here, rather than leaving it to
+        :meth:`begin_pending_transactions`, makes sessions created in the
+        background available as soon as they are ready.
+        """
+        session.transaction().begin()
+        super(TransactionPingingPool, self).put(session)
+
     def begin_pending_transactions(self):
         """Begin all transactions for sessions added to the pool."""
-        while not self._pending_sessions.empty():
-            session = self._pending_sessions.get()
-            session._transaction.begin()
+        while True:
+            try:
+                session = self._pending_sessions.get(block=False)
+            except queue.Empty:
+                break
+            try:
+                session._transaction.begin()
+            except Exception:
+                # Keep the session pending for a later attempt rather than
+                # dropping it from the pool.
+                self._pending_sessions.put(session)
+                raise
             super(TransactionPingingPool, self).put(session)
 
+    def _maintain(self):
+        """Run one round of background maintenance.
+
+        Begins pending transactions in addition to pinging sessions.
+        """
+        self.begin_pending_transactions()
+        super(TransactionPingingPool, self)._maintain()
+
+
+class ElasticPool(AbstractSessionPool):
+    """Concrete session pool implementation:
+
+    - Pre-allocates / creates ``min_sessions`` sessions.
+
+    - Grows by up to ``growth_step`` sessions at a time, using a single
+      ``BatchCreateSessions`` request, when :meth:`get` is called on an
+      empty pool, until the pool owns ``max_sessions`` sessions.
+
+    - Once at ``max_sessions``, blocks, with a timeout, when :meth:`get` is
+      called on an empty pool.  Returned sessions are handed to waiting
+      callers in the order in which they started waiting.  Raises after
+      timing out.
+
+    - Deletes sessions which have been idle for longer than ``idle_timeout``
+      via :meth:`shrink`, down to ``min_sessions`` sessions.
+
+    - "Pings" existing sessions via :meth:`session.exists` before returning
+      them, if they have been idle for longer than ``max_idle_time``.
+
+    Unless ``maintenance_interval`` is passed, the application is
+    responsible for calling :meth:`shrink` at appropriate times, e.g. from a
+    background thread.
+
+    :type min_sessions: int
+    :param min_sessions: number of sessions created when the pool is bound,
+                         and kept when shrinking.
+
+    :type max_sessions: int
+    :param max_sessions: maximum number of sessions owned by the pool.
+
+    :type growth_step: int
+    :param growth_step: maximum number of sessions created at a time.
+
+    :type default_timeout: int
+    :param default_timeout: default timeout, in seconds, to wait for
+                            a returned session.
+
+    :type idle_timeout: int
+    :param idle_timeout: seconds after which an unused session is deleted
+                         by :meth:`shrink`.
+
+    :type labels: dict (str -> str) or None
+    :param labels: (Optional) user-assigned labels for sessions created
+                    by the pool.
+
+    :type max_idle_time: int
+    :param max_idle_time: (Optional) seconds a session may stay unused in
+                          the pool before :meth:`get` checks that it still
+                          exists.
+
+    :type maintenance_interval: int
+    :param maintenance_interval:
+        (Optional) interval, in seconds, at which the pool's own background
+        thread calls :meth:`shrink`.
+
+    :raises ValueError: if the size limits are inconsistent.
+    """
+
+    def __init__(
+        self,
+        min_sessions=10,
+        max_sessions=100,
+        growth_step=10,
+        default_timeout=10,
+        idle_timeout=600,
+        labels=None,
+        max_idle_time=3000,
+        maintenance_interval=None,
+    ):
+        if not 0 <= min_sessions <= max_sessions:
+            raise ValueError("Require 0 <= 'min_sessions' <= 'max_sessions'.")
+        if growth_step < 1:
+            raise ValueError("'growth_step' must be positive.")
+
+        super(ElasticPool, self).__init__(labels=labels)
+        self.min_sessions = min_sessions
+        self.max_sessions = max_sessions
+        self.growth_step = growth_step
+        self.default_timeout = default_timeout
+        self.maintenance_interval = maintenance_interval
+        self._idle_timeout = datetime.timedelta(seconds=idle_timeout)
+        self._max_idle = datetime.timedelta(seconds=max_idle_time)
+        self._lock = threading.Lock()
+        self._sessions = collections.deque()  # least recently used first
+        self._waiters = collections.deque()  # longest waiting first
+        self._size = 0  # sessions owned, including checked out / pending
+
+    @property
+    def size(self):
+        """Number of sessions owned by the pool, including checked-out ones.
+
+        :rtype: int
+        :returns: the current pool size
+        """
+        return self._size
+
+    def bind(self, database):
+        """Associate the pool with a database.
+
+        :type database: :class:`~google.cloud.spanner_v1.database.Database`
+        :param database: database used by the pool:  used to create sessions
+                         when needed.
+        """
+        self._database = database
+        with self._lock:
+            count = max(self.min_sessions - self._size, 0)
+            self._size += count
+        self._create_sessions(count)
+
+        if self.maintenance_interval is not None:
+            self._start_maintenance()
+
+    def _create_sessions(self, count):
+        """Create sessions in as few requests as possible, adding them to the pool.
+
+        :type count: int
+        :param count: number of sessions already reserved in :attr:`size`.
+        """
+        api = self._database.spanner_api
+        metadata = _metadata_with_prefix(self._database.name)
+        created = 0
+        try:
+            while created < count:
+                resp = api.batch_create_sessions(
+                    database=self._database.name,
+                    session_count=count - created,
+                    metadata=metadata,
+                )
+                for session_pb in resp.session:
+                    session = self._new_session()
+                    session._session_id = session_pb.name.split("/")[-1]
+                    self.put(session)
+                created += len(resp.session)
+        finally:
+            if created < count:
+                with self._lock:
+                    self._size -= count - created
+
+    def get(self, timeout=None):  # pylint: disable=arguments-differ
+        """Check a session out from the pool.
+
+        :type timeout: int
+        :param timeout: seconds to block waiting for an available session
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: an existing session from the pool, or a newly-created
+                  session.
+        :raises: :exc:`six.moves.queue.Empty` if no session becomes
+                 available before the timeout.
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+
+        growth = 0
+        with self._lock:
+            if self._sessions and not self._waiters:
+                session = self._sessions.pop()
+                waiter = None
+            else:
+                waiter = _SessionWaiter()
+                self._waiters.append(waiter)
+                if self._size < self.max_sessions:
+                    growth = min(self.growth_step, self.max_sessions - self._size)
+                    self._size += growth
+
+        if waiter is not None:
+            if growth:
+                try:
+                    self._create_sessions(growth)
+                except Exception:
+                    self._abandon(waiter)
+                    raise
+            session = self._wait(waiter, timeout)
+
+        if _idle_longer_than(session, self._max_idle) and not session.exists():
+            session = self._new_session()
+            session.create()
+
+        return session
+
+    def _wait(self, waiter, timeout):
+        """Helper for :meth:`get`:  wait for a session to be handed over.
+
+        :type waiter: :class:`_SessionWaiter`
+        :param waiter: the caller's entry in the queue of waiters.
+
+        :type timeout: int
+        :param timeout: seconds to block waiting for an available session
+
+        :rtype: :class:`~google.cloud.spanner_v1.session.Session`
+        :returns: the session handed over by :meth:`put`.
+        :raises: :exc:`six.moves.queue.Empty` after timing out.
+        """
+        waiter.ready.wait(timeout)
+        with self._lock:
+            if waiter.session is None:
+                self._waiters.remove(waiter)
+                raise queue.Empty()
+        return waiter.session
+
+    def _abandon(self, waiter):
+        """Helper for :meth:`get`:  stop waiting, returning any handed-over session.
+
+        :type waiter: :class:`_SessionWaiter`
+        :param waiter: the caller's entry in the queue of waiters.
+        """
+        with self._lock:
+            if waiter.session is None:
+                self._waiters.remove(waiter)
+                return
+        self.put(waiter.session)
+
+    def put(self, session):
+        """Return a session to the pool.
+
+        Never blocks:  hands the session to the longest-waiting caller of
+        :meth:`get`, if any.
+
+        :type session: :class:`~google.cloud.spanner_v1.session.Session`
+        :param session: the session being returned.
+        """
+        session._last_use_time = _NOW()
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.session = session
+                waiter.ready.set()
+            else:
+                self._sessions.append(session)
+
+    def shrink(self):
+        """Delete sessions idle for longer than ``idle_timeout``.
+
+        Keeps at least ``min_sessions`` sessions.  This method is designed
+        to be called from a background thread, or during the "idle" phase
+        of an event loop.
+        """
+        expired = []
+        with self._lock:
+            threshold = _NOW() - self._idle_timeout
+            while (
+                self._sessions
+                and self._size > self.min_sessions
+                and self._sessions[0]._last_use_time < threshold
+            ):
+                expired.append(self._sessions.popleft())
+                self._size -= 1
+
+        for session in expired:
+            try:
+                session.delete()
+            except NotFound:
+                pass
+
+    def _maintain(self):
+        """Run one round of background maintenance."""
+        self.shrink()
+
+    def clear(self):
+        """Delete all sessions in the pool.
+
+        Stops the pool's maintenance thread, if running, before deleting.
+        """
+        self._stop_maintenance()
+        with self._lock:
+            sessions, self._sessions = self._sessions, collections.deque()
+            self._size -= len(sessions)
+
+        for session in sessions:
+            session.delete()
+
+
+class _SessionWaiter(object):
+    """Caller of :meth:`ElasticPool.get` waiting for a returned session."""
+
+    def __init__(self):
+        self.ready = threading.Event()
+        self.session = None
+
 
 class SessionCheckout(object):
     """Context manager: hold session checked out from a pool.
@@ -0,0 +1,247 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Policies for retrying aborted read-write transactions."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+import random
+import threading
+import time
+
+from google.rpc.error_details_pb2 import RetryInfo
+
+JITTER_NONE = "none"
+"""Wait exactly the computed delay."""
+
+JITTER_FULL = "full"
+"""Wait a random time between zero and the computed delay."""
+
+JITTER_EQUAL = "equal"
+"""Wait half the computed delay, plus a random time up to the other half."""
+
+_JITTERS = {
+    JITTER_NONE: lambda delay: delay,
+    JITTER_FULL: lambda delay: random.uniform(0, delay),
+    JITTER_EQUAL: lambda delay: delay / 2 + random.uniform(0, delay / 2),
+}
+
+DEFAULT_RETRY_DEADLINE = 30
+"""Default time, in seconds, for retrying an aborted transaction."""
+
+
+class AbortStats(object):
+    """Counts of aborted and committed read-write transaction attempts.
+
+    Each :class:`~google.cloud.spanner_v1.database.Database` keeps one, for
+    its retry policy to adapt to contention.  Safe to update from several
+    threads.
+
+    :type smoothing: float
+    :param smoothing: (Optional) weight of the latest attempt in
+                      :attr:`contention`, between 0 (excluded) and 1.
+
+    :raises ValueError: if ``smoothing`` is out of range.
+    """
+
+    def __init__(self, smoothing=0.1):
+        if not 0 < smoothing <= 1:
+            raise ValueError("'smoothing' must be in (0, 1]")
+        self.aborts = 0
+        self.commits = 0
+        self.contention = 0.0  # Moving average of the fraction aborted
+        self._smoothing = smoothing
+        self._lock = threading.Lock()
+
+    def record_abort(self):
+        """Count an attempt which was aborted."""
+        with self._lock:
+            self.aborts += 1
+            self.contention += self._smoothing * (1.0 - self.contention)
+
+    def record_commit(self):
+        """Count an attempt which committed."""
+        with self._lock:
+            self.commits += 1
+            self.contention -= self._smoothing * self.contention
+
+    @property
+    def abort_ratio(self):
+        """Fraction of all attempts so far which aborted.
+
+        :rtype: float
+        """
+        attempts = self.aborts + self.commits
+        if not attempts:
+            return 0.0
+        return self.aborts / attempts
+
+    def __repr__(self):
+        return "AbortStats(aborts=%d, commits=%d, contention=%.3f)" % (
+            self.aborts,
+            self.commits,
+            self.contention,
+        )
+
+
+class AbortRetryPolicy(object):
+    """Policy for retrying aborted read-write transactions.
+
+    If the back-end says how long to wait before retrying, waits that long.
+    Otherwise, waits a delay growing exponentially with the number of
+    attempts, up to ``maximum``, with jitter.  The delay grows with the
+    recent contention of the database, if its abort statistics are passed.
+    Gives up once the next attempt would start after the deadline.
+
+    :type initial: float
+    :param initial: (Optional) delay before the first retry, in seconds.
+
+    :type maximum: float
+    :param maximum: (Optional) maximum delay, in seconds.
+
+    :type multiplier: float
+    :param multiplier: (Optional) growth of the delay for each attempt.
+
+    :type jitter: str
+    :param jitter: (Optional) one of :data:`JITTER_FULL` (the default),
+                   :data:`JITTER_EQUAL` or :data:`JITTER_NONE`.
+
+    :type deadline: float
+    :param deadline: (Optional) time after the first attempt, in seconds,
+                     after which to stop retrying.
+
+    :type max_attempts: int
+    :param max_attempts: (Optional) maximum number of attempts;  unlimited
+                         if not passed.
+
+    :type contention_weight: float
+    :param contention_weight: (Optional) how much contention lengthens the
+                              delay:  it is multiplied by
+                              ``1 + contention_weight * stats.contention``.
+
+    :raises ValueError: for an unknown ``jitter``, or invalid delays.
+    """
+
+    def __init__(
+        self,
+        initial=0.02,
+        maximum=1.0,
+        multiplier=2.0,
+        jitter=JITTER_FULL,
+        deadline=DEFAULT_RETRY_DEADLINE,
+        max_attempts=None,
+        contention_weight=1.0,
+    ):
+        if jitter not in _JITTERS:
+            raise ValueError("Unknown jitter: %r" % (jitter,))
+        if initial < 0 or maximum < initial or multiplier < 1:
+            raise ValueError("Invalid 'initial' / 'maximum' / 'multiplier'")
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.deadline = deadline
+        self.max_attempts = max_attempts
+        self.contention_weight = contention_weight
+
+    def get_delay(self, attempts, exc=None, stats=None):
+        """Compute the delay before retrying.
+
+        :type attempts: int
+        :param attempts: number of attempts made so far.
+
+        :type exc: :class:`google.api_core.exceptions.Aborted`
+        :param exc: (Optional) exception for the aborted attempt.
+
+        :type stats: :class:`AbortStats`
+        :param stats: (Optional) abort statistics of the database.
+
+        :rtype: float
+        :returns: seconds to wait before the next attempt.
+        """
+        if exc is not None and exc.errors:
+            server_delay = _get_server_delay(exc.errors[0])
+            if server_delay is not None:
+                return server_delay
+
+        delay = self.initial * self.multiplier ** max(attempts - 1, 0)
+        if stats is not None:
+            delay *= 1 + self.contention_weight * stats.contention
+        return _JITTERS[self.jitter](min(delay, self.maximum))
+
+    def retry_delay(self, exc, attempts, deadline, stats=None):
+        """Decide whether to retry an aborted attempt.
+
+        :type exc: :class:`google.api_core.exceptions.Aborted`
+        :param exc: exception for the aborted attempt.
+
+        :type attempts: int
+        :param attempts: number of attempts made so far.
+
+        :type deadline: float
+        :param deadline: time (as from :func:`time.time`) after which to
+                         stop retrying.
+
+        :type stats: :class:`AbortStats`
+        :param stats: (Optional) abort statistics of the database.
+
+        :rtype: float
+        :returns: seconds to wait before the next attempt, or None to give up.
+        """
+        if self.max_attempts is not None and attempts >= self.max_attempts:
+            return None
+
+        now = time.time()
+        if now >= deadline:
+            return None
+
+        delay = self.get_delay(attempts, exc, stats)
+        if now + delay > deadline:
+            return None
+        return delay
+
+
+DEFAULT_RETRY_POLICY = AbortRetryPolicy()
+"""Default policy for retrying aborted transactions."""
+
+DEFAULT_PDML_RETRY_DEADLINE = 120
+"""Default time, in seconds, for retrying an aborted partitioned DML."""
+
+DEFAULT_PDML_RETRY_POLICY = AbortRetryPolicy(
+    initial=0.02, maximum=32, multiplier=1.3, deadline=DEFAULT_PDML_RETRY_DEADLINE
+)
+"""Default policy for retrying aborted partitioned DML statements."""
+
+
+def _get_server_delay(cause):
+    """Helper for :meth:`AbortRetryPolicy.get_delay`.
+
+    :type cause: :class:`grpc.Call`
+    :param cause: the error of the aborted call.
+
+    :rtype: float
+    :returns: the delay the back-end asked for, in seconds, or None.
+    """
+    metadata = dict(cause.trailing_metadata())
+    retry_info_pb = metadata.get("google.rpc.retryinfo-bin")
+    if retry_info_pb is None:
+        return None
+    retry_info = RetryInfo()
+    retry_info.ParseFromString(retry_info_pb)
+    nanos = retry_info.retry_delay.nanos
+    return retry_info.retry_delay.seconds + nanos / 1.0e9
@@ -17,16 +17,12 @@ from __future__ import division
 from __future__ import unicode_literals
 from __future__ import print_function
 from __future__ import absolute_import
-from builtins import dict
 from future import standard_library
 standard_library.install_aliases()
 
 from functools import total_ordering
-import random
 import time
 
-from google.rpc.error_details_pb2 import RetryInfo
-
 # pylint: disable=ungrouped-imports
 from google.api_core.exceptions import Aborted
 from google.api_core.exceptions import GoogleAPICallError
@@ -35,6 +31,8 @@ import google.api_core.gapic_v1.method
 from google.cloud.spanner_v1._helpers import _metadata_with_prefix
 from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
 from google.cloud.spanner_v1.batch import Batch
+from google.cloud.spanner_v1.retry_policy import DEFAULT_RETRY_DEADLINE
+from google.cloud.spanner_v1.retry_policy import DEFAULT_RETRY_POLICY
 from google.cloud.spanner_v1.snapshot import Snapshot
 from google.cloud.spanner_v1.transaction import Transaction
 from google.cloud.spanner_v1 import ExecuteSqlRequest
@@ -43,7 +41,7 @@ from google.cloud.spanner_v1 import CreateSessionRequest
 # pylint: enable=ungrouped-imports
 
 
-DEFAULT_RETRY_TIMEOUT_SECS = 30
+DEFAULT_RETRY_TIMEOUT_SECS = DEFAULT_RETRY_DEADLINE
 """Default timeout used by :meth:`Session.run_in_transaction`."""
 
 
@@ -66,6 +64,7 @@ class Session(object):
 
     _session_id = None
     _transaction = None
+    _last_use_time = None
 
     def __init__(self, database, labels=None):
         self._database = database
@@ -133,6 +132,16 @@ class Session(object):
             session_pb = api.create_session(request=request, metadata=metadata,)
         self._session_id = session_pb.name.split("/")[-1]
 
+    def _recreate(self):
+        """Replace this session, after the back-end deleted it.
+
+        Keeps this object, e.g. its place in a pool, but creates a new
+        back-end session for it, discarding any transaction state.
+        """
+        self._session_id = None
+        self._transaction = None
+        self.create()
+
     def exists(self):
         """Test for the existence of this session.
 
@@ -322,7 +331,10 @@ class Session(object):
         :param kw: (Optional) keyword arguments to be passed to ``func``.
                    If passed, "timeout_secs" will be removed and used to
                    override the default retry timeout which defines maximum timestamp
-                   to continue retrying the transaction.
+                   to continue retrying the transaction.  If passed,
+                   "retry_policy" will be removed and used instead of the
+                   database's
+                   :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`.
 
         :rtype: Any
         :returns: The return value of ``func``.
@@ -330,7 +342,9 @@ class Session(object):
         :raises Exception:
             reraises any non-ABORT execptions raised by ``func``.
         """
-        deadline = time.time() + kw.pop("timeout_secs", DEFAULT_RETRY_TIMEOUT_SECS)
+        policy = kw.pop("retry_policy", None) or self._database.retry_policy
+        stats = self._database.abort_stats
+        deadline = time.time() + kw.pop("timeout_secs", policy.deadline)
         attempts = 0
 
         while True:
@@ -338,15 +352,14 @@ class Session(object):
                 txn = self.transaction()
             else:
                 txn = self._transaction
-            if txn._transaction_id is None:
-                txn.begin()
 
             try:
                 attempts += 1
                 return_value = func(txn, *args, **kw)
             except Aborted as exc:
                 del self._transaction
-                _delay_until_retry(exc, deadline, attempts)
+                stats.record_abort()
+                _delay_until_retry(exc, deadline, attempts, policy, stats)
                 continue
             except GoogleAPICallError:
                 del self._transaction
@@ -359,11 +372,13 @@ class Session(object):
                 txn.commit()
             except Aborted as exc:
                 del self._transaction
-                _delay_until_retry(exc, deadline, attempts)
+                stats.record_abort()
+                _delay_until_retry(exc, deadline, attempts, policy, stats)
             except GoogleAPICallError:
                 del self._transaction
                 raise
             else:
+                stats.record_commit()
                 return return_value
 
 
@@ -371,10 +386,10 @@ class Session(object):
 #
 # Rational:  this function factors out complex shared deadline / retry
 #            handling from two `except:` clauses.
-def _delay_until_retry(exc, deadline, attempts):
+def _delay_until_retry(exc, deadline, attempts, retry_policy=None, stats=None):
     """Helper for :meth:`Session.run_in_transaction`.
 
-    Detect retryable abort, and impose server-supplied delay.
+    Detect retryable abort, and wait as long as the retry policy says.
 
     :type exc: :class:`google.api_core.exceptions.Aborted`
     :param exc: exception for aborted transaction
@@ -384,44 +399,23 @@ def _delay_until_retry(exc, deadline, attempts):
 
     :type attempts: int
     :param attempts: number of call retries
-    """
-    cause = exc.errors[0]
 
-    now = time.time()
+    :type retry_policy:
+        :class:`~google.cloud.spanner_v1.retry_policy.AbortRetryPolicy`
+    :param retry_policy: (Optional) policy deciding the delay;  defaults to
+                         :data:`~google.cloud.spanner_v1.retry_policy.DEFAULT_RETRY_POLICY`.
 
-    if now >= deadline:
-        raise
-
-    delay = _get_retry_delay(cause, attempts)
-    if delay is not None:
+    :type stats: :class:`~google.cloud.spanner_v1.retry_policy.AbortStats`
+    :param stats: (Optional) abort statistics of the database.
+    """
+    if retry_policy is None:
+        retry_policy = DEFAULT_RETRY_POLICY
 
-        if now + delay > deadline:
-            raise
+    delay = retry_policy.retry_delay(exc, attempts, deadline, stats)
+    if delay is None:
+        raise
 
-        time.sleep(delay)
+    time.sleep(delay)
 
 
 # pylint: enable=misplaced-bare-raise
-
-
-def _get_retry_delay(cause, attempts):
-    """Helper for :func:`_delay_until_retry`.
-
-    :type exc: :class:`grpc.Call`
-    :param exc: exception for aborted transaction
-
-    :rtype: float
-    :returns: seconds to wait before retrying the transaction.
-
-    :type attempts: int
-    :param attempts: number of call retries
-    """
-    metadata = dict(cause.trailing_metadata())
-    retry_info_pb = metadata.get("google.rpc.retryinfo-bin")
-    if retry_info_pb is not None:
-        retry_info = RetryInfo()
-        retry_info.ParseFromString(retry_info_pb)
-        nanos = retry_info.retry_delay.nanos
-        return retry_info.retry_delay.seconds + nanos / 1.0e9
-
-    return 2 ** attempts + random.random()
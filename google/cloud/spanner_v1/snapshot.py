@@ -22,6 +22,11 @@ from future import standard_library
 standard_library.install_aliases()
 
 import functools
+import sys
+import threading
+
+import six
+from six.moves import queue
 
 from google.protobuf.struct_pb2 import Struct
 from google.cloud.spanner_v1 import ExecuteSqlRequest
@@ -33,14 +38,18 @@ from google.cloud.spanner_v1 import PartitionQueryRequest
 from google.cloud.spanner_v1 import PartitionReadRequest
 
 from google.api_core.exceptions import InternalServerError
+from google.api_core.exceptions import NotFound
 from google.api_core.exceptions import ServiceUnavailable
 import google.api_core.gapic_v1.method
 from google.cloud.spanner_v1._helpers import _make_value_pb
 from google.cloud.spanner_v1._helpers import _merge_query_options
 from google.cloud.spanner_v1._helpers import _metadata_with_prefix
+from google.cloud.spanner_v1._helpers import _session_not_found
 from google.cloud.spanner_v1._helpers import _SessionWrapper
 from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
+from google.cloud.spanner_v1.streamed import BYTES_AS_BASE64
 from google.cloud.spanner_v1.streamed import StreamedResultSet
+from google.cloud.spanner_v1.streamed import TIMESTAMP_AS_DATETIME
 
 _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES = (
     "RST_STREAM",
@@ -48,14 +57,82 @@ _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES = (
 )
 
 
-def _restart_on_unavailable(restart, trace_name=None, session=None, attributes=None):
+BUFFER_OVERFLOW_FLUSH = "flush"
+"""Buffer overflow policy:  yield the buffered items, giving up resumption.
+
+Once buffered items have been yielded without a resume token, a failure
+of the stream before the next resume token is raised to the caller.
+"""
+
+BUFFER_OVERFLOW_RAISE = "raise"
+"""Buffer overflow policy:  raise :exc:`BufferExceeded`."""
+
+_BUFFER_OVERFLOW_POLICIES = (BUFFER_OVERFLOW_FLUSH, BUFFER_OVERFLOW_RAISE)
+
+_PREFETCH_POLL_INTERVAL = 0.1  # seconds
+
+
+class BufferExceeded(RuntimeError):
+    """Partial results buffered while awaiting a resume token exceed the limit.
+
+    :type max_buffer_bytes: int
+    :param max_buffer_bytes: the limit which was exceeded
+    """
+
+    def __init__(self, max_buffer_bytes):
+        message = (
+            "Partial results received since the last resume token exceed "
+            "%d bytes" % (max_buffer_bytes,)
+        )
+        super(BufferExceeded, self).__init__(message)
+        self.max_buffer_bytes = max_buffer_bytes
+
+
+def _item_size(item):
+    """Serialized size of a partial result set.
+
+    :type item: :class:`~google.cloud.spanner_v1.PartialResultSet`
+    :param item: item received from the stream
+
+    :rtype: int
+    :returns: size in bytes
+    """
+    return getattr(item, "_pb", item).ByteSize()
+
+
+def _restart_on_unavailable(
+    restart,
+    trace_name=None,
+    session=None,
+    attributes=None,
+    max_buffer_bytes=None,
+    buffer_overflow=BUFFER_OVERFLOW_FLUSH,
+):
     """Restart iteration after :exc:`.ServiceUnavailable`.
 
+    Items are held back until one carrying a resume token is received, so
+    that none is yielded twice if the stream must be restarted.
+
     :type restart: callable
     :param restart: curried function returning iterator
+
+    :type max_buffer_bytes: int
+    :param max_buffer_bytes: (Optional) limit on the serialized size of the
+        items held back.  If not passed, the buffer is unbounded.
+
+    :type buffer_overflow: str
+    :param buffer_overflow: policy applied once ``max_buffer_bytes`` is
+        exceeded:  one of :data:`BUFFER_OVERFLOW_FLUSH` or
+        :data:`BUFFER_OVERFLOW_RAISE`.
+
+    :raises BufferExceeded:
+        if ``max_buffer_bytes`` is exceeded and ``buffer_overflow`` is
+        :data:`BUFFER_OVERFLOW_RAISE`.
     """
     resume_token = b""
     item_buffer = []
+    buffer_bytes = 0
+    resumable = True
     with trace_call(trace_name, session, attributes):
         iterator = restart()
     while True:
@@ -64,9 +141,20 @@ def _restart_on_unavailable(restart, trace_name=None, session=None, attributes=N
                 item_buffer.append(item)
                 if item.resume_token:
                     resume_token = item.resume_token
+                    resumable = True
                     break
+                if max_buffer_bytes is not None:
+                    buffer_bytes += _item_size(item)
+                    if buffer_bytes > max_buffer_bytes:
+                        if buffer_overflow == BUFFER_OVERFLOW_RAISE:
+                            raise BufferExceeded(max_buffer_bytes)
+                        resumable = False
+                        break
         except ServiceUnavailable:
+            if not resumable:
+                raise
             del item_buffer[:]
+            buffer_bytes = 0
             with trace_call(trace_name, session, attributes):
                 iterator = restart(resume_token=resume_token)
             continue
@@ -75,9 +163,10 @@ def _restart_on_unavailable(restart, trace_name=None, session=None, attributes=N
                 resumable_message in exc.message
                 for resumable_message in _STREAM_RESUMPTION_INTERNAL_ERROR_MESSAGES
             )
-            if not resumable_error:
+            if not resumable_error or not resumable:
                 raise
             del item_buffer[:]
+            buffer_bytes = 0
             with trace_call(trace_name, session, attributes):
                 iterator = restart(resume_token=resume_token)
             continue
@@ -89,6 +178,159 @@ def _restart_on_unavailable(restart, trace_name=None, session=None, attributes=N
             yield item
 
         del item_buffer[:]
+        buffer_bytes = 0
+
+
+class _PrefetchDone(object):
+    """Marks the end of a prefetched stream, with the error ending it, if any."""
+
+    def __init__(self, exc_info=None):
+        self.exc_info = exc_info
+
+
+def _prefetch(iterator, depth):
+    """Iterate in a background thread, keeping items ready ahead of the caller.
+
+    Receiving (and deserializing) the next items from the stream thus
+    overlaps with the caller's processing of the current one.  Errors raised
+    by ``iterator`` are re-raised to the caller once the items received
+    before them have been yielded.
+
+    :type iterator: iterator
+    :param iterator: items to be prefetched
+
+    :type depth: int
+    :param depth: maximum number of items held ready.
+    """
+    items = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+
+    def _put(item):
+        while not stopped.is_set():
+            try:
+                items.put(item, timeout=_PREFETCH_POLL_INTERVAL)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def _produce():
+        try:
+            for item in iterator:
+                if not _put(item):
+                    return
+        except Exception:  # pylint: disable=broad-except
+            _put(_PrefetchDone(sys.exc_info()))
+        else:
+            _put(_PrefetchDone())
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=_produce, name="spanner-prefetch")
+    thread.daemon = True
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if isinstance(item, _PrefetchDone):
+                if item.exc_info is not None:
+                    six.reraise(*item.exc_info)
+                return
+            yield item
+    finally:
+        stopped.set()
+
+
+def _make_result_iterator(
+    restart, trace_name, session, attributes, max_buffer_bytes, buffer_overflow, prefetch
+):
+    """Helper for :meth:`_SnapshotBase.read` / :meth:`_SnapshotBase.execute_sql`.
+
+    :rtype: iterator
+    :returns: partial result sets, resumed after transient errors and
+              optionally prefetched in a background thread.
+
+    :raises ValueError: for an unknown ``buffer_overflow`` policy, or a
+                        negative ``prefetch``.
+    """
+    if buffer_overflow not in _BUFFER_OVERFLOW_POLICIES:
+        raise ValueError("Unknown buffer overflow policy: %r" % (buffer_overflow,))
+    if prefetch < 0:
+        raise ValueError("'prefetch' must not be negative.")
+    iterator = _restart_on_unavailable(
+        restart,
+        trace_name,
+        session,
+        attributes,
+        max_buffer_bytes=max_buffer_bytes,
+        buffer_overflow=buffer_overflow,
+    )
+    if prefetch:
+        iterator = _prefetch(iterator, prefetch)
+    return iterator
+
+
+def _recreate_session_on_not_found(restart, session, request):
+    """Retry a single-use read / query once on a recreated session.
+
+    Single-use requests hold no state on the session, so if the back-end
+    deleted it, the request can be sent again with a new one.
+
+    :type restart: callable
+    :param restart: curried function returning iterator
+
+    :type session: :class:`~google.cloud.spanner_v1.session.Session`
+    :param session: the session used for the request
+
+    :type request: :class:`~google.cloud.spanner_v1.ReadRequest` or
+                   :class:`~google.cloud.spanner_v1.ExecuteSqlRequest`
+    :param request: the request passed to ``restart``
+
+    :rtype: callable
+    :returns: wrapped ``restart``
+    """
+
+    def restart_w_session(**kw):
+        try:
+            return restart(**kw)
+        except NotFound as exc:
+            if not _session_not_found(exc):
+                raise
+        session._recreate()
+        request.session = session.name
+        return restart(**kw)
+
+    return restart_w_session
+
+
+def _resume_in_begun_transaction(restart, source, request):
+    """Resume a read / query which began its transaction inline.
+
+    Once the transaction ID is known, a restarted request selects the
+    transaction by its ID, rather than beginning another one.
+
+    :type restart: callable
+    :param restart: curried function returning iterator
+
+    :type source: :class:`~google.cloud.spanner_v1.transaction.Transaction`
+    :param source: the transaction begun by the request
+
+    :type request: :class:`~google.cloud.spanner_v1.ReadRequest` or
+                   :class:`~google.cloud.spanner_v1.ExecuteSqlRequest`
+    :param request: the request passed to ``restart``
+
+    :rtype: callable
+    :returns: wrapped ``restart``
+    """
+
+    def restart_w_transaction_id(**kw):
+        if source._transaction_id is not None:
+            request.transaction = TransactionSelector(id=source._transaction_id)
+        return restart(**kw)
+
+    return restart_w_transaction_id
 
 
 class _SnapshotBase(_SessionWrapper):
@@ -116,7 +358,103 @@ class _SnapshotBase(_SessionWrapper):
         """
         raise NotImplementedError
 
-    def read(self, table, columns, keyset, index="", limit=0, partition=None):
+    def _check_reusable(self):
+        """Helper for :meth:`_make_read_request` et al.
+
+        :raises ValueError:
+            for reuse of single-use snapshots, or if a transaction ID is
+            already pending for multiple-use snapshots.
+        """
+        if self._read_request_count > 0:
+            if not self._multi_use:
+                raise ValueError("Cannot re-use single-use snapshot.")
+            if self._transaction_id is None:
+                raise ValueError("Transaction ID pending.")
+
+    def _make_read_request(self, table, columns, keyset, index, limit, partition):
+        """Helper for :meth:`read`:  build the ``ReadRequest``.
+
+        See :meth:`read` for the parameters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.ReadRequest`
+        :returns: the request.
+
+        :raises ValueError:
+            for reuse of single-use snapshots, or if a transaction ID is
+            already pending for multiple-use snapshots.
+        """
+        self._check_reusable()
+        return ReadRequest(
+            session=self._session.name,
+            table=table,
+            columns=columns,
+            key_set=keyset._to_pb(),
+            transaction=self._make_txn_selector(),
+            index=index,
+            limit=limit,
+            partition_token=partition,
+        )
+
+    def _make_execute_sql_request(
+        self, sql, params, param_types, query_mode, query_options, partition
+    ):
+        """Helper for :meth:`execute_sql`:  build the ``ExecuteSqlRequest``.
+
+        See :meth:`execute_sql` for the parameters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.ExecuteSqlRequest`
+        :returns: the request.
+
+        :raises ValueError:
+            for reuse of single-use snapshots, if a transaction ID is
+            already pending for multiple-use snapshots, or if ``params``
+            are passed without ``param_types``.
+        """
+        self._check_reusable()
+
+        if params is not None:
+            if param_types is None:
+                raise ValueError("Specify 'param_types' when passing 'params'.")
+            params_pb = Struct(
+                fields={key: _make_value_pb(value) for key, value in params.items()}
+            )
+        else:
+            params_pb = {}
+
+        database = self._session._database
+
+        # Query-level options have higher precedence than client-level and
+        # environment-level options
+        default_query_options = database._instance._client._query_options
+        query_options = _merge_query_options(default_query_options, query_options)
+
+        return ExecuteSqlRequest(
+            session=self._session.name,
+            sql=sql,
+            transaction=self._make_txn_selector(),
+            params=params_pb,
+            param_types=param_types,
+            query_mode=query_mode,
+            partition_token=partition,
+            seqno=self._execute_sql_count,
+            query_options=query_options,
+        )
+
+    def read(
+        self,
+        table,
+        columns,
+        keyset,
+        index="",
+        limit=0,
+        partition=None,
+        row_factory=None,
+        max_buffer_bytes=None,
+        buffer_overflow=BUFFER_OVERFLOW_FLUSH,
+        prefetch=0,
+        bytes_decoding=BYTES_AS_BASE64,
+        timestamp_decoding=TIMESTAMP_AS_DATETIME,
+    ):
         """Perform a ``StreamingRead`` API request for rows in a table.
 
         :type table: str
@@ -141,6 +479,40 @@ class _SnapshotBase(_SessionWrapper):
                           from :meth:`partition_read`.  Incompatible with
                           ``limit``.
 
+        :type row_factory: callable
+        :param row_factory: (Optional) row factory for the result set, e.g.
+            :func:`~google.cloud.spanner_v1.streamed.tuple_row_factory`.
+            If not passed, rows are lists.
+
+        :type max_buffer_bytes: int
+        :param max_buffer_bytes: (Optional) limit on the size of the partial
+            results held back while awaiting a resume token.  If not passed,
+            the buffer is unbounded.
+
+        :type buffer_overflow: str
+        :param buffer_overflow: (Optional) policy once ``max_buffer_bytes``
+            is exceeded: :data:`BUFFER_OVERFLOW_FLUSH` (the default) hands
+            the buffered results over, after which the stream can no longer
+            be resumed until the next resume token;
+            :data:`BUFFER_OVERFLOW_RAISE` raises :exc:`BufferExceeded`.
+
+        :type prefetch: int
+        :param prefetch: (Optional) if positive, receive up to this many
+            partial results ahead of the consumer in a background thread.
+
+        :type bytes_decoding: str
+        :param bytes_decoding: (Optional) how BYTES values are returned, see
+            :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`.
+            Pass :data:`~google.cloud.spanner_v1.streamed.BYTES_DECODED` to
+            get the decoded bytes instead of their base64 encoding.
+
+        :type timestamp_decoding: str
+        :param timestamp_decoding: (Optional) how TIMESTAMP values are
+            returned.  Pass
+            :data:`~google.cloud.spanner_v1.streamed.TIMESTAMP_AS_NANOSECONDS`
+            to get integer nanoseconds since the Unix epoch instead of
+            datetimes.
+
         :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
         :returns: a result set instance which can be used to consume rows.
 
@@ -148,42 +520,40 @@ class _SnapshotBase(_SessionWrapper):
             for reuse of single-use snapshots, or if a transaction ID is
             already pending for multiple-use snapshots.
         """
-        if self._read_request_count > 0:
-            if not self._multi_use:
-                raise ValueError("Cannot re-use single-use snapshot.")
-            if self._transaction_id is None:
-                raise ValueError("Transaction ID pending.")
-
+        request = self._make_read_request(
+            table, columns, keyset, index, limit, partition
+        )
         database = self._session._database
         api = database.spanner_api
         metadata = _metadata_with_prefix(database.name)
-        transaction = self._make_txn_selector()
-
-        request = ReadRequest(
-            session=self._session.name,
-            table=table,
-            columns=columns,
-            key_set=keyset._to_pb(),
-            transaction=transaction,
-            index=index,
-            limit=limit,
-            partition_token=partition,
-        )
         restart = functools.partial(
             api.streaming_read, request=request, metadata=metadata,
         )
+        if not self._multi_use:
+            restart = _recreate_session_on_not_found(restart, self._session, request)
+        elif "begin" in request.transaction:
+            restart = _resume_in_begun_transaction(restart, self, request)
 
         trace_attributes = {"table_id": table, "columns": columns}
-        iterator = _restart_on_unavailable(
-            restart, "CloudSpanner.ReadOnlyTransaction", self._session, trace_attributes
+        iterator = _make_result_iterator(
+            restart,
+            "CloudSpanner.ReadOnlyTransaction",
+            self._session,
+            trace_attributes,
+            max_buffer_bytes,
+            buffer_overflow,
+            prefetch,
         )
 
         self._read_request_count += 1
 
-        if self._multi_use:
-            return StreamedResultSet(iterator, source=self)
-        else:
-            return StreamedResultSet(iterator)
+        return StreamedResultSet(
+            iterator,
+            source=self if self._multi_use else None,
+            row_factory=row_factory,
+            bytes_decoding=bytes_decoding,
+            timestamp_decoding=timestamp_decoding,
+        )
 
     def execute_sql(
         self,
@@ -195,6 +565,12 @@ class _SnapshotBase(_SessionWrapper):
         partition=None,
         retry=google.api_core.gapic_v1.method.DEFAULT,
         timeout=google.api_core.gapic_v1.method.DEFAULT,
+        row_factory=None,
+        max_buffer_bytes=None,
+        buffer_overflow=BUFFER_OVERFLOW_FLUSH,
+        prefetch=0,
+        bytes_decoding=BYTES_AS_BASE64,
+        timestamp_decoding=TIMESTAMP_AS_DATETIME,
     ):
         """Perform an ``ExecuteStreamingSql`` API request.
 
@@ -228,6 +604,40 @@ class _SnapshotBase(_SessionWrapper):
         :param partition: (Optional) one of the partition tokens returned
                           from :meth:`partition_query`.
 
+        :type row_factory: callable
+        :param row_factory: (Optional) row factory for the result set, e.g.
+            :func:`~google.cloud.spanner_v1.streamed.tuple_row_factory`.
+            If not passed, rows are lists.
+
+        :type max_buffer_bytes: int
+        :param max_buffer_bytes: (Optional) limit on the size of the partial
+            results held back while awaiting a resume token.  If not passed,
+            the buffer is unbounded.
+
+        :type buffer_overflow: str
+        :param buffer_overflow: (Optional) policy once ``max_buffer_bytes``
+            is exceeded: :data:`BUFFER_OVERFLOW_FLUSH` (the default) hands
+            the buffered results over, after which the stream can no longer
+            be resumed until the next resume token;
+            :data:`BUFFER_OVERFLOW_RAISE` raises :exc:`BufferExceeded`.
+
+        :type prefetch: int
+        :param prefetch: (Optional) if positive, receive up to this many
+            partial results ahead of the consumer in a background thread.
+
+        :type bytes_decoding: str
+        :param bytes_decoding: (Optional) how BYTES values are returned, see
+            :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`.
+            Pass :data:`~google.cloud.spanner_v1.streamed.BYTES_DECODED` to
+            get the decoded bytes instead of their base64 encoding.
+
+        :type timestamp_decoding: str
+        :param timestamp_decoding: (Optional) how TIMESTAMP values are
+            returned.  Pass
+            :data:`~google.cloud.spanner_v1.streamed.TIMESTAMP_AS_NANOSECONDS`
+            to get integer nanoseconds since the Unix epoch instead of
+            datetimes.
+
         :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
         :returns: a result set instance which can be used to consume rows.
 
@@ -235,42 +645,12 @@ class _SnapshotBase(_SessionWrapper):
             for reuse of single-use snapshots, or if a transaction ID is
             already pending for multiple-use snapshots.
         """
-        if self._read_request_count > 0:
-            if not self._multi_use:
-                raise ValueError("Cannot re-use single-use snapshot.")
-            if self._transaction_id is None:
-                raise ValueError("Transaction ID pending.")
-
-        if params is not None:
-            if param_types is None:
-                raise ValueError("Specify 'param_types' when passing 'params'.")
-            params_pb = Struct(
-                fields={key: _make_value_pb(value) for key, value in params.items()}
-            )
-        else:
-            params_pb = {}
-
+        request = self._make_execute_sql_request(
+            sql, params, param_types, query_mode, query_options, partition
+        )
         database = self._session._database
         metadata = _metadata_with_prefix(database.name)
-        transaction = self._make_txn_selector()
         api = database.spanner_api
-
-        # Query-level options have higher precedence than client-level and
-        # environment-level options
-        default_query_options = database._instance._client._query_options
-        query_options = _merge_query_options(default_query_options, query_options)
-
-        request = ExecuteSqlRequest(
-            session=self._session.name,
-            sql=sql,
-            transaction=transaction,
-            params=params_pb,
-            param_types=param_types,
-            query_mode=query_mode,
-            partition_token=partition,
-            seqno=self._execute_sql_count,
-            query_options=query_options,
-        )
         restart = functools.partial(
             api.execute_streaming_sql,
             request=request,
@@ -278,22 +658,32 @@ class _SnapshotBase(_SessionWrapper):
             retry=retry,
             timeout=timeout,
         )
+        if not self._multi_use:
+            restart = _recreate_session_on_not_found(restart, self._session, request)
+        elif "begin" in request.transaction:
+            restart = _resume_in_begun_transaction(restart, self, request)
 
         trace_attributes = {"db.statement": sql}
-        iterator = _restart_on_unavailable(
+        iterator = _make_result_iterator(
             restart,
             "CloudSpanner.ReadWriteTransaction",
             self._session,
             trace_attributes,
+            max_buffer_bytes,
+            buffer_overflow,
+            prefetch,
         )
 
         self._read_request_count += 1
         self._execute_sql_count += 1
 
-        if self._multi_use:
-            return StreamedResultSet(iterator, source=self)
-        else:
-            return StreamedResultSet(iterator)
+        return StreamedResultSet(
+            iterator,
+            source=self if self._multi_use else None,
+            row_factory=row_factory,
+            bytes_decoding=bytes_decoding,
+            timestamp_decoding=timestamp_decoding,
+        )
 
     def partition_read(
         self,
@@ -485,6 +875,9 @@ class Snapshot(_SnapshotBase):
                       ``max_staleness`` and ``min_read_timestamp``.
     """
 
+    _return_read_timestamp = False
+    _transaction_read_timestamp = None
+
     def __init__(
         self,
         session,
@@ -536,23 +929,22 @@ class Snapshot(_SnapshotBase):
             key = "strong"
             value = True
 
-        options = TransactionOptions(
-            read_only=TransactionOptions.ReadOnly(**{key: value})
-        )
+        read_only = TransactionOptions.ReadOnly(**{key: value})
+        if self._return_read_timestamp:
+            read_only.return_read_timestamp = True
+        options = TransactionOptions(read_only=read_only)
 
         if self._multi_use:
             return TransactionSelector(begin=options)
         else:
             return TransactionSelector(single_use=options)
 
-    def begin(self):
-        """Begin a read-only transaction on the database.
-
-        :rtype: bytes
-        :returns: the ID for the newly-begun transaction.
+    def _check_begin(self):
+        """Helper for :meth:`begin`.
 
         :raises ValueError:
-            if the transaction is already begun, committed, or rolled back.
+            if the snapshot is single-use, or its transaction is already
+            begun or pending.
         """
         if not self._multi_use:
             raise ValueError("Cannot call 'begin' on single-use snapshots")
@@ -563,6 +955,17 @@ class Snapshot(_SnapshotBase):
         if self._read_request_count > 0:
             raise ValueError("Read-only transaction already pending")
 
+    def begin(self):
+        """Begin a read-only transaction on the database.
+
+        :rtype: bytes
+        :returns: the ID for the newly-begun transaction.
+
+        :raises ValueError:
+            if the transaction is already begun, committed, or rolled back.
+        """
+        self._check_begin()
+
         database = self._session._database
         api = database.spanner_api
         metadata = _metadata_with_prefix(database.name)
@@ -574,4 +977,6 @@ class Snapshot(_SnapshotBase):
                 metadata=metadata,
             )
         self._transaction_id = response.id
+        if self._return_read_timestamp:
+            self._transaction_read_timestamp = response.read_timestamp
         return self._transaction_id
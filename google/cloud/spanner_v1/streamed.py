@@ -23,15 +23,56 @@ from builtins import next
 from future import standard_library
 standard_library.install_aliases()
 
+import collections
+import functools
+
 from google.cloud import exceptions
 from google.cloud.spanner_v1 import TypeCode
 import six
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
 # pylint: disable=ungrouped-imports
-from google.cloud.spanner_v1._helpers import _parse_value
+from google.cloud.spanner_v1._helpers import _make_value_parser
+from google.cloud.spanner_v1._helpers import _parse_bytes
+from google.cloud.spanner_v1._helpers import _parse_bytes_decoded
+from google.cloud.spanner_v1._helpers import _parse_bytes_memoryview
+from google.cloud.spanner_v1._helpers import _parse_timestamp
+from google.cloud.spanner_v1._helpers import _parse_timestamp_nanoseconds
+from google.cloud.spanner_v1._helpers import _SCALAR_PARSERS
 
 # pylint: enable=ungrouped-imports
 
+BYTES_AS_BASE64 = "base64"
+"""Return BYTES values as ``bytes`` holding their base64 encoding."""
+
+BYTES_DECODED = "decoded"
+"""Return BYTES values decoded, as ``bytes``."""
+
+BYTES_AS_MEMORYVIEW = "memoryview"
+"""Return BYTES values decoded, as a ``memoryview`` on the decoded bytes."""
+
+_BYTES_PARSERS = {
+    BYTES_AS_BASE64: _parse_bytes,
+    BYTES_DECODED: _parse_bytes_decoded,
+    BYTES_AS_MEMORYVIEW: _parse_bytes_memoryview,
+}
+
+TIMESTAMP_AS_DATETIME = "datetime"
+"""Return TIMESTAMP values as
+:class:`~google.api_core.datetime_helpers.DatetimeWithNanoseconds`."""
+
+TIMESTAMP_AS_NANOSECONDS = "nanoseconds"
+"""Return TIMESTAMP values as ``int`` nanoseconds since the Unix epoch."""
+
+_TIMESTAMP_PARSERS = {
+    TIMESTAMP_AS_DATETIME: _parse_timestamp,
+    TIMESTAMP_AS_NANOSECONDS: _parse_timestamp_nanoseconds,
+}
+
 
 class StreamedResultSet(object):
     """Process a sequence of partial result sets into a single set of row data.
@@ -44,16 +85,58 @@ class StreamedResultSet(object):
 
     :type source: :class:`~google.cloud.spanner_v1.snapshot.Snapshot`
     :param source: Snapshot from which the result set was fetched.
+
+    :type row_factory: callable
+    :param row_factory: (Optional) called with the result set's
+                        :attr:`fields` once they are known, returning a
+                        callable which builds each row from the list of its
+                        values, e.g. :func:`tuple_row_factory`,
+                        :func:`record_row_factory` or :func:`dict_row_factory`.
+                        If not passed, rows are lists.
+
+    :type bytes_decoding: str
+    :param bytes_decoding: (Optional) how BYTES values are returned: one of
+                           :data:`BYTES_AS_BASE64` (the default),
+                           :data:`BYTES_DECODED` or :data:`BYTES_AS_MEMORYVIEW`.
+
+    :type timestamp_decoding: str
+    :param timestamp_decoding: (Optional) how TIMESTAMP values are returned:
+                               one of :data:`TIMESTAMP_AS_DATETIME` (the
+                               default) or :data:`TIMESTAMP_AS_NANOSECONDS`.
+
+    :raises ValueError: for an unknown ``bytes_decoding`` or
+                        ``timestamp_decoding``.
     """
 
-    def __init__(self, response_iterator, source=None):
+    def __init__(
+        self,
+        response_iterator,
+        source=None,
+        row_factory=None,
+        bytes_decoding=BYTES_AS_BASE64,
+        timestamp_decoding=TIMESTAMP_AS_DATETIME,
+    ):
+        if bytes_decoding not in _BYTES_PARSERS:
+            raise ValueError("Unknown BYTES decoding: %r" % (bytes_decoding,))
+        if timestamp_decoding not in _TIMESTAMP_PARSERS:
+            raise ValueError("Unknown TIMESTAMP decoding: %r" % (timestamp_decoding,))
         self._response_iterator = response_iterator
+        self._scalar_parsers = dict(_SCALAR_PARSERS)
+        self._scalar_parsers[TypeCode.BYTES] = _BYTES_PARSERS[bytes_decoding]
+        self._scalar_parsers[TypeCode.TIMESTAMP] = _TIMESTAMP_PARSERS[
+            timestamp_decoding
+        ]
+        self._row_factory = row_factory
+        self._make_row = None  # Built by 'row_factory' from metadata
         self._rows = []  # Fully-processed rows
         self._metadata = None  # Until set from first PRS
         self._stats = None  # Until set from last PRS
         self._current_row = []  # Accumulated values for incomplete row
         self._pending_chunk = None  # Incomplete value
         self._source = source  # Source snapshot
+        self._parsers = None  # Per-column parsers, built from metadata
+        self._pending_response = None  # First response, if read ahead
+        self._pending_error = None  # Error raised reading ahead
 
     @property
     def fields(self):
@@ -83,6 +166,20 @@ class StreamedResultSet(object):
         """
         return self._stats
 
+    @property
+    def _column_parsers(self):
+        """Parsers for each column, built once from the result set metadata.
+
+        :rtype: list of callable
+        :returns: one parser per entry in :attr:`fields`.
+        """
+        if self._parsers is None:
+            self._parsers = [
+                _make_value_parser(field.type_, self._scalar_parsers)
+                for field in self.fields
+            ]
+        return self._parsers
+
     def _merge_chunk(self, value):
         """Merge pending chunk with next value.
 
@@ -93,11 +190,10 @@ class StreamedResultSet(object):
         :rtype: :class:`~google.protobuf.struct_pb2.Value`
         :returns: the merged value
         """
-        current_column = len(self._current_row)
-        field = self.fields[current_column]
+        field = self.fields[len(self._current_row)]
         merged = _merge_by_type(self._pending_chunk, value, field.type_)
         self._pending_chunk = None
-        return _parse_value(merged, field.type_)
+        return merged
 
     def _merge_values(self, values):
         """Merge values into rows.
@@ -105,21 +201,78 @@ class StreamedResultSet(object):
         :type values: list of :class:`~google.protobuf.struct_pb2.Value`
         :param values: non-chunked values from partial result set.
         """
-        width = len(self.fields)
+        parsers = self._column_parsers
+        width = len(parsers)
+        make_row = self._make_row
+        if make_row is None and self._row_factory is not None:
+            make_row = self._make_row = self._row_factory(self.fields)
+        current_row = self._current_row
         for value in values:
-            index = len(self._current_row)
-            field = self.fields[index]
-            self._current_row.append(_parse_value(value, field.type_))
-            if len(self._current_row) == width:
-                self._rows.append(self._current_row)
-                self._current_row = []
+            current_row.append(parsers[len(current_row)](value))
+            if len(current_row) == width:
+                if make_row is not None:
+                    self._rows.append(make_row(current_row))
+                else:
+                    self._rows.append(current_row)
+                current_row = self._current_row = []
+
+    def _read_values(self):
+        """Read the next partial result set from the stream.
+
+        Records the result set metadata from the first response, and the
+        stats from the last one.  Values are read from the underlying
+        protobuf message, bypassing the per-value conversions of its
+        proto-plus wrapper.
+
+        :rtype: list
+        :returns: the values of the response, with a pending chunk merged
+                  into the first one, and the last one held back as the new
+                  pending chunk if it is chunked.
+        """
+        if self._pending_error is not None:
+            error, self._pending_error = self._pending_error, None
+            raise error
+        response, self._pending_response = self._pending_response, None
+        if response is None:
+            response = six.next(self._response_iterator)
+        return self._process_response(response)
+
+    def _read_ahead(self):
+        """Read the first response before consumption starts.
+
+        Sets the transaction ID of the source from the response metadata, for
+        a statement which began its transaction.  The response, or the error
+        raised reading it, is held until consumption starts.
+        """
+        if (
+            self._metadata is not None
+            or self._pending_response is not None
+            or self._pending_error is not None
+        ):
+            return
+        try:
+            response = six.next(self._response_iterator)
+        except StopIteration:
+            return
+        except Exception as exc:
+            self._pending_error = exc
+            return
+        self._pending_response = response
 
-    def _consume_next(self):
-        """Consume the next partial result set from the stream.
+        source = self._source
+        if source is not None and source._transaction_id is None:
+            source._transaction_id = response.metadata.transaction.id
 
-        Parse the result set into new/existing rows in :attr:`_rows`
+    def _process_response(self, response):
+        """Helper for :meth:`_read_values`:  process a partial result set.
+
+        :type response: :class:`~google.cloud.spanner_v1.PartialResultSet`
+        :param response: the response read from the stream.
+
+        :rtype: list
+        :returns: see :meth:`_read_values`.
         """
-        response = six.next(self._response_iterator)
+        response_pb = response._pb
 
         if self._metadata is None:  # first response
             metadata = self._metadata = response.metadata
@@ -128,29 +281,185 @@ class StreamedResultSet(object):
             if source is not None and source._transaction_id is None:
                 source._transaction_id = metadata.transaction.id
 
-        if "stats" in response:  # last response
+        if response_pb.HasField("stats"):  # last response
             self._stats = response.stats
 
-        values = list(response.values)
+        values = [_value_pb_to_python(value_pb) for value_pb in response_pb.values]
         if self._pending_chunk is not None:
             values[0] = self._merge_chunk(values[0])
 
-        if response.chunked_value:
+        if response_pb.chunked_value:
             self._pending_chunk = values.pop()
 
-        self._merge_values(values)
+        return values
+
+    def _consume_next(self):
+        """Consume the next partial result set from the stream.
+
+        Parse the result set into new/existing rows in :attr:`_rows`
+        """
+        self._merge_values(self._read_values())
 
     def __iter__(self):
-        iter_rows, self._rows[:] = self._rows[:], ()
         while True:
-            if not iter_rows:
-                try:
-                    self._consume_next()
-                except StopIteration:
-                    return
-                iter_rows, self._rows[:] = self._rows[:], ()
-            while iter_rows:
-                yield iter_rows.pop(0)
+            # Take ownership of the rows parsed so far, without copying:
+            # '_consume_next' appends to the fresh list.
+            rows, self._rows = self._rows, []
+            for row in rows:
+                yield row
+            try:
+                self._consume_next()
+            except StopIteration:
+                return
+
+    def _consume_next_columns(self, use_numpy):
+        """Consume the next partial result set, decoding it column by column.
+
+        :type use_numpy: bool
+        :param use_numpy: decode numeric and boolean columns into NumPy
+                          masked arrays.
+
+        :rtype: list
+        :returns: one decoded column per field, holding the rows completed
+                  by this response.
+        """
+        return self._decode_columns(self._read_values(), use_numpy)
+
+    def _decode_columns(self, values, use_numpy):
+        """Decode the values of a partial result set column by column.
+
+        Unparsed values of an incomplete last row are kept in
+        :attr:`_current_row` until the rest of the row arrives.
+
+        :type values: list
+        :param values: values returned by :meth:`_read_values`.
+
+        :type use_numpy: bool
+        :param use_numpy: decode numeric and boolean columns into NumPy
+                          masked arrays.
+
+        :rtype: list
+        :returns: one decoded column per field, holding the completed rows.
+        """
+        fields = self.fields
+        width = len(fields)
+        if width == 0:  # e.g. DML statements:  no rows, hence no columns
+            return []
+
+        pending = self._current_row
+        pending.extend(values)
+        complete = len(pending) - len(pending) % width
+        values, self._current_row = pending[:complete], pending[complete:]
+
+        return [
+            _decode_column(
+                values[index::width], field.type_, use_numpy, self._scalar_parsers
+            )
+            for index, field in enumerate(fields)
+        ]
+
+    def _check_column_decoding(self, use_numpy):
+        """Helper for :meth:`iter_column_batches`.
+
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        :raises: :exc:`ImportError`: If ``use_numpy`` is passed but
+            ``numpy`` is not installed.
+        """
+        if use_numpy and numpy is None:
+            raise ImportError("The 'numpy' package is required for 'use_numpy'.")
+
+        if self._metadata is not None:
+            raise RuntimeError(
+                "Can not decode columns after stream consumption "
+                "has already started."
+            )
+
+    def iter_column_batches(self, use_numpy=False):
+        """Iterate over the results, one batch of columns at a time.
+
+        Each batch holds the rows completed by one partial result set, as a
+        list with one column per entry in :attr:`fields`.  Values in a column
+        are decoded together, avoiding per-cell type dispatch.
+
+        With ``use_numpy``, INT64, FLOAT64 and BOOL columns are returned as
+        :class:`numpy.ma.MaskedArray` instances, whose mask flags NULL
+        values.  Other columns are lists.
+
+        :type use_numpy: bool
+        :param use_numpy: (Optional) return NumPy arrays for numeric and
+                          boolean columns.  Requires ``numpy``.
+
+        :rtype: iterable of list
+        :returns: batches of columns.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        :raises: :exc:`ImportError`: If ``use_numpy`` is passed but
+            ``numpy`` is not installed.
+        """
+        self._check_column_decoding(use_numpy)
+
+        while True:
+            try:
+                columns = self._consume_next_columns(use_numpy)
+            except StopIteration:
+                return
+            if columns and len(columns[0]):
+                yield columns
+
+    def to_columns(self, use_numpy=False):
+        """Consume all results, returning them as columns.
+
+        See :meth:`iter_column_batches` for the column types.
+
+        :type use_numpy: bool
+        :param use_numpy: (Optional) return NumPy arrays for numeric and
+                          boolean columns.  Requires ``numpy``.
+
+        :rtype: list
+        :returns: one column per entry in :attr:`fields`.
+        :raises: :exc:`RuntimeError`: If consumption has already occurred,
+            in whole or in part.
+        """
+        batches = list(self.iter_column_batches(use_numpy=use_numpy))
+        return self._join_column_batches(batches, use_numpy)
+
+    def _join_column_batches(self, batches, use_numpy):
+        """Helper for :meth:`to_columns`:  join batches into whole columns.
+
+        :type batches: list
+        :param batches: batches returned by :meth:`iter_column_batches`.
+
+        :type use_numpy: bool
+        :param use_numpy: whether batches hold NumPy arrays.
+
+        :rtype: list
+        :returns: one column per entry in :attr:`fields`.
+        """
+        if self._metadata is None:  # no response at all
+            return []
+
+        if not batches:
+            return [
+                _decode_column([], field.type_, use_numpy) for field in self.fields
+            ]
+
+        columns = []
+        for parts in zip(*batches):
+            if use_numpy and isinstance(parts[0], numpy.ma.MaskedArray):
+                # 'numpy.ma.concatenate' would shrink an all-False mask
+                # to 'nomask':  keep '.mask' a boolean array throughout.
+                data = numpy.concatenate([part.data for part in parts])
+                mask = numpy.concatenate(
+                    [numpy.ma.getmaskarray(part) for part in parts]
+                )
+                columns.append(numpy.ma.MaskedArray(data, mask=mask, shrink=False))
+            else:
+                column = []
+                for part in parts:
+                    column.extend(part)
+                columns.append(column)
+        return columns
 
     def one(self):
         """Return exactly one result, or raise an exception.
@@ -197,6 +506,175 @@ class StreamedResultSet(object):
             return answer
 
 
+def _value_pb_to_python(value_pb):
+    """Convert a ``Value`` protobuf to the native value it holds.
+
+    Same result as the proto-plus marshal, without its per-value overhead.
+
+    :type value_pb: :class:`~google.protobuf.struct_pb2.Value`
+    :param value_pb: value from a partial result set
+
+    :rtype: str, bool, float, list, dict or None
+    :returns: the native value.
+    """
+    kind = value_pb.WhichOneof("kind")
+    if kind == "string_value":
+        return value_pb.string_value
+    if kind == "list_value":
+        return [_value_pb_to_python(item) for item in value_pb.list_value.values]
+    if kind == "bool_value":
+        return value_pb.bool_value
+    if kind == "number_value":
+        return value_pb.number_value
+    if kind == "struct_value":
+        return {
+            key: _value_pb_to_python(item)
+            for key, item in value_pb.struct_value.fields.items()
+        }
+    return None  # null_value, or unset
+
+
+def _decode_int64_column(values):
+    """Helper for '_decode_column'."""
+    return [None if value is None else int(value) for value in values]
+
+
+def _decode_float64_column(values):
+    """Helper for '_decode_column'."""
+    return [float(value) if isinstance(value, str) else value for value in values]
+
+
+def _copy_column(values):
+    """Helper for '_decode_column':  values need no conversion."""
+    return list(values)
+
+
+_COLUMN_DECODERS = {
+    TypeCode.BOOL: _copy_column,
+    TypeCode.FLOAT64: _decode_float64_column,
+    TypeCode.INT64: _decode_int64_column,
+    TypeCode.STRING: _copy_column,
+}
+
+
+def _decode_numpy_column(values, field_type):
+    """Helper for '_decode_column':  decode into a masked array.
+
+    NULL values are replaced by zero / False, and flagged in the mask.
+    """
+    mask = numpy.array([value is None for value in values], dtype=bool)
+    if field_type.code == TypeCode.INT64:
+        # INT64 values arrive as decimal strings:  let NumPy parse them.
+        filled = numpy.array([u"0" if value is None else value for value in values])
+        data = filled.astype("int64")
+    elif field_type.code == TypeCode.FLOAT64:
+        filled = [0.0 if value is None else value for value in values]
+        data = numpy.array(_decode_float64_column(filled), dtype="float64")
+    else:
+        filled = [False if value is None else value for value in values]
+        data = numpy.array(filled, dtype=bool)
+    return numpy.ma.MaskedArray(data, mask=mask, shrink=False)
+
+
+_NUMPY_TYPES = (TypeCode.BOOL, TypeCode.FLOAT64, TypeCode.INT64)
+
+
+def _decode_column(values, field_type, use_numpy=False, scalar_parsers=None):
+    """Decode all unparsed values of a column.
+
+    :type values: list
+    :param values: values for one column, as found in partial result sets.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.Type`
+    :param field_type: type of the column.
+
+    :type use_numpy: bool
+    :param use_numpy: decode INT64, FLOAT64 and BOOL columns into
+                      :class:`numpy.ma.MaskedArray` instances.
+
+    :type scalar_parsers: dict
+    :param scalar_parsers: (Optional) parsers for scalar values, see
+                           :func:`~google.cloud.spanner_v1._helpers._make_value_parser`.
+
+    :rtype: list or :class:`numpy.ma.MaskedArray`
+    :returns: the decoded column.
+    """
+    if use_numpy and field_type.code in _NUMPY_TYPES:
+        return _decode_numpy_column(values, field_type)
+    decoder = _COLUMN_DECODERS.get(field_type.code)
+    if decoder is not None:
+        return decoder(values)
+    parse = _make_value_parser(field_type, scalar_parsers)
+    return [parse(value) for value in values]
+
+
+def tuple_row_factory(fields):  # pylint: disable=unused-argument
+    """Row factory building each row as a tuple.
+
+    :type fields: list of :class:`~google.cloud.spanner_v1.StructType.Field`
+    :param fields: fields describing the result set columns.
+
+    :rtype: callable
+    :returns: function building a row from the list of its values.
+    """
+    return tuple
+
+
+_RECORD_CLASS_CACHE_SIZE = 256
+"""Number of distinct sets of column names whose record class is kept."""
+
+
+@functools.lru_cache(maxsize=_RECORD_CLASS_CACHE_SIZE)
+def _record_class(names):
+    """Helper for :func:`record_row_factory`.
+
+    :type names: tuple of str
+    :param names: column names of the result set.
+
+    :rtype: type
+    :returns: named tuple class with a field for each column.
+    """
+    return collections.namedtuple("Row", names, rename=True)
+
+
+def record_row_factory(fields):
+    """Row factory building each row as a named tuple.
+
+    Values can be read by position or as attributes named after the
+    columns.  Names which are not valid identifiers, or are repeated, are
+    replaced by positional names (``_0``, ``_1``, ...).  Records take no
+    more memory than tuples:  their class is built once per set of column
+    names, and the classes of recently used sets are kept.
+
+    :type fields: list of :class:`~google.cloud.spanner_v1.StructType.Field`
+    :param fields: fields describing the result set columns.
+
+    :rtype: callable
+    :returns: function building a row from the list of its values.
+    """
+    names = tuple(field.name for field in fields)
+    return _record_class(names)._make
+
+
+def dict_row_factory(fields):
+    """Row factory building each row as a dict keyed by column name.
+
+    If column names are repeated, the last value wins.
+
+    :type fields: list of :class:`~google.cloud.spanner_v1.StructType.Field`
+    :param fields: fields describing the result set columns.
+
+    :rtype: callable
+    :returns: function building a row from the list of its values.
+    """
+    names = [field.name for field in fields]
+
+    def make_row(values):
+        return dict(zip(names, values))
+
+    return make_row
+
+
 class Unmergeable(ValueError):
     """Unable to merge two values.
 
@@ -235,6 +713,18 @@ def _merge_string(lhs, rhs, type_):  # pylint: disable=unused-argument
     return str(lhs) + str(rhs)
 
 
+def _merge_bytes(lhs, rhs, type_):  # pylint: disable=unused-argument
+    """Helper for '_merge_by_type'.
+
+    Base64 text is ASCII:  chunks are appended to a ``bytearray``, so that
+    merging a value split over many partial result sets takes linear time.
+    """
+    if not isinstance(lhs, bytearray):
+        lhs = bytearray(lhs.encode("ascii"))
+    lhs.extend(rhs.encode("ascii"))
+    return lhs
+
+
 _UNMERGEABLE_TYPES = (TypeCode.BOOL,)
 
 
@@ -298,7 +788,7 @@ def _merge_struct(lhs, rhs, type_):
 _MERGE_BY_TYPE = {
     TypeCode.ARRAY: _merge_array,
     TypeCode.BOOL: _unmergeable,
-    TypeCode.BYTES: _merge_string,
+    TypeCode.BYTES: _merge_bytes,
     TypeCode.DATE: _merge_string,
     TypeCode.FLOAT64: _merge_float64,
     TypeCode.INT64: _merge_string,
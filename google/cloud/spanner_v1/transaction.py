@@ -40,6 +40,11 @@ from google.cloud.spanner_v1._opentelemetry_tracing import trace_call
 class Transaction(_SnapshotBase, _BatchBase):
     """Implement read-write transaction semantics for a session.
 
+    Unless :meth:`begin` is called, the first read, query or DML statement
+    begins the transaction inline, saving the ``BeginTransaction`` round
+    trip:  later statements wait for its response to carry the transaction
+    ID.
+
     :type session: :class:`~google.cloud.spanner_v1.session.Session`
     :param session: the session used to perform the commit
 
@@ -51,6 +56,7 @@ class Transaction(_SnapshotBase, _BatchBase):
     rolled_back = False
     _multi_use = True
     _execute_sql_count = 0
+    _begin_results = None
 
     def __init__(self, session):
         if session._transaction is not None:
@@ -73,21 +79,44 @@ class Transaction(_SnapshotBase, _BatchBase):
         if self.rolled_back:
             raise ValueError("Transaction is already rolled back")
 
+    def _wait_for_begin(self):
+        """Wait for a read / query which began the transaction inline.
+
+        Reads the first response of its result set ahead, to learn the
+        transaction ID.  If the statement failed, the ID stays unset, and the
+        next statement begins the transaction instead.
+        """
+        results, self._begin_results = self._begin_results, None
+        if results is not None and self._transaction_id is None:
+            results._read_ahead()
+
+    def _check_reusable(self):
+        """Helper for :meth:`_make_read_request` et al.
+
+        Transactions are always multiple-use:  rather than raising while the
+        transaction ID is pending, wait for it.
+        """
+        self._wait_for_begin()
+
     def _make_txn_selector(self):
         """Helper for :meth:`read`.
 
         :rtype:
             :class:`~.transaction_pb2.TransactionSelector`
-        :returns: a selector configured for read-write transaction semantics.
+        :returns: a selector configured for read-write transaction semantics,
+                  beginning the transaction if it has no ID yet.
         """
+        self._wait_for_begin()
+        if self._transaction_id is None:
+            self._check_begin()
+            txn_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
+            return TransactionSelector(begin=txn_options)
         self._check_state()
         return TransactionSelector(id=self._transaction_id)
 
-    def begin(self):
-        """Begin a transaction on the database.
+    def _check_begin(self):
+        """Helper for :meth:`begin`.
 
-        :rtype: bytes
-        :returns: the ID for the newly-begun transaction.
         :raises ValueError:
             if the transaction is already begun, committed, or rolled back.
         """
@@ -100,6 +129,16 @@ class Transaction(_SnapshotBase, _BatchBase):
         if self.rolled_back:
             raise ValueError("Transaction is already rolled back")
 
+    def begin(self):
+        """Begin a transaction on the database.
+
+        :rtype: bytes
+        :returns: the ID for the newly-begun transaction.
+        :raises ValueError:
+            if the transaction is already begun, committed, or rolled back.
+        """
+        self._check_begin()
+
         database = self._session._database
         api = database.spanner_api
         metadata = _metadata_with_prefix(database.name)
@@ -112,7 +151,17 @@ class Transaction(_SnapshotBase, _BatchBase):
         return self._transaction_id
 
     def rollback(self):
-        """Roll back a transaction on the database."""
+        """Roll back a transaction on the database.
+
+        A transaction which was never begun is marked as rolled back without
+        an API request.
+        """
+        self._wait_for_begin()
+        if self._transaction_id is None:
+            self._check_begin()
+            self.rolled_back = True
+            del self._session._transaction
+            return
         self._check_state()
         database = self._session._database
         api = database.spanner_api
@@ -131,9 +180,19 @@ class Transaction(_SnapshotBase, _BatchBase):
 
         :rtype: datetime
         :returns: timestamp of the committed changes.
-        :raises ValueError: if there are no mutations to commit.
+        :raises ValueError: if the transaction is already committed or rolled
+                            back.
         """
-        self._check_state()
+        self._wait_for_begin()
+        if self._transaction_id is None:
+            # No read or DML was issued:  as for a batch, commit the mutations
+            # in a single-use transaction, rather than beginning one first.
+            self._check_begin()
+            txn_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
+            selector = {"single_use_transaction": txn_options}
+        else:
+            self._check_state()
+            selector = {"transaction_id": self._transaction_id}
 
         database = self._session._database
         api = database.spanner_api
@@ -143,8 +202,8 @@ class Transaction(_SnapshotBase, _BatchBase):
             response = api.commit(
                 session=self._session.name,
                 mutations=self._mutations,
-                transaction_id=self._transaction_id,
                 metadata=metadata,
+                **selector
             )
         self.committed = response.commit_timestamp
         del self._session._transaction
@@ -182,6 +241,69 @@ class Transaction(_SnapshotBase, _BatchBase):
 
         return {}
 
+    def read(self, *args, **kw):
+        """Perform a ``StreamingRead`` API request for rows in a table.
+
+        See :meth:`google.cloud.spanner_v1.snapshot._SnapshotBase.read` for
+        the parameters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
+        :returns: a result set instance which can be used to consume rows.
+        """
+        results = super(Transaction, self).read(*args, **kw)
+        if self._transaction_id is None:
+            self._begin_results = results
+        return results
+
+    def execute_sql(self, *args, **kw):
+        """Perform an ``ExecuteStreamingSql`` API request.
+
+        See :meth:`google.cloud.spanner_v1.snapshot._SnapshotBase.execute_sql`
+        for the parameters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.streamed.StreamedResultSet`
+        :returns: a result set instance which can be used to consume rows.
+        """
+        results = super(Transaction, self).execute_sql(*args, **kw)
+        if self._transaction_id is None:
+            self._begin_results = results
+        return results
+
+    def _make_execute_update_request(
+        self, dml, params, param_types, query_mode, query_options
+    ):
+        """Helper for :meth:`execute_update`:  build the ``ExecuteSqlRequest``.
+
+        See :meth:`execute_update` for the parameters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.ExecuteSqlRequest`
+        :returns: the request, with the next sequence number.
+        """
+        params_pb = self._make_params_pb(params, param_types)
+        database = self._session._database
+        transaction = self._make_txn_selector()
+
+        seqno, self._execute_sql_count = (
+            self._execute_sql_count,
+            self._execute_sql_count + 1,
+        )
+
+        # Query-level options have higher precedence than client-level and
+        # environment-level options
+        default_query_options = database._instance._client._query_options
+        query_options = _merge_query_options(default_query_options, query_options)
+
+        return ExecuteSqlRequest(
+            session=self._session.name,
+            sql=dml,
+            transaction=transaction,
+            params=params_pb,
+            param_types=param_types,
+            query_mode=query_mode,
+            query_options=query_options,
+            seqno=seqno,
+        )
+
     def execute_update(
         self, dml, params=None, param_types=None, query_mode=None, query_options=None
     ):
@@ -213,38 +335,56 @@ class Transaction(_SnapshotBase, _BatchBase):
         :rtype: int
         :returns: Count of rows affected by the DML statement.
         """
-        params_pb = self._make_params_pb(params, param_types)
+        request = self._make_execute_update_request(
+            dml, params, param_types, query_mode, query_options
+        )
         database = self._session._database
         metadata = _metadata_with_prefix(database.name)
-        transaction = self._make_txn_selector()
         api = database.spanner_api
 
+        trace_attributes = {"db.statement": dml}
+        with trace_call(
+            "CloudSpanner.ReadWriteTransaction", self._session, trace_attributes
+        ):
+            response = api.execute_sql(request=request, metadata=metadata)
+        if self._transaction_id is None:
+            self._transaction_id = response.metadata.transaction.id
+        return response.stats.row_count_exact
+
+    def _make_batch_update_request(self, statements):
+        """Helper for :meth:`batch_update`:  build the ``ExecuteBatchDmlRequest``.
+
+        See :meth:`batch_update` for the parameters.
+
+        :rtype: :class:`~google.cloud.spanner_v1.ExecuteBatchDmlRequest`
+        :returns: the request, with the next sequence number.
+        """
+        parsed = []
+        for statement in statements:
+            if isinstance(statement, str):
+                parsed.append(ExecuteBatchDmlRequest.Statement(sql=statement))
+            else:
+                dml, params, param_types = statement
+                params_pb = self._make_params_pb(params, param_types)
+                parsed.append(
+                    ExecuteBatchDmlRequest.Statement(
+                        sql=dml, params=params_pb, param_types=param_types
+                    )
+                )
+
+        transaction = self._make_txn_selector()
+
         seqno, self._execute_sql_count = (
             self._execute_sql_count,
             self._execute_sql_count + 1,
         )
 
-        # Query-level options have higher precedence than client-level and
-        # environment-level options
-        default_query_options = database._instance._client._query_options
-        query_options = _merge_query_options(default_query_options, query_options)
-
-        trace_attributes = {"db.statement": dml}
-        request = ExecuteSqlRequest(
+        return ExecuteBatchDmlRequest(
             session=self._session.name,
-            sql=dml,
             transaction=transaction,
-            params=params_pb,
-            param_types=param_types,
-            query_mode=query_mode,
-            query_options=query_options,
+            statements=parsed,
             seqno=seqno,
         )
-        with trace_call(
-            "CloudSpanner.ReadWriteTransaction", self._session, trace_attributes
-        ):
-            response = api.execute_sql(request=request, metadata=metadata)
-        return response.stats.row_count_exact
 
     def batch_update(self, statements):
         """Perform a batch of DML statements via an ``ExecuteBatchDml`` request.
@@ -268,41 +408,18 @@ class Transaction(_SnapshotBase, _BatchBase):
             statement triggering the error will not have an entry in the
             list, nor will any statements following that one.
         """
-        parsed = []
-        for statement in statements:
-            if isinstance(statement, str):
-                parsed.append(ExecuteBatchDmlRequest.Statement(sql=statement))
-            else:
-                dml, params, param_types = statement
-                params_pb = self._make_params_pb(params, param_types)
-                parsed.append(
-                    ExecuteBatchDmlRequest.Statement(
-                        sql=dml, params=params_pb, param_types=param_types
-                    )
-                )
-
+        request = self._make_batch_update_request(statements)
         database = self._session._database
         metadata = _metadata_with_prefix(database.name)
-        transaction = self._make_txn_selector()
         api = database.spanner_api
 
-        seqno, self._execute_sql_count = (
-            self._execute_sql_count,
-            self._execute_sql_count + 1,
-        )
-
-        trace_attributes = {
-            # Get just the queries from the DML statement batch
-            "db.statement": ";".join([statement.sql for statement in parsed])
-        }
-        request = ExecuteBatchDmlRequest(
-            session=self._session.name,
-            transaction=transaction,
-            statements=parsed,
-            seqno=seqno,
-        )
+        # Get just the queries from the DML statement batch
+        queries = [statement.sql for statement in request.statements]
+        trace_attributes = {"db.statement": ";".join(queries)}
         with trace_call("CloudSpanner.DMLTransaction", self._session, trace_attributes):
             response = api.execute_batch_dml(request=request, metadata=metadata)
+        if self._transaction_id is None and response.result_sets:
+            self._transaction_id = response.result_sets[0].metadata.transaction.id
         row_counts = [
             result_set.stats.row_count_exact for result_set in response.result_sets
         ]
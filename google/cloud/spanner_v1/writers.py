@@ -0,0 +1,376 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""File writers for exported result sets."""
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+
+import csv
+import json
+import math
+
+from google.cloud.spanner_v1 import TypeCode
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+# pylint: disable=ungrouped-imports
+from google.cloud.spanner_v1.streamed import BYTES_AS_BASE64
+from google.cloud.spanner_v1.streamed import BYTES_DECODED
+from google.cloud.spanner_v1.streamed import TIMESTAMP_AS_DATETIME
+from google.cloud.spanner_v1.streamed import TIMESTAMP_AS_NANOSECONDS
+
+# pylint: enable=ungrouped-imports
+
+FORMAT_CSV = "csv"
+"""Comma-separated values, with a header row of column names."""
+
+FORMAT_NDJSON = "ndjson"
+"""Newline-delimited JSON:  one object per row, keyed by column name."""
+
+FORMAT_PARQUET = "parquet"
+"""Apache Parquet.  Requires ``pyarrow``."""
+
+
+class _Writer(object):
+    """Base class for writers of column batches to a file.
+
+    :type path: str
+    :param path: name of the file to write.
+
+    :type fields: list of :class:`~google.cloud.spanner_v1.StructType.Field`
+    :param fields: fields of the result set being written.
+    """
+
+    extension = None
+    """Extension of the files written."""
+
+    bytes_decoding = BYTES_AS_BASE64
+    """Decoding of BYTES values expected by :meth:`write`."""
+
+    timestamp_decoding = TIMESTAMP_AS_DATETIME
+    """Decoding of TIMESTAMP values expected by :meth:`write`."""
+
+    needs_field_types = False
+    """Whether the file records column types, which must then be known."""
+
+    def write(self, columns):
+        """Write a batch of rows.
+
+        :type columns: list
+        :param columns: one column per field, as returned by
+                        :meth:`~.streamed.StreamedResultSet.iter_column_batches`.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Flush and close the file."""
+        raise NotImplementedError
+
+    def __enter__(self):
+        """Begin ``with`` block."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """End ``with`` block:  close the file."""
+        self.close()
+
+
+class CSVWriter(_Writer):
+    """Write rows as comma-separated values.
+
+    BYTES values are written base64-encoded, TIMESTAMP values in RFC 3339
+    format, and ARRAY / STRUCT values as JSON arrays.
+    """
+
+    extension = "csv"
+
+    def __init__(self, path, fields):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([field.name for field in fields])
+        self._converters = [_make_csv_converter(field.type_) for field in fields]
+
+    def write(self, columns):
+        """Write a batch of rows.
+
+        :type columns: list
+        :param columns: one column per field.
+        """
+        self._writer.writerows(zip(*_convert_columns(columns, self._converters)))
+
+    def close(self):
+        """Flush and close the file."""
+        self._file.close()
+
+
+class NDJSONWriter(_Writer):
+    """Write rows as newline-delimited JSON objects.
+
+    BYTES values are written base64-encoded, TIMESTAMP values in RFC 3339
+    format, NUMERIC and non-finite FLOAT64 values as strings, and STRUCT
+    values as arrays.
+    """
+
+    extension = "ndjson"
+
+    def __init__(self, path, fields):
+        self._file = open(path, "w", encoding="utf-8")
+        self._names = [field.name for field in fields]
+        self._converters = [_make_json_converter(field.type_) for field in fields]
+        self._encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def write(self, columns):
+        """Write a batch of rows.
+
+        :type columns: list
+        :param columns: one column per field.
+        """
+        names = self._names
+        encode = self._encoder.encode
+        self._file.writelines(
+            encode(dict(zip(names, row))) + "\n"
+            for row in zip(*_convert_columns(columns, self._converters))
+        )
+
+    def close(self):
+        """Flush and close the file."""
+        self._file.close()
+
+
+class ParquetWriter(_Writer):
+    """Write rows to an Apache Parquet file.
+
+    Each batch of rows is written as Arrow arrays of the column types, e.g.
+    ``timestamp[ns, tz=UTC]`` for TIMESTAMP and ``decimal128(38, 9)`` for
+    NUMERIC columns.  STRUCT values are not supported.
+
+    :raises ImportError: if ``pyarrow`` is not installed.
+    :raises ValueError: for a STRUCT column.
+    """
+
+    extension = "parquet"
+    bytes_decoding = BYTES_DECODED
+    timestamp_decoding = TIMESTAMP_AS_NANOSECONDS
+    needs_field_types = True
+
+    def __init__(self, path, fields):
+        if pyarrow is None:
+            raise ImportError("The 'pyarrow' package is required for Parquet.")
+        self._types = [_arrow_type(field.type_) for field in fields]
+        self._schema = pyarrow.schema(
+            [(field.name, type_) for field, type_ in zip(fields, self._types)]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def write(self, columns):
+        """Write a batch of rows.
+
+        :type columns: list
+        :param columns: one column per field.
+        """
+        arrays = [
+            pyarrow.array(column, type=type_)
+            for column, type_ in zip(columns, self._types)
+        ]
+        self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        """Flush and close the file."""
+        self._writer.close()
+
+
+WRITERS = {
+    FORMAT_CSV: CSVWriter,
+    FORMAT_NDJSON: NDJSONWriter,
+    FORMAT_PARQUET: ParquetWriter,
+}
+"""Writer classes, keyed by format."""
+
+
+def get_writer_class(format_):
+    """Look up the writer for a format.
+
+    :type format_: str
+    :param format_: one of :data:`FORMAT_CSV`, :data:`FORMAT_NDJSON` or
+                    :data:`FORMAT_PARQUET`.
+
+    :rtype: type
+    :returns: the writer class.
+    :raises ValueError: for an unknown format.
+    :raises ImportError: for :data:`FORMAT_PARQUET` if ``pyarrow`` is not
+                         installed.
+    """
+    try:
+        writer_class = WRITERS[format_]
+    except KeyError:
+        raise ValueError("Unknown export format: %r" % (format_,))
+    if writer_class is ParquetWriter and pyarrow is None:
+        raise ImportError("The 'pyarrow' package is required for Parquet.")
+    return writer_class
+
+
+def _convert_columns(columns, converters):
+    """Apply per-column converters, skipping NULL values.
+
+    :type columns: list
+    :param columns: one column per field.
+
+    :type converters: list
+    :param converters: one callable, or ``None`` if values are written
+                       unchanged, per field.
+
+    :rtype: list
+    :returns: converted columns.
+    """
+    return [
+        column
+        if convert is None
+        else [None if value is None else convert(value) for value in column]
+        for column, convert in zip(columns, converters)
+    ]
+
+
+def _convert_bytes(value):
+    """Helper for '_make_json_converter':  base64-encoded BYTES."""
+    return value.decode("ascii")
+
+
+def _convert_date(value):
+    """Helper for '_make_json_converter'."""
+    return value.isoformat()
+
+
+def _convert_timestamp(value):
+    """Helper for '_make_json_converter'."""
+    return value.rfc3339()
+
+
+def _convert_float64(value):
+    """Helper for '_make_json_converter':  JSON has no NaN / Infinity."""
+    if math.isfinite(value):
+        return value
+    if math.isnan(value):
+        return "NaN"
+    return "Infinity" if value > 0 else "-Infinity"
+
+
+_JSON_CONVERTERS = {
+    TypeCode.BYTES: _convert_bytes,
+    TypeCode.DATE: _convert_date,
+    TypeCode.TIMESTAMP: _convert_timestamp,
+    TypeCode.NUMERIC: str,
+    TypeCode.FLOAT64: _convert_float64,
+}
+
+
+def _make_json_converter(field_type):
+    """Build a callable converting non-NULL values to JSON-compatible ones.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.Type`
+    :param field_type: type of the values.
+
+    :rtype: callable
+    :returns: the converter, or ``None`` if values need no conversion.
+    """
+    code = field_type.code
+
+    if code == TypeCode.ARRAY:
+        convert_element = _make_json_converter(field_type.array_element_type)
+        if convert_element is None:
+            return None
+
+        def convert_array(value):
+            return [None if item is None else convert_element(item) for item in value]
+
+        return convert_array
+
+    if code == TypeCode.STRUCT:
+        converters = [
+            _make_json_converter(field.type_)
+            for field in field_type.struct_type.fields
+        ]
+        if not any(converters):
+            return None
+
+        def convert_struct(value):
+            return [
+                item if item is None or convert is None else convert(item)
+                for convert, item in zip(converters, value)
+            ]
+
+        return convert_struct
+
+    return _JSON_CONVERTERS.get(code)
+
+
+def _make_csv_converter(field_type):
+    """Build a callable converting non-NULL values to CSV cells.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.Type`
+    :param field_type: type of the values.
+
+    :rtype: callable
+    :returns: the converter, or ``None`` if values need no conversion.
+    """
+    if field_type.code in (TypeCode.ARRAY, TypeCode.STRUCT):
+        convert_json = _make_json_converter(field_type) or (lambda value: value)
+
+        def convert_to_json(value):
+            return json.dumps(convert_json(value))
+
+        return convert_to_json
+
+    if field_type.code in (TypeCode.NUMERIC, TypeCode.FLOAT64):
+        return None
+
+    return _JSON_CONVERTERS.get(field_type.code)
+
+
+def _arrow_type(field_type):
+    """Map a Spanner type to an Arrow type.
+
+    :type field_type: :class:`~google.cloud.spanner_v1.Type`
+    :param field_type: type of a column.
+
+    :rtype: :class:`pyarrow.DataType`
+    :raises ValueError: for a STRUCT type.
+    """
+    code = field_type.code
+    if code == TypeCode.ARRAY:
+        return pyarrow.list_(_arrow_type(field_type.array_element_type))
+    if code == TypeCode.BOOL:
+        return pyarrow.bool_()
+    if code == TypeCode.INT64:
+        return pyarrow.int64()
+    if code == TypeCode.FLOAT64:
+        return pyarrow.float64()
+    if code == TypeCode.STRING:
+        return pyarrow.string()
+    if code == TypeCode.BYTES:
+        return pyarrow.binary()
+    if code == TypeCode.DATE:
+        return pyarrow.date32()
+    if code == TypeCode.TIMESTAMP:
+        return pyarrow.timestamp("ns", tz="UTC")
+    if code == TypeCode.NUMERIC:
+        return pyarrow.decimal128(38, 9)
+    raise ValueError("Cannot export %s values to Parquet." % (TypeCode(code).name,))
@@ -78,7 +78,7 @@ def default(session):
     session.install("asyncmock", "pytest-asyncio")
 
     session.install("mock", "pytest", "pytest-cov")
-    session.install("-e", ".")
+    session.install("-e", ".[numpy]")
 
     # Run py.test against the unit tests.
     session.run(
@@ -45,7 +45,8 @@ extras = {
         "opentelemetry-api==0.11b0",
         "opentelemetry-sdk==0.11b0",
         "opentelemetry-instrumentation==0.11b0",
-    ]
+    ],
+    "numpy": ["numpy"],
 }
 
 
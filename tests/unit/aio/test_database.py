@@ -0,0 +1,211 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import unittest
+
+import mock
+
+PROJECT_ID = "project-id"
+INSTANCE_NAME = "projects/" + PROJECT_ID + "/instances/instance-id"
+DATABASE_ID = "database-id"
+DATABASE_NAME = INSTANCE_NAME + "/databases/" + DATABASE_ID
+SESSION_NAME = DATABASE_NAME + "/sessions/session-id"
+TXN_ID = b"DEAFBEAD"
+TABLE_NAME = "citizens"
+COLUMNS = ["email", "age"]
+VALUES = [[u"phred@example.com", 32]]
+COMMIT_TIMESTAMP = datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+
+class _AsyncSpannerAPI(object):
+    def __init__(self):
+        self.calls = []
+
+    async def begin_transaction(self, **kw):
+        from google.cloud.spanner_v1 import Transaction
+
+        self.calls.append(("begin_transaction", kw))
+        return Transaction(id=TXN_ID)
+
+    async def commit(self, **kw):
+        from google.cloud.spanner_v1 import CommitResponse
+
+        self.calls.append(("commit", kw))
+        return CommitResponse(commit_timestamp=COMMIT_TIMESTAMP)
+
+    async def rollback(self, **kw):
+        self.calls.append(("rollback", kw))
+
+
+class _Client(object):
+    def __init__(self):
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+        self.project = PROJECT_ID
+        self.credentials = mock.Mock(spec=[])
+        self._client_info = mock.Mock()
+        self._client_options = None
+        self._query_options = ExecuteSqlRequest.QueryOptions(optimizer_version="1")
+
+
+class _Instance(object):
+    def __init__(self, emulator_host=None):
+        self.name = INSTANCE_NAME
+        self.instance_id = INSTANCE_NAME.rsplit("/", 1)[1]
+        self._client = _Client()
+        self.emulator_host = emulator_host
+
+
+class _Pool(object):
+    _bound = None
+
+    def __init__(self, session=None):
+        self._session = session
+        self.returned = []
+
+    def bind(self, database):
+        self._bound = database
+
+    async def get(self):
+        return self._session
+
+    def put(self, session):
+        self.returned.append(session)
+
+    def session(self):
+        from google.cloud.spanner_v1.aio.pool import AsyncSessionCheckout
+
+        return AsyncSessionCheckout(self)
+
+
+class TestAsyncDatabase(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.aio.database import AsyncDatabase
+
+        return AsyncDatabase
+
+    def _make_one(self, instance=None, pool=None):
+        if instance is None:
+            instance = _Instance()
+        return self._getTargetClass()(DATABASE_ID, instance, pool=pool)
+
+    def _make_database_w_session(self):
+        api = _AsyncSpannerAPI()
+        pool = _Pool()
+        database = self._make_one(pool=pool)
+        database._spanner_api = api
+        session = pool._session = database.session()
+        session._session_id = SESSION_NAME.rsplit("/", 1)[1]
+        return database, pool, session, api
+
+    def test_ctor_defaults(self):
+        from google.cloud.spanner_v1.aio.pool import AsyncFixedSizePool
+        from google.cloud.spanner_v1.database import Database
+        from google.cloud.spanner_v1.retry_policy import DEFAULT_RETRY_POLICY
+
+        instance = _Instance()
+        database = self._make_one(instance=instance)
+
+        self.assertEqual(database.database_id, DATABASE_ID)
+        self.assertEqual(database.name, DATABASE_NAME)
+        self.assertIs(database._instance, instance)
+        self.assertEqual(database.ddl_statements, ())
+        self.assertIs(database.retry_policy, DEFAULT_RETRY_POLICY)
+        self.assertIsInstance(database._pool, AsyncFixedSizePool)
+        self.assertIs(database._pool._database, database)
+
+        sync_database = database.sync_database
+        self.assertIsInstance(sync_database, Database)
+        self.assertEqual(sync_database.name, DATABASE_NAME)
+        self.assertIs(database.abort_stats, sync_database.abort_stats)
+        self.assertIsNot(sync_database._pool, database._pool)
+
+    def test_ctor_w_explicit(self):
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
+
+        pool = _Pool()
+        policy = AbortRetryPolicy(max_attempts=3)
+        ddl = ["CREATE TABLE citizens (email STRING(MAX)) PRIMARY KEY (email)"]
+
+        database = self._getTargetClass()(
+            DATABASE_ID, _Instance(), ddl_statements=ddl, pool=pool, retry_policy=policy
+        )
+
+        self.assertIs(database._pool, pool)
+        self.assertIs(pool._bound, database)
+        self.assertEqual(database.ddl_statements, tuple(ddl))
+        self.assertIs(database.retry_policy, policy)
+        self.assertIs(database.sync_database.retry_policy, policy)
+
+    def test_state_delegated(self):
+        from google.cloud.spanner_admin_database_v1 import Database as DatabasePB
+
+        database = self._make_one(pool=_Pool())
+        sync_database = database.sync_database
+        sync_database._state = DatabasePB.State.READY
+        sync_database._create_time = COMMIT_TIMESTAMP
+        sync_database._restore_info = restore_info = mock.Mock()
+
+        self.assertEqual(database.state, DatabasePB.State.READY)
+        self.assertEqual(database.create_time, COMMIT_TIMESTAMP)
+        self.assertIs(database.restore_info, restore_info)
+        self.assertTrue(database.is_ready())
+        self.assertTrue(database.is_optimized())
+
+    def test_admin_methods_delegated(self):
+        database = self._make_one(pool=_Pool())
+        source = mock.Mock()
+
+        with mock.patch.object(database, "_database") as sync_database:
+            self.assertIs(database.create(), sync_database.create.return_value)
+            self.assertIs(database.exists(), sync_database.exists.return_value)
+            database.reload()
+            self.assertIs(
+                database.update_ddl(["DROP TABLE citizens"], operation_id="op"),
+                sync_database.update_ddl.return_value,
+            )
+            database.drop()
+            self.assertIs(
+                database.restore(source), sync_database.restore.return_value
+            )
+            self.assertIs(
+                database.list_database_operations(filter_="foo", page_size=5),
+                sync_database.list_database_operations.return_value,
+            )
+
+        sync_database.create.assert_called_once_with()
+        sync_database.exists.assert_called_once_with()
+        sync_database.reload.assert_called_once_with()
+        sync_database.update_ddl.assert_called_once_with(
+            ["DROP TABLE citizens"], operation_id="op"
+        )
+        sync_database.drop.assert_called_once_with()
+        sync_database.restore.assert_called_once_with(source)
+        sync_database.list_database_operations.assert_called_once_with(
+            filter_="foo", page_size=5
+        )
+
+    def test_sync_only_methods_absent(self):
+        database = self._make_one(pool=_Pool())
+
+        for method in (
+            "batch_snapshot",
+            "bulk_writer",
+            "execute_partitioned_dml",
+            "export_table",
+            "shared_snapshot",
+        ):
+            self.assertFalse(hasattr(database, method), method)
+            self.assertTrue(hasattr(database.sync_database, method), method)
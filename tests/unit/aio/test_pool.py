@@ -0,0 +1,158 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import unittest
+
+from tests.unit.aio import run_coroutine
+
+DATABASE_NAME = "projects/project-id/instances/instance-id/databases/database-id"
+
+
+class _AsyncSpannerAPI(object):
+    def __init__(self):
+        self.batch_sizes = []
+        self._created = 0
+
+    async def batch_create_sessions(self, database, session_count, metadata):
+        from google.cloud.spanner_v1 import BatchCreateSessionsResponse
+        from google.cloud.spanner_v1 import Session
+
+        self.batch_sizes.append(session_count)
+        sessions = []
+        for _ in range(session_count):
+            self._created += 1
+            sessions.append(
+                Session(name="{}/sessions/{}".format(database, self._created))
+            )
+        return BatchCreateSessionsResponse(session=sessions)
+
+
+class _Session(object):
+    def __init__(self, database, labels=None):
+        self._database = database
+        self.labels = labels
+        self._session_id = None
+        self.deleted = False
+
+    async def delete(self):
+        self.deleted = True
+
+
+class _Database(object):
+    name = DATABASE_NAME
+
+    def __init__(self):
+        self.spanner_api = _AsyncSpannerAPI()
+
+    def session(self, labels=None):
+        return _Session(self, labels=labels)
+
+
+class TestAsyncFixedSizePool(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.aio.pool import AsyncFixedSizePool
+
+        return AsyncFixedSizePool
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def test_bind_is_lazy(self):
+        pool = self._make_one(size=4)
+        database = _Database()
+
+        pool.bind(database)
+
+        self.assertIs(pool._database, database)
+        self.assertEqual(database.spanner_api.batch_sizes, [])
+
+    def test_get_fills_pool(self):
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(size=MUT._MAX_SESSIONS_PER_BATCH + 5)
+        database = _Database()
+        pool.bind(database)
+
+        session = run_coroutine(pool.get())
+
+        self.assertIsNotNone(session._session_id)
+        self.assertEqual(
+            database.spanner_api.batch_sizes, [MUT._MAX_SESSIONS_PER_BATCH, 5]
+        )
+        self.assertEqual(pool._sessions.qsize(), pool.size - 1)
+
+    def test_get_w_labels(self):
+        pool = self._make_one(size=1, labels={"foo": "bar"})
+        pool.bind(_Database())
+
+        session = run_coroutine(pool.get())
+
+        self.assertEqual(session.labels, {"foo": "bar"})
+
+    def test_get_empty_times_out(self):
+        pool = self._make_one(size=1)
+        pool.bind(_Database())
+
+        async def run():
+            await pool.get()
+            await pool.get(timeout=0.01)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            run_coroutine(run())
+
+    def test_session_checkout_returns_session(self):
+        pool = self._make_one(size=2)
+        database = _Database()
+        pool.bind(database)
+
+        async def run():
+            async with pool.session() as session:
+                self.assertEqual(pool._sessions.qsize(), 1)
+            return session
+
+        session = run_coroutine(run())
+
+        self.assertEqual(pool._sessions.qsize(), 2)
+        self.assertEqual(database.spanner_api.batch_sizes, [2])
+        self.assertIsNotNone(session._last_use_time)
+
+    def test_put_full(self):
+        pool = self._make_one(size=1)
+        pool.bind(_Database())
+
+        async def run():
+            await pool.get()
+            pool.put(_Session(None))
+            pool.put(_Session(None))
+
+        with self.assertRaises(asyncio.QueueFull):
+            run_coroutine(run())
+
+    def test_clear(self):
+        pool = self._make_one(size=3)
+        pool.bind(_Database())
+
+        async def run():
+            session = await pool.get()
+            pool.put(session)
+            sessions = list(pool._sessions._queue)
+            await pool.clear()
+            return sessions
+
+        sessions = run_coroutine(run())
+
+        self.assertEqual(len(sessions), 3)
+        self.assertTrue(all(session.deleted for session in sessions))
+        self.assertTrue(pool._sessions.empty())
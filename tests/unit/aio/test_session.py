@@ -0,0 +1,261 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import unittest
+
+import mock
+
+from tests.unit.aio import run_coroutine
+
+DATABASE_NAME = "projects/project-id/instances/instance-id/databases/database-id"
+SESSION_ID = "session-id"
+SESSION_NAME = DATABASE_NAME + "/sessions/" + SESSION_ID
+TXN_ID = b"DEAFBEAD"
+TABLE_NAME = "citizens"
+COLUMNS = ["email", "age"]
+VALUES = [[u"phred@example.com", 32]]
+COMMIT_TIMESTAMP = datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+
+def _make_rpc_error(error_cls, trailing_metadata=None):
+    import grpc
+
+    grpc_error = mock.create_autospec(grpc.Call, instance=True)
+    grpc_error.trailing_metadata.return_value = trailing_metadata
+    return error_cls("error", errors=(grpc_error,))
+
+
+class _AsyncSpannerAPI(object):
+    def __init__(self, commit_errors=(), get_session_error=None):
+        self._commit_errors = list(commit_errors)
+        self._get_session_error = get_session_error
+        self.calls = []
+
+    async def create_session(self, **kw):
+        from google.cloud.spanner_v1 import Session
+
+        self.calls.append(("create_session", kw))
+        return Session(name=SESSION_NAME)
+
+    async def get_session(self, **kw):
+        self.calls.append(("get_session", kw))
+        if self._get_session_error is not None:
+            raise self._get_session_error
+
+    async def delete_session(self, **kw):
+        self.calls.append(("delete_session", kw))
+
+    async def begin_transaction(self, **kw):
+        from google.cloud.spanner_v1 import Transaction
+
+        self.calls.append(("begin_transaction", kw))
+        return Transaction(id=TXN_ID)
+
+    async def commit(self, **kw):
+        from google.cloud.spanner_v1 import CommitResponse
+
+        self.calls.append(("commit", kw))
+        if self._commit_errors:
+            raise self._commit_errors.pop(0)
+        return CommitResponse(commit_timestamp=COMMIT_TIMESTAMP)
+
+    async def rollback(self, **kw):
+        self.calls.append(("rollback", kw))
+
+
+class _Database(object):
+    name = DATABASE_NAME
+
+    def __init__(self, api):
+        from google.cloud.spanner_v1.retry_policy import AbortStats
+        from google.cloud.spanner_v1.retry_policy import DEFAULT_RETRY_POLICY
+
+        self.spanner_api = api
+        self.retry_policy = DEFAULT_RETRY_POLICY
+        self.abort_stats = AbortStats()
+
+
+class TestAsyncSession(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.aio.session import AsyncSession
+
+        return AsyncSession
+
+    def _make_one(self, api, session_id=None, **kw):
+        session = self._getTargetClass()(_Database(api), **kw)
+        session._session_id = session_id
+        return session
+
+    def test_create(self):
+        api = _AsyncSpannerAPI()
+        session = self._make_one(api, labels={"foo": "bar"})
+
+        run_coroutine(session.create())
+
+        self.assertEqual(session.session_id, SESSION_ID)
+        ((name, kw),) = api.calls
+        self.assertEqual(name, "create_session")
+        self.assertEqual(kw["request"].database, DATABASE_NAME)
+        self.assertEqual(kw["request"].session.labels, {"foo": "bar"})
+
+    def test_create_w_session_id(self):
+        session = self._make_one(_AsyncSpannerAPI(), SESSION_ID)
+
+        with self.assertRaises(ValueError):
+            run_coroutine(session.create())
+
+    def test__recreate(self):
+        api = _AsyncSpannerAPI()
+        session = self._make_one(api, "old-session-id")
+        session._transaction = mock.Mock()
+
+        run_coroutine(session._recreate())
+
+        self.assertEqual(session.session_id, SESSION_ID)
+        self.assertIsNone(session._transaction)
+        ((name, kw),) = api.calls
+        self.assertEqual(name, "create_session")
+        self.assertEqual(kw["request"].database, DATABASE_NAME)
+
+    def test_exists(self):
+        api = _AsyncSpannerAPI()
+        session = self._make_one(api, SESSION_ID)
+
+        self.assertTrue(run_coroutine(session.exists()))
+        self.assertEqual(api.calls[0][1]["name"], SESSION_NAME)
+
+    def test_exists_not_found(self):
+        from google.api_core.exceptions import NotFound
+
+        api = _AsyncSpannerAPI(get_session_error=NotFound("testing"))
+        session = self._make_one(api, SESSION_ID)
+
+        self.assertFalse(run_coroutine(session.exists()))
+
+    def test_delete(self):
+        api = _AsyncSpannerAPI()
+        session = self._make_one(api, SESSION_ID)
+
+        run_coroutine(session.delete())
+
+        self.assertEqual(api.calls, [("delete_session", mock.ANY)])
+
+    def test_factories_wo_session_id(self):
+        session = self._make_one(_AsyncSpannerAPI())
+
+        with self.assertRaises(ValueError):
+            session.snapshot()
+        with self.assertRaises(ValueError):
+            session.batch()
+        with self.assertRaises(ValueError):
+            session.transaction()
+
+    def test_factories(self):
+        from google.cloud.spanner_v1.aio.batch import AsyncBatch
+        from google.cloud.spanner_v1.aio.snapshot import AsyncSnapshot
+        from google.cloud.spanner_v1.aio.transaction import AsyncTransaction
+
+        session = self._make_one(_AsyncSpannerAPI(), SESSION_ID)
+
+        self.assertIsInstance(session.snapshot(multi_use=True), AsyncSnapshot)
+        self.assertIsInstance(session.batch(), AsyncBatch)
+        transaction = session.transaction()
+        self.assertIsInstance(transaction, AsyncTransaction)
+        self.assertIs(session._transaction, transaction)
+
+    def test_run_in_transaction(self):
+        api = _AsyncSpannerAPI()
+        session = self._make_one(api, SESSION_ID)
+        called_with = []
+
+        async def unit_of_work(txn, *args, **kw):
+            called_with.append((txn, args, kw))
+            txn.insert(TABLE_NAME, COLUMNS, VALUES)
+            return 42
+
+        return_value = run_coroutine(
+            session.run_in_transaction(unit_of_work, "abc", some_arg="def")
+        )
+
+        self.assertEqual(return_value, 42)
+        self.assertIsNone(session._transaction)
+        ((txn, args, kw),) = called_with
+        self.assertEqual(txn.committed, COMMIT_TIMESTAMP)
+        self.assertEqual(args, ("abc",))
+        self.assertEqual(kw, {"some_arg": "def"})
+        self.assertEqual(
+            [name for name, _ in api.calls], ["begin_transaction", "commit"]
+        )
+
+    def test_run_in_transaction_w_abort_on_commit(self):
+        from google.api_core.exceptions import Aborted
+        from google.protobuf.duration_pb2 import Duration
+        from google.rpc.error_details_pb2 import RetryInfo
+
+        retry_info = RetryInfo(retry_delay=Duration(seconds=1))
+        trailing_metadata = [
+            ("google.rpc.retryinfo-bin", retry_info.SerializeToString())
+        ]
+        aborted = _make_rpc_error(Aborted, trailing_metadata=trailing_metadata)
+        api = _AsyncSpannerAPI(commit_errors=[aborted])
+        session = self._make_one(api, SESSION_ID)
+        called_with = []
+
+        async def unit_of_work(txn):
+            called_with.append(txn)
+            txn.insert(TABLE_NAME, COLUMNS, VALUES)
+
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        with mock.patch("asyncio.sleep", new=sleep):
+            run_coroutine(session.run_in_transaction(unit_of_work))
+
+        self.assertEqual(len(called_with), 2)
+        self.assertIsNot(called_with[0], called_with[1])
+        self.assertEqual(called_with[1].committed, COMMIT_TIMESTAMP)
+        self.assertEqual(delays, [1])
+        self.assertEqual(
+            [name for name, _ in api.calls],
+            ["begin_transaction", "commit", "begin_transaction", "commit"],
+        )
+
+    def test_run_in_transaction_w_abort_past_deadline(self):
+        from google.api_core.exceptions import Aborted
+
+        api = _AsyncSpannerAPI(commit_errors=[_make_rpc_error(Aborted)])
+        session = self._make_one(api, SESSION_ID)
+
+        async def unit_of_work(txn):
+            txn.insert(TABLE_NAME, COLUMNS, VALUES)
+
+        with self.assertRaises(Aborted):
+            run_coroutine(session.run_in_transaction(unit_of_work, timeout_secs=0))
+
+    def test_run_in_transaction_w_error_in_func(self):
+        api = _AsyncSpannerAPI()
+        session = self._make_one(api, SESSION_ID)
+
+        async def unit_of_work(txn):
+            raise RuntimeError("testing")
+
+        with self.assertRaises(RuntimeError):
+            run_coroutine(session.run_in_transaction(unit_of_work))
+
+        self.assertEqual(
+            [name for name, _ in api.calls], ["begin_transaction", "rollback"]
+        )
@@ -0,0 +1,427 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+from tests.unit.aio import run_coroutine
+
+DATABASE_NAME = "projects/project-id/instances/instance-id/databases/database-id"
+SESSION_NAME = DATABASE_NAME + "/sessions/session-id"
+TXN_ID = b"DEAFBEAD"
+SQL_QUERY = "SELECT first_name, age FROM citizens"
+TABLE_NAME = "citizens"
+COLUMNS = ["first_name", "age"]
+RESUME_TOKEN = b"DEADBEEF"
+
+
+def _make_partial_result_sets():
+    from google.cloud.spanner_v1 import PartialResultSet
+    from google.cloud.spanner_v1 import ResultSetMetadata
+    from google.cloud.spanner_v1 import StructType
+    from google.cloud.spanner_v1 import Type
+    from google.cloud.spanner_v1 import TypeCode
+    from google.cloud.spanner_v1._helpers import _make_value_pb
+
+    metadata = ResultSetMetadata(
+        row_type=StructType(
+            fields=[
+                StructType.Field(name="first_name", type_=Type(code=TypeCode.STRING)),
+                StructType.Field(name="age", type_=Type(code=TypeCode.INT64)),
+            ]
+        )
+    )
+    first = PartialResultSet(metadata=metadata)
+    for value in [u"Phred", u"32"]:
+        first.values.append(_make_value_pb(value))
+    second = PartialResultSet()
+    for value in [u"Bharney", u"31"]:
+        second.values.append(_make_value_pb(value))
+    return [first, second]
+
+
+class _AsyncIterator(object):
+    def __init__(self, items, error=None):
+        self._items = list(items)
+        self._error = error
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._items:
+            if self._error is not None:
+                raise self._error
+            raise StopAsyncIteration
+        return self._items.pop(0)
+
+
+class _Restart(object):
+    """Stand-in for a curried streaming API method."""
+
+    def __init__(self, *streams):
+        self._streams = list(streams)
+        self.calls = []
+
+    async def __call__(self, **kw):
+        self.calls.append(kw)
+        return self._streams.pop(0)
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class Test_restart_on_unavailable(unittest.TestCase):
+    def _call_fut(self, restart, **kw):
+        from google.cloud.spanner_v1.aio.snapshot import _restart_on_unavailable
+
+        return _restart_on_unavailable(restart, **kw)
+
+    def _make_item(self, value, resume_token=b""):
+        return mock.Mock(
+            value=value, resume_token=resume_token, spec=["value", "resume_token"]
+        )
+
+    def test_iteration_w_empty_raw(self):
+        restart = _Restart(_AsyncIterator([]))
+
+        self.assertEqual(run_coroutine(_collect(self._call_fut(restart))), [])
+        self.assertEqual(restart.calls, [{}])
+
+    def test_iteration_w_raw_w_resume_token(self):
+        ITEMS = (
+            self._make_item(0),
+            self._make_item(1, resume_token=RESUME_TOKEN),
+            self._make_item(2),
+            self._make_item(3),
+        )
+        restart = _Restart(_AsyncIterator(ITEMS))
+
+        items = run_coroutine(_collect(self._call_fut(restart)))
+
+        self.assertEqual(items, list(ITEMS))
+        self.assertEqual(restart.calls, [{}])
+
+    def test_iteration_w_raw_raising_unavailable_no_token(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        ITEMS = (
+            self._make_item(0),
+            self._make_item(1, resume_token=RESUME_TOKEN),
+            self._make_item(2),
+        )
+        before = _AsyncIterator([], error=ServiceUnavailable("testing"))
+        restart = _Restart(before, _AsyncIterator(ITEMS))
+
+        items = run_coroutine(_collect(self._call_fut(restart)))
+
+        self.assertEqual(items, list(ITEMS))
+        self.assertEqual(restart.calls, [{}, {"resume_token": b""}])
+
+    def test_iteration_w_raw_raising_unavailable(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        FIRST = (self._make_item(0), self._make_item(1, resume_token=RESUME_TOKEN))
+        SECOND = (self._make_item(2),)  # discarded after 503
+        LAST = (self._make_item(3),)
+        before = _AsyncIterator(FIRST + SECOND, error=ServiceUnavailable("testing"))
+        restart = _Restart(before, _AsyncIterator(LAST))
+
+        items = run_coroutine(_collect(self._call_fut(restart)))
+
+        self.assertEqual(items, list(FIRST + LAST))
+        self.assertEqual(restart.calls, [{}, {"resume_token": RESUME_TOKEN}])
+
+    def test_iteration_w_raw_raising_rst_stream_internal_error(self):
+        from google.api_core.exceptions import InternalServerError
+
+        FIRST = (self._make_item(0), self._make_item(1, resume_token=RESUME_TOKEN))
+        SECOND = (self._make_item(2),)  # discarded after RST_STREAM
+        LAST = (self._make_item(3),)
+        error = InternalServerError("Received RST_STREAM with error code 2")
+        before = _AsyncIterator(FIRST + SECOND, error=error)
+        restart = _Restart(before, _AsyncIterator(LAST))
+
+        items = run_coroutine(_collect(self._call_fut(restart)))
+
+        self.assertEqual(items, list(FIRST + LAST))
+        self.assertEqual(restart.calls, [{}, {"resume_token": RESUME_TOKEN}])
+
+    def test_iteration_w_raw_raising_unexpected_eos_internal_error(self):
+        from google.api_core.exceptions import InternalServerError
+
+        FIRST = (self._make_item(0), self._make_item(1, resume_token=RESUME_TOKEN))
+        LAST = (self._make_item(2),)
+        error = InternalServerError("Received unexpected EOS on DATA frame from server")
+        before = _AsyncIterator(FIRST, error=error)
+        restart = _Restart(before, _AsyncIterator(LAST))
+
+        items = run_coroutine(_collect(self._call_fut(restart)))
+
+        self.assertEqual(items, list(FIRST + LAST))
+        self.assertEqual(restart.calls, [{}, {"resume_token": RESUME_TOKEN}])
+
+    def test_iteration_w_raw_raising_non_retryable_internal_error(self):
+        from google.api_core.exceptions import InternalServerError
+
+        FIRST = (self._make_item(0), self._make_item(1, resume_token=RESUME_TOKEN))
+        before = _AsyncIterator(FIRST, error=InternalServerError("testing"))
+        restart = _Restart(before, _AsyncIterator(()))
+
+        with self.assertRaises(InternalServerError):
+            run_coroutine(_collect(self._call_fut(restart)))
+
+        self.assertEqual(restart.calls, [{}])
+
+    def test_iteration_w_buffer_limit_raise(self):
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1.snapshot import BUFFER_OVERFLOW_RAISE
+        from google.cloud.spanner_v1.snapshot import BufferExceeded
+
+        ITEMS = [PartialResultSet(chunked_value=True) for _ in range(3)]
+        restart = _Restart(_AsyncIterator(ITEMS))
+        resumable = self._call_fut(
+            restart, max_buffer_bytes=3, buffer_overflow=BUFFER_OVERFLOW_RAISE
+        )
+
+        with self.assertRaises(BufferExceeded):
+            run_coroutine(_collect(resumable))
+
+    def test_iteration_w_buffer_limit_flush_then_unavailable(self):
+        from google.api_core.exceptions import ServiceUnavailable
+        from google.cloud.spanner_v1 import PartialResultSet
+
+        ITEMS = [PartialResultSet(chunked_value=True) for _ in range(3)]
+        before = _AsyncIterator(ITEMS, error=ServiceUnavailable("testing"))
+        restart = _Restart(before, _AsyncIterator(()))
+        resumable = self._call_fut(restart, max_buffer_bytes=3)
+        received = []
+
+        async def consume():
+            async for item in resumable:
+                received.append(item)
+
+        with self.assertRaises(ServiceUnavailable):
+            run_coroutine(consume())
+
+        self.assertEqual(received, ITEMS[:2])
+        self.assertEqual(restart.calls, [{}])
+
+
+class Test_resumable(unittest.TestCase):
+    def _call_fut(self, method, request, **kw):
+        from google.cloud.spanner_v1.aio.snapshot import _resumable
+
+        return _resumable(method, request, **kw)
+
+    def test_sets_resume_token_on_request(self):
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+        request = ExecuteSqlRequest(session=SESSION_NAME, sql=SQL_QUERY)
+        method = mock.Mock(spec=[])
+        restart = self._call_fut(method, request, metadata=[("foo", "bar")])
+
+        self.assertIs(restart(), method.return_value)
+        self.assertEqual(request.resume_token, b"")
+        restart(resume_token=RESUME_TOKEN)
+
+        self.assertEqual(request.resume_token, RESUME_TOKEN)
+        self.assertEqual(
+            method.mock_calls,
+            [
+                mock.call(request=request, metadata=[("foo", "bar")]),
+                mock.call(request=request, metadata=[("foo", "bar")]),
+            ],
+        )
+
+
+class _AsyncSpannerAPI(object):
+    def __init__(self, responses=(), *streams):
+        self._streams = list(streams) or [_AsyncIterator(responses)]
+        self.requests = []
+        self.resume_tokens = []
+
+    async def _stream(self, **kw):
+        self.requests.append(kw)
+        self.resume_tokens.append(kw["request"].resume_token)
+        return self._streams.pop(0)
+
+    def execute_streaming_sql(self, **kw):
+        return self._stream(**kw)
+
+    def streaming_read(self, **kw):
+        return self._stream(**kw)
+
+    async def begin_transaction(self, **kw):
+        from google.cloud.spanner_v1 import Transaction
+
+        self.requests.append(kw)
+        return Transaction(id=TXN_ID)
+
+
+class _Client(object):
+    def __init__(self):
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+        self._query_options = ExecuteSqlRequest.QueryOptions(optimizer_version="1")
+
+
+class _Instance(object):
+    def __init__(self):
+        self._client = _Client()
+
+
+class _Database(object):
+    name = DATABASE_NAME
+
+    def __init__(self, api):
+        self.spanner_api = api
+        self._instance = _Instance()
+
+
+class _Session(object):
+    name = SESSION_NAME
+
+    def __init__(self, database):
+        self._database = database
+
+
+class TestAsyncSnapshot(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.aio.snapshot import AsyncSnapshot
+
+        return AsyncSnapshot
+
+    def _make_one(self, api, **kw):
+        return self._getTargetClass()(_Session(_Database(api)), **kw)
+
+    def test_execute_sql(self):
+        from google.cloud.spanner_v1.aio.streamed import AsyncStreamedResultSet
+
+        api = _AsyncSpannerAPI(_make_partial_result_sets())
+        snapshot = self._make_one(api)
+
+        async def consume():
+            result_set = snapshot.execute_sql(SQL_QUERY)
+            self.assertIsInstance(result_set, AsyncStreamedResultSet)
+            self.assertEqual(api.requests, [])
+            return [row async for row in result_set]
+
+        rows = run_coroutine(consume())
+
+        self.assertEqual(rows, [[u"Phred", 32], [u"Bharney", 31]])
+        (call,) = api.requests
+        request = call["request"]
+        self.assertEqual(request.session, SESSION_NAME)
+        self.assertEqual(request.sql, SQL_QUERY)
+        self.assertTrue(request.transaction.single_use.read_only.strong)
+        self.assertEqual(
+            call["metadata"], [("google-cloud-resource-prefix", DATABASE_NAME)]
+        )
+
+    def test_execute_sql_resumes_after_unavailable(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        first, second = _make_partial_result_sets()
+        first.resume_token = RESUME_TOKEN
+        api = _AsyncSpannerAPI(
+            (),
+            _AsyncIterator([first], error=ServiceUnavailable("testing")),
+            _AsyncIterator([second]),
+        )
+        snapshot = self._make_one(api)
+
+        async def consume():
+            return [row async for row in snapshot.execute_sql(SQL_QUERY)]
+
+        rows = run_coroutine(consume())
+
+        self.assertEqual(rows, [[u"Phred", 32], [u"Bharney", 31]])
+        self.assertEqual(api.resume_tokens, [b"", RESUME_TOKEN])
+
+    def test_execute_sql_w_invalid_buffer_overflow(self):
+        snapshot = self._make_one(_AsyncSpannerAPI())
+
+        with self.assertRaises(ValueError):
+            snapshot.execute_sql(SQL_QUERY, buffer_overflow="discard")
+
+        self.assertEqual(snapshot._read_request_count, 0)
+
+    def test_execute_sql_single_use_twice(self):
+        snapshot = self._make_one(_AsyncSpannerAPI())
+
+        snapshot.execute_sql(SQL_QUERY)
+
+        with self.assertRaises(ValueError):
+            snapshot.execute_sql(SQL_QUERY)
+
+    def test_read(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        api = _AsyncSpannerAPI(_make_partial_result_sets())
+        snapshot = self._make_one(api)
+
+        async def consume():
+            result_set = snapshot.read(TABLE_NAME, COLUMNS, KeySet(all_=True))
+            return [row async for row in result_set]
+
+        rows = run_coroutine(consume())
+
+        self.assertEqual(rows, [[u"Phred", 32], [u"Bharney", 31]])
+        (call,) = api.requests
+        request = call["request"]
+        self.assertEqual(request.table, TABLE_NAME)
+        self.assertEqual(request.columns, COLUMNS)
+        self.assertTrue(request.key_set.all_)
+
+    def test_begin_then_execute_sql(self):
+        api = _AsyncSpannerAPI(_make_partial_result_sets())
+        snapshot = self._make_one(api, multi_use=True)
+
+        async def run():
+            txn_id = await snapshot.begin()
+            result_set = snapshot.execute_sql(SQL_QUERY)
+            rows = [row async for row in result_set]
+            return txn_id, rows
+
+        txn_id, rows = run_coroutine(run())
+
+        self.assertEqual(txn_id, TXN_ID)
+        self.assertEqual(len(rows), 2)
+        begin_call, execute_call = api.requests
+        self.assertEqual(begin_call["session"], SESSION_NAME)
+        self.assertTrue(begin_call["options"].read_only.strong)
+        self.assertEqual(execute_call["request"].transaction.id, TXN_ID)
+
+    def test_begin_wo_multi_use(self):
+        snapshot = self._make_one(_AsyncSpannerAPI())
+
+        with self.assertRaises(ValueError):
+            run_coroutine(snapshot.begin())
+
+    def test_partition_read(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        snapshot = self._make_one(_AsyncSpannerAPI(), multi_use=True)
+
+        with self.assertRaises(TypeError):
+            snapshot.partition_read(TABLE_NAME, COLUMNS, KeySet(all_=True))
+
+    def test_partition_query(self):
+        snapshot = self._make_one(_AsyncSpannerAPI(), multi_use=True)
+
+        with self.assertRaises(TypeError):
+            snapshot.partition_query(SQL_QUERY)
@@ -0,0 +1,155 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from tests.unit.aio import run_coroutine
+
+
+def _make_metadata(*fields):
+    from google.cloud.spanner_v1 import ResultSetMetadata
+    from google.cloud.spanner_v1 import StructType
+    from google.cloud.spanner_v1 import Type
+
+    return ResultSetMetadata(
+        row_type=StructType(
+            fields=[
+                StructType.Field(name=name, type_=Type(code=code))
+                for name, code in fields
+            ]
+        )
+    )
+
+
+def _make_partial_result_set(values, metadata=None, chunked_value=False):
+    from google.cloud.spanner_v1 import PartialResultSet
+    from google.cloud.spanner_v1._helpers import _make_value_pb
+
+    result = PartialResultSet(metadata=metadata, chunked_value=chunked_value)
+    for value in values:
+        result.values.append(_make_value_pb(value))
+    return result
+
+
+class _AsyncIterator(object):
+    def __init__(self, *items):
+        self._items = list(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._items:
+            raise StopAsyncIteration
+        return self._items.pop(0)
+
+
+class TestAsyncStreamedResultSet(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.aio.streamed import AsyncStreamedResultSet
+
+        return AsyncStreamedResultSet
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def _make_responses(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        metadata = _make_metadata(("name", TypeCode.STRING), ("age", TypeCode.INT64))
+        return [
+            _make_partial_result_set([u"Phred", u"32", u"Bhar"], metadata, True),
+            _make_partial_result_set([u"ney", u"31"]),
+        ]
+
+    def test_iter_sync(self):
+        streamed = self._make_one(_AsyncIterator())
+
+        with self.assertRaises(TypeError):
+            iter(streamed)
+
+    def test_aiter_merges_chunks(self):
+        streamed = self._make_one(_AsyncIterator(*self._make_responses()))
+
+        async def consume():
+            return [row async for row in streamed]
+
+        rows = run_coroutine(consume())
+
+        self.assertEqual(rows, [[u"Phred", 32], [u"Bharney", 31]])
+        self.assertEqual([field.name for field in streamed.fields], ["name", "age"])
+
+    def test_aiter_w_row_factory(self):
+        from google.cloud.spanner_v1.streamed import tuple_row_factory
+
+        streamed = self._make_one(
+            _AsyncIterator(*self._make_responses()), row_factory=tuple_row_factory
+        )
+
+        async def consume():
+            return [row async for row in streamed]
+
+        rows = run_coroutine(consume())
+
+        self.assertEqual(rows, [(u"Phred", 32), (u"Bharney", 31)])
+
+    def test_to_columns(self):
+        streamed = self._make_one(_AsyncIterator(*self._make_responses()))
+
+        columns = run_coroutine(streamed.to_columns())
+
+        self.assertEqual(columns, [[u"Phred", u"Bharney"], [32, 31]])
+
+    def test_to_columns_wo_fields(self):
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1 import ResultSetStats
+
+        # E.g. a DML statement run with 'execute_sql' in a transaction.
+        response = PartialResultSet(
+            metadata=_make_metadata(), stats=ResultSetStats(row_count_exact=3)
+        )
+        streamed = self._make_one(_AsyncIterator(response))
+
+        columns = run_coroutine(streamed.to_columns())
+
+        self.assertEqual(columns, [])
+        self.assertEqual(streamed.stats.row_count_exact, 3)
+
+    def test_one_w_single_row(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        metadata = _make_metadata(("name", TypeCode.STRING))
+        streamed = self._make_one(
+            _AsyncIterator(_make_partial_result_set([u"Phred"], metadata))
+        )
+
+        self.assertEqual(run_coroutine(streamed.one()), [u"Phred"])
+
+    def test_one_wo_rows(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.spanner_v1 import TypeCode
+
+        metadata = _make_metadata(("name", TypeCode.STRING))
+        streamed = self._make_one(
+            _AsyncIterator(_make_partial_result_set([], metadata))
+        )
+
+        with self.assertRaises(NotFound):
+            run_coroutine(streamed.one())
+
+    def test_one_or_none_w_multiple_rows(self):
+        streamed = self._make_one(_AsyncIterator(*self._make_responses()))
+
+        with self.assertRaises(ValueError):
+            run_coroutine(streamed.one_or_none())
@@ -0,0 +1,193 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import unittest
+
+from tests.unit.aio import run_coroutine
+
+DATABASE_NAME = "projects/project-id/instances/instance-id/databases/database-id"
+SESSION_NAME = DATABASE_NAME + "/sessions/session-id"
+TXN_ID = b"DEAFBEAD"
+DML_QUERY = "UPDATE citizens SET age = age + 1"
+TABLE_NAME = "citizens"
+COLUMNS = ["email", "age"]
+VALUES = [[u"phred@example.com", 32]]
+COMMIT_TIMESTAMP = datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+
+class _AsyncSpannerAPI(object):
+    def __init__(self):
+        self.calls = []
+
+    async def begin_transaction(self, **kw):
+        from google.cloud.spanner_v1 import Transaction
+
+        self.calls.append(("begin_transaction", kw))
+        return Transaction(id=TXN_ID)
+
+    async def commit(self, **kw):
+        from google.cloud.spanner_v1 import CommitResponse
+
+        self.calls.append(("commit", kw))
+        return CommitResponse(commit_timestamp=COMMIT_TIMESTAMP)
+
+    async def rollback(self, **kw):
+        self.calls.append(("rollback", kw))
+
+    async def execute_sql(self, **kw):
+        from google.cloud.spanner_v1 import ResultSet
+        from google.cloud.spanner_v1 import ResultSetStats
+
+        self.calls.append(("execute_sql", kw))
+        return ResultSet(stats=ResultSetStats(row_count_exact=3))
+
+    async def execute_batch_dml(self, **kw):
+        from google.cloud.spanner_v1 import ExecuteBatchDmlResponse
+        from google.cloud.spanner_v1 import ResultSet
+        from google.cloud.spanner_v1 import ResultSetStats
+
+        self.calls.append(("execute_batch_dml", kw))
+        return ExecuteBatchDmlResponse(
+            result_sets=[
+                ResultSet(stats=ResultSetStats(row_count_exact=1)),
+                ResultSet(stats=ResultSetStats(row_count_exact=2)),
+            ]
+        )
+
+
+class _Client(object):
+    def __init__(self):
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+        self._query_options = ExecuteSqlRequest.QueryOptions(optimizer_version="1")
+
+
+class _Instance(object):
+    def __init__(self):
+        self._client = _Client()
+
+
+class _Database(object):
+    name = DATABASE_NAME
+
+    def __init__(self, api):
+        self.spanner_api = api
+        self._instance = _Instance()
+
+
+class _Session(object):
+    name = SESSION_NAME
+    _transaction = None
+
+    def __init__(self, database):
+        self._database = database
+
+
+class TestAsyncTransaction(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.aio.transaction import AsyncTransaction
+
+        return AsyncTransaction
+
+    def _make_one(self, api):
+        session = _Session(_Database(api))
+        transaction = session._transaction = self._getTargetClass()(session)
+        return transaction
+
+    def test_sync_context_manager(self):
+        transaction = self._make_one(_AsyncSpannerAPI())
+
+        with self.assertRaises(TypeError):
+            with transaction:
+                pass
+
+    def test_partition_query(self):
+        transaction = self._make_one(_AsyncSpannerAPI())
+
+        with self.assertRaises(TypeError):
+            transaction.partition_query("SELECT 1")
+
+    def test_async_context_manager_commits(self):
+        api = _AsyncSpannerAPI()
+        transaction = self._make_one(api)
+
+        async def run():
+            async with transaction:
+                transaction.insert(TABLE_NAME, COLUMNS, VALUES)
+
+        run_coroutine(run())
+
+        self.assertEqual(transaction.committed, COMMIT_TIMESTAMP)
+        self.assertEqual(
+            [name for name, _ in api.calls], ["begin_transaction", "commit"]
+        )
+        commit_kw = api.calls[1][1]
+        self.assertEqual(commit_kw["session"], SESSION_NAME)
+        self.assertEqual(commit_kw["transaction_id"], TXN_ID)
+        self.assertEqual(len(commit_kw["mutations"]), 1)
+
+    def test_async_context_manager_rolls_back_on_error(self):
+        api = _AsyncSpannerAPI()
+        transaction = self._make_one(api)
+
+        async def run():
+            async with transaction:
+                raise RuntimeError("testing")
+
+        with self.assertRaises(RuntimeError):
+            run_coroutine(run())
+
+        self.assertTrue(transaction.rolled_back)
+        self.assertIsNone(transaction.committed)
+        self.assertEqual(
+            [name for name, _ in api.calls], ["begin_transaction", "rollback"]
+        )
+
+    def test_commit_not_begun(self):
+        transaction = self._make_one(_AsyncSpannerAPI())
+
+        with self.assertRaises(ValueError):
+            run_coroutine(transaction.commit())
+
+    def test_execute_update(self):
+        api = _AsyncSpannerAPI()
+        transaction = self._make_one(api)
+        transaction._transaction_id = TXN_ID
+
+        row_count = run_coroutine(transaction.execute_update(DML_QUERY))
+
+        self.assertEqual(row_count, 3)
+        ((name, kw),) = api.calls
+        self.assertEqual(name, "execute_sql")
+        self.assertEqual(kw["request"].sql, DML_QUERY)
+        self.assertEqual(kw["request"].transaction.id, TXN_ID)
+        self.assertEqual(kw["request"].seqno, 0)
+        self.assertEqual(transaction._execute_sql_count, 1)
+
+    def test_batch_update(self):
+        api = _AsyncSpannerAPI()
+        transaction = self._make_one(api)
+        transaction._transaction_id = TXN_ID
+
+        status, row_counts = run_coroutine(
+            transaction.batch_update([DML_QUERY, DML_QUERY])
+        )
+
+        self.assertEqual(status.code, 0)
+        self.assertEqual(row_counts, [1, 2])
+        ((name, kw),) = api.calls
+        self.assertEqual(name, "execute_batch_dml")
+        self.assertEqual(len(kw["request"].statements), 2)
+        self.assertEqual(kw["request"].transaction.id, TXN_ID)
@@ -21,6 +21,105 @@ standard_library.install_aliases()
 import unittest
 
 
+class TestResultsChecksum(unittest.TestCase):
+    def test_consume_result_ignores_row_factory(self):
+        import collections
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        Row = collections.namedtuple("Row", ["name", "age"])
+        rows = [[u"phred", 32], (u"phred", 32), Row(u"phred", 32)]
+        rows.append({"name": u"phred", "age": 32})
+        checksums = []
+        for row in rows:
+            checksum = ResultsChecksum()
+            checksum.consume_result(row)
+            checksums.append(checksum)
+
+        for checksum in checksums[1:]:
+            self.assertEqual(checksum, checksums[0])
+
+    def test_consume_result_ignores_object_identity(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        name = u"phred" * 10
+        shared = ResultsChecksum()
+        shared.consume_result((name, name))
+
+        copied = ResultsChecksum()
+        copied.consume_result((name, u"".join(name)))
+
+        self.assertEqual(shared, copied)
+
+    def test_consume_result_type_aware(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        rows = [(1,), (1.0,), (True,), (u"1",), (b"1",), ([1],), (None,)]
+        digests = set()
+        for row in rows:
+            checksum = ResultsChecksum()
+            checksum.consume_result(row)
+            digests.add(checksum.checksum.digest())
+
+        self.assertEqual(len(digests), len(rows))
+
+    def test_consume_result_w_converted_values(self):
+        import datetime
+        import decimal
+        from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        def _checksum(*rows):
+            checksum = ResultsChecksum()
+            for row in rows:
+                checksum.consume_result(row)
+            return checksum
+
+        when = DatetimeWithNanoseconds(2020, 1, 1, nanosecond=1)
+        later = DatetimeWithNanoseconds(2020, 1, 1, nanosecond=2)
+        row = [decimal.Decimal("1.5"), datetime.date(2020, 1, 1), [when], u"phred"]
+
+        self.assertEqual(_checksum(row), _checksum(tuple(row)))
+        self.assertNotEqual(_checksum(row), _checksum(row[:2] + [[later]] + row[3:]))
+        self.assertEqual(
+            _checksum((u"phred", 32), row, (u"phred", 32)),
+            _checksum([u"phred", 32], list(row), [u"phred", 32]),
+        )
+        self.assertNotEqual(_checksum((decimal.Decimal("1"),)), _checksum((u"1",)))
+
+    def test_matches_prefix(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        original = ResultsChecksum()
+        original.CHECKPOINT_INTERVAL = 2
+        for result in range(4):
+            original.consume_result(result)
+
+        retried = ResultsChecksum()
+        retried.CHECKPOINT_INTERVAL = 2
+        self.assertTrue(original.matches_prefix(retried))
+        retried.consume_result(0)
+        self.assertTrue(original.matches_prefix(retried))
+        retried.consume_result(1)
+        self.assertTrue(original.matches_prefix(retried))
+        retried.consume_result(5)
+        # Not detected before the next checkpoint.
+        self.assertTrue(original.matches_prefix(retried))
+        retried.consume_result(3)
+        self.assertFalse(original.matches_prefix(retried))
+
+    def test_matches_prefix_w_more_results(self):
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        original = ResultsChecksum()
+        original.consume_result(5)
+
+        retried = ResultsChecksum()
+        retried.consume_result(5)
+        retried.consume_result(5)
+
+        self.assertFalse(original.matches_prefix(retried))
+
+
 class Test_compare_checksums(unittest.TestCase):
     def test_equal(self):
         from google.cloud.spanner_dbapi.checksum import _compare_checksums
@@ -75,3 +174,31 @@ class Test_compare_checksums(unittest.TestCase):
 
         with self.assertRaises(RetryAborted):
             _compare_checksums(original, retried)
+
+
+class Test_compare_checksum_prefixes(unittest.TestCase):
+    def test_prefix(self):
+        from google.cloud.spanner_dbapi.checksum import _compare_checksum_prefixes
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+
+        original = ResultsChecksum()
+        original.consume_result(5)
+        original.consume_result(2)
+
+        retried = ResultsChecksum()
+        retried.consume_result(5)
+
+        self.assertIsNone(_compare_checksum_prefixes(original, retried))
+
+    def test_more_results(self):
+        from google.cloud.spanner_dbapi.checksum import _compare_checksum_prefixes
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+        from google.cloud.spanner_dbapi.exceptions import RetryAborted
+
+        original = ResultsChecksum()
+
+        retried = ResultsChecksum()
+        retried.consume_result(5)
+
+        with self.assertRaises(RetryAborted):
+            _compare_checksum_prefixes(original, retried)
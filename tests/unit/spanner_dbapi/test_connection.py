@@ -192,10 +192,9 @@ class TestConnection(unittest.TestCase):
 
     @mock.patch.object(warnings, "warn")
     def test_commit(self, mock_warn):
-        from google.cloud.spanner_dbapi import Connection
         from google.cloud.spanner_dbapi.connection import AUTOCOMMIT_MODE_WARNING
 
-        connection = Connection(self.INSTANCE, self.DATABASE)
+        connection = self._make_connection()
 
         with mock.patch(
             "google.cloud.spanner_dbapi.connection.Connection._release_session"
@@ -214,6 +213,7 @@ class TestConnection(unittest.TestCase):
             connection.commit()
             mock_commit.assert_called_once_with()
             mock_release.assert_called_once_with()
+        self.assertEqual(connection.database.abort_stats.commits, 1)
 
         connection._autocommit = True
         connection.commit()
@@ -569,3 +569,112 @@ class TestConnection(unittest.TestCase):
                     mock.call(statement, retried=True),
                 )
             )
+
+    def test_retry_aborted_retry_gives_up(self):
+        """
+        Check that the connection stops retrying an aborted
+        transaction as the database's retry policy says.
+        """
+        from google.api_core.exceptions import Aborted
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+        from google.cloud.spanner_dbapi.cursor import Statement
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
+        from google.cloud.spanner_v1.retry_policy import JITTER_NONE
+
+        connection = self._make_connection()
+        connection.database._retry_policy = AbortRetryPolicy(
+            initial=0.5, jitter=JITTER_NONE, max_attempts=2, contention_weight=0
+        )
+        statement = Statement("SELECT 1", [], {}, ResultsChecksum(), False)
+        connection._statements.append(statement)
+
+        metadata_mock = mock.Mock()
+        metadata_mock.trailing_metadata.return_value = {}
+        aborted = Aborted("Aborted", errors=[metadata_mock])
+
+        with mock.patch.object(
+            connection, "run_statement", side_effect=aborted
+        ) as retry_mock:
+            with mock.patch("time.sleep") as sleep_mock:
+                with self.assertRaises(Aborted):
+                    connection.retry_transaction()
+
+        self.assertEqual(retry_mock.call_count, 2)
+        sleep_mock.assert_called_once_with(0.5)
+        self.assertEqual(connection.database.abort_stats.aborts, 2)
+
+    def test_retry_transaction_stops_at_first_mismatch(self):
+        """
+        Check that retrying an aborted transaction stops reading
+        results once they no longer match the original ones.
+        """
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+        from google.cloud.spanner_dbapi.cursor import Statement
+        from google.cloud.spanner_dbapi.exceptions import RetryAborted
+
+        connection = self._make_connection()
+        checksum = ResultsChecksum()
+        checksum.consume_result([1])
+        first = Statement("SELECT 1", [], {}, checksum, False)
+        second = Statement("SELECT 2", [], {}, ResultsChecksum(), False)
+        connection._statements.extend([first, second])
+
+        read = []
+
+        def _rows():
+            for value in range(1, 100):
+                read.append(value)
+                yield [value]
+
+        with mock.patch(
+            "google.cloud.spanner_dbapi.connection.Connection.run_statement",
+            return_value=(_rows(), ResultsChecksum()),
+        ) as run_mock:
+            with self.assertRaises(RetryAborted):
+                connection.retry_transaction()
+
+        self.assertEqual(read, [1, 2])
+        run_mock.assert_called_once_with(first, retried=True)
+
+    def test_retry_transaction_consumed_only(self):
+        """
+        Check that with ``retry_consumed_only``, queries with no fetched
+        results are skipped, and the others read only as far as fetched.
+        """
+        from google.cloud.spanner_dbapi.checksum import ResultsChecksum
+        from google.cloud.spanner_dbapi.cursor import Statement
+
+        connection = self._make_connection()
+        connection.retry_consumed_only = True
+
+        checksum = ResultsChecksum()
+        checksum.consume_result([1])
+        fetched = Statement("SELECT a FROM t", [], {}, checksum, False)
+        unfetched = Statement("SELECT b FROM t", [], {}, ResultsChecksum(), False)
+        update = Statement(
+            "UPDATE t SET a = 1 WHERE true", [], {}, ResultsChecksum(), False
+        )
+        insert = Statement(
+            "INSERT INTO t (a) VALUES (1)", [], {}, ResultsChecksum(), True
+        )
+        last = Statement("SELECT c FROM t", [], {}, ResultsChecksum(), False)
+        connection._statements.extend([fetched, unfetched, update, insert, last])
+
+        def _run_statement(statement, retried):
+            return iter([[1], [2], [3]]), ResultsChecksum()
+
+        with mock.patch(
+            "google.cloud.spanner_dbapi.connection.Connection.run_statement",
+            side_effect=_run_statement,
+        ) as run_mock:
+            connection.retry_transaction()
+
+        self.assertEqual(
+            run_mock.call_args_list,
+            [
+                mock.call(fetched, retried=True),
+                mock.call(update, retried=True),
+                mock.call(insert, retried=True),
+                mock.call(last, retried=True),
+            ],
+        )
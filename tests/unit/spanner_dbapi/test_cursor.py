@@ -404,6 +404,25 @@ class TestCursor(unittest.TestCase):
         self.assertIsInstance(cursor._itr, utils.PeekIterator)
         self.assertEqual(cursor._row_count, _UNSET_COUNT)
 
+    def test_handle_dql_w_row_factory(self):
+        from google.cloud.spanner_v1.streamed import dict_row_factory
+        from google.cloud.spanner_v1.streamed import tuple_row_factory
+
+        connection = self._make_connection(self.INSTANCE, mock.MagicMock())
+        connection.database.snapshot.return_value.__enter__.return_value = (
+            mock_snapshot
+        ) = mock.MagicMock()
+        cursor = self._make_one(connection)
+
+        cursor._handle_DQL("sql", params=None)
+        _, kwargs = mock_snapshot.execute_sql.call_args
+        self.assertIs(kwargs["row_factory"], tuple_row_factory)
+
+        cursor.row_factory = dict_row_factory
+        cursor._handle_DQL("sql", params=None)
+        _, kwargs = mock_snapshot.execute_sql.call_args
+        self.assertIs(kwargs["row_factory"], dict_row_factory)
+
     def test_context(self):
         connection = self._make_connection(self.INSTANCE, self.DATABASE)
         cursor = self._make_one(connection)
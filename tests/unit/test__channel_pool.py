@@ -0,0 +1,185 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+import mock
+
+
+SESSION_NAME = "projects/p/instances/i/databases/d/sessions/s"
+
+
+class TestChannelPool(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1._channel_pool import ChannelPool
+
+        return ChannelPool
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def _make_channels(self, count):
+        import grpc
+
+        return [mock.create_autospec(grpc.Channel, instance=True) for _ in range(count)]
+
+    def test_ctor_wo_channels(self):
+        with self.assertRaises(ValueError):
+            self._make_one([])
+
+    def test_channels(self):
+        channels = self._make_channels(3)
+        pool = self._make_one(channels)
+        self.assertEqual(pool.channels, channels)
+
+    def test_channel_index_w_session_is_stable(self):
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+        from google.cloud.spanner_v1 import ReadRequest
+
+        pool = self._make_one(self._make_channels(4))
+        query = ExecuteSqlRequest(session=SESSION_NAME, sql="SELECT 1")
+        read = ReadRequest(session=SESSION_NAME, table="citizens")
+
+        index = pool.channel_index(query)
+
+        self.assertEqual(pool.channel_index(query), index)
+        self.assertEqual(pool.channel_index(read), index)
+
+    def test_channel_index_w_sessions_spread(self):
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+        pool = self._make_one(self._make_channels(4))
+        indexes = set(
+            pool.channel_index(
+                ExecuteSqlRequest(session="%s-%d" % (SESSION_NAME, i), sql="")
+            )
+            for i in range(100)
+        )
+        self.assertEqual(indexes, {0, 1, 2, 3})
+
+    def test_channel_index_wo_session_round_robin(self):
+        from google.cloud.spanner_v1 import BatchCreateSessionsRequest
+        from google.cloud.spanner_v1 import CreateSessionRequest
+
+        pool = self._make_one(self._make_channels(3))
+        batch = BatchCreateSessionsRequest(database="db", session_count=10)
+        create = CreateSessionRequest(database="db")
+
+        indexes = [pool.channel_index(request) for request in [batch, create] * 2]
+
+        self.assertEqual(indexes, [0, 1, 2, 0])
+
+    def test_unary_unary(self):
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+        channels = self._make_channels(2)
+        pool = self._make_one(channels)
+        request = ExecuteSqlRequest(session=SESSION_NAME, sql="SELECT 1")
+        index = pool.channel_index(request)
+
+        stub = pool.unary_unary("/method", request_serializer=str)
+        result = stub(request, timeout=5)
+
+        for channel in channels:
+            channel.unary_unary.assert_called_once_with(
+                "/method", request_serializer=str
+            )
+        callable_ = channels[index].unary_unary.return_value
+        self.assertIs(result, callable_.return_value)
+        callable_.assert_called_once_with(request, timeout=5)
+        channels[1 - index].unary_unary.return_value.assert_not_called()
+
+    def test_unary_unary_with_call_and_future(self):
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+        channels = self._make_channels(2)
+        pool = self._make_one(channels)
+        request = ExecuteSqlRequest(session=SESSION_NAME, sql="SELECT 1")
+        callable_ = channels[pool.channel_index(request)].unary_unary.return_value
+
+        stub = pool.unary_unary("/method")
+
+        self.assertIs(stub.with_call(request), callable_.with_call.return_value)
+        self.assertIs(stub.future(request), callable_.future.return_value)
+
+    def test_unary_stream(self):
+        import grpc
+        from google.cloud.spanner_v1 import ExecuteSqlRequest
+
+        channels = self._make_channels(2)
+        pool = self._make_one(channels)
+        request = ExecuteSqlRequest(session=SESSION_NAME, sql="SELECT 1")
+        callable_ = channels[pool.channel_index(request)].unary_stream.return_value
+
+        stub = pool.unary_stream("/method")
+
+        self.assertIsInstance(stub, grpc.UnaryStreamMultiCallable)
+        self.assertIs(stub(request), callable_.return_value)
+
+    def test_stream_unary_round_robin(self):
+        import grpc
+
+        channels = self._make_channels(2)
+        pool = self._make_one(channels)
+        requests = iter([])
+
+        stub = pool.stream_unary("/method", request_serializer=str)
+
+        self.assertIsInstance(stub, grpc.StreamUnaryMultiCallable)
+        for channel in channels:
+            channel.stream_unary.assert_called_once_with(
+                "/method", request_serializer=str
+            )
+        callables = [channel.stream_unary.return_value for channel in channels]
+        self.assertIs(stub(requests, timeout=5), callables[0].return_value)
+        callables[0].assert_called_once_with(requests, timeout=5)
+        self.assertIs(stub.with_call(requests), callables[1].with_call.return_value)
+        self.assertIs(stub.future(requests), callables[0].future.return_value)
+
+    def test_stream_stream_round_robin(self):
+        import grpc
+
+        channels = self._make_channels(2)
+        pool = self._make_one(channels)
+        requests = iter([])
+
+        stub = pool.stream_stream("/method")
+
+        self.assertIsInstance(stub, grpc.StreamStreamMultiCallable)
+        callables = [channel.stream_stream.return_value for channel in channels]
+        self.assertIs(stub(requests), callables[0].return_value)
+        self.assertIs(stub(requests), callables[1].return_value)
+        self.assertIs(stub(requests), callables[0].return_value)
+
+    def test_subscribe_unsubscribe(self):
+        channels = self._make_channels(2)
+        pool = self._make_one(channels)
+        callback = mock.Mock()
+
+        pool.subscribe(callback, try_to_connect=True)
+        pool.unsubscribe(callback)
+
+        for channel in channels:
+            channel.subscribe.assert_called_once_with(callback, try_to_connect=True)
+            channel.unsubscribe.assert_called_once_with(callback)
+
+    def test_context_manager_closes_channels(self):
+        channels = self._make_channels(2)
+
+        with self._make_one(channels) as pool:
+            self.assertIsInstance(pool, self._getTargetClass())
+
+        for channel in channels:
+            channel.close.assert_called_once_with()
@@ -473,6 +473,215 @@ class Test_parse_value(unittest.TestCase):
             self._callFUT(value_pb, field_type)
 
 
+class Test_make_value_parser(Test_parse_value):
+    """Parsers built by '_make_value_parser' must match '_parse_value'."""
+
+    def _callFUT(self, value, field_type):
+        from google.cloud.spanner_v1._helpers import _make_value_parser
+
+        return _make_value_parser(field_type)(value)
+
+    def test_w_null_array(self):
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        field_type = Type(
+            code=TypeCode.ARRAY, array_element_type=Type(code=TypeCode.INT64)
+        )
+
+        self.assertIsNone(self._callFUT(None, field_type))
+
+    def test_w_null_struct(self):
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        struct_type = StructType(
+            fields=[StructType.Field(name="age", type_=Type(code=TypeCode.INT64))]
+        )
+        field_type = Type(code=TypeCode.STRUCT, struct_type=struct_type)
+
+        self.assertIsNone(self._callFUT(None, field_type))
+
+    def test_w_unknown_type_null(self):
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        field_type = Type(code=TypeCode.TYPE_CODE_UNSPECIFIED)
+
+        self.assertIsNone(self._callFUT(None, field_type))
+
+    def test_array_of_struct_parsers_are_prebuilt(self):
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+        import mock
+        from google.cloud.spanner_v1 import _helpers as MUT
+
+        struct_type = StructType(
+            fields=[
+                StructType.Field(name="name", type_=Type(code=TypeCode.STRING)),
+                StructType.Field(name="age", type_=Type(code=TypeCode.INT64)),
+            ]
+        )
+        field_type = Type(
+            code=TypeCode.ARRAY,
+            array_element_type=Type(code=TypeCode.STRUCT, struct_type=struct_type),
+        )
+        parse = MUT._make_value_parser(field_type)
+
+        with mock.patch.object(MUT, "_make_value_parser") as make_parser:
+            result = parse([[u"Phred", u"32"], None, [u"Bharney", u"31"]])
+
+        make_parser.assert_not_called()
+        self.assertEqual(result, [[u"Phred", 32], None, [u"Bharney", 31]])
+
+    def test_w_bytes_from_bytearray(self):
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        field_type = Type(code=TypeCode.BYTES)
+        result = self._callFUT(bytearray(b"AAEC"), field_type)
+
+        self.assertIsInstance(result, bytes)
+        self.assertEqual(result, b"AAEC")
+
+    def test_w_scalar_parsers(self):
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1._helpers import _make_value_parser
+        from google.cloud.spanner_v1._helpers import _parse_bytes_decoded
+        from google.cloud.spanner_v1._helpers import _SCALAR_PARSERS
+
+        struct_type = StructType(
+            fields=[
+                StructType.Field(
+                    name="blobs",
+                    type_=Type(
+                        code=TypeCode.ARRAY,
+                        array_element_type=Type(code=TypeCode.BYTES),
+                    ),
+                ),
+            ]
+        )
+        field_type = Type(code=TypeCode.STRUCT, struct_type=struct_type)
+        scalar_parsers = dict(_SCALAR_PARSERS)
+        scalar_parsers[TypeCode.BYTES] = _parse_bytes_decoded
+        parse = _make_value_parser(field_type, scalar_parsers)
+
+        result = parse([[u"AAEC", None, bytearray(b"AwQF")]])
+
+        self.assertEqual(result, [[b"\x00\x01\x02", None, b"\x03\x04\x05"]])
+
+    def test_w_scalar_parsers_memoryview(self):
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1._helpers import _make_value_parser
+        from google.cloud.spanner_v1._helpers import _parse_bytes_memoryview
+
+        scalar_parsers = {TypeCode.BYTES: _parse_bytes_memoryview}
+        parse = _make_value_parser(Type(code=TypeCode.BYTES), scalar_parsers)
+
+        result = parse(u"AAEC")
+
+        self.assertIsInstance(result, memoryview)
+        self.assertEqual(result.tobytes(), b"\x00\x01\x02")
+        self.assertIsNone(parse(None))
+
+
+class Test_parse_date(unittest.TestCase):
+    def _callFUT(self, value):
+        from google.cloud.spanner_v1._helpers import _parse_date
+
+        return _parse_date(value)
+
+    def test_w_null(self):
+        self.assertIsNone(self._callFUT(None))
+
+    def test_w_canonical(self):
+        import datetime
+
+        self.assertEqual(self._callFUT(u"2020-02-29"), datetime.date(2020, 2, 29))
+
+    def test_w_invalid(self):
+        with self.assertRaises(ValueError):
+            self._callFUT(u"2019-02-29")
+
+    def test_w_non_canonical(self):
+        import datetime
+
+        self.assertEqual(self._callFUT(u"2020-2-9"), datetime.date(2020, 2, 9))
+
+    def test_cached(self):
+        self.assertIs(self._callFUT(u"2016-12-20"), self._callFUT(u"2016-12-20"))
+
+
+class Test_parse_timestamp(unittest.TestCase):
+    def _callFUT(self, value):
+        from google.cloud.spanner_v1._helpers import _parse_timestamp
+
+        return _parse_timestamp(value)
+
+    def _check(self, value):
+        from google.api_core import datetime_helpers
+
+        expected = datetime_helpers.DatetimeWithNanoseconds.from_rfc3339(value)
+        found = self._callFUT(value)
+
+        self.assertIsInstance(found, datetime_helpers.DatetimeWithNanoseconds)
+        self.assertEqual(found, expected)
+        self.assertEqual(found.nanosecond, expected.nanosecond)
+        self.assertEqual(found.rfc3339(), expected.rfc3339())
+
+    def test_w_null(self):
+        self.assertIsNone(self._callFUT(None))
+
+    def test_wo_fraction(self):
+        self._check(u"2016-12-20T21:13:47Z")
+
+    def test_w_nanoseconds(self):
+        self._check(u"2016-12-20T21:13:47.123456789Z")
+
+    def test_w_short_fraction(self):
+        self._check(u"2016-12-20T21:13:47.12Z")
+
+    def test_w_invalid(self):
+        with self.assertRaises(ValueError):
+            self._callFUT(u"2016-12-20 21:13:47")
+
+    def test_cached(self):
+        value = u"2016-12-20T21:13:47.5Z"
+
+        self.assertIs(self._callFUT(value), self._callFUT(value))
+
+
+class Test_parse_timestamp_nanoseconds(unittest.TestCase):
+    def _callFUT(self, value):
+        from google.cloud.spanner_v1._helpers import _parse_timestamp_nanoseconds
+
+        return _parse_timestamp_nanoseconds(value)
+
+    def test_w_null(self):
+        self.assertIsNone(self._callFUT(None))
+
+    def test_epoch(self):
+        self.assertEqual(self._callFUT(u"1970-01-01T00:00:00Z"), 0)
+
+    def test_before_epoch(self):
+        self.assertEqual(self._callFUT(u"1969-12-31T23:59:59.999999999Z"), -1)
+
+    def test_w_nanoseconds(self):
+        import calendar
+        import datetime
+
+        seconds = calendar.timegm(datetime.datetime(2016, 12, 20, 21, 13, 47).timetuple())
+
+        found = self._callFUT(u"2016-12-20T21:13:47.123456789Z")
+
+        self.assertEqual(found, seconds * 1000000000 + 123456789)
+
+
 class Test_parse_value_pb(unittest.TestCase):
     def _callFUT(self, *args, **kw):
         from google.cloud.spanner_v1._helpers import _parse_value_pb
@@ -724,6 +933,25 @@ class Test_parse_list_value_pbs(unittest.TestCase):
         )
 
 
+class Test_session_not_found(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1._helpers import _session_not_found
+
+        return _session_not_found(*args, **kw)
+
+    def test_w_session_not_found(self):
+        from google.api_core.exceptions import NotFound
+
+        exc = NotFound("Session not found: projects/p/instances/i/sessions/s")
+        self.assertTrue(self._callFUT(exc))
+
+    def test_w_other_not_found(self):
+        from google.api_core.exceptions import NotFound
+
+        exc = NotFound("Table not found: testing")
+        self.assertFalse(self._callFUT(exc))
+
+
 class Test_SessionWrapper(unittest.TestCase):
     def _getTargetClass(self):
         from google.cloud.spanner_v1._helpers import _SessionWrapper
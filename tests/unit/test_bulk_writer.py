@@ -0,0 +1,365 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+import mock
+
+TABLE_NAME = "citizens"
+COLUMNS = ["email", "age"]
+
+
+def _make_rows(count):
+    return [[u"phred%d@example.com" % (index,), index] for index in range(count)]
+
+
+class _Batch(object):
+    def __init__(self):
+        self._mutations = []
+
+
+class _BatchCheckout(object):
+    def __init__(self, database):
+        self._database = database
+
+    def __enter__(self):
+        self._batch = _Batch()
+        return self._batch
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self._database._commit(self._batch._mutations)
+
+
+class _Snapshot(object):
+    def __init__(self, database):
+        self._database = database
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def execute_sql(self, sql, params=None, param_types=None):
+        self._database.queries.append((sql, params, param_types))
+        return iter(self._database.primary_key)
+
+
+class _Database(object):
+    def __init__(self, errors=(), primary_key=()):
+        self._errors = list(errors)
+        self._lock = threading.Lock()
+        self.committed = []
+        self.attempts = 0
+        self.primary_key = list(primary_key)
+        self.queries = []
+
+    def batch(self):
+        return _BatchCheckout(self)
+
+    def snapshot(self):
+        return _Snapshot(self)
+
+    def _commit(self, mutations):
+        with self._lock:
+            self.attempts += 1
+            if self._errors:
+                raise self._errors.pop(0)
+            self.committed.append(mutations)
+
+
+class TestBulkWriter(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.bulk_writer import BulkWriter
+
+        return BulkWriter
+
+    def _make_one(self, database, **kw):
+        return self._getTargetClass()(database, **kw)
+
+    def _committed_row_counts(self, database):
+        return sorted(
+            sum(len(mutation.insert.values) for mutation in mutations)
+            for mutations in database.committed
+        )
+
+    def _committed_emails(self, database):
+        return sorted(
+            [row[0] for mutation in mutations for row in mutation.insert.values]
+            for mutations in database.committed
+        )
+
+    def test_ctor_w_invalid_limits(self):
+        for kw in (
+            {"max_mutations": 0},
+            {"max_bytes": 0},
+            {"max_in_flight": 0},
+            {"sort_buffer_rows": 0},
+        ):
+            with self.assertRaises(ValueError):
+                self._make_one(_Database(), **kw)
+
+    def test_splits_by_mutation_count(self):
+        database = _Database()
+
+        with self._make_one(database, max_mutations=4) as writer:
+            writer.insert(TABLE_NAME, COLUMNS, iter(_make_rows(5)))
+
+        self.assertEqual(self._committed_row_counts(database), [1, 2, 2])
+        stats = writer.stats
+        self.assertEqual(stats.rows, 5)
+        self.assertEqual(stats.mutations, 10)
+        self.assertEqual(stats.commits, 3)
+        self.assertEqual(stats.retries, 0)
+
+    def test_splits_by_bytes(self):
+        from google.cloud.spanner_v1._helpers import _make_list_value_pb
+
+        rows = _make_rows(4)
+        overhead = len(TABLE_NAME) + sum(len(column) for column in COLUMNS)
+        row_size = _make_list_value_pb(rows[0]).ByteSize()
+        database = _Database()
+        writer = self._make_one(database, max_bytes=overhead + 2 * row_size)
+
+        writer.insert(TABLE_NAME, COLUMNS, rows)
+        writer.close()
+
+        self.assertEqual(self._committed_row_counts(database), [2, 2])
+        self.assertEqual(writer.stats.bytes, 2 * overhead + 4 * row_size)
+
+    def test_oversized_row_committed_alone(self):
+        database = _Database()
+        writer = self._make_one(database, max_bytes=1)
+
+        writer.insert(TABLE_NAME, COLUMNS, _make_rows(2))
+        writer.close()
+
+        self.assertEqual(len(database.committed), 2)
+
+    def test_packs_writes_into_one_commit(self):
+        database = _Database()
+        writer = self._make_one(database)
+
+        writer.insert(TABLE_NAME, COLUMNS, _make_rows(2))
+        writer.insert_or_update("other", COLUMNS, _make_rows(1))
+        writer.insert(TABLE_NAME, COLUMNS, [])
+        writer.flush()
+
+        ((first, second),) = database.committed
+        self.assertEqual(first.insert.table, TABLE_NAME)
+        self.assertEqual(list(first.insert.columns), COLUMNS)
+        self.assertEqual(len(first.insert.values), 2)
+        self.assertEqual(second.insert_or_update.table, "other")
+        self.assertEqual(writer.stats.rows, 3)
+
+        writer.close()
+
+    def test_mutation_kinds(self):
+        database = _Database()
+        writer = self._make_one(database)
+
+        writer.update(TABLE_NAME, COLUMNS, _make_rows(1))
+        writer.replace(TABLE_NAME, COLUMNS, _make_rows(1))
+        writer.close()
+
+        ((update, replace),) = database.committed
+        self.assertEqual(len(update.update.values), 1)
+        self.assertEqual(len(replace.replace.values), 1)
+
+    def test_row_wider_than_max_mutations(self):
+        writer = self._make_one(_Database(), max_mutations=1)
+
+        with self.assertRaises(ValueError):
+            writer.insert(TABLE_NAME, COLUMNS, _make_rows(1))
+
+    def test_retries_aborted_commit(self):
+        from google.api_core.exceptions import Aborted
+
+        database = _Database(errors=[Aborted("testing")])
+        writer = self._make_one(database)
+
+        with mock.patch("time.sleep"):
+            writer.insert(TABLE_NAME, COLUMNS, _make_rows(1))
+            writer.close()
+
+        self.assertEqual(database.attempts, 2)
+        self.assertEqual(writer.stats.commits, 1)
+        self.assertEqual(writer.stats.retries, 1)
+
+    def test_commit_error_raised_from_flush(self):
+        from google.api_core.exceptions import AlreadyExists
+
+        database = _Database(errors=[AlreadyExists("testing")])
+        writer = self._make_one(database)
+        writer.insert(TABLE_NAME, COLUMNS, _make_rows(1))
+
+        with self.assertRaises(AlreadyExists):
+            writer.close()
+
+        self.assertEqual(database.attempts, 1)
+        self.assertEqual(writer.stats.commits, 0)
+        with self.assertRaises(ValueError):
+            writer.insert(TABLE_NAME, COLUMNS, _make_rows(1))
+
+    def test_wo_retry(self):
+        from google.api_core.exceptions import Aborted
+
+        database = _Database(errors=[Aborted("testing")])
+        writer = self._make_one(database, retry=None)
+        writer.insert(TABLE_NAME, COLUMNS, _make_rows(1))
+
+        with self.assertRaises(Aborted):
+            writer.flush()
+
+        writer.close()
+        self.assertEqual(database.attempts, 1)
+
+    def test_bounds_commits_in_flight(self):
+        database = _Database()
+        lock = threading.Lock()
+        counts = {"current": 0, "max": 0}
+        commit = database._commit
+
+        def slow_commit(mutations):
+            with lock:
+                counts["current"] += 1
+                counts["max"] = max(counts["max"], counts["current"])
+            threading.Event().wait(0.01)
+            commit(mutations)
+            with lock:
+                counts["current"] -= 1
+
+        database._commit = slow_commit
+
+        with self._make_one(database, max_mutations=2, max_in_flight=2) as writer:
+            writer.insert(TABLE_NAME, COLUMNS, _make_rows(8))
+
+        self.assertEqual(len(database.committed), 8)
+        self.assertLessEqual(counts["max"], 2)
+
+    def test_context_manager_w_error_discards_rows(self):
+        database = _Database()
+
+        with self.assertRaises(RuntimeError):
+            with self._make_one(database) as writer:
+                writer.insert(TABLE_NAME, COLUMNS, _make_rows(1))
+                raise RuntimeError("testing")
+
+        self.assertEqual(database.committed, [])
+        with self.assertRaises(ValueError):
+            writer.flush()
+
+    def test_close_twice(self):
+        writer = self._make_one(_Database())
+
+        writer.close()
+        writer.close()
+
+    def test_sorts_rows_by_key_columns(self):
+        emails = ["d", "b", "f", "a", "e", "c", "g"]
+        database = _Database()
+        writer = self._make_one(
+            database,
+            max_mutations=4,
+            sort_buffer_rows=4,
+            key_columns={TABLE_NAME: ["email"]},
+        )
+
+        writer.insert(TABLE_NAME, COLUMNS, ([email, 1] for email in emails))
+        writer.close()
+
+        self.assertEqual(
+            self._committed_emails(database),
+            [["a", "b"], ["c", "e"], ["d", "f"], ["g"]],
+        )
+        self.assertEqual(database.queries, [])
+        self.assertEqual(writer.stats.rows, len(emails))
+
+    def test_sorts_rows_by_primary_key_from_schema(self):
+        from google.cloud.spanner_v1 import param_types
+        from google.cloud.spanner_v1.bulk_writer import _PRIMARY_KEY_SQL
+
+        database = _Database(primary_key=[("age", "DESC"), ("email", "ASC")])
+        writer = self._make_one(database, sort_buffer_rows=10)
+        rows = [["a", "1"], ["b", "2"], ["c", None], ["d", "2"], ["e", "1"]]
+
+        writer.insert(TABLE_NAME, COLUMNS, rows)
+        writer.insert(TABLE_NAME, COLUMNS, [["f", "3"]])
+        writer.close()
+
+        self.assertEqual(
+            self._committed_emails(database), [["f", "b", "d", "a", "e", "c"]]
+        )
+        self.assertEqual(
+            database.queries,
+            [(_PRIMARY_KEY_SQL, {"table": TABLE_NAME}, {"table": param_types.STRING})],
+        )
+
+    def test_sort_wo_key_columns_in_row(self):
+        database = _Database(primary_key=[("id", "ASC")])
+        writer = self._make_one(database, sort_buffer_rows=10)
+
+        with self.assertRaises(ValueError):
+            writer.insert(TABLE_NAME, COLUMNS, _make_rows(1))
+
+    def test_sort_wo_primary_key(self):
+        writer = self._make_one(_Database(), sort_buffer_rows=10)
+
+        with self.assertRaises(ValueError):
+            writer.insert(TABLE_NAME, COLUMNS, _make_rows(1))
+
+    def test_context_manager_w_error_discards_sort_buffers(self):
+        database = _Database()
+
+        with self.assertRaises(RuntimeError):
+            with self._make_one(
+                database, sort_buffer_rows=10, key_columns={TABLE_NAME: ["email"]}
+            ) as writer:
+                writer.insert(TABLE_NAME, COLUMNS, _make_rows(1))
+                raise RuntimeError("testing")
+
+        self.assertEqual(database.committed, [])
+        self.assertEqual(writer._sort_buffers, {})
+
+    def test_stats_before_writing(self):
+        stats = self._make_one(_Database()).stats
+
+        self.assertEqual(stats.rows, 0)
+        self.assertEqual(stats.elapsed, 0.0)
+        self.assertEqual(stats.rows_per_second, 0.0)
+
+
+class TestBulkWriterStats(unittest.TestCase):
+    def _make_one(self, **kw):
+        from google.cloud.spanner_v1.bulk_writer import BulkWriterStats
+
+        values = dict(rows=10, mutations=20, bytes=300, commits=2, retries=1)
+        values.update(kw)
+        return BulkWriterStats(**values)
+
+    def test_rows_per_second(self):
+        stats = self._make_one(elapsed=4.0)
+
+        self.assertEqual(stats.rows_per_second, 2.5)
+
+    def test_repr(self):
+        stats = self._make_one(elapsed=4.0)
+
+        self.assertEqual(
+            repr(stats),
+            "BulkWriterStats(rows=10, mutations=20, bytes=300, commits=2, "
+            "retries=1, elapsed=4.000)",
+        )
@@ -125,6 +125,43 @@ class TestDatabase(_BaseTest):
         self.assertIs(database._pool, pool)
         self.assertIs(pool._bound, database)
 
+    def test_ctor_w_channel_count(self):
+        instance = _Instance(self.INSTANCE_NAME)
+        pool = _Pool()
+        database = self._make_one(
+            self.DATABASE_ID, instance, pool=pool, channel_count=4
+        )
+        self.assertEqual(database.channel_count, 4)
+
+    def test_ctor_w_retry_policy(self):
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
+        from google.cloud.spanner_v1.retry_policy import AbortStats
+        from google.cloud.spanner_v1.retry_policy import DEFAULT_PDML_RETRY_POLICY
+        from google.cloud.spanner_v1.retry_policy import DEFAULT_RETRY_POLICY
+
+        instance = _Instance(self.INSTANCE_NAME)
+        database = self._make_one(self.DATABASE_ID, instance, pool=_Pool())
+        self.assertIs(database.retry_policy, DEFAULT_RETRY_POLICY)
+        self.assertIs(database.pdml_retry_policy, DEFAULT_PDML_RETRY_POLICY)
+        self.assertEqual(database.pdml_retry_policy.deadline, 120)
+        self.assertIsInstance(database.abort_stats, AbortStats)
+
+        policy = AbortRetryPolicy(max_attempts=3)
+        pdml_policy = AbortRetryPolicy(deadline=600)
+        database = self._make_one(
+            self.DATABASE_ID,
+            instance,
+            pool=_Pool(),
+            retry_policy=policy,
+            pdml_retry_policy=pdml_policy,
+        )
+        self.assertIs(database.retry_policy, policy)
+        self.assertIs(database.pdml_retry_policy, pdml_policy)
+
+    def test_ctor_w_invalid_channel_count(self):
+        with self.assertRaises(ValueError):
+            self._make_one(self.DATABASE_ID, instance=object(), channel_count=0)
+
     def test_ctor_w_ddl_statements_non_string(self):
 
         with self.assertRaises(ValueError):
@@ -347,6 +384,118 @@ class TestDatabase(_BaseTest):
         self.assertEqual(called_args, ())
         self.assertIsNotNone(called_kw["transport"])
 
+    def test_spanner_api_w_channel_count(self):
+        from google.cloud.spanner_v1._channel_pool import ChannelPool
+
+        client = _Client()
+        client_info = client._client_info = mock.Mock()
+        client._client_options = None
+        credentials = client.credentials = object()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        database = self._make_one(
+            self.DATABASE_ID, instance, pool=pool, channel_count=3
+        )
+
+        client_patch = mock.patch("google.cloud.spanner_v1.database.SpannerClient")
+        transport_patch = mock.patch(
+            "google.cloud.spanner_v1.database.SpannerGrpcTransport"
+        )
+        with client_patch as spanner_client, transport_patch as transport_class:
+            spanner_client.DEFAULT_ENDPOINT = "spanner.googleapis.com"
+            api = database.spanner_api
+
+        self.assertIs(api, spanner_client.return_value)
+        spanner_client.assert_called_once_with(
+            client_info=client_info, transport=transport_class.return_value
+        )
+        create_channel = transport_class.create_channel
+        self.assertEqual(create_channel.call_count, 3)
+        called_args, called_kw = create_channel.call_args
+        self.assertEqual(called_args, ("spanner.googleapis.com:443",))
+        self.assertIs(called_kw["credentials"], credentials)
+        # Each channel opens its own connections.
+        self.assertIn(("grpc.use_local_subchannel_pool", 1), called_kw["options"])
+        _, transport_kw = transport_class.call_args
+        self.assertIs(transport_kw["client_info"], client_info)
+        channel = transport_kw["channel"]
+        self.assertIsInstance(channel, ChannelPool)
+        self.assertEqual(
+            channel.channels, [create_channel.return_value] * 3
+        )
+
+    def test_spanner_api_w_channel_count_and_api_endpoint(self):
+        from google.api_core.client_options import ClientOptions
+
+        client = _Client()
+        client._client_info = mock.Mock()
+        client._client_options = ClientOptions(api_endpoint="example.com:8443")
+        client.credentials = object()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        database = self._make_one(
+            self.DATABASE_ID, instance, pool=pool, channel_count=2
+        )
+
+        client_patch = mock.patch("google.cloud.spanner_v1.database.SpannerClient")
+        transport_patch = mock.patch(
+            "google.cloud.spanner_v1.database.SpannerGrpcTransport"
+        )
+        with client_patch, transport_patch as transport_class:
+            database.spanner_api
+
+        called_args, _ = transport_class.create_channel.call_args
+        self.assertEqual(called_args, ("example.com:8443",))
+
+    def test_spanner_api_w_channel_count_and_client_options(self):
+        from google.api_core.client_options import ClientOptions
+
+        client = _Client()
+        client._client_info = mock.Mock()
+        client._client_options = ClientOptions(
+            credentials_file="credentials.json", quota_project_id="quota-project"
+        )
+        client.credentials = object()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        database = self._make_one(
+            self.DATABASE_ID, instance, pool=pool, channel_count=2
+        )
+
+        client_patch = mock.patch("google.cloud.spanner_v1.database.SpannerClient")
+        transport_patch = mock.patch(
+            "google.cloud.spanner_v1.database.SpannerGrpcTransport"
+        )
+        with client_patch, transport_patch as transport_class:
+            database.spanner_api
+
+        _, called_kw = transport_class.create_channel.call_args
+        self.assertIsNone(called_kw["credentials"])
+        self.assertEqual(called_kw["credentials_file"], "credentials.json")
+        self.assertEqual(called_kw["quota_project_id"], "quota-project")
+
+    def test_spanner_api_w_emulator_host_and_channel_count(self):
+        from google.cloud.spanner_v1._channel_pool import ChannelPool
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client, emulator_host="host")
+        pool = _Pool()
+        database = self._make_one(
+            self.DATABASE_ID, instance, pool=pool, channel_count=2
+        )
+
+        client_patch = mock.patch("google.cloud.spanner_v1.database.SpannerClient")
+        transport_patch = mock.patch(
+            "google.cloud.spanner_v1.database.SpannerGrpcTransport"
+        )
+        with client_patch, transport_patch as transport_class:
+            database.spanner_api
+
+        _, transport_kw = transport_class.call_args
+        channel = transport_kw["channel"]
+        self.assertIsInstance(channel, ChannelPool)
+        self.assertEqual(len(channel.channels), 2)
+
     def test___eq__(self):
         instance = _Instance(self.INSTANCE_NAME)
         pool1, pool2 = _Pool(), _Pool()
@@ -876,6 +1025,9 @@ class TestDatabase(_BaseTest):
             self.assertEqual(api.execute_streaming_sql.call_count, 2)
         else:
             self.assertEqual(api.execute_streaming_sql.call_count, 1)
+        # Partitioned DML does not count as read-write transactions.
+        self.assertEqual(database.abort_stats.aborts, 0)
+        self.assertEqual(database.abort_stats.commits, 0)
 
     def test_execute_partitioned_dml_wo_params(self):
         self._execute_partitioned_dml_helper(dml=DML_WO_PARAM)
@@ -900,6 +1052,30 @@ class TestDatabase(_BaseTest):
     def test_execute_partitioned_dml_wo_params_retry_aborted(self):
         self._execute_partitioned_dml_helper(dml=DML_WO_PARAM, retried=True)
 
+    def test_execute_partitioned_dml_retry_aborted_gives_up(self):
+        from google.api_core.exceptions import Aborted
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
+
+        instance = _Instance(self.INSTANCE_NAME, client=_Client())
+        pool = _Pool()
+        pool.put(_Session())
+        policy = AbortRetryPolicy(max_attempts=2)
+        database = self._make_one(
+            self.DATABASE_ID, instance, pool=pool, pdml_retry_policy=policy
+        )
+        api = database._spanner_api = self._make_spanner_api()
+        api.begin_transaction.return_value = TransactionPB(id=self.TRANSACTION_ID)
+        api.execute_streaming_sql.side_effect = Aborted("test")
+
+        with mock.patch("time.sleep") as sleep_mock:
+            with self.assertRaises(Aborted):
+                database.execute_partitioned_dml(DML_WO_PARAM)
+
+        self.assertEqual(api.execute_streaming_sql.call_count, 2)
+        sleep_mock.assert_called_once()
+        self.assertEqual(database.abort_stats.aborts, 0)
+
     def test_session_factory_defaults(self):
         from google.cloud.spanner_v1.session import Session
 
@@ -1014,6 +1190,88 @@ class TestDatabase(_BaseTest):
         self.assertIsNone(batch_txn._read_timestamp)
         self.assertEqual(batch_txn._exact_staleness, duration)
 
+    def test_shared_snapshot(self):
+        from google.cloud.spanner_v1.database import SharedSnapshot
+
+        database = self._make_one(self.DATABASE_ID, instance=object(), pool=_Pool())
+        duration = self._make_duration()
+
+        shared = database.shared_snapshot(session_count=4, exact_staleness=duration)
+        self.assertIsInstance(shared, SharedSnapshot)
+        self.assertIs(shared._database, database)
+        self.assertEqual(shared._session_count, 4)
+        self.assertIsNone(shared.read_timestamp)
+        self.assertEqual(shared._exact_staleness, duration)
+
+    def test_bulk_writer(self):
+        from google.cloud.spanner_v1.bulk_writer import BulkWriter
+        from google.cloud.spanner_v1.bulk_writer import DEFAULT_BULK_RETRY
+
+        database = self._make_one(self.DATABASE_ID, instance=object(), pool=_Pool())
+
+        writer = database.bulk_writer(max_mutations=100, max_in_flight=2)
+
+        self.assertIsInstance(writer, BulkWriter)
+        self.assertIs(writer._database, database)
+        self.assertEqual(writer._max_mutations, 100)
+        self.assertEqual(writer._max_in_flight, 2)
+        self.assertIs(writer._retry, DEFAULT_BULK_RETRY)
+
+    def test_export_table(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        database = self._make_one(self.DATABASE_ID, instance=object(), pool=_Pool())
+        timestamp = self._make_timestamp()
+        batch_txn = mock.MagicMock()
+        batch_txn.__enter__.return_value = batch_txn
+        batches = batch_txn.generate_read_batches.return_value
+        filenames = batch_txn.export_partitions.return_value
+
+        with mock.patch.object(
+            database, "batch_snapshot", return_value=batch_txn
+        ) as batch_snapshot:
+            found = database.export_table(
+                "citizens",
+                ["email", "age"],
+                "/tmp/export",
+                format="ndjson",
+                max_partitions=4,
+                max_workers=2,
+                retry=None,
+                read_timestamp=timestamp,
+            )
+
+        self.assertIs(found, filenames)
+        batch_snapshot.assert_called_once_with(
+            read_timestamp=timestamp, exact_staleness=None
+        )
+        batch_txn.generate_read_batches.assert_called_once_with(
+            "citizens",
+            ["email", "age"],
+            KeySet(all_=True),
+            index="",
+            partition_size_bytes=None,
+            max_partitions=4,
+        )
+        batch_txn.export_partitions.assert_called_once_with(
+            batches,
+            "/tmp/export",
+            format="ndjson",
+            prefix="citizens",
+            max_workers=2,
+            retry=None,
+        )
+        batch_txn.__exit__.assert_called_once()
+
+    def test_export_table_w_invalid_format(self):
+        database = self._make_one(self.DATABASE_ID, instance=object(), pool=_Pool())
+
+        with mock.patch.object(database, "batch_snapshot") as batch_snapshot:
+            with self.assertRaises(ValueError):
+                database.export_table("citizens", ["email"], "/tmp/export", "xml")
+
+        batch_snapshot.assert_not_called()
+
     def test_run_in_transaction_wo_args(self):
         import datetime
 
@@ -1054,6 +1312,50 @@ class TestDatabase(_BaseTest):
         self.assertEqual(committed, NOW)
         self.assertEqual(session._retried, (_unit_of_work, (SINCE,), {"until": UNTIL}))
 
+    def test_run_in_transaction_w_session_not_found(self):
+        from google.api_core.exceptions import NotFound
+
+        NOW = object()
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        session = _Session()
+        session._committed = NOW
+        session.run_in_transaction = mock.Mock(
+            side_effect=[NotFound("Session not found: testing"), NOW]
+        )
+        session._recreate = mock.Mock()
+        pool.put(session)
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        _unit_of_work = object()
+
+        committed = database.run_in_transaction(_unit_of_work)
+
+        self.assertIs(committed, NOW)
+        session._recreate.assert_called_once_with()
+        self.assertEqual(session.run_in_transaction.call_count, 2)
+
+    def test_run_in_transaction_w_other_not_found(self):
+        from google.api_core.exceptions import NotFound
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        pool = _Pool()
+        session = _Session()
+        session.run_in_transaction = mock.Mock(
+            side_effect=NotFound("Table not found: testing")
+        )
+        session._recreate = mock.Mock()
+        pool.put(session)
+        database = self._make_one(self.DATABASE_ID, instance, pool=pool)
+
+        with self.assertRaises(NotFound):
+            database.run_in_transaction(object())
+
+        session._recreate.assert_not_called()
+        self.assertIs(pool._session, session)
+
     def test_run_in_transaction_nested(self):
         from datetime import datetime
 
@@ -1305,6 +1607,35 @@ class TestBatchCheckout(_BaseTest):
             metadata=[("google-cloud-resource-prefix", database.name)],
         )
 
+    def test_context_mgr_w_session_not_found(self):
+        import datetime
+        from google.api_core.exceptions import NotFound
+        from google.cloud.spanner_v1.keyset import KeySet
+        from google.cloud.spanner_v1 import CommitResponse
+        from google.cloud._helpers import UTC
+        from google.cloud._helpers import _datetime_to_pb_timestamp
+
+        now = datetime.datetime.utcnow().replace(tzinfo=UTC)
+        response = CommitResponse(commit_timestamp=_datetime_to_pb_timestamp(now))
+        database = _Database(self.DATABASE_NAME)
+        api = database.spanner_api = self._make_spanner_client()
+        api.commit.side_effect = [NotFound("Session not found: testing"), response]
+        pool = database._pool = _Pool()
+        session = _Session(database)
+        session._recreate = mock.Mock()
+        pool.put(session)
+        checkout = self._make_one(database)
+
+        with checkout as batch:
+            batch.delete("table", KeySet(all_=True))
+
+        self.assertIs(pool._session, session)
+        self.assertEqual(batch.committed, now)
+        session._recreate.assert_called_once_with()
+        self.assertEqual(api.commit.call_count, 2)
+        _, kwargs = api.commit.call_args
+        self.assertEqual(len(kwargs["mutations"]), 1)
+
     def test_context_mgr_failure(self):
         from google.cloud.spanner_v1.batch import Batch
 
@@ -1401,6 +1732,140 @@ class TestSnapshotCheckout(_BaseTest):
         self.assertIs(pool._session, session)
 
 
+class TestSharedSnapshot(_BaseTest):
+
+    SQL = "SELECT email FROM citizens"
+    TABLE = "citizens"
+    COLUMNS = ["email", "age"]
+    KEYSET = object()
+
+    def _get_target_class(self):
+        from google.cloud.spanner_v1.database import SharedSnapshot
+
+        return SharedSnapshot
+
+    def _make_database(self, session_count):
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+        from google.cloud.spanner_v1 import SpannerClient
+
+        database = _Database(self.DATABASE_NAME)
+        api = database.spanner_api = mock.create_autospec(
+            SpannerClient, instance=True
+        )
+        api.begin_transaction.return_value = TransactionPB(
+            id=self.TRANSACTION_ID, read_timestamp=self._now()
+        )
+        pool = database._pool = _ListPool()
+        for index in range(session_count):
+            pool.put(_Session(database, name="%s-%d" % (self.SESSION_NAME, index)))
+        return database
+
+    @staticmethod
+    def _now():
+        import datetime
+        from google.cloud._helpers import UTC
+
+        return datetime.datetime(2020, 10, 1, 12, 0, 0, tzinfo=UTC)
+
+    def test_ctor_w_invalid_session_count(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_Database(self.DATABASE_NAME), session_count=0)
+
+    def test_read_not_begun(self):
+        shared = self._make_one(_Database(self.DATABASE_NAME))
+
+        with self.assertRaises(ValueError):
+            shared.execute_sql(self.SQL)
+
+    def test_begin(self):
+        database = self._make_database(3)
+        shared = self._make_one(database, session_count=2)
+
+        read_timestamp = shared.begin()
+
+        self.assertEqual(read_timestamp, self._now())
+        self.assertEqual(shared.read_timestamp, self._now())
+        self.assertEqual(len(shared._sessions), 2)
+        self.assertEqual(len(database._pool._sessions), 1)
+        self.assertEqual(shared._snapshot._transaction_id, self.TRANSACTION_ID)
+        self.assertTrue(shared._snapshot._multi_use)
+        options = database.spanner_api.begin_transaction.call_args[1]["options"]
+        self.assertTrue(options.read_only.strong)
+        self.assertTrue(options.read_only.return_read_timestamp)
+        with self.assertRaises(ValueError):
+            shared.begin()
+
+    def test_begin_error_returns_sessions(self):
+        database = self._make_database(1)
+        database.spanner_api.begin_transaction.side_effect = RuntimeError()
+        shared = self._make_one(database, session_count=2)
+
+        with self.assertRaises(RuntimeError):
+            shared.begin()
+
+        self.assertEqual(len(database._pool._sessions), 1)
+        self.assertEqual(shared._sessions, [])
+
+    def test_spreads_requests_over_sessions(self):
+        database = self._make_database(3)
+        shared = self._make_one(database, session_count=3)
+        snapshots = []
+
+        def record(snapshot, *args, **kw):
+            snapshots.append(snapshot)
+            return args
+
+        with mock.patch(
+            "google.cloud.spanner_v1.snapshot._SnapshotBase.execute_sql",
+            autospec=True,
+            side_effect=record,
+        ), mock.patch(
+            "google.cloud.spanner_v1.snapshot._SnapshotBase.read",
+            autospec=True,
+            side_effect=record,
+        ):
+            with shared:
+                results = [shared.execute_sql(self.SQL) for _ in range(4)]
+                results.append(shared.read(self.TABLE, self.COLUMNS, self.KEYSET))
+
+        self.assertEqual(results[0], (self.SQL,))
+        self.assertEqual(results[4], (self.TABLE, self.COLUMNS, self.KEYSET))
+        self.assertIs(snapshots[0], snapshots[3])
+        self.assertEqual(
+            [snapshot._session.name for snapshot in snapshots],
+            [self.SESSION_NAME + "-%d" % (index % 3,) for index in range(5)],
+        )
+        for snapshot in snapshots[1:3] + snapshots[4:]:
+            self.assertFalse(snapshot._multi_use)
+            self.assertEqual(snapshot._read_timestamp, self._now())
+        self.assertEqual(len(database._pool._sessions), 3)
+        with self.assertRaises(ValueError):
+            shared.execute_sql(self.SQL)
+
+    def test_concurrent_requests(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        database = self._make_database(2)
+
+        with mock.patch(
+            "google.cloud.spanner_v1.snapshot._SnapshotBase.execute_sql",
+            autospec=True,
+            side_effect=lambda snapshot, sql: snapshot,
+        ):
+            with self._make_one(database, session_count=2) as shared:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    snapshots = list(
+                        executor.map(
+                            lambda _: shared.execute_sql(self.SQL), range(20)
+                        )
+                    )
+
+        self.assertEqual(shared._request_count, 20)
+        sessions = [snapshot._session.name for snapshot in snapshots]
+        self.assertEqual(sessions.count(self.SESSION_NAME + "-0"), 10)
+        self.assertEqual(sessions.count(self.SESSION_NAME + "-1"), 10)
+
+
 class TestBatchSnapshot(_BaseTest):
     TABLE = "table_name"
     COLUMNS = ["column_one", "column_two"]
@@ -1857,6 +2322,466 @@ class TestBatchSnapshot(_BaseTest):
             sql=sql, params=params, param_types=param_types, partition=token
         )
 
+    def _make_partition_session(self, rows_by_token, errors_by_token=None):
+        from google.cloud.spanner_v1.snapshot import Snapshot
+
+        errors_by_token = errors_by_token or {}
+        session = self._make_session()
+        snapshots = []
+
+        def execute(partition, **kwargs):
+            errors = errors_by_token.get(partition)
+            if errors:
+                raise errors.pop(0)
+            return iter(rows_by_token[partition])
+
+        def make_snapshot(**kwargs):
+            snapshot = mock.create_autospec(Snapshot, instance=True)
+            snapshot.execute_sql.side_effect = execute
+            snapshot.read.side_effect = execute
+            snapshots.append((kwargs, snapshot))
+            return snapshot
+
+        session.snapshot.side_effect = make_snapshot
+        return session, snapshots
+
+    def _make_query_batches(self, tokens):
+        return [
+            {"partition": token, "query": {"sql": "SELECT * FROM table_name"}}
+            for token in tokens
+        ]
+
+    def _make_batch_txn_w_partitions(self, rows_by_token, errors_by_token=None):
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        session, snapshots = self._make_partition_session(
+            rows_by_token, errors_by_token
+        )
+        batch_txn._session = session
+        batch_txn._snapshot = self._make_snapshot(transaction_id=self.TRANSACTION_ID)
+        return batch_txn, snapshots
+
+    def test_run_partitions_w_invalid_max_workers(self):
+        batch_txn = self._make_one(self._make_database())
+
+        with self.assertRaises(ValueError):
+            batch_txn.run_partitions([], max_workers=0)
+
+    def test_run_partitions(self):
+        rows_by_token = {
+            b"TOKEN1": [[1], [2]],
+            b"TOKEN2": [[3]],
+            b"TOKEN3": [],
+            b"TOKEN4": [[4], [5]],
+        }
+        batch_txn, snapshots = self._make_batch_txn_w_partitions(rows_by_token)
+        batches = self._make_query_batches(sorted(rows_by_token))
+
+        rows = list(batch_txn.run_partitions(batches, max_workers=2))
+
+        self.assertEqual(sorted(rows), [[1], [2], [3], [4], [5]])
+        self.assertEqual(len(snapshots), len(batches))
+        for kwargs, snapshot in snapshots:
+            self.assertEqual(kwargs, {"multi_use": True})
+            self.assertEqual(snapshot._transaction_id, self.TRANSACTION_ID)
+            snapshot.execute_sql.assert_called_once_with(
+                partition=mock.ANY, sql="SELECT * FROM table_name"
+            )
+        batch_txn._database.session.assert_not_called()
+        batch_txn._session.delete.assert_not_called()
+
+    def test_run_partitions_per_partition(self):
+        rows_by_token = {b"TOKEN1": [[1], [2]], b"TOKEN2": [[3]]}
+        batch_txn, _ = self._make_batch_txn_w_partitions(rows_by_token)
+        batches = self._make_query_batches(sorted(rows_by_token))
+
+        results = list(batch_txn.run_partitions(batches, per_partition=True))
+
+        found = {batch["partition"]: rows for batch, rows in results}
+        self.assertEqual(found, rows_by_token)
+
+    def test_run_partitions_w_read_batches(self):
+        keyset = self._make_keyset()
+        batch_txn, snapshots = self._make_batch_txn_w_partitions({b"TOKEN": [[1]]})
+        batch = {
+            "partition": b"TOKEN",
+            "read": {
+                "table": self.TABLE,
+                "columns": self.COLUMNS,
+                "keyset": {"all": True},
+                "index": self.INDEX,
+            },
+        }
+
+        rows = list(batch_txn.run_partitions([batch]))
+
+        self.assertEqual(rows, [[1]])
+        ((_, snapshot),) = snapshots
+        snapshot.read.assert_called_once_with(
+            table=self.TABLE,
+            columns=self.COLUMNS,
+            keyset=keyset,
+            index=self.INDEX,
+            partition=b"TOKEN",
+        )
+
+    def test_run_partitions_retries_failed_partition(self):
+        from google.api_core.exceptions import ServiceUnavailable
+        from google.api_core.retry import Retry
+        from google.api_core.retry import if_exception_type
+
+        rows_by_token = {b"TOKEN1": [[1]], b"TOKEN2": [[2]]}
+        errors_by_token = {b"TOKEN2": [ServiceUnavailable("testing")]}
+        batch_txn, snapshots = self._make_batch_txn_w_partitions(
+            rows_by_token, errors_by_token
+        )
+        batches = self._make_query_batches(sorted(rows_by_token))
+        retry = Retry(
+            predicate=if_exception_type(ServiceUnavailable), initial=0, maximum=0
+        )
+
+        rows = list(batch_txn.run_partitions(batches, retry=retry))
+
+        self.assertEqual(sorted(rows), [[1], [2]])
+        self.assertEqual(len(snapshots), 3)
+
+    def test_run_partitions_wo_retry(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        rows_by_token = {b"TOKEN1": [[1]]}
+        errors_by_token = {b"TOKEN1": [ServiceUnavailable("testing")]}
+        batch_txn, _ = self._make_batch_txn_w_partitions(
+            rows_by_token, errors_by_token
+        )
+        batches = self._make_query_batches([b"TOKEN1"])
+
+        with self.assertRaises(ServiceUnavailable):
+            list(batch_txn.run_partitions(batches, retry=None))
+
+    def test_run_partitions_closed_early(self):
+        tokens = [b"TOKEN%d" % (index,) for index in range(10)]
+        rows_by_token = {token: [[token]] for token in tokens}
+        batch_txn, snapshots = self._make_batch_txn_w_partitions(rows_by_token)
+        batches = self._make_query_batches(tokens)
+
+        results = batch_txn.run_partitions(batches, max_workers=2)
+        next(results)
+        results.close()
+
+        self.assertLessEqual(len(snapshots), 3)
+
+    def test_process_partitions_w_invalid_max_workers(self):
+        batch_txn = self._make_one(self._make_database())
+
+        with self.assertRaises(ValueError):
+            batch_txn.process_partitions([], mock.Mock(), max_workers=0)
+
+    def test_process_partitions(self):
+        rows_by_token = {b"TOKEN1": [[1], [2]], b"TOKEN2": [[3]], b"TOKEN3": []}
+        batch_txn, snapshots = self._make_batch_txn_w_partitions(rows_by_token)
+        batches = self._make_query_batches(sorted(rows_by_token))
+        handled = []
+
+        def handler(results, batch):
+            # Rows are streamed to the handler, not materialized first.
+            self.assertNotIsInstance(results, list)
+            handled.append(batch)
+            return sum(row[0] for row in results)
+
+        results = list(batch_txn.process_partitions(batches, handler, max_workers=2))
+
+        found = {batch["partition"]: total for batch, total in results}
+        self.assertEqual(found, {b"TOKEN1": 3, b"TOKEN2": 3, b"TOKEN3": 0})
+        self.assertEqual(len(handled), len(batches))
+        for kwargs, snapshot in snapshots:
+            self.assertEqual(kwargs, {"multi_use": True})
+            self.assertEqual(snapshot._transaction_id, self.TRANSACTION_ID)
+        batch_txn._database.session.assert_not_called()
+
+    def test_process_partitions_retries_failed_partition(self):
+        from google.api_core.exceptions import ServiceUnavailable
+        from google.api_core.retry import Retry
+        from google.api_core.retry import if_exception_type
+
+        rows_by_token = {b"TOKEN1": [[1]], b"TOKEN2": [[2]]}
+        errors_by_token = {b"TOKEN2": [ServiceUnavailable("testing")]}
+        batch_txn, snapshots = self._make_batch_txn_w_partitions(
+            rows_by_token, errors_by_token
+        )
+        batches = self._make_query_batches(sorted(rows_by_token))
+        retry = Retry(
+            predicate=if_exception_type(ServiceUnavailable), initial=0, maximum=0
+        )
+
+        results = list(
+            batch_txn.process_partitions(
+                batches, lambda results, batch: list(results), retry=retry
+            )
+        )
+
+        self.assertEqual(sorted(rows for _, rows in results), [[[1]], [[2]]])
+        self.assertEqual(len(snapshots), 3)
+
+    def test_run_partitioned_query(self):
+        sql = "SELECT * FROM table_name"
+        client = _Client(self.PROJECT_ID)
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        database = _Database(self.DATABASE_NAME, instance=instance)
+        batch_txn = self._make_one(database)
+        rows_by_token = {token: [[token]] for token in self.TOKENS}
+        session, snapshots = self._make_partition_session(rows_by_token)
+        batch_txn._session = session
+        snapshot = batch_txn._snapshot = self._make_snapshot(
+            transaction_id=self.TRANSACTION_ID
+        )
+        snapshot.partition_query.return_value = self.TOKENS
+
+        rows = list(batch_txn.run_partitioned_query(sql, max_partitions=2))
+
+        self.assertEqual(sorted(rows), [[token] for token in self.TOKENS])
+        snapshot.partition_query.assert_called_once_with(
+            sql=sql,
+            params=None,
+            param_types=None,
+            partition_size_bytes=None,
+            max_partitions=2,
+        )
+        for _, partition_snapshot in snapshots:
+            partition_snapshot.execute_sql.assert_called_once_with(
+                partition=mock.ANY, sql=sql, query_options=client._query_options
+            )
+
+    def test_run_partitioned_read(self):
+        keyset = self._make_keyset()
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        rows_by_token = {token: [[token]] for token in self.TOKENS}
+        session, _ = self._make_partition_session(rows_by_token)
+        batch_txn._session = session
+        snapshot = batch_txn._snapshot = self._make_snapshot(
+            transaction_id=self.TRANSACTION_ID
+        )
+        snapshot.partition_read.return_value = self.TOKENS
+
+        results = list(
+            batch_txn.run_partitioned_read(
+                self.TABLE, self.COLUMNS, keyset, per_partition=True
+            )
+        )
+
+        self.assertEqual(
+            sorted(batch["partition"] for batch, _ in results), sorted(self.TOKENS)
+        )
+        for batch, rows in results:
+            self.assertEqual(rows, [[batch["partition"]]])
+
+    def _make_batch_txn_w_column_batches(self, batches_by_token, errors_by_token=None):
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        fields = [
+            StructType.Field(name="name", type_=Type(code=TypeCode.STRING)),
+            StructType.Field(name="age", type_=Type(code=TypeCode.INT64)),
+        ]
+        errors_by_token = errors_by_token or {}
+        batch_txn, snapshots = self._make_batch_txn_w_partitions({})
+
+        def execute(partition, **kwargs):
+            errors = errors_by_token.get(partition)
+            if errors:
+                raise errors.pop(0)
+            results = mock.Mock(spec=["fields", "metadata", "iter_column_batches"])
+            results.fields = fields
+            results.metadata = mock.sentinel.metadata
+            results.iter_column_batches.return_value = iter(
+                batches_by_token[partition]
+            )
+            return results
+
+        make_snapshot = batch_txn._session.snapshot.side_effect
+
+        def make_snapshot_w_columns(**kwargs):
+            snapshot = make_snapshot(**kwargs)
+            snapshot.execute_sql.side_effect = execute
+            return snapshot
+
+        batch_txn._session.snapshot.side_effect = make_snapshot_w_columns
+        return batch_txn, snapshots
+
+    def test_export_partitions_w_invalid_format(self):
+        batch_txn = self._make_one(self._make_database())
+
+        with self.assertRaises(ValueError):
+            batch_txn.export_partitions([], "unused", format="xml")
+
+    def test_export_partitions_w_invalid_max_workers(self):
+        batch_txn = self._make_one(self._make_database())
+
+        with self.assertRaises(ValueError):
+            batch_txn.export_partitions([], "unused", max_workers=0)
+
+    def test_export_partitions_csv(self):
+        import os
+        import tempfile
+
+        batches_by_token = {
+            b"TOKEN1": [[["phred", "bharney"], [32, None]], [["wylma"], [31]]],
+            b"TOKEN2": [],
+        }
+        batch_txn, snapshots = self._make_batch_txn_w_column_batches(batches_by_token)
+        batches = self._make_query_batches(sorted(batches_by_token))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "export")
+            filenames = batch_txn.export_partitions(
+                batches, path, prefix="citizens", max_workers=2
+            )
+            contents = []
+            for filename in filenames:
+                with open(filename) as file_obj:
+                    contents.append(file_obj.read())
+
+        self.assertEqual(
+            filenames,
+            [
+                os.path.join(path, "citizens-00000.csv"),
+                os.path.join(path, "citizens-00001.csv"),
+            ],
+        )
+        self.assertEqual(
+            contents,
+            ["name,age\nphred,32\nbharney,\nwylma,31\n", "name,age\n"],
+        )
+        for _, snapshot in snapshots:
+            snapshot.execute_sql.assert_called_once_with(
+                partition=mock.ANY,
+                sql="SELECT * FROM table_name",
+                bytes_decoding="base64",
+                timestamp_decoding="datetime",
+            )
+
+    def test_export_partitions_ndjson_w_retry(self):
+        import os
+        import tempfile
+        from google.api_core.exceptions import ServiceUnavailable
+        from google.api_core.retry import Retry
+        from google.api_core.retry import if_exception_type
+
+        batches_by_token = {b"TOKEN1": [[["phred"], [32]]]}
+        errors_by_token = {b"TOKEN1": [ServiceUnavailable("testing")]}
+        batch_txn, snapshots = self._make_batch_txn_w_column_batches(
+            batches_by_token, errors_by_token
+        )
+        batches = self._make_query_batches([b"TOKEN1"])
+        retry = Retry(
+            predicate=if_exception_type(ServiceUnavailable), initial=0, maximum=0
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (filename,) = batch_txn.export_partitions(
+                batches, tmpdir, format="ndjson", retry=retry
+            )
+            with open(filename) as file_obj:
+                content = file_obj.read()
+
+        self.assertEqual(os.path.basename(filename), "part-00000.ndjson")
+        self.assertEqual(content, '{"name":"phred","age":32}\n')
+        self.assertEqual(len(snapshots), 2)
+
+    def test_export_partitions_removes_failed_file(self):
+        import os
+        import tempfile
+
+        def fail():
+            yield [["phred"], [32]]
+            raise RuntimeError("testing")
+
+        batch_txn, _ = self._make_batch_txn_w_column_batches({b"TOKEN1": fail()})
+        batches = self._make_query_batches([b"TOKEN1"])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(RuntimeError):
+                batch_txn.export_partitions(batches, tmpdir, retry=None)
+
+            self.assertEqual(os.listdir(tmpdir), [])
+
+    def test_export_partitions_wo_response(self):
+        import os
+        import tempfile
+        from google.cloud.spanner_v1.streamed import StreamedResultSet
+
+        batch_txn, _ = self._make_batch_txn_w_partitions({})
+        make_snapshot = batch_txn._session.snapshot.side_effect
+
+        def make_snapshot_wo_response(**kwargs):
+            snapshot = make_snapshot(**kwargs)
+            snapshot.execute_sql.side_effect = lambda **kw: StreamedResultSet(iter([]))
+            snapshot.read.side_effect = lambda **kw: StreamedResultSet(iter([]))
+            return snapshot
+
+        batch_txn._session.snapshot.side_effect = make_snapshot_wo_response
+        read_batch = {
+            "partition": b"TOKEN1",
+            "read": {"table": self.TABLE, "columns": ["name", "age"], "keyset": {}},
+        }
+        (query_batch,) = self._make_query_batches([b"TOKEN2"])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filenames = batch_txn.export_partitions(
+                [read_batch, query_batch], tmpdir, retry=None
+            )
+            with open(filenames[0]) as file_obj:
+                content = file_obj.read()
+            found = os.listdir(tmpdir)
+
+        # Header-only file for the read;  nothing known for the query.
+        self.assertEqual([os.path.basename(name) for name in filenames], found)
+        self.assertEqual(found, ["part-00000.csv"])
+        self.assertEqual(content, "name,age\n")
+
+    def test_export_partitions_wo_response_parquet(self):
+        import os
+        import tempfile
+        from google.cloud.spanner_v1.streamed import StreamedResultSet
+
+        batch_txn, _ = self._make_batch_txn_w_partitions({})
+        make_snapshot = batch_txn._session.snapshot.side_effect
+
+        def make_snapshot_wo_response(**kwargs):
+            snapshot = make_snapshot(**kwargs)
+            snapshot.read.side_effect = lambda **kw: StreamedResultSet(iter([]))
+            return snapshot
+
+        batch_txn._session.snapshot.side_effect = make_snapshot_wo_response
+        read_batch = {
+            "partition": b"TOKEN1",
+            "read": {"table": self.TABLE, "columns": ["name", "age"], "keyset": {}},
+        }
+
+        with mock.patch("google.cloud.spanner_v1.writers.pyarrow") as pyarrow:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                filenames = batch_txn.export_partitions(
+                    [read_batch], tmpdir, format="parquet", retry=None
+                )
+                found = os.listdir(tmpdir)
+
+        # Column types are unknown, so no Parquet schema can be written.
+        self.assertEqual(filenames, [])
+        self.assertEqual(found, [])
+        pyarrow.schema.assert_not_called()
+
+    def test_context_manager(self):
+        database = self._make_database()
+        batch_txn = self._make_one(database)
+        session = batch_txn._session = self._make_session()
+
+        with batch_txn as entered:
+            self.assertIs(entered, batch_txn)
+            session.delete.assert_not_called()
+
+        session.delete.assert_called_once_with()
+
 
 def _make_instance_api():
     from google.cloud.spanner_admin_instance_v1 import InstanceAdminClient
@@ -1911,6 +2836,17 @@ class _Pool(object):
         self._session = session
 
 
+class _ListPool(object):
+    def __init__(self):
+        self._sessions = []
+
+    def get(self):
+        return self._sessions.pop(0)
+
+    def put(self, session):
+        self._sessions.append(session)
+
+
 class _Session(object):
 
     _rows = ()
@@ -0,0 +1,298 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+PROJECT_ID = "project-id"
+INSTANCE_ID = "instance-id"
+DATABASE_ID = "database-id"
+SESSION_ID = "session-id"
+TXN_ID = b"DEAFBEAD"
+STATE = {"session_id": SESSION_ID, "transaction_id": TXN_ID}
+BATCHES = [{"partition": b"TOKEN1"}, {"partition": b"TOKEN2"}]
+
+
+class _Results(object):
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def to_columns(self):
+        return [list(column) for column in zip(*self._rows)]
+
+
+class _BatchSnapshot(object):
+    def __init__(self, database, errors=()):
+        self._database = database
+        self._errors = list(errors)
+        self.processed = []
+
+    def to_dict(self):
+        return STATE
+
+    def process(self, batch):
+        self.processed.append(batch)
+        if self._errors:
+            raise self._errors.pop(0)
+        return _Results([[batch["partition"], 1]])
+
+
+class _Client(object):
+    project = PROJECT_ID
+
+    def __init__(self):
+        self.instances = {}
+
+    def instance(self, instance_id):
+        return self.instances.setdefault(instance_id, _Instance(instance_id, self))
+
+
+class _Instance(object):
+    def __init__(self, instance_id, client):
+        self.instance_id = instance_id
+        self._client = client
+
+    def database(self, database_id):
+        return _Database(database_id, self)
+
+
+class _Database(object):
+    def __init__(self, database_id, instance):
+        self.database_id = database_id
+        self._instance = instance
+
+
+class _Pool(object):
+    """Run the initializer and tasks inline, in this process."""
+
+    def __init__(self, processes, initializer, initargs):
+        self.processes = processes
+        self.closed = self.terminated = self.joined = False
+        initializer(*initargs)
+
+    def imap_unordered(self, func, iterable):
+        for item in iterable:
+            yield func(item)
+
+    def close(self):
+        self.closed = True
+
+    def terminate(self):
+        self.terminated = True
+
+    def join(self):
+        self.joined = True
+
+
+class _Context(object):
+    pool = None
+
+    def Pool(self, processes, initializer, initargs):
+        self.pool = _Pool(processes, initializer, initargs)
+        return self.pool
+
+
+class _WorkerClient(object):
+    """Client used by real worker processes:  must be importable."""
+
+    def instance(self, instance_id):
+        return self
+
+    def database(self, database_id):
+        return self
+
+    def session(self):
+        return self
+
+    def snapshot(self):
+        return self
+
+    def execute_sql(self, partition, sql):
+        return _Results([[partition, sql, self._transaction_id]])
+
+
+class Test_handlers(unittest.TestCase):
+    def test_fetch_rows(self):
+        from google.cloud.spanner_v1.export import fetch_rows
+
+        rows = fetch_rows(_Results([["a", 1], ["b", 2]]), BATCHES[0])
+
+        self.assertEqual(rows, [["a", 1], ["b", 2]])
+
+    def test_fetch_columns(self):
+        from google.cloud.spanner_v1.export import fetch_columns
+
+        columns = fetch_columns(_Results([["a", 1], ["b", 2]]), BATCHES[0])
+
+        self.assertEqual(columns, [["a", "b"], [1, 2]])
+
+
+class Test_run_partitions_in_processes(unittest.TestCase):
+    def tearDown(self):
+        from google.cloud.spanner_v1 import export
+
+        export._WORKER.clear()
+
+    def _call_fut(self, *args, **kw):
+        from google.cloud.spanner_v1.export import run_partitions_in_processes
+
+        return run_partitions_in_processes(*args, **kw)
+
+    def _make_batch_snapshot(self):
+        client = _Client()
+        database = client.instance(INSTANCE_ID).database(DATABASE_ID)
+        return _BatchSnapshot(database), client
+
+    def _run(self, worker_snapshot, **kw):
+        parent_snapshot, client = self._make_batch_snapshot()
+        context = _Context()
+        from_dict = mock.Mock(return_value=worker_snapshot)
+
+        with mock.patch(
+            "google.cloud.spanner_v1.export.BatchSnapshot.from_dict", new=from_dict
+        ):
+            results = self._call_fut(
+                parent_snapshot,
+                iter(BATCHES),
+                processes=2,
+                client_factory=lambda: client,
+                mp_context=context,
+                **kw
+            )
+            pairs = list(results)
+
+        return pairs, context.pool, from_dict
+
+    def test_defaults_to_fetch_rows(self):
+        worker_snapshot = _BatchSnapshot(None)
+
+        pairs, pool, from_dict = self._run(worker_snapshot)
+
+        self.assertEqual(
+            pairs,
+            [(BATCHES[0], [[b"TOKEN1", 1]]), (BATCHES[1], [[b"TOKEN2", 1]])],
+        )
+        self.assertEqual(pool.processes, 2)
+        self.assertTrue(pool.closed)
+        self.assertFalse(pool.terminated)
+        self.assertTrue(pool.joined)
+        ((database, state), _) = from_dict.call_args
+        self.assertEqual(database.database_id, DATABASE_ID)
+        self.assertEqual(database._instance.instance_id, INSTANCE_ID)
+        self.assertEqual(state, STATE)
+
+    def test_w_handler(self):
+        from google.cloud.spanner_v1.export import fetch_columns
+
+        worker_snapshot = _BatchSnapshot(None)
+
+        pairs, _, _ = self._run(worker_snapshot, handler=fetch_columns)
+
+        self.assertEqual(
+            pairs, [(BATCHES[0], [[b"TOKEN1"], [1]]), (BATCHES[1], [[b"TOKEN2"], [1]])]
+        )
+
+    def test_retries_partition(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        worker_snapshot = _BatchSnapshot(None, errors=[ServiceUnavailable("testing")])
+
+        with mock.patch("time.sleep"):
+            pairs, _, _ = self._run(worker_snapshot)
+
+        self.assertEqual(len(pairs), 2)
+        self.assertEqual(worker_snapshot.processed, [BATCHES[0]] + BATCHES)
+
+    def test_wo_retry(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        worker_snapshot = _BatchSnapshot(None, errors=[ServiceUnavailable("testing")])
+
+        with self.assertRaises(ServiceUnavailable):
+            self._run(worker_snapshot, retry=False)
+
+    def test_close_early_terminates_pool(self):
+        parent_snapshot, client = self._make_batch_snapshot()
+        context = _Context()
+
+        with mock.patch(
+            "google.cloud.spanner_v1.export.BatchSnapshot.from_dict",
+            return_value=_BatchSnapshot(None),
+        ):
+            results = self._call_fut(
+                parent_snapshot,
+                BATCHES,
+                client_factory=lambda: client,
+                mp_context=context,
+            )
+            next(results)
+            results.close()
+
+        self.assertFalse(context.pool.closed)
+        self.assertTrue(context.pool.terminated)
+        self.assertTrue(context.pool.joined)
+
+    def test_default_client_factory(self):
+        from google.cloud.spanner_v1.client import Client
+
+        parent_snapshot, _ = self._make_batch_snapshot()
+        context = mock.Mock(spec=["Pool"])
+        context.Pool.return_value.imap_unordered.return_value = iter(())
+
+        results = self._call_fut(parent_snapshot, BATCHES, mp_context=context)
+
+        context.Pool.assert_not_called()
+        next(results, None)
+        _, kw = context.Pool.call_args
+        client_factory = kw["initargs"][0]
+        self.assertIs(client_factory.func, Client)
+        self.assertEqual(client_factory.keywords, {"project": PROJECT_ID})
+        self.assertEqual(kw["initargs"][1:4], (INSTANCE_ID, DATABASE_ID, STATE))
+
+    def test_w_spawned_processes(self):
+        parent_snapshot, _ = self._make_batch_snapshot()
+        batches = [
+            {"partition": b"TOKEN1", "query": {"sql": "SELECT 1"}},
+            {"partition": b"TOKEN2", "query": {"sql": "SELECT 2"}},
+        ]
+
+        results = self._call_fut(
+            parent_snapshot, batches, processes=2, client_factory=_WorkerClient
+        )
+        pairs = sorted(results, key=lambda pair: pair[0]["partition"])
+
+        self.assertEqual(
+            pairs,
+            [
+                (batches[0], [[b"TOKEN1", "SELECT 1", TXN_ID]]),
+                (batches[1], [[b"TOKEN2", "SELECT 2", TXN_ID]]),
+            ],
+        )
+
+    def test_defaults_to_spawn(self):
+        parent_snapshot, client = self._make_batch_snapshot()
+
+        with mock.patch("multiprocessing.get_context") as get_context:
+            get_context.return_value.Pool.return_value.imap_unordered.return_value = (
+                iter(())
+            )
+            list(
+                self._call_fut(parent_snapshot, BATCHES, client_factory=lambda: client)
+            )
+
+        get_context.assert_called_once_with("spawn")
@@ -495,15 +495,21 @@ class TestInstance(unittest.TestCase):
 
     def test_database_factory_explicit(self):
         from google.cloud.spanner_v1.database import Database
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
         from tests._fixtures import DDL_STATEMENTS
 
         client = _Client(self.PROJECT)
         instance = self._make_one(self.INSTANCE_ID, client, self.CONFIG_NAME)
         DATABASE_ID = "database-id"
         pool = _Pool()
+        policy = AbortRetryPolicy()
 
         database = instance.database(
-            DATABASE_ID, ddl_statements=DDL_STATEMENTS, pool=pool
+            DATABASE_ID,
+            ddl_statements=DDL_STATEMENTS,
+            pool=pool,
+            channel_count=4,
+            retry_policy=policy,
         )
 
         self.assertIsInstance(database, Database)
@@ -512,6 +518,8 @@ class TestInstance(unittest.TestCase):
         self.assertEqual(list(database.ddl_statements), DDL_STATEMENTS)
         self.assertIs(database._pool, pool)
         self.assertIs(pool._bound, database)
+        self.assertEqual(database.channel_count, 4)
+        self.assertIs(database.retry_policy, policy)
 
     def test_list_databases(self):
         from google.cloud.spanner_admin_database_v1 import Database as DatabasePB
@@ -58,6 +58,23 @@ class TestAbstractSessionPool(unittest.TestCase):
         self.assertIsNone(pool._database)
         self.assertEqual(pool.labels, labels)
 
+    def test_wait_for_warm_up_wo_warm_up(self):
+        pool = self._make_one()
+        self.assertTrue(pool.wait_for_warm_up())
+
+    def test_wait_for_warm_up_still_running(self):
+        import threading
+
+        pool = self._make_one()
+        release = threading.Event()
+        pool._warmup_thread = threading.Thread(target=release.wait)
+        pool._warmup_thread.start()
+
+        self.assertFalse(pool.wait_for_warm_up(timeout=0.01))
+
+        release.set()
+        self.assertTrue(pool.wait_for_warm_up())
+
     def test_bind_abstract(self):
         pool = self._make_one()
         database = _make_database("name")
@@ -168,6 +185,88 @@ class TestFixedSizePool(unittest.TestCase):
         for session in SESSIONS:
             session.create.assert_not_called()
 
+    def test_bind_w_multiple_batches(self):
+        pool = self._make_one(size=250, warm_up_workers=3)
+        database = _Database("name")
+        database._sessions.extend([_Session(database) for i in range(250)])
+        _make_batch_create_exact(database)
+
+        pool.bind(database)
+
+        self.assertTrue(pool._sessions.full())
+        api = database.spanner_api
+        counts = sorted(
+            kwargs["session_count"]
+            for _, kwargs in api.batch_create_sessions.call_args_list
+        )
+        self.assertEqual(counts, [50, 100, 100])
+
+    def test_bind_w_multiple_batches_uses_daemon_threads(self):
+        import threading
+
+        pool = self._make_one(size=250, warm_up_workers=3)
+        database = _Database("name")
+        database._sessions.extend([_Session(database) for i in range(250)])
+        _make_batch_create_exact(database)
+        threads = []
+        thread_cls = threading.Thread
+
+        def make_thread(*args, **kwargs):
+            thread = thread_cls(*args, **kwargs)
+            threads.append(thread)
+            return thread
+
+        with mock.patch("threading.Thread", side_effect=make_thread):
+            pool.bind(database)
+
+        self.assertTrue(pool._sessions.full())
+        self.assertEqual(len(threads), 2)
+        for thread in threads:
+            self.assertTrue(thread.daemon)
+
+    def test_bind_w_error(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        pool = self._make_one()
+        database = _Database("name")
+        api = database.spanner_api
+        api.batch_create_sessions.side_effect = ServiceUnavailable("testing")
+
+        with self.assertRaises(ServiceUnavailable):
+            pool.bind(database)
+
+    def test_bind_w_background_warm_up(self):
+        pool = self._make_one(size=4, background_warm_up=True)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for i in range(4)]
+        database._sessions.extend(SESSIONS)
+
+        pool.bind(database)
+
+        self.assertTrue(pool.wait_for_warm_up(timeout=5))
+        self.assertTrue(pool._sessions.full())
+        self.assertIn(pool.get(), SESSIONS)
+
+    def test_get_w_background_warm_up_error(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        pool = self._make_one(size=4, background_warm_up=True)
+        database = _Database("name")
+        api = database.spanner_api
+        api.batch_create_sessions.side_effect = ServiceUnavailable("testing")
+
+        pool.bind(database)
+        pool._warmup_thread.join()
+
+        with self.assertRaises(ServiceUnavailable):
+            pool.get(timeout=0.01)
+        with self.assertRaises(ServiceUnavailable):
+            pool.wait_for_warm_up()
+
+    def test_ctor_w_max_idle_time(self):
+        pool = self._make_one(max_idle_time=600)
+        self.assertEqual(pool._max_idle.seconds, 600)
+
     def test_get_non_expired(self):
         pool = self._make_one(size=4)
         database = _Database("name")
@@ -179,16 +278,45 @@ class TestFixedSizePool(unittest.TestCase):
         for i in (3, 2, 1, 0):
             session = pool.get()
             self.assertIs(session, SESSIONS[i])
-            self.assertTrue(session._exists_checked)
+            self.assertFalse(session._exists_checked)
             self.assertFalse(pool._sessions.full())
 
+    def test_get_idle_non_expired(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(size=4)
+        database = _Database("name")
+        SESSIONS = sorted([_Session(database) for i in range(0, 4)])
+        database._sessions.extend(SESSIONS)
+
+        sessions_created = datetime.datetime.utcnow() - datetime.timedelta(seconds=4000)
+
+        with _Monkey(MUT, _NOW=lambda: sessions_created):
+            pool.bind(database)
+
+        session = pool.get()
+
+        self.assertIs(session, SESSIONS[3])
+        self.assertTrue(session._exists_checked)
+        session.create.assert_not_called()
+
     def test_get_expired(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
         pool = self._make_one(size=4)
         database = _Database("name")
         SESSIONS = [_Session(database)] * 5
         SESSIONS[0]._exists = False
         database._sessions.extend(SESSIONS)
-        pool.bind(database)
+
+        sessions_created = datetime.datetime.utcnow() - datetime.timedelta(seconds=4000)
+
+        with _Monkey(MUT, _NOW=lambda: sessions_created):
+            pool.bind(database)
 
         session = pool.get()
 
@@ -301,7 +429,7 @@ class TestBurstyPool(unittest.TestCase):
         session.create.assert_called()
         self.assertTrue(pool._sessions.empty())
 
-    def test_get_non_empty_session_exists(self):
+    def test_get_non_empty_session_recently_used(self):
         pool = self._make_one()
         database = _Database("name")
         previous = _Session(database)
@@ -310,19 +438,47 @@ class TestBurstyPool(unittest.TestCase):
 
         session = pool.get()
 
+        self.assertIs(session, previous)
+        session.create.assert_not_called()
+        self.assertFalse(session._exists_checked)
+        self.assertTrue(pool._sessions.empty())
+
+    def test_get_non_empty_session_exists(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(max_idle_time=600)
+        database = _Database("name")
+        previous = _Session(database)
+        pool.bind(database)
+
+        last_used = datetime.datetime.utcnow() - datetime.timedelta(seconds=601)
+        with _Monkey(MUT, _NOW=lambda: last_used):
+            pool.put(previous)
+
+        session = pool.get()
+
         self.assertIs(session, previous)
         session.create.assert_not_called()
         self.assertTrue(session._exists_checked)
         self.assertTrue(pool._sessions.empty())
 
     def test_get_non_empty_session_expired(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
         pool = self._make_one()
         database = _Database("name")
         previous = _Session(database, exists=False)
         newborn = _Session(database)
         database._sessions.append(newborn)
         pool.bind(database)
-        pool.put(previous)
+
+        last_used = datetime.datetime.utcnow() - datetime.timedelta(seconds=4000)
+        with _Monkey(MUT, _NOW=lambda: last_used):
+            pool.put(previous)
 
         session = pool.get()
 
@@ -399,11 +555,17 @@ class TestPingingPool(unittest.TestCase):
         self.assertEqual(pool._delta.seconds, 3000)
         self.assertTrue(pool._sessions.empty())
         self.assertEqual(pool.labels, {})
+        self.assertIsNone(pool.maintenance_interval)
+        self.assertIsNone(pool._maintenance_thread)
 
     def test_ctor_explicit(self):
         labels = {"foo": "bar"}
         pool = self._make_one(
-            size=4, default_timeout=30, ping_interval=1800, labels=labels
+            size=4,
+            default_timeout=30,
+            ping_interval=1800,
+            labels=labels,
+            maintenance_interval=60,
         )
         self.assertIsNone(pool._database)
         self.assertEqual(pool.size, 4)
@@ -411,6 +573,8 @@ class TestPingingPool(unittest.TestCase):
         self.assertEqual(pool._delta.seconds, 1800)
         self.assertTrue(pool._sessions.empty())
         self.assertEqual(pool.labels, labels)
+        self.assertEqual(pool.maintenance_interval, 60)
+        self.assertIsNone(pool._maintenance_thread)
 
     def test_bind(self):
         pool = self._make_one()
@@ -430,6 +594,17 @@ class TestPingingPool(unittest.TestCase):
         for session in SESSIONS:
             session.create.assert_not_called()
 
+    def test_bind_w_background_warm_up(self):
+        pool = self._make_one(size=4, background_warm_up=True)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for i in range(4)]
+        database._sessions.extend(SESSIONS)
+
+        pool.bind(database)
+
+        self.assertTrue(pool.wait_for_warm_up(timeout=5))
+        self.assertTrue(pool._sessions.full())
+
     def test_get_hit_no_ping(self):
         pool = self._make_one(size=4)
         database = _Database("name")
@@ -612,6 +787,144 @@ class TestPingingPool(unittest.TestCase):
         self.assertTrue(SESSIONS[0]._pinged)
         SESSIONS[1].create.assert_called()
 
+    def test_ping_oldest_stale_and_not_exists_w_create_error(self):
+        import datetime
+        from google.api_core.exceptions import ServiceUnavailable
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(size=1)
+        database = _Database("name")
+        stale = _Session(database, exists=False)
+        database._sessions.append(stale)
+        pool.bind(database)
+        replacement = _Session(database)
+        replacement.create = mock.Mock(side_effect=ServiceUnavailable("testing"))
+        database._sessions.append(replacement)
+
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=4000)
+        with _Monkey(MUT, _NOW=lambda: later):
+            with self.assertRaises(ServiceUnavailable):
+                pool.ping()
+
+        self.assertTrue(pool._sessions.full())
+        _, queued = pool._sessions.get(block=False)
+        self.assertIs(queued, stale)
+
+    def test_ping_oldest_stale_w_transient_error(self):
+        import datetime
+        from google.api_core.exceptions import ServiceUnavailable
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(size=1)
+        database = _Database("name")
+        SESSIONS = [_Session(database)] * 1
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+        SESSIONS[0].ping = mock.Mock(side_effect=ServiceUnavailable("testing"))
+
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=4000)
+        with _Monkey(MUT, _NOW=lambda: later):
+            with self.assertRaises(ServiceUnavailable):
+                pool.ping()
+
+        self.assertTrue(pool._sessions.full())
+
+    def test_bind_w_maintenance_interval(self):
+        pool = self._make_one(size=2, maintenance_interval=3600)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for _ in range(2)]
+        database._sessions.extend(SESSIONS)
+
+        pool.bind(database)
+
+        thread = pool._maintenance_thread
+        self.assertTrue(thread.daemon)
+        self.assertTrue(thread.is_alive())
+
+        pool.clear()
+
+        self.assertIsNone(pool._maintenance_thread)
+        self.assertFalse(thread.is_alive())
+        for session in SESSIONS:
+            self.assertTrue(session._deleted)
+
+    def test_bind_wo_maintenance_interval(self):
+        pool = self._make_one(size=2)
+        database = _Database("name")
+        database._sessions.extend([_Session(database) for _ in range(2)])
+
+        pool.bind(database)
+
+        self.assertIsNone(pool._maintenance_thread)
+
+    def test__maintain_pings_sessions_due_before_next_run(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(size=1, ping_interval=3000, maintenance_interval=600)
+        database = _Database("name")
+        SESSIONS = [_Session(database)] * 1
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+        pool._stop_maintenance()
+
+        # Not yet due, but would be before the next maintenance run.
+        soon = datetime.datetime.utcnow() + datetime.timedelta(seconds=2500)
+        with _Monkey(MUT, _NOW=lambda: soon):
+            pool._maintain()
+
+        self.assertTrue(SESSIONS[0]._pinged)
+
+    def test__maintain_pings_each_session_once(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(size=2, ping_interval=60, maintenance_interval=600)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for _ in range(2)]
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+        pool._stop_maintenance()
+        for session in SESSIONS:
+            session.ping = mock.Mock()
+
+        # Refreshed sessions are due again before the next maintenance run.
+        soon = datetime.datetime.utcnow() + datetime.timedelta(seconds=120)
+        with _Monkey(MUT, _NOW=lambda: soon):
+            pool._maintain()
+
+        for session in SESSIONS:
+            session.ping.assert_called_once_with()
+        self.assertTrue(pool._sessions.full())
+
+    def test__maintenance_loop_survives_transient_error(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        pool = self._make_one(size=1, maintenance_interval=0)
+        stop = mock.Mock()
+        stop.wait.side_effect = [False, False, True]
+        pool._maintain = mock.Mock(side_effect=[ServiceUnavailable("testing"), None])
+
+        pool._maintenance_loop(stop)
+
+        self.assertEqual(pool._maintain.call_count, 2)
+
+    def test__maintenance_loop_survives_unexpected_error(self):
+        from google.api_core.exceptions import RetryError
+
+        pool = self._make_one(size=1, maintenance_interval=0)
+        stop = mock.Mock()
+        stop.wait.side_effect = [False, False, True]
+        pool._maintain = mock.Mock(side_effect=[RetryError("testing", None), None])
+
+        pool._maintenance_loop(stop)
+
+        self.assertEqual(pool._maintain.call_count, 2)
+
 
 class TestTransactionPingingPool(unittest.TestCase):
     def _getTargetClass(self):
@@ -645,6 +958,25 @@ class TestTransactionPingingPool(unittest.TestCase):
         self.assertTrue(pool._pending_sessions.empty())
         self.assertEqual(pool.labels, labels)
 
+    def test_ctor_w_warm_up_options(self):
+        pool = self._make_one(warm_up_workers=2, background_warm_up=True)
+        self.assertEqual(pool.warm_up_workers, 2)
+        self.assertTrue(pool.background_warm_up)
+
+    def test_bind_w_background_warm_up(self):
+        pool = self._make_one(size=4, background_warm_up=True)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for _ in range(4)]
+        database._sessions.extend(SESSIONS)
+
+        pool.bind(database)
+
+        self.assertTrue(pool.wait_for_warm_up(timeout=5))
+        self.assertTrue(pool._sessions.full())
+        self.assertTrue(pool._pending_sessions.empty())
+        for session in SESSIONS:
+            session._transaction.begin.assert_called_once_with()
+
     def test_bind(self):
         pool = self._make_one()
         database = _Database("name")
@@ -782,6 +1114,325 @@ class TestTransactionPingingPool(unittest.TestCase):
 
         self.assertTrue(pending.empty())
 
+    def test_begin_pending_transactions_w_error(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        pool = self._make_one(size=1)
+        pool._sessions = _Queue()
+
+        database = _Database("name")
+        txn = _make_transaction(object())
+        txn.begin.side_effect = ServiceUnavailable("testing")
+        session = _Session(database, transaction=txn)
+        pending = pool._pending_sessions = _Queue(session)
+
+        with self.assertRaises(ServiceUnavailable):
+            pool.begin_pending_transactions()
+
+        self.assertIs(pending._items[0], session)
+        self.assertEqual(len(pool._sessions._items), 0)
+
+    def test__maintain(self):
+        pool = self._make_one(size=1, maintenance_interval=600)
+        pool._sessions = _Queue()
+
+        database = _Database("name")
+        txn = _make_transaction(object())
+        session = _Session(database, transaction=txn)
+        pending = pool._pending_sessions = _Queue(session)
+
+        pool._maintain()
+
+        txn.begin.assert_called_once_with()
+        self.assertTrue(pending.empty())
+        _, queued = pool._sessions._items[0]
+        self.assertIs(queued, session)
+        self.assertFalse(session._pinged)
+
+
+class TestElasticPool(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.pool import ElasticPool
+
+        return ElasticPool
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def test_ctor_defaults(self):
+        pool = self._make_one()
+        self.assertIsNone(pool._database)
+        self.assertEqual(pool.min_sessions, 10)
+        self.assertEqual(pool.max_sessions, 100)
+        self.assertEqual(pool.growth_step, 10)
+        self.assertEqual(pool.default_timeout, 10)
+        self.assertEqual(pool._idle_timeout.seconds, 600)
+        self.assertEqual(pool.size, 0)
+        self.assertEqual(len(pool._sessions), 0)
+        self.assertEqual(pool.labels, {})
+        self.assertIsNone(pool.maintenance_interval)
+
+    def test_ctor_explicit(self):
+        labels = {"foo": "bar"}
+        pool = self._make_one(
+            min_sessions=2,
+            max_sessions=8,
+            growth_step=3,
+            default_timeout=30,
+            idle_timeout=60,
+            labels=labels,
+            maintenance_interval=5,
+        )
+        self.assertEqual(pool.min_sessions, 2)
+        self.assertEqual(pool.max_sessions, 8)
+        self.assertEqual(pool.growth_step, 3)
+        self.assertEqual(pool.default_timeout, 30)
+        self.assertEqual(pool._idle_timeout.seconds, 60)
+        self.assertEqual(pool.labels, labels)
+        self.assertEqual(pool.maintenance_interval, 5)
+
+    def test_ctor_w_min_greater_than_max(self):
+        with self.assertRaises(ValueError):
+            self._make_one(min_sessions=5, max_sessions=4)
+
+    def test_ctor_w_zero_growth_step(self):
+        with self.assertRaises(ValueError):
+            self._make_one(growth_step=0)
+
+    def test_bind(self):
+        pool = self._make_one(min_sessions=4)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for i in range(4)]
+        database._sessions.extend(SESSIONS)
+
+        pool.bind(database)
+
+        self.assertIs(pool._database, database)
+        self.assertEqual(pool.size, 4)
+        self.assertEqual(list(pool._sessions), SESSIONS)
+        api = database.spanner_api
+        self.assertEqual(api.batch_create_sessions.call_count, 2)
+        for session in SESSIONS:
+            session.create.assert_not_called()
+
+    def test_get_from_idle_sessions(self):
+        pool = self._make_one(min_sessions=2)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for i in range(2)]
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+
+        self.assertIs(pool.get(), SESSIONS[1])
+        self.assertIs(pool.get(), SESSIONS[0])
+        self.assertEqual(pool.size, 2)
+        self.assertFalse(SESSIONS[0]._exists_checked)
+
+    def test_get_grows_by_growth_step(self):
+        pool = self._make_one(min_sessions=0, max_sessions=10, growth_step=4)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for i in range(4)]
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+        self.assertEqual(pool.size, 0)
+
+        session = pool.get()
+
+        self.assertIs(session, SESSIONS[0])
+        self.assertEqual(pool.size, 4)
+        self.assertEqual(list(pool._sessions), SESSIONS[1:])
+        api = database.spanner_api
+        self.assertEqual(api.batch_create_sessions.call_count, 2)
+        _, kwargs = api.batch_create_sessions.call_args_list[0]
+        self.assertEqual(kwargs["session_count"], 4)
+        _, kwargs = api.batch_create_sessions.call_args_list[1]
+        self.assertEqual(kwargs["session_count"], 2)
+
+    def test_get_growth_capped_at_max_sessions(self):
+        pool = self._make_one(min_sessions=2, max_sessions=3, growth_step=10)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for i in range(3)]
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+        pool.get()
+        pool.get()
+
+        session = pool.get()
+
+        self.assertIs(session, SESSIONS[2])
+        self.assertEqual(pool.size, 3)
+        _, kwargs = database.spanner_api.batch_create_sessions.call_args
+        self.assertEqual(kwargs["session_count"], 1)
+
+    def test_get_growth_failure(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        pool = self._make_one(min_sessions=0, max_sessions=2)
+        database = _Database("name")
+        pool.bind(database)
+        api = database.spanner_api
+        api.batch_create_sessions.side_effect = ServiceUnavailable("testing")
+
+        with self.assertRaises(ServiceUnavailable):
+            pool.get()
+
+        self.assertEqual(pool.size, 0)
+        self.assertEqual(len(pool._waiters), 0)
+
+    def test_get_at_max_sessions_timeout(self):
+        from six.moves.queue import Empty
+
+        pool = self._make_one(min_sessions=1, max_sessions=1)
+        database = _Database("name")
+        database._sessions.append(_Session(database))
+        pool.bind(database)
+        pool.get()
+
+        with self.assertRaises(Empty):
+            pool.get(timeout=0.01)
+
+        self.assertEqual(len(pool._waiters), 0)
+        self.assertEqual(database.spanner_api.batch_create_sessions.call_count, 1)
+
+    def test_get_at_max_sessions_waits_for_put(self):
+        import threading
+
+        pool = self._make_one(min_sessions=1, max_sessions=1)
+        database = _Database("name")
+        SESSION = _Session(database)
+        database._sessions.append(SESSION)
+        pool.bind(database)
+        pool.get()
+        results = []
+
+        def waiter():
+            results.append(pool.get(timeout=5))
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        while not pool._waiters:
+            thread.join(0.001)
+
+        pool.put(SESSION)
+        thread.join()
+
+        self.assertEqual(results, [SESSION])
+        self.assertEqual(len(pool._sessions), 0)
+
+    def test_put_hands_session_to_oldest_waiter(self):
+        from google.cloud.spanner_v1.pool import _SessionWaiter
+
+        pool = self._make_one()
+        session = _Session(_Database("name"))
+        first, second = _SessionWaiter(), _SessionWaiter()
+        pool._waiters.extend([first, second])
+
+        pool.put(session)
+
+        self.assertIs(first.session, session)
+        self.assertTrue(first.ready.is_set())
+        self.assertIsNone(second.session)
+        self.assertEqual(list(pool._waiters), [second])
+        self.assertEqual(len(pool._sessions), 0)
+
+    def test_get_idle_expired(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(min_sessions=1, max_idle_time=600)
+        database = _Database("name")
+        EXPIRED = _Session(database, exists=False)
+        NEW = _Session(database)
+        database._sessions.extend([EXPIRED, NEW])
+        then = datetime.datetime.utcnow() - datetime.timedelta(seconds=4000)
+        with _Monkey(MUT, _NOW=lambda: then):
+            pool.bind(database)
+
+        session = pool.get()
+
+        self.assertIs(session, NEW)
+        self.assertTrue(EXPIRED._exists_checked)
+        NEW.create.assert_called_once_with()
+
+    def test_shrink(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(min_sessions=1, max_sessions=4, idle_timeout=60)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for i in range(4)]
+        SESSIONS[1]._exists = False
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+        checked_out = [pool.get() for i in range(4)]
+        self.assertEqual(pool.size, 4)
+
+        now = datetime.datetime.utcnow()
+        with _Monkey(MUT, _NOW=lambda: now - datetime.timedelta(seconds=120)):
+            for session in checked_out[:3]:
+                pool.put(session)
+        with _Monkey(MUT, _NOW=lambda: now):
+            pool.put(checked_out[3])
+            pool.shrink()
+
+        self.assertEqual(pool.size, 1)
+        self.assertEqual(list(pool._sessions), [checked_out[3]])
+        for session in checked_out[:3]:
+            self.assertTrue(session._deleted)
+        self.assertFalse(checked_out[3]._deleted)
+
+    def test_shrink_keeps_min_sessions(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud.spanner_v1 import pool as MUT
+
+        pool = self._make_one(min_sessions=2, idle_timeout=60)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for i in range(2)]
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+
+        later = datetime.datetime.utcnow() + datetime.timedelta(seconds=120)
+        with _Monkey(MUT, _NOW=lambda: later):
+            pool.shrink()
+
+        self.assertEqual(pool.size, 2)
+        for session in SESSIONS:
+            self.assertFalse(session._deleted)
+
+    def test__maintain(self):
+        pool = self._make_one()
+        pool.shrink = mock.Mock()
+
+        pool._maintain()
+
+        pool.shrink.assert_called_once_with()
+
+    def test_bind_w_maintenance_interval(self):
+        pool = self._make_one(min_sessions=0, maintenance_interval=60)
+        database = _Database("name")
+
+        pool.bind(database)
+
+        self.assertTrue(pool._maintenance_thread.is_alive())
+        pool.clear()
+        self.assertIsNone(pool._maintenance_thread)
+
+    def test_clear(self):
+        pool = self._make_one(min_sessions=2)
+        database = _Database("name")
+        SESSIONS = [_Session(database) for i in range(2)]
+        database._sessions.extend(SESSIONS)
+        pool.bind(database)
+
+        pool.clear()
+
+        self.assertEqual(pool.size, 0)
+        self.assertEqual(len(pool._sessions), 0)
+        for session in SESSIONS:
+            self.assertTrue(session._deleted)
+
 
 class TestSessionCheckout(unittest.TestCase):
     def _getTargetClass(self):
@@ -852,6 +1503,7 @@ def _make_transaction(*args, **kw):
 class _Session(object):
 
     _transaction = None
+    _last_use_time = None
 
     def __init__(self, database, exists=True, transaction=None):
         self._database = database
@@ -888,6 +1540,24 @@ class _Session(object):
         return txn
 
 
+def _make_batch_create_exact(database):
+    """Make ``database`` create exactly as many sessions as requested."""
+
+    def mock_batch_create_sessions(
+        database=None, session_count=10, timeout=10, metadata=[]
+    ):
+        from google.cloud.spanner_v1 import BatchCreateSessionsResponse
+        from google.cloud.spanner_v1 import Session
+
+        return BatchCreateSessionsResponse(
+            session=[Session() for _ in range(session_count)]
+        )
+
+    database.spanner_api.batch_create_sessions.side_effect = (
+        mock_batch_create_sessions
+    )
+
+
 class _Database(object):
     def __init__(self, name):
         self.name = name
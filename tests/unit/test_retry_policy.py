@@ -0,0 +1,195 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+import mock
+
+
+def _make_aborted(trailing_metadata=()):
+    from google.api_core.exceptions import Aborted
+
+    cause = mock.Mock(spec=["trailing_metadata"])
+    cause.trailing_metadata.return_value = list(trailing_metadata)
+    return Aborted("aborted", errors=[cause])
+
+
+def _make_aborted_w_retry_info(seconds, nanos=0):
+    from google.protobuf.duration_pb2 import Duration
+    from google.rpc.error_details_pb2 import RetryInfo
+
+    retry_info = RetryInfo(retry_delay=Duration(seconds=seconds, nanos=nanos))
+    return _make_aborted(
+        [("google.rpc.retryinfo-bin", retry_info.SerializeToString())]
+    )
+
+
+class TestAbortStats(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.retry_policy import AbortStats
+
+        return AbortStats
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def test_ctor_defaults(self):
+        stats = self._make_one()
+        self.assertEqual(stats.aborts, 0)
+        self.assertEqual(stats.commits, 0)
+        self.assertEqual(stats.contention, 0.0)
+        self.assertEqual(stats.abort_ratio, 0.0)
+
+    def test_ctor_w_invalid_smoothing(self):
+        with self.assertRaises(ValueError):
+            self._make_one(smoothing=0)
+
+        with self.assertRaises(ValueError):
+            self._make_one(smoothing=1.5)
+
+    def test_record_abort_and_commit(self):
+        stats = self._make_one(smoothing=0.5)
+
+        stats.record_abort()
+        self.assertEqual(stats.contention, 0.5)
+        stats.record_abort()
+        self.assertEqual(stats.contention, 0.75)
+        stats.record_commit()
+        self.assertEqual(stats.contention, 0.375)
+
+        self.assertEqual(stats.aborts, 2)
+        self.assertEqual(stats.commits, 1)
+        self.assertAlmostEqual(stats.abort_ratio, 2.0 / 3)
+        self.assertEqual(
+            repr(stats), "AbortStats(aborts=2, commits=1, contention=0.375)"
+        )
+
+
+class TestAbortRetryPolicy(unittest.TestCase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
+
+        return AbortRetryPolicy
+
+    def _make_one(self, *args, **kwargs):
+        return self._getTargetClass()(*args, **kwargs)
+
+    def test_ctor_defaults(self):
+        from google.cloud.spanner_v1.retry_policy import DEFAULT_RETRY_DEADLINE
+        from google.cloud.spanner_v1.retry_policy import JITTER_FULL
+
+        policy = self._make_one()
+        self.assertEqual(policy.jitter, JITTER_FULL)
+        self.assertEqual(policy.deadline, DEFAULT_RETRY_DEADLINE)
+        self.assertIsNone(policy.max_attempts)
+
+    def test_ctor_w_unknown_jitter(self):
+        with self.assertRaises(ValueError):
+            self._make_one(jitter="bogus")
+
+    def test_ctor_w_invalid_delays(self):
+        with self.assertRaises(ValueError):
+            self._make_one(initial=2, maximum=1)
+
+        with self.assertRaises(ValueError):
+            self._make_one(multiplier=0.5)
+
+    def test_get_delay_exponential_w_cap(self):
+        from google.cloud.spanner_v1.retry_policy import JITTER_NONE
+
+        policy = self._make_one(initial=1, maximum=5, jitter=JITTER_NONE)
+
+        delays = [policy.get_delay(attempts) for attempts in range(1, 6)]
+
+        self.assertEqual(delays, [1, 2, 4, 5, 5])
+
+    def test_get_delay_w_full_jitter(self):
+        policy = self._make_one(initial=4, maximum=4)
+
+        with mock.patch("random.uniform", return_value=1.5) as uniform:
+            self.assertEqual(policy.get_delay(1), 1.5)
+
+        uniform.assert_called_once_with(0, 4)
+
+    def test_get_delay_w_equal_jitter(self):
+        from google.cloud.spanner_v1.retry_policy import JITTER_EQUAL
+
+        policy = self._make_one(initial=4, maximum=4, jitter=JITTER_EQUAL)
+
+        with mock.patch("random.uniform", return_value=1.5) as uniform:
+            self.assertEqual(policy.get_delay(1), 3.5)
+
+        uniform.assert_called_once_with(0, 2)
+
+    def test_get_delay_w_server_delay(self):
+        policy = self._make_one(initial=1, maximum=1)
+        exc = _make_aborted_w_retry_info(3, 500000000)
+
+        self.assertEqual(policy.get_delay(1, exc), 3.5)
+
+    def test_get_delay_wo_server_delay(self):
+        from google.cloud.spanner_v1.retry_policy import JITTER_NONE
+
+        policy = self._make_one(initial=1, jitter=JITTER_NONE)
+
+        self.assertEqual(policy.get_delay(1, _make_aborted()), 1)
+
+    def test_get_delay_w_contention(self):
+        from google.cloud.spanner_v1.retry_policy import AbortStats
+        from google.cloud.spanner_v1.retry_policy import JITTER_NONE
+
+        policy = self._make_one(
+            initial=1, maximum=2, jitter=JITTER_NONE, contention_weight=2
+        )
+        stats = AbortStats(smoothing=0.25)
+        stats.record_abort()
+
+        self.assertEqual(policy.get_delay(1, stats=stats), 1.5)
+        # Capped at the maximum.
+        self.assertEqual(policy.get_delay(2, stats=stats), 2)
+
+    def test_retry_delay_before_deadline(self):
+        from google.cloud.spanner_v1.retry_policy import JITTER_NONE
+
+        policy = self._make_one(initial=1, jitter=JITTER_NONE)
+
+        with mock.patch("time.time", return_value=10):
+            delay = policy.retry_delay(_make_aborted(), 1, 20)
+
+        self.assertEqual(delay, 1)
+
+    def test_retry_delay_past_deadline(self):
+        policy = self._make_one()
+
+        with mock.patch("time.time", return_value=10):
+            self.assertIsNone(policy.retry_delay(_make_aborted(), 1, 10))
+
+    def test_retry_delay_overrunning_deadline(self):
+        policy = self._make_one()
+        exc = _make_aborted_w_retry_info(5)
+
+        with mock.patch("time.time", return_value=10):
+            self.assertIsNone(policy.retry_delay(exc, 1, 14))
+
+    def test_retry_delay_w_max_attempts(self):
+        from google.cloud.spanner_v1.retry_policy import JITTER_NONE
+
+        policy = self._make_one(
+            initial=1, maximum=4, jitter=JITTER_NONE, max_attempts=3
+        )
+
+        with mock.patch("time.time", return_value=10):
+            self.assertEqual(policy.retry_delay(_make_aborted(), 2, 20), 2)
+            self.assertIsNone(policy.retry_delay(_make_aborted(), 3, 20))
@@ -72,8 +72,13 @@ class TestSession(OpenTelemetryBase):
     def _make_database(name=DATABASE_NAME):
         from google.cloud.spanner_v1.database import Database
 
+        from google.cloud.spanner_v1.retry_policy import AbortStats
+        from google.cloud.spanner_v1.retry_policy import DEFAULT_RETRY_POLICY
+
         database = mock.create_autospec(Database, instance=True)
         database.name = name
+        database.retry_policy = DEFAULT_RETRY_POLICY
+        database.abort_stats = AbortStats()
         return database
 
     @staticmethod
@@ -157,6 +162,22 @@ class TestSession(OpenTelemetryBase):
             "CloudSpanner.CreateSession", attributes=TestSession.BASE_ATTRIBUTES
         )
 
+    def test__recreate(self):
+        session_pb = self._make_session_pb(self.SESSION_NAME)
+        gax_api = self._make_spanner_api()
+        gax_api.create_session.return_value = session_pb
+        database = self._make_database()
+        database.spanner_api = gax_api
+        session = self._make_one(database)
+        session._session_id = "deleted-session-id"
+        session._transaction = mock.Mock()
+
+        session._recreate()
+
+        self.assertEqual(session.session_id, self.SESSION_ID)
+        self.assertIsNone(session._transaction)
+        gax_api.create_session.assert_called_once()
+
     def test_create_w_labels(self):
         from google.cloud.spanner_v1 import CreateSessionRequest
         from google.cloud.spanner_v1 import Session as SessionPB
@@ -669,10 +690,7 @@ class TestSession(OpenTelemetryBase):
         self.assertTrue(existing.rolled_back)
 
     def test_run_in_transaction_callback_raises_non_gax_error(self):
-        from google.cloud.spanner_v1 import (
-            Transaction as TransactionPB,
-            TransactionOptions,
-        )
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
         from google.cloud.spanner_v1.transaction import Transaction
 
         TABLE_NAME = "citizens"
@@ -713,24 +731,13 @@ class TestSession(OpenTelemetryBase):
         self.assertEqual(args, ())
         self.assertEqual(kw, {})
 
-        expected_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
-        gax_api.begin_transaction.assert_called_once_with(
-            session=self.SESSION_NAME,
-            options=expected_options,
-            metadata=[("google-cloud-resource-prefix", database.name)],
-        )
-        gax_api.rollback.assert_called_once_with(
-            session=self.SESSION_NAME,
-            transaction_id=TRANSACTION_ID,
-            metadata=[("google-cloud-resource-prefix", database.name)],
-        )
+        # The transaction was never begun, so there is nothing to roll back.
+        gax_api.begin_transaction.assert_not_called()
+        gax_api.rollback.assert_not_called()
 
     def test_run_in_transaction_callback_raises_non_abort_rpc_error(self):
         from google.api_core.exceptions import Cancelled
-        from google.cloud.spanner_v1 import (
-            Transaction as TransactionPB,
-            TransactionOptions,
-        )
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
         from google.cloud.spanner_v1.transaction import Transaction
 
         TABLE_NAME = "citizens"
@@ -768,21 +775,13 @@ class TestSession(OpenTelemetryBase):
         self.assertEqual(args, ())
         self.assertEqual(kw, {})
 
-        expected_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
-        gax_api.begin_transaction.assert_called_once_with(
-            session=self.SESSION_NAME,
-            options=expected_options,
-            metadata=[("google-cloud-resource-prefix", database.name)],
-        )
+        gax_api.begin_transaction.assert_not_called()
         gax_api.rollback.assert_not_called()
 
     def test_run_in_transaction_w_args_w_kwargs_wo_abort(self):
         import datetime
         from google.cloud.spanner_v1 import CommitResponse
-        from google.cloud.spanner_v1 import (
-            Transaction as TransactionPB,
-            TransactionOptions,
-        )
+        from google.cloud.spanner_v1 import TransactionOptions
         from google.cloud._helpers import UTC
         from google.cloud._helpers import _datetime_to_pb_timestamp
         from google.cloud.spanner_v1.transaction import Transaction
@@ -793,13 +792,10 @@ class TestSession(OpenTelemetryBase):
             ["phred@exammple.com", "Phred", "Phlyntstone", 32],
             ["bharney@example.com", "Bharney", "Rhubble", 31],
         ]
-        TRANSACTION_ID = b"FACEDACE"
-        transaction_pb = TransactionPB(id=TRANSACTION_ID)
         now = datetime.datetime.utcnow().replace(tzinfo=UTC)
         now_pb = _datetime_to_pb_timestamp(now)
         response = CommitResponse(commit_timestamp=now_pb)
         gax_api = self._make_spanner_api()
-        gax_api.begin_transaction.return_value = transaction_pb
         gax_api.commit.return_value = response
         database = self._make_database()
         database.spanner_api = gax_api
@@ -824,15 +820,11 @@ class TestSession(OpenTelemetryBase):
         self.assertEqual(kw, {"some_arg": "def"})
 
         expected_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
-        gax_api.begin_transaction.assert_called_once_with(
-            session=self.SESSION_NAME,
-            options=expected_options,
-            metadata=[("google-cloud-resource-prefix", database.name)],
-        )
+        gax_api.begin_transaction.assert_not_called()
         gax_api.commit.assert_called_once_with(
             session=self.SESSION_NAME,
             mutations=txn._mutations,
-            transaction_id=TRANSACTION_ID,
+            single_use_transaction=expected_options,
             metadata=[("google-cloud-resource-prefix", database.name)],
         )
 
@@ -887,10 +879,7 @@ class TestSession(OpenTelemetryBase):
         import datetime
         from google.api_core.exceptions import Aborted
         from google.cloud.spanner_v1 import CommitResponse
-        from google.cloud.spanner_v1 import (
-            Transaction as TransactionPB,
-            TransactionOptions,
-        )
+        from google.cloud.spanner_v1 import TransactionOptions
         from google.cloud._helpers import UTC
         from google.cloud._helpers import _datetime_to_pb_timestamp
         from google.cloud.spanner_v1.transaction import Transaction
@@ -901,14 +890,11 @@ class TestSession(OpenTelemetryBase):
             ["phred@exammple.com", "Phred", "Phlyntstone", 32],
             ["bharney@example.com", "Bharney", "Rhubble", 31],
         ]
-        TRANSACTION_ID = b"FACEDACE"
-        transaction_pb = TransactionPB(id=TRANSACTION_ID)
         now = datetime.datetime.utcnow().replace(tzinfo=UTC)
         now_pb = _datetime_to_pb_timestamp(now)
         aborted = _make_rpc_error(Aborted, trailing_metadata=[])
         response = CommitResponse(commit_timestamp=now_pb)
         gax_api = self._make_spanner_api()
-        gax_api.begin_transaction.return_value = transaction_pb
         gax_api.commit.side_effect = [aborted, response]
         database = self._make_database()
         database.spanner_api = gax_api
@@ -932,24 +918,14 @@ class TestSession(OpenTelemetryBase):
             self.assertEqual(kw, {"some_arg": "def"})
 
         expected_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
-        self.assertEqual(
-            gax_api.begin_transaction.call_args_list,
-            [
-                mock.call(
-                    session=self.SESSION_NAME,
-                    options=expected_options,
-                    metadata=[("google-cloud-resource-prefix", database.name)],
-                )
-            ]
-            * 2,
-        )
+        gax_api.begin_transaction.assert_not_called()
         self.assertEqual(
             gax_api.commit.call_args_list,
             [
                 mock.call(
                     session=self.SESSION_NAME,
                     mutations=txn._mutations,
-                    transaction_id=TRANSACTION_ID,
+                    single_use_transaction=expected_options,
                     metadata=[("google-cloud-resource-prefix", database.name)],
                 )
             ]
@@ -962,10 +938,7 @@ class TestSession(OpenTelemetryBase):
         from google.protobuf.duration_pb2 import Duration
         from google.rpc.error_details_pb2 import RetryInfo
         from google.cloud.spanner_v1 import CommitResponse
-        from google.cloud.spanner_v1 import (
-            Transaction as TransactionPB,
-            TransactionOptions,
-        )
+        from google.cloud.spanner_v1 import TransactionOptions
         from google.cloud._helpers import UTC
         from google.cloud._helpers import _datetime_to_pb_timestamp
         from google.cloud.spanner_v1.transaction import Transaction
@@ -976,7 +949,6 @@ class TestSession(OpenTelemetryBase):
             ["phred@exammple.com", "Phred", "Phlyntstone", 32],
             ["bharney@example.com", "Bharney", "Rhubble", 31],
         ]
-        TRANSACTION_ID = b"FACEDACE"
         RETRY_SECONDS = 12
         RETRY_NANOS = 3456
         retry_info = RetryInfo(
@@ -986,12 +958,10 @@ class TestSession(OpenTelemetryBase):
             ("google.rpc.retryinfo-bin", retry_info.SerializeToString())
         ]
         aborted = _make_rpc_error(Aborted, trailing_metadata=trailing_metadata)
-        transaction_pb = TransactionPB(id=TRANSACTION_ID)
         now = datetime.datetime.utcnow().replace(tzinfo=UTC)
         now_pb = _datetime_to_pb_timestamp(now)
         response = CommitResponse(commit_timestamp=now_pb)
         gax_api = self._make_spanner_api()
-        gax_api.begin_transaction.return_value = transaction_pb
         gax_api.commit.side_effect = [aborted, response]
         database = self._make_database()
         database.spanner_api = gax_api
@@ -1020,24 +990,14 @@ class TestSession(OpenTelemetryBase):
             self.assertEqual(kw, {"some_arg": "def"})
 
         expected_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
-        self.assertEqual(
-            gax_api.begin_transaction.call_args_list,
-            [
-                mock.call(
-                    session=self.SESSION_NAME,
-                    options=expected_options,
-                    metadata=[("google-cloud-resource-prefix", database.name)],
-                )
-            ]
-            * 2,
-        )
+        gax_api.begin_transaction.assert_not_called()
         self.assertEqual(
             gax_api.commit.call_args_list,
             [
                 mock.call(
                     session=self.SESSION_NAME,
                     mutations=txn._mutations,
-                    transaction_id=TRANSACTION_ID,
+                    single_use_transaction=expected_options,
                     metadata=[("google-cloud-resource-prefix", database.name)],
                 )
             ]
@@ -1050,10 +1010,7 @@ class TestSession(OpenTelemetryBase):
         from google.protobuf.duration_pb2 import Duration
         from google.rpc.error_details_pb2 import RetryInfo
         from google.cloud.spanner_v1 import CommitResponse
-        from google.cloud.spanner_v1 import (
-            Transaction as TransactionPB,
-            TransactionOptions,
-        )
+        from google.cloud.spanner_v1 import TransactionOptions
         from google.cloud._helpers import UTC
         from google.cloud._helpers import _datetime_to_pb_timestamp
         from google.cloud.spanner_v1.transaction import Transaction
@@ -1064,10 +1021,8 @@ class TestSession(OpenTelemetryBase):
             ["phred@exammple.com", "Phred", "Phlyntstone", 32],
             ["bharney@example.com", "Bharney", "Rhubble", 31],
         ]
-        TRANSACTION_ID = b"FACEDACE"
         RETRY_SECONDS = 1
         RETRY_NANOS = 3456
-        transaction_pb = TransactionPB(id=TRANSACTION_ID)
         now = datetime.datetime.utcnow().replace(tzinfo=UTC)
         now_pb = _datetime_to_pb_timestamp(now)
         response = CommitResponse(commit_timestamp=now_pb)
@@ -1078,7 +1033,6 @@ class TestSession(OpenTelemetryBase):
             ("google.rpc.retryinfo-bin", retry_info.SerializeToString())
         ]
         gax_api = self._make_spanner_api()
-        gax_api.begin_transaction.return_value = transaction_pb
         gax_api.commit.side_effect = [response]
         database = self._make_database()
         database.spanner_api = gax_api
@@ -1108,21 +1062,11 @@ class TestSession(OpenTelemetryBase):
             self.assertEqual(kw, {})
 
         expected_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
-        self.assertEqual(
-            gax_api.begin_transaction.call_args_list,
-            [
-                mock.call(
-                    session=self.SESSION_NAME,
-                    options=expected_options,
-                    metadata=[("google-cloud-resource-prefix", database.name)],
-                )
-            ]
-            * 2,
-        )
+        gax_api.begin_transaction.assert_not_called()
         gax_api.commit.assert_called_once_with(
             session=self.SESSION_NAME,
             mutations=txn._mutations,
-            transaction_id=TRANSACTION_ID,
+            single_use_transaction=expected_options,
             metadata=[("google-cloud-resource-prefix", database.name)],
         )
 
@@ -1132,10 +1076,7 @@ class TestSession(OpenTelemetryBase):
         from google.protobuf.duration_pb2 import Duration
         from google.rpc.error_details_pb2 import RetryInfo
         from google.cloud.spanner_v1 import CommitResponse
-        from google.cloud.spanner_v1 import (
-            Transaction as TransactionPB,
-            TransactionOptions,
-        )
+        from google.cloud.spanner_v1 import TransactionOptions
         from google.cloud.spanner_v1.transaction import Transaction
         from google.cloud._helpers import UTC
         from google.cloud._helpers import _datetime_to_pb_timestamp
@@ -1146,10 +1087,8 @@ class TestSession(OpenTelemetryBase):
             ["phred@exammple.com", "Phred", "Phlyntstone", 32],
             ["bharney@example.com", "Bharney", "Rhubble", 31],
         ]
-        TRANSACTION_ID = b"FACEDACE"
         RETRY_SECONDS = 1
         RETRY_NANOS = 3456
-        transaction_pb = TransactionPB(id=TRANSACTION_ID)
         now = datetime.datetime.utcnow().replace(tzinfo=UTC)
         now_pb = _datetime_to_pb_timestamp(now)
         response = CommitResponse(commit_timestamp=now_pb)
@@ -1161,7 +1100,6 @@ class TestSession(OpenTelemetryBase):
         ]
         aborted = _make_rpc_error(Aborted, trailing_metadata=trailing_metadata)
         gax_api = self._make_spanner_api()
-        gax_api.begin_transaction.return_value = transaction_pb
         gax_api.commit.side_effect = [aborted, response]
         database = self._make_database()
         database.spanner_api = gax_api
@@ -1201,24 +1139,19 @@ class TestSession(OpenTelemetryBase):
         self.assertEqual(kw, {})
 
         expected_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
-        gax_api.begin_transaction.assert_called_once_with(
-            session=self.SESSION_NAME,
-            options=expected_options,
-            metadata=[("google-cloud-resource-prefix", database.name)],
-        )
+        gax_api.begin_transaction.assert_not_called()
         gax_api.commit.assert_called_once_with(
             session=self.SESSION_NAME,
             mutations=txn._mutations,
-            transaction_id=TRANSACTION_ID,
+            single_use_transaction=expected_options,
             metadata=[("google-cloud-resource-prefix", database.name)],
         )
 
     def test_run_in_transaction_w_timeout(self):
         from google.api_core.exceptions import Aborted
-        from google.cloud.spanner_v1 import (
-            Transaction as TransactionPB,
-            TransactionOptions,
-        )
+        from google.cloud.spanner_v1 import TransactionOptions
+        from google.cloud.spanner_v1.retry_policy import AbortRetryPolicy
+        from google.cloud.spanner_v1.retry_policy import JITTER_NONE
         from google.cloud.spanner_v1.transaction import Transaction
 
         TABLE_NAME = "citizens"
@@ -1227,11 +1160,8 @@ class TestSession(OpenTelemetryBase):
             ["phred@exammple.com", "Phred", "Phlyntstone", 32],
             ["bharney@example.com", "Bharney", "Rhubble", 31],
         ]
-        TRANSACTION_ID = b"FACEDACE"
-        transaction_pb = TransactionPB(id=TRANSACTION_ID)
         aborted = _make_rpc_error(Aborted, trailing_metadata=[])
         gax_api = self._make_spanner_api()
-        gax_api.begin_transaction.return_value = transaction_pb
         gax_api.commit.side_effect = aborted
         database = self._make_database()
         database.spanner_api = gax_api
@@ -1248,16 +1178,22 @@ class TestSession(OpenTelemetryBase):
         def _time(_results=[1, 2, 4, 8]):
             return _results.pop(0)
 
+        policy = AbortRetryPolicy(initial=2, maximum=8, jitter=JITTER_NONE)
+
         with mock.patch("time.time", _time):
             if HAS_OPENTELEMETRY_INSTALLED:
                 with mock.patch("opentelemetry.util.time", _ConstantTime()):
                     with mock.patch("time.sleep") as sleep_mock:
                         with self.assertRaises(Aborted):
-                            session.run_in_transaction(unit_of_work, timeout_secs=8)
+                            session.run_in_transaction(
+                                unit_of_work, timeout_secs=8, retry_policy=policy
+                            )
             else:
                 with mock.patch("time.sleep") as sleep_mock:
                     with self.assertRaises(Aborted):
-                        session.run_in_transaction(unit_of_work, timeout_secs=8)
+                        session.run_in_transaction(
+                            unit_of_work, timeout_secs=8, retry_policy=policy
+                        )
 
         # unpacking call args into list
         call_args = [call_[0][0] for call_ in sleep_mock.call_args_list]
@@ -1266,6 +1202,8 @@ class TestSession(OpenTelemetryBase):
         assert sleep_mock.call_count == 2
 
         self.assertEqual(len(called_with), 3)
+        self.assertEqual(database.abort_stats.aborts, 3)
+        self.assertEqual(database.abort_stats.commits, 0)
         for txn, args, kw in called_with:
             self.assertIsInstance(txn, Transaction)
             self.assertIsNone(txn.committed)
@@ -1273,24 +1211,14 @@ class TestSession(OpenTelemetryBase):
             self.assertEqual(kw, {})
 
         expected_options = TransactionOptions(read_write=TransactionOptions.ReadWrite())
-        self.assertEqual(
-            gax_api.begin_transaction.call_args_list,
-            [
-                mock.call(
-                    session=self.SESSION_NAME,
-                    options=expected_options,
-                    metadata=[("google-cloud-resource-prefix", database.name)],
-                )
-            ]
-            * 3,
-        )
+        gax_api.begin_transaction.assert_not_called()
         self.assertEqual(
             gax_api.commit.call_args_list,
             [
                 mock.call(
                     session=self.SESSION_NAME,
                     mutations=txn._mutations,
-                    transaction_id=TRANSACTION_ID,
+                    single_use_transaction=expected_options,
                     metadata=[("google-cloud-resource-prefix", database.name)],
                 )
             ]
@@ -1313,12 +1241,15 @@ class TestSession(OpenTelemetryBase):
             with self.assertRaises(Exception):
                 _delay_until_retry(exc_mock, 2, 1)
 
-        with mock.patch("time.time", _time_func):
-            with mock.patch(
-                "google.cloud.spanner_v1.session._get_retry_delay"
-            ) as get_retry_delay_mock:
-                with mock.patch("time.sleep") as sleep_mock:
-                    get_retry_delay_mock.return_value = None
+        policy = mock.Mock(spec=["retry_delay"])
+        policy.retry_delay.return_value = None
+        with self.assertRaises(Exception):
+            _delay_until_retry(exc_mock, 6, 1, policy)
+
+        policy.retry_delay.return_value = 0.5
+        stats = object()
+        with mock.patch("time.sleep") as sleep_mock:
+            _delay_until_retry(exc_mock, 6, 2, policy, stats)
 
-                    _delay_until_retry(exc_mock, 6, 1)
-                    sleep_mock.assert_not_called()
+        sleep_mock.assert_called_once_with(0.5)
+        policy.retry_delay.assert_called_with(exc_mock, 2, 6, stats)
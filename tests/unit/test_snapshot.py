@@ -22,6 +22,9 @@ standard_library.install_aliases()
 # limitations under the License.
 
 
+import itertools
+import unittest
+
 import google.api_core.gapic_v1.method
 import mock
 from tests._helpers import (
@@ -303,6 +306,142 @@ class Test_restart_on_unavailable(OpenTelemetryBase):
                 )
 
 
+class Test_restart_on_unavailable_w_buffer_limit(unittest.TestCase):
+    def _call_fut(self, restart, **kw):
+        from google.cloud.spanner_v1.snapshot import _restart_on_unavailable
+
+        return _restart_on_unavailable(restart, **kw)
+
+    def _make_item(self, value, resume_token=b""):
+        from google.cloud.spanner_v1 import PartialResultSet
+
+        item = PartialResultSet(resume_token=resume_token)
+        item.values.append(value)
+        return item
+
+    def _make_items(self):
+        return (
+            self._make_item(u"a" * 100),
+            self._make_item(u"b" * 100),
+            self._make_item(u"c" * 100),
+            self._make_item(u"d" * 100, resume_token=RESUME_TOKEN),
+        )
+
+    def test_under_limit(self):
+        ITEMS = self._make_items()
+        restart = mock.Mock(spec=[], return_value=_MockIterator(*ITEMS))
+        resumable = self._call_fut(restart, max_buffer_bytes=1000)
+        self.assertEqual(list(resumable), list(ITEMS))
+
+    def test_over_limit_w_flush(self):
+        ITEMS = self._make_items()
+        restart = mock.Mock(spec=[], return_value=_MockIterator(*ITEMS))
+        resumable = self._call_fut(restart, max_buffer_bytes=150)
+
+        # Items are handed over as soon as the limit is exceeded.
+        self.assertEqual(list(itertools.islice(resumable, 2)), list(ITEMS[:2]))
+        self.assertEqual(list(resumable), list(ITEMS[2:]))
+
+    def test_over_limit_w_flush_then_unavailable(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        ITEMS = self._make_items()[:3]
+        before = _MockIterator(
+            *ITEMS, fail_after=True, error=ServiceUnavailable("testing")
+        )
+        restart = mock.Mock(spec=[], side_effect=[before])
+        resumable = self._call_fut(restart, max_buffer_bytes=150)
+
+        found = []
+        with self.assertRaises(ServiceUnavailable):
+            for item in resumable:
+                found.append(item)
+
+        self.assertEqual(found, list(ITEMS[:2]))
+        restart.assert_called_once_with()
+
+    def test_over_limit_w_flush_resumable_after_token(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        FIRST = self._make_items()
+        SECOND = (self._make_item(u"e"),)
+        before = _MockIterator(
+            *FIRST, fail_after=True, error=ServiceUnavailable("testing")
+        )
+        after = _MockIterator(*SECOND)
+        restart = mock.Mock(spec=[], side_effect=[before, after])
+        resumable = self._call_fut(restart, max_buffer_bytes=150)
+
+        self.assertEqual(list(resumable), list(FIRST + SECOND))
+        self.assertEqual(
+            restart.mock_calls, [mock.call(), mock.call(resume_token=RESUME_TOKEN)]
+        )
+
+    def test_over_limit_w_raise(self):
+        from google.cloud.spanner_v1.snapshot import BUFFER_OVERFLOW_RAISE
+        from google.cloud.spanner_v1.snapshot import BufferExceeded
+
+        ITEMS = self._make_items()
+        restart = mock.Mock(spec=[], return_value=_MockIterator(*ITEMS))
+        resumable = self._call_fut(
+            restart, max_buffer_bytes=150, buffer_overflow=BUFFER_OVERFLOW_RAISE
+        )
+
+        with self.assertRaises(BufferExceeded) as exc_info:
+            list(resumable)
+
+        self.assertEqual(exc_info.exception.max_buffer_bytes, 150)
+
+
+class Test_prefetch(unittest.TestCase):
+    def _call_fut(self, iterator, depth):
+        from google.cloud.spanner_v1.snapshot import _prefetch
+
+        return _prefetch(iterator, depth)
+
+    def test_empty(self):
+        self.assertEqual(list(self._call_fut(iter(()), 2)), [])
+
+    def test_w_items(self):
+        ITEMS = list(range(10))
+        self.assertEqual(list(self._call_fut(iter(ITEMS), 2)), ITEMS)
+
+    def test_w_error(self):
+        from google.api_core.exceptions import ServiceUnavailable
+
+        raw = _MockIterator(1, 2, fail_after=True, error=ServiceUnavailable("testing"))
+        prefetched = self._call_fut(raw, 4)
+
+        found = []
+        with self.assertRaises(ServiceUnavailable):
+            for item in prefetched:
+                found.append(item)
+
+        self.assertEqual(found, [1, 2])
+
+    def test_stays_bounded_and_stops_when_closed(self):
+        import threading
+
+        received = []
+        closed = threading.Event()
+
+        def produce():
+            try:
+                for value in itertools.count():
+                    received.append(value)
+                    yield value
+            finally:
+                closed.set()
+
+        prefetched = self._call_fut(produce(), 2)
+        self.assertEqual(next(prefetched), 0)
+        prefetched.close()
+
+        self.assertTrue(closed.wait(5))
+        # One item handed over, at most two queued and one being queued.
+        self.assertLessEqual(len(received), 4)
+
+
 class Test_SnapshotBase(OpenTelemetryBase):
 
     PROJECT_ID = "project-id"
@@ -384,6 +523,182 @@ class Test_SnapshotBase(OpenTelemetryBase):
             ),
         )
 
+    def test_read_wo_multi_use_w_session_not_found(self):
+        from google.api_core.exceptions import NotFound
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        keyset = KeySet(all_=True)
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.streaming_read.side_effect = [
+            NotFound("Session not found: testing"),
+            _MockIterator(),
+        ]
+        session = _Session(database)
+        new_name = self.DATABASE_NAME + "/sessions/new-session-id"
+
+        def _recreate():
+            session.name = new_name
+
+        session._recreate = mock.Mock(side_effect=_recreate)
+        derived = self._makeDerived(session)
+
+        self.assertEqual(list(derived.read(TABLE_NAME, COLUMNS, keyset)), [])
+
+        session._recreate.assert_called_once_with()
+        self.assertEqual(api.streaming_read.call_count, 2)
+        _, kwargs = api.streaming_read.call_args
+        self.assertEqual(kwargs["request"].session, new_name)
+
+    def test_read_w_multi_use_w_session_not_found(self):
+        from google.api_core.exceptions import NotFound
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        keyset = KeySet(all_=True)
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.streaming_read.side_effect = NotFound("Session not found: testing")
+        session = _Session(database)
+        session._recreate = mock.Mock()
+        derived = self._makeDerived(session)
+        derived._multi_use = True
+
+        with self.assertRaises(NotFound):
+            list(derived.read(TABLE_NAME, COLUMNS, keyset))
+
+        session._recreate.assert_not_called()
+
+    def test_read_w_row_factory(self):
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1.keyset import KeySet
+        from google.cloud.spanner_v1.streamed import dict_row_factory
+
+        struct_type_pb = StructType(
+            fields=[
+                StructType.Field(name="name", type_=Type(code=TypeCode.STRING)),
+                StructType.Field(name="age", type_=Type(code=TypeCode.INT64)),
+            ]
+        )
+        result_set = PartialResultSet(
+            metadata=ResultSetMetadata(row_type=struct_type_pb)
+        )
+        result_set.values.extend([u"phred", u"32"])
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.streaming_read.return_value = _MockIterator(result_set)
+        session = _Session(database)
+        derived = self._makeDerived(session)
+
+        rows = derived.read(
+            TABLE_NAME, COLUMNS, KeySet(all_=True), row_factory=dict_row_factory
+        )
+
+        self.assertEqual(list(rows), [{"name": u"phred", "age": 32}])
+
+    def test_execute_sql_w_row_factory(self):
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1.streamed import tuple_row_factory
+
+        struct_type_pb = StructType(
+            fields=[
+                StructType.Field(name="name", type_=Type(code=TypeCode.STRING)),
+                StructType.Field(name="age", type_=Type(code=TypeCode.INT64)),
+            ]
+        )
+        result_set = PartialResultSet(
+            metadata=ResultSetMetadata(row_type=struct_type_pb)
+        )
+        result_set.values.extend([u"phred", u"32"])
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.execute_streaming_sql.return_value = _MockIterator(result_set)
+        session = _Session(database)
+        derived = self._makeDerived(session)
+
+        rows = derived.execute_sql(SQL_QUERY, row_factory=tuple_row_factory)
+
+        self.assertEqual(list(rows), [(u"phred", 32)])
+
+    def test_execute_sql_w_prefetch_and_buffer_limit(self):
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        struct_type_pb = StructType(
+            fields=[StructType.Field(name="name", type_=Type(code=TypeCode.STRING))]
+        )
+        result_sets = [
+            PartialResultSet(metadata=ResultSetMetadata(row_type=struct_type_pb))
+        ]
+        for name in (u"phred", u"bharney", u"wylma"):
+            result_set = PartialResultSet()
+            result_set.values.append(name)
+            result_sets.append(result_set)
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.execute_streaming_sql.return_value = _MockIterator(*result_sets)
+        session = _Session(database)
+        derived = self._makeDerived(session)
+
+        rows = derived.execute_sql(SQL_QUERY, max_buffer_bytes=10, prefetch=2)
+
+        self.assertEqual(list(rows), [[u"phred"], [u"bharney"], [u"wylma"]])
+
+    def test_execute_sql_w_bytes_decoding(self):
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1.streamed import BYTES_DECODED
+
+        struct_type_pb = StructType(
+            fields=[StructType.Field(name="image", type_=Type(code=TypeCode.BYTES))]
+        )
+        result_set = PartialResultSet(
+            metadata=ResultSetMetadata(row_type=struct_type_pb)
+        )
+        result_set.values.append(u"AAEC")
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.execute_streaming_sql.return_value = _MockIterator(result_set)
+        session = _Session(database)
+        derived = self._makeDerived(session)
+
+        rows = derived.execute_sql(SQL_QUERY, bytes_decoding=BYTES_DECODED)
+
+        self.assertEqual(list(rows), [[b"\x00\x01\x02"]])
+
+    def test_execute_sql_w_invalid_buffer_overflow(self):
+        database = _Database()
+        database.spanner_api = self._make_spanner_api()
+        session = _Session(database)
+        derived = self._makeDerived(session)
+
+        with self.assertRaises(ValueError):
+            derived.execute_sql(SQL_QUERY, buffer_overflow="ignore")
+
+    def test_read_w_negative_prefetch(self):
+        from google.cloud.spanner_v1.keyset import KeySet
+
+        database = _Database()
+        database.spanner_api = self._make_spanner_api()
+        session = _Session(database)
+        derived = self._makeDerived(session)
+
+        with self.assertRaises(ValueError):
+            derived.read(TABLE_NAME, COLUMNS, KeySet(all_=True), prefetch=-1)
+
     def _read_helper(self, multi_use, first=True, count=0, partition=None):
         from google.protobuf.struct_pb2 import Struct
         from google.cloud.spanner_v1 import (
@@ -1291,6 +1606,37 @@ class TestSnapshot(OpenTelemetryBase):
             attributes=BASE_ATTRIBUTES,
         )
 
+    def test_begin_ok_w_return_read_timestamp(self):
+        import datetime
+        from google.cloud._helpers import UTC
+        from google.cloud.spanner_v1 import (
+            Transaction as TransactionPB,
+            TransactionOptions,
+        )
+
+        now = datetime.datetime.utcnow().replace(tzinfo=UTC)
+        transaction_pb = TransactionPB(id=TXN_ID, read_timestamp=now)
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.begin_transaction.return_value = transaction_pb
+        session = _Session(database)
+        snapshot = self._make_one(session, multi_use=True)
+        snapshot._return_read_timestamp = True
+
+        snapshot.begin()
+
+        self.assertEqual(snapshot._transaction_read_timestamp, now)
+        expected_txn_options = TransactionOptions(
+            read_only=TransactionOptions.ReadOnly(
+                strong=True, return_read_timestamp=True
+            )
+        )
+        api.begin_transaction.assert_called_once_with(
+            session=session.name,
+            options=expected_txn_options,
+            metadata=[("google-cloud-resource-prefix", database.name)],
+        )
+
 
 class _Client(object):
     def __init__(self):
@@ -171,11 +171,11 @@ class TestStreamedResultSet(unittest.TestCase):
         streamed = self._make_one(iterator)
         FIELDS = [self._make_scalar_field("age", TypeCode.INT64)]
         streamed._metadata = self._make_result_set_metadata(FIELDS)
-        streamed._pending_chunk = 42
-        chunk = 13
+        streamed._pending_chunk = u"42"
+        chunk = u"13"
 
         merged = streamed._merge_chunk(chunk)
-        self.assertEqual(merged, 4213)
+        self.assertEqual(merged, u"4213")
         self.assertIsNone(streamed._pending_chunk)
 
     def test__merge_chunk_float64_nan_string(self):
@@ -283,12 +283,12 @@ class TestStreamedResultSet(unittest.TestCase):
         streamed = self._make_one(iterator)
         FIELDS = [self._make_array_field("name", element_type_code=TypeCode.INT64)]
         streamed._metadata = self._make_result_set_metadata(FIELDS)
-        streamed._pending_chunk = [0, 1, 2]
-        chunk = [3, 4, 5]
+        streamed._pending_chunk = [u"0", u"1", u"2"]
+        chunk = [u"3", u"4", u"5"]
 
         merged = streamed._merge_chunk(chunk)
 
-        expected = [0, 1, 23, 4, 5]
+        expected = [u"0", u"1", u"23", u"4", u"5"]
         self.assertEqual(merged, expected)
         self.assertIsNone(streamed._pending_chunk)
 
@@ -374,15 +374,15 @@ class TestStreamedResultSet(unittest.TestCase):
         streamed = self._make_one(iterator)
         FIELDS = [StructType.Field(name="loloi", type_=array_type)]
         streamed._metadata = self._make_result_set_metadata(FIELDS)
-        streamed._pending_chunk = [[0, 1], [2]]
-        chunk = [[3], [4, 5]]
+        streamed._pending_chunk = [[u"0", u"1"], [u"2"]]
+        chunk = [[u"3"], [u"4", u"5"]]
 
         merged = streamed._merge_chunk(chunk)
 
         expected = [
-            [0, 1],
-            [23],
-            [4, 5],
+            [u"0", u"1"],
+            [u"23"],
+            [u"4", u"5"],
         ]
 
         self.assertEqual(merged, expected)
@@ -740,6 +740,47 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(streamed.metadata, metadata)
         self.assertEqual(source._transaction_id, TXN_ID)
 
+    def test__read_ahead(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        TXN_ID = b"DEADBEEF"
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS, transaction_id=TXN_ID)
+        BARE = [u"Phred Phlyntstone", 42]
+        result_set = self._make_partial_result_set(BARE, metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        source = mock.Mock(_transaction_id=None, spec=["_transaction_id"])
+        streamed = self._make_one(iterator, source=source)
+
+        streamed._read_ahead()
+        streamed._read_ahead()  # no-op once read ahead
+
+        self.assertEqual(source._transaction_id, TXN_ID)
+        self.assertIsNone(streamed.metadata)
+        self.assertEqual(streamed.one(), BARE)
+
+    def test__read_ahead_w_error(self):
+        class _Failing(object):
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                raise RuntimeError("testing")
+
+            next = __next__
+
+        source = mock.Mock(_transaction_id=None, spec=["_transaction_id"])
+        streamed = self._make_one(_Failing(), source=source)
+
+        streamed._read_ahead()
+
+        self.assertIsNone(source._transaction_id)
+        with self.assertRaises(RuntimeError):
+            list(streamed)
+
     def test_consume_next_first_set_partial_existing_txn_id(self):
         from google.cloud.spanner_v1 import TypeCode
 
@@ -811,6 +852,99 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(streamed._current_row, [BARE[6]])
         self.assertIsNone(streamed._pending_chunk)
 
+    def _make_chunked_bytes_result_sets(self):
+        import base64
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [self._make_scalar_field("image", TypeCode.BYTES)]
+        metadata = self._make_result_set_metadata(FIELDS)
+        blob = bytes(bytearray(range(256))) * 4
+        encoded = base64.b64encode(blob).decode("ascii")
+        third = len(encoded) // 3
+        chunks = [encoded[:third], encoded[third : 2 * third], encoded[2 * third :]]
+        result_sets = [
+            self._make_partial_result_set(
+                [self._make_value(chunks[0])], metadata=metadata, chunked_value=True
+            ),
+            self._make_partial_result_set(
+                [self._make_value(chunks[1])], chunked_value=True
+            ),
+            self._make_partial_result_set([self._make_value(chunks[2])]),
+        ]
+        return blob, encoded, result_sets
+
+    def test___iter___w_chunked_bytes(self):
+        blob, encoded, result_sets = self._make_chunked_bytes_result_sets()
+        iterator = _MockCancellableIterator(*result_sets)
+        streamed = self._make_one(iterator)
+
+        found = list(streamed)
+
+        self.assertEqual(found, [[encoded.encode("ascii")]])
+        self.assertIsInstance(found[0][0], bytes)
+
+    def test___iter___w_chunked_bytes_decoded(self):
+        from google.cloud.spanner_v1.streamed import BYTES_DECODED
+
+        blob, _, result_sets = self._make_chunked_bytes_result_sets()
+        iterator = _MockCancellableIterator(*result_sets)
+        streamed = self._make_one(iterator, bytes_decoding=BYTES_DECODED)
+
+        found = list(streamed)
+
+        self.assertEqual(found, [[blob]])
+        self.assertIsInstance(found[0][0], bytes)
+
+    def test___iter___w_chunked_bytes_as_memoryview(self):
+        from google.cloud.spanner_v1.streamed import BYTES_AS_MEMORYVIEW
+
+        blob, _, result_sets = self._make_chunked_bytes_result_sets()
+        iterator = _MockCancellableIterator(*result_sets)
+        streamed = self._make_one(iterator, bytes_decoding=BYTES_AS_MEMORYVIEW)
+
+        [[found]] = list(streamed)
+
+        self.assertIsInstance(found, memoryview)
+        self.assertEqual(found.tobytes(), blob)
+
+    def test_to_columns_w_chunked_bytes_decoded(self):
+        from google.cloud.spanner_v1.streamed import BYTES_DECODED
+
+        blob, _, result_sets = self._make_chunked_bytes_result_sets()
+        iterator = _MockCancellableIterator(*result_sets)
+        streamed = self._make_one(iterator, bytes_decoding=BYTES_DECODED)
+
+        self.assertEqual(streamed.to_columns(), [[blob]])
+
+    def test___iter___w_timestamp_as_nanoseconds(self):
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1.streamed import TIMESTAMP_AS_NANOSECONDS
+
+        FIELDS = [
+            self._make_scalar_field("created", TypeCode.TIMESTAMP),
+            self._make_array_field("seen", element_type_code=TypeCode.TIMESTAMP),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        VALUES = [
+            self._make_value(u"1970-01-01T00:00:01.5Z"),
+            self._make_value([u"1970-01-01T00:00:00.000000001Z", None]),
+        ]
+        result_set = self._make_partial_result_set(VALUES, metadata=metadata)
+        iterator = _MockCancellableIterator(result_set)
+        streamed = self._make_one(
+            iterator, timestamp_decoding=TIMESTAMP_AS_NANOSECONDS
+        )
+
+        self.assertEqual(list(streamed), [[1500000000, [1, None]]])
+
+    def test_ctor_w_invalid_timestamp_decoding(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_MockCancellableIterator(), timestamp_decoding="seconds")
+
+    def test_ctor_w_invalid_bytes_decoding(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_MockCancellableIterator(), bytes_decoding="hex")
+
     def test_consume_next_last_set(self):
         from google.cloud.spanner_v1 import TypeCode
 
@@ -942,6 +1076,348 @@ class TestStreamedResultSet(unittest.TestCase):
         self.assertEqual(streamed._current_row, [])
         self.assertIsNone(streamed._pending_chunk)
 
+    def test___iter___w_many_rows_per_result_set(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [self._make_scalar_field("age", TypeCode.INT64)]
+        metadata = self._make_result_set_metadata(FIELDS)
+        VALUES = [self._make_value(age) for age in range(1000)]
+        result_set1 = self._make_partial_result_set(VALUES[:600], metadata=metadata)
+        result_set2 = self._make_partial_result_set(VALUES[600:])
+        iterator = _MockCancellableIterator(result_set1, result_set2)
+        streamed = self._make_one(iterator)
+
+        found = list(streamed)
+
+        self.assertEqual(found, [[age] for age in range(1000)])
+        self.assertEqual(streamed._rows, [])
+
+    def test___iter___builds_column_parsers_once(self):
+        from google.cloud.spanner_v1 import streamed as MUT
+
+        iterator = _MockCancellableIterator(*self._make_people_result_sets())
+        streamed = self._make_one(iterator)
+
+        with mock.patch.object(
+            MUT, "_make_value_parser", wraps=MUT._make_value_parser
+        ) as make_parser:
+            found = list(streamed)
+
+        self.assertEqual(len(found), 3)
+        self.assertEqual(make_parser.call_count, 4)
+
+    def _make_row_factory_result_sets(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = [u"Phred Phlyntstone", 42, u"Bharney Rhubble", 39]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set1 = self._make_partial_result_set(VALUES[:3], metadata=metadata)
+        result_set2 = self._make_partial_result_set(VALUES[3:])
+        return result_set1, result_set2
+
+    def test___iter___w_tuple_row_factory(self):
+        from google.cloud.spanner_v1.streamed import tuple_row_factory
+
+        iterator = _MockCancellableIterator(*self._make_row_factory_result_sets())
+        streamed = self._make_one(iterator, row_factory=tuple_row_factory)
+
+        found = list(streamed)
+
+        self.assertEqual(
+            found, [(u"Phred Phlyntstone", 42), (u"Bharney Rhubble", 39)]
+        )
+
+    def test___iter___w_record_row_factory(self):
+        from google.cloud.spanner_v1.streamed import record_row_factory
+
+        iterator = _MockCancellableIterator(*self._make_row_factory_result_sets())
+        streamed = self._make_one(iterator, row_factory=record_row_factory)
+
+        first, second = list(streamed)
+
+        self.assertEqual(first.full_name, u"Phred Phlyntstone")
+        self.assertEqual(first.age, 42)
+        self.assertEqual(tuple(second), (u"Bharney Rhubble", 39))
+        self.assertIs(type(first), type(second))
+
+    def test___iter___w_dict_row_factory(self):
+        from google.cloud.spanner_v1.streamed import dict_row_factory
+
+        iterator = _MockCancellableIterator(*self._make_row_factory_result_sets())
+        streamed = self._make_one(iterator, row_factory=dict_row_factory)
+
+        found = list(streamed)
+
+        self.assertEqual(
+            found,
+            [
+                {"full_name": u"Phred Phlyntstone", "age": 42},
+                {"full_name": u"Bharney Rhubble", "age": 39},
+            ],
+        )
+
+    def test___iter___w_row_factory_called_once(self):
+        factory = mock.Mock(return_value=tuple)
+        iterator = _MockCancellableIterator(*self._make_row_factory_result_sets())
+        streamed = self._make_one(iterator, row_factory=factory)
+
+        list(streamed)
+
+        factory.assert_called_once_with(streamed.fields)
+
+    def _make_people_result_sets(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [
+            self._make_scalar_field("full_name", TypeCode.STRING),
+            self._make_scalar_field("age", TypeCode.INT64),
+            self._make_scalar_field("weight", TypeCode.FLOAT64),
+            self._make_scalar_field("married", TypeCode.BOOL),
+        ]
+        metadata = self._make_result_set_metadata(FIELDS)
+        BARE = [
+            u"Phred ",
+            u"Phlyntstone",
+            42,
+            88.5,
+            True,
+            u"Bharney Rhubble",
+            None,
+            u"NaN",
+            None,
+            u"Wylma Phlyntstone",
+            41,
+            55.0,
+            False,
+        ]
+        VALUES = [self._make_value(bare) for bare in BARE]
+        result_set1 = self._make_partial_result_set(
+            VALUES[:1], metadata=metadata, chunked_value=True
+        )
+        result_set2 = self._make_partial_result_set(VALUES[1:8])
+        result_set3 = self._make_partial_result_set(VALUES[8:])
+        return result_set1, result_set2, result_set3
+
+    def test_iter_column_batches(self):
+        iterator = _MockCancellableIterator(*self._make_people_result_sets())
+        streamed = self._make_one(iterator)
+
+        batches = list(streamed.iter_column_batches())
+
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(batches[0], [[u"Phred Phlyntstone"], [42], [88.5], [True]])
+        names, ages, weights, married = batches[1]
+        self.assertEqual(names, [u"Bharney Rhubble", u"Wylma Phlyntstone"])
+        self.assertEqual(ages, [None, 41])
+        self.assertNotEqual(weights[0], weights[0])  # NaN
+        self.assertEqual(weights[1], 55.0)
+        self.assertEqual(married, [None, False])
+        self.assertEqual(streamed._current_row, [])
+        self.assertIsNone(streamed._pending_chunk)
+
+    def test_iter_column_batches_after_consumption(self):
+        iterator = _MockCancellableIterator(*self._make_people_result_sets())
+        streamed = self._make_one(iterator)
+        next(iter(streamed))
+
+        with self.assertRaises(RuntimeError):
+            list(streamed.iter_column_batches())
+
+    def test_iter_column_batches_w_numpy_missing(self):
+        from google.cloud.spanner_v1 import streamed as MUT
+
+        streamed = self._make_one(_MockCancellableIterator())
+
+        with mock.patch.object(MUT, "numpy", None):
+            with self.assertRaises(ImportError):
+                list(streamed.iter_column_batches(use_numpy=True))
+
+    def test_to_columns(self):
+        iterator = _MockCancellableIterator(*self._make_people_result_sets())
+        streamed = self._make_one(iterator)
+
+        names, ages, weights, married = streamed.to_columns()
+
+        self.assertEqual(
+            names, [u"Phred Phlyntstone", u"Bharney Rhubble", u"Wylma Phlyntstone"]
+        )
+        self.assertEqual(ages, [42, None, 41])
+        self.assertEqual(len(weights), 3)
+        self.assertEqual(married, [True, None, False])
+
+    def test_to_columns_empty(self):
+        streamed = self._make_one(_MockCancellableIterator())
+        self.assertEqual(streamed.to_columns(), [])
+
+    def test_to_columns_wo_rows(self):
+        from google.cloud.spanner_v1 import TypeCode
+
+        FIELDS = [self._make_scalar_field("age", TypeCode.INT64)]
+        metadata = self._make_result_set_metadata(FIELDS)
+        result_set = self._make_partial_result_set([], metadata=metadata)
+        streamed = self._make_one(_MockCancellableIterator(result_set))
+
+        self.assertEqual(streamed.to_columns(), [[]])
+
+    def test_to_columns_wo_fields(self):
+        from google.cloud.spanner_v1 import ResultSetStats
+
+        # E.g. a DML statement run with 'execute_sql' in a transaction.
+        metadata = self._make_result_set_metadata()
+        stats = ResultSetStats(row_count_exact=3)
+        result_set = self._make_partial_result_set([], metadata=metadata, stats=stats)
+        streamed = self._make_one(_MockCancellableIterator(result_set))
+
+        self.assertEqual(streamed.to_columns(), [])
+        self.assertEqual(streamed.stats.row_count_exact, 3)
+
+    def test_to_columns_w_numpy(self):
+        from google.cloud.spanner_v1 import streamed as MUT
+
+        if MUT.numpy is None:  # pragma: NO COVER
+            self.skipTest("numpy is not installed")
+
+        iterator = _MockCancellableIterator(*self._make_people_result_sets())
+        streamed = self._make_one(iterator)
+
+        names, ages, weights, married = streamed.to_columns(use_numpy=True)
+
+        self.assertEqual(
+            names, [u"Phred Phlyntstone", u"Bharney Rhubble", u"Wylma Phlyntstone"]
+        )
+        self.assertEqual(str(ages.dtype), "int64")
+        self.assertEqual(ages.tolist(), [42, None, 41])
+        self.assertEqual(str(weights.dtype), "float64")
+        self.assertEqual(list(weights.mask), [False, False, False])
+        self.assertEqual(married.tolist(), [True, None, False])
+
+    def test_iter_column_batches_w_numpy_wo_nulls(self):
+        from google.cloud.spanner_v1 import streamed as MUT
+
+        if MUT.numpy is None:  # pragma: NO COVER
+            self.skipTest("numpy is not installed")
+
+        iterator = _MockCancellableIterator(*self._make_people_result_sets())
+        streamed = self._make_one(iterator)
+
+        for batch in streamed.iter_column_batches(use_numpy=True):
+            weights = batch[2]
+            self.assertEqual(weights.mask.dtype, MUT.numpy.bool_)
+            self.assertEqual(weights.mask.shape, weights.shape)
+            self.assertFalse(weights.mask.any())
+
+
+class Test_value_pb_to_python(unittest.TestCase):
+    def _callFUT(self, value_pb):
+        from google.cloud.spanner_v1.streamed import _value_pb_to_python
+
+        return _value_pb_to_python(value_pb)
+
+    def test_matches_proto_plus(self):
+        from google.protobuf.struct_pb2 import Struct
+        from google.protobuf.struct_pb2 import Value
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1._helpers import _make_value_pb
+
+        result_set = PartialResultSet()
+        BARE = [
+            u"phred",
+            u"NaN",
+            True,
+            False,
+            3.5,
+            None,
+            [u"1", None, [2.5, [u"x"]]],
+            [],
+        ]
+        result_set.values.extend([_make_value_pb(bare) for bare in BARE])
+        result_set.values.append(
+            Value(struct_value=Struct(fields={"a": _make_value_pb(None)}))
+        )
+
+        found = [self._callFUT(value_pb) for value_pb in result_set._pb.values]
+
+        self.assertEqual(found, list(result_set.values))
+        self.assertEqual(found[:-1], BARE)
+        self.assertEqual(found[-1], {"a": None})
+
+    def test_w_unset(self):
+        from google.protobuf.struct_pb2 import Value
+
+        self.assertIsNone(self._callFUT(Value()))
+
+
+class Test_merge_bytes(unittest.TestCase):
+    def _callFUT(self, lhs, rhs):
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1.streamed import _merge_bytes
+
+        return _merge_bytes(lhs, rhs, Type(code=TypeCode.BYTES))
+
+    def test_w_text(self):
+        merged = self._callFUT(u"AAEC", u"AwQF")
+
+        self.assertIsInstance(merged, bytearray)
+        self.assertEqual(merged, b"AAECAwQF")
+
+    def test_appends_in_place(self):
+        pending = self._callFUT(u"AAEC", u"AwQF")
+
+        merged = self._callFUT(pending, u"Bgc=")
+
+        self.assertIs(merged, pending)
+        self.assertEqual(merged, b"AAECAwQFBgc=")
+
+
+class Test_record_row_factory(unittest.TestCase):
+    def _callFUT(self, *args, **kw):
+        from google.cloud.spanner_v1.streamed import record_row_factory
+
+        return record_row_factory(*args, **kw)
+
+    @staticmethod
+    def _make_fields(*names):
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        return [
+            StructType.Field(name=name, type_=Type(code=TypeCode.STRING))
+            for name in names
+        ]
+
+    def test_class_reused_for_same_names(self):
+        first = self._callFUT(self._make_fields("a", "b"))([1, 2])
+        second = self._callFUT(self._make_fields("a", "b"))([3, 4])
+
+        self.assertIs(type(first), type(second))
+        self.assertEqual(type(first).__slots__, ())
+
+    def test_class_cache_bounded(self):
+        from google.cloud.spanner_v1 import streamed
+
+        streamed._record_class.cache_clear()
+        for index in range(streamed._RECORD_CLASS_CACHE_SIZE + 10):
+            self._callFUT(self._make_fields("column_%d" % index))
+
+        info = streamed._record_class.cache_info()
+        self.assertEqual(info.currsize, streamed._RECORD_CLASS_CACHE_SIZE)
+
+    def test_w_invalid_and_repeated_names(self):
+        row = self._callFUT(self._make_fields("", "a", "a", "class"))([1, 2, 3, 4])
+
+        self.assertEqual(row, (1, 2, 3, 4))
+        self.assertEqual(row.a, 2)
+        self.assertEqual(row._0, 1)
+        self.assertEqual(row._2, 3)
+        self.assertEqual(row._3, 4)
+
 
 class _MockCancellableIterator(object):
 
@@ -995,6 +1471,26 @@ class TestStreamedResultSet_JSON_acceptance_tests(unittest.TestCase):
     def test_basic(self):
         self._match_results("Basic Test")
 
+    def test_basic_columns(self):
+        partial_result_sets, expected = self._load_json_test("Basic Test")
+        iterator = _MockCancellableIterator(*partial_result_sets)
+        partial = self._make_one(iterator)
+        self.assertEqual(partial.to_columns(), [list(col) for col in zip(*expected)])
+
+    def test_struct_array_and_string_chunking_columns(self):
+        name = "Struct Array And String Chunking Test"
+        partial_result_sets, expected = self._load_json_test(name)
+        iterator = _MockCancellableIterator(*partial_result_sets)
+        partial = self._make_one(iterator)
+        self.assertEqual(partial.to_columns(), [list(col) for col in zip(*expected)])
+
+    def test_multiple_row_chunks_non_chunks_interleaved_columns(self):
+        name = "Multiple Row Chunks/Non Chunks Interleaved"
+        partial_result_sets, expected = self._load_json_test(name)
+        iterator = _MockCancellableIterator(*partial_result_sets)
+        partial = self._make_one(iterator)
+        self.assertEqual(partial.to_columns(), [list(col) for col in zip(*expected)])
+
     def test_string_chunking(self):
         self._match_results("String Chunking Test")
 
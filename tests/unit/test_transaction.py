@@ -127,6 +127,20 @@ class TestTransaction(OpenTelemetryBase):
         selector = transaction._make_txn_selector()
         self.assertEqual(selector.id, self.TRANSACTION_ID)
 
+    def test__make_txn_selector_not_begun(self):
+        session = _Session()
+        transaction = self._make_one(session)
+        selector = transaction._make_txn_selector()
+        self.assertIn("read_write", selector.begin)
+        self.assertNotIn("id", selector)
+
+    def test__make_txn_selector_not_begun_already_rolled_back(self):
+        session = _Session()
+        transaction = self._make_one(session)
+        transaction.rolled_back = True
+        with self.assertRaises(ValueError):
+            transaction._make_txn_selector()
+
     def test_begin_already_begun(self):
         session = _Session()
         transaction = self._make_one(session)
@@ -198,11 +212,21 @@ class TestTransaction(OpenTelemetryBase):
     def test_rollback_not_begun(self):
         session = _Session()
         transaction = self._make_one(session)
-        with self.assertRaises(ValueError):
-            transaction.rollback()
+        session._transaction = transaction
 
+        transaction.rollback()
+
+        self.assertTrue(transaction.rolled_back)
+        self.assertIsNone(session._transaction)
         self.assertNoSpans()
 
+    def test_rollback_not_begun_already_rolled_back(self):
+        session = _Session()
+        transaction = self._make_one(session)
+        transaction.rolled_back = True
+        with self.assertRaises(ValueError):
+            transaction.rollback()
+
     def test_rollback_already_committed(self):
         session = _Session()
         transaction = self._make_one(session)
@@ -269,8 +293,43 @@ class TestTransaction(OpenTelemetryBase):
         )
 
     def test_commit_not_begun(self):
+        import datetime
+        from google.cloud.spanner_v1 import CommitResponse
+        from google.cloud.spanner_v1 import TransactionOptions
+        from google.cloud._helpers import UTC
+
+        now = datetime.datetime.utcnow().replace(tzinfo=UTC)
+        database = _Database()
+        api = database.spanner_api = _FauxSpannerAPI(
+            _commit_response=CommitResponse(commit_timestamp=now)
+        )
+        session = _Session(database)
+        transaction = self._make_one(session)
+        transaction.insert(TABLE_NAME, COLUMNS, VALUES)
+
+        self.assertEqual(transaction.commit(), now)
+
+        self.assertIsNone(session._transaction)
+        self.assertFalse(hasattr(api, "_begun"))
+        session_id, mutations, txn_id, metadata = api._committed
+        self.assertEqual(session_id, session.name)
+        self.assertEqual(mutations, transaction._mutations)
+        self.assertEqual(txn_id, "")
+        self.assertEqual(
+            api._single_use_transaction,
+            TransactionOptions(read_write=TransactionOptions.ReadWrite()),
+        )
+        self.assertEqual(metadata, [("google-cloud-resource-prefix", database.name)])
+
+        self.assertSpanAttributes(
+            "CloudSpanner.Commit",
+            attributes=dict(TestTransaction.BASE_ATTRIBUTES, num_mutations=1),
+        )
+
+    def test_commit_not_begun_already_rolled_back(self):
         session = _Session()
         transaction = self._make_one(session)
+        transaction.rolled_back = True
         with self.assertRaises(ValueError):
             transaction.commit()
 
@@ -489,6 +548,86 @@ class TestTransaction(OpenTelemetryBase):
 
         self.assertEqual(transaction._execute_sql_count, 1)
 
+    def test_execute_update_begins_transaction(self):
+        from google.cloud.spanner_v1 import ResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import ResultSetStats
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.execute_sql.return_value = ResultSet(
+            metadata=ResultSetMetadata(
+                transaction=TransactionPB(id=self.TRANSACTION_ID)
+            ),
+            stats=ResultSetStats(row_count_exact=1),
+        )
+        session = _Session(database)
+        transaction = self._make_one(session)
+
+        self.assertEqual(transaction.execute_update(DML_QUERY), 1)
+        self.assertEqual(transaction.execute_update(DML_QUERY), 1)
+
+        first, second = api.execute_sql.call_args_list
+        self.assertIn("read_write", first[1]["request"].transaction.begin)
+        self.assertEqual(second[1]["request"].transaction.id, self.TRANSACTION_ID)
+        self.assertEqual(transaction._transaction_id, self.TRANSACTION_ID)
+        api.begin_transaction.assert_not_called()
+
+    def test_execute_sql_begins_transaction(self):
+        from google.cloud.spanner_v1 import PartialResultSet
+        from google.cloud.spanner_v1 import ResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+
+        metadata_pb = ResultSetMetadata(
+            row_type=StructType(
+                fields=[StructType.Field(name="age", type_=Type(code=TypeCode.INT64))]
+            ),
+            transaction=TransactionPB(id=self.TRANSACTION_ID),
+        )
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        result_set = PartialResultSet(metadata=metadata_pb)
+        result_set.values.append(u"32")
+        api.execute_streaming_sql.return_value = iter([result_set])
+        api.execute_sql.return_value = ResultSet()
+        session = _Session(database)
+        transaction = self._make_one(session)
+
+        results = transaction.execute_sql("SELECT age FROM citizens")
+        self.assertIsNone(transaction._transaction_id)
+
+        transaction.execute_update(DML_QUERY)
+
+        self.assertEqual(transaction._transaction_id, self.TRANSACTION_ID)
+        request = api.execute_streaming_sql.call_args[1]["request"]
+        self.assertIn("read_write", request.transaction.begin)
+        request = api.execute_sql.call_args[1]["request"]
+        self.assertEqual(request.transaction.id, self.TRANSACTION_ID)
+        self.assertEqual(list(results), [[32]])
+
+    def test_execute_sql_begin_failed(self):
+        from google.api_core.exceptions import InvalidArgument
+        from google.cloud.spanner_v1 import ResultSet
+
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.execute_streaming_sql.side_effect = InvalidArgument("testing")
+        api.execute_sql.return_value = ResultSet()
+        session = _Session(database)
+        transaction = self._make_one(session)
+
+        results = transaction.execute_sql("SELECT bogus")
+        transaction.execute_update(DML_QUERY)
+
+        # The failed query did not begin the transaction:  the next one does.
+        request = api.execute_sql.call_args[1]["request"]
+        self.assertIn("read_write", request.transaction.begin)
+        with self.assertRaises(InvalidArgument):
+            list(results)
+
     def test_execute_update_w_query_options(self):
         from google.cloud.spanner_v1 import ExecuteSqlRequest
 
@@ -594,6 +733,34 @@ class TestTransaction(OpenTelemetryBase):
     def test_batch_update_w_errors(self):
         self._batch_update_helper(error_after=2, count=1)
 
+    def test_batch_update_begins_transaction(self):
+        from google.rpc.status_pb2 import Status
+        from google.cloud.spanner_v1 import ExecuteBatchDmlResponse
+        from google.cloud.spanner_v1 import ResultSet
+        from google.cloud.spanner_v1 import ResultSetMetadata
+        from google.cloud.spanner_v1 import Transaction as TransactionPB
+
+        database = _Database()
+        api = database.spanner_api = self._make_spanner_api()
+        api.execute_batch_dml.return_value = ExecuteBatchDmlResponse(
+            status=Status(code=0),
+            result_sets=[
+                ResultSet(
+                    metadata=ResultSetMetadata(
+                        transaction=TransactionPB(id=self.TRANSACTION_ID)
+                    )
+                )
+            ],
+        )
+        session = _Session(database)
+        transaction = self._make_one(session)
+
+        transaction.batch_update([DML_QUERY])
+
+        request = api.execute_batch_dml.call_args[1]["request"]
+        self.assertIn("read_write", request.transaction.begin)
+        self.assertEqual(transaction._transaction_id, self.TRANSACTION_ID)
+
     def test_batch_update_error(self):
         from google.cloud.spanner_v1 import Type
         from google.cloud.spanner_v1 import TypeCode
@@ -733,6 +900,6 @@ class _FauxSpannerAPI(object):
         single_use_transaction=None,
         metadata=None,
     ):
-        assert single_use_transaction is None
         self._committed = (session, mutations, transaction_id, metadata)
+        self._single_use_transaction = single_use_transaction
         return self._commit_response
@@ -0,0 +1,253 @@
+# Copyright 2020 Google LLC All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+import os
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+def _make_field(name, code, element_code=None):
+    from google.cloud.spanner_v1 import StructType
+    from google.cloud.spanner_v1 import Type
+
+    if element_code is None:
+        type_ = Type(code=code)
+    else:
+        type_ = Type(code=code, array_element_type=Type(code=element_code))
+    return StructType.Field(name=name, type_=type_)
+
+
+def _make_fields():
+    from google.cloud.spanner_v1 import TypeCode
+
+    return [
+        _make_field("name", TypeCode.STRING),
+        _make_field("score", TypeCode.FLOAT64),
+        _make_field("photo", TypeCode.BYTES),
+        _make_field("born", TypeCode.DATE),
+        _make_field("seen", TypeCode.TIMESTAMP),
+        _make_field("balance", TypeCode.NUMERIC),
+        _make_field("tags", TypeCode.ARRAY, TypeCode.DATE),
+    ]
+
+
+def _make_columns():
+    from google.api_core.datetime_helpers import DatetimeWithNanoseconds
+
+    seen = DatetimeWithNanoseconds(
+        2020, 1, 2, 3, 4, 5, nanosecond=6, tzinfo=datetime.timezone.utc
+    )
+    return [
+        ["phred", None],
+        [1.5, float("nan")],
+        [b"AAEC", None],
+        [datetime.date(1990, 4, 5), None],
+        [seen, None],
+        [decimal.Decimal("1.25"), None],
+        [[datetime.date(2020, 1, 2), None], None],
+    ]
+
+
+class _WriterTestBase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "out")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _read(self):
+        with open(self.path, newline="", encoding="utf-8") as file_obj:
+            return file_obj.read()
+
+
+class TestCSVWriter(_WriterTestBase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.writers import CSVWriter
+
+        return CSVWriter
+
+    def test_write(self):
+        with self._getTargetClass()(self.path, _make_fields()) as writer:
+            writer.write(_make_columns())
+
+        self.assertEqual(
+            self._read(),
+            "name,score,photo,born,seen,balance,tags\r\n"
+            'phred,1.5,AAEC,1990-04-05,2020-01-02T03:04:05.000000006Z,1.25,'
+            '"[""2020-01-02"", null]"\r\n'
+            ",nan,,,,,\r\n",
+        )
+
+    def test_header_only(self):
+        with self._getTargetClass()(self.path, _make_fields()[:2]):
+            pass
+
+        self.assertEqual(self._read(), "name,score\r\n")
+
+
+class TestNDJSONWriter(_WriterTestBase):
+    def _getTargetClass(self):
+        from google.cloud.spanner_v1.writers import NDJSONWriter
+
+        return NDJSONWriter
+
+    def test_write(self):
+        import json
+
+        with self._getTargetClass()(self.path, _make_fields()) as writer:
+            writer.write(_make_columns())
+            writer.write(
+                [["wylma"], [float("-inf")], [None], [None], [None], [None], [[]]]
+            )
+
+        lines = [json.loads(line) for line in self._read().splitlines()]
+        self.assertEqual(
+            lines,
+            [
+                {
+                    "name": "phred",
+                    "score": 1.5,
+                    "photo": "AAEC",
+                    "born": "1990-04-05",
+                    "seen": "2020-01-02T03:04:05.000000006Z",
+                    "balance": "1.25",
+                    "tags": ["2020-01-02", None],
+                },
+                {
+                    "name": None,
+                    "score": "NaN",
+                    "photo": None,
+                    "born": None,
+                    "seen": None,
+                    "balance": None,
+                    "tags": None,
+                },
+                {
+                    "name": "wylma",
+                    "score": "-Infinity",
+                    "photo": None,
+                    "born": None,
+                    "seen": None,
+                    "balance": None,
+                    "tags": [],
+                },
+            ],
+        )
+
+    def test_struct_values(self):
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+
+        struct_type = Type(
+            code=TypeCode.STRUCT,
+            struct_type=StructType(
+                fields=[
+                    _make_field("day", TypeCode.DATE),
+                    _make_field("count", TypeCode.INT64),
+                ]
+            ),
+        )
+        fields = [StructType.Field(name="visit", type_=struct_type)]
+
+        with self._getTargetClass()(self.path, fields) as writer:
+            writer.write([[[datetime.date(2020, 1, 2), 3], [None, 4]]])
+
+        self.assertEqual(
+            self._read(),
+            '{"visit":["2020-01-02",3]}\n{"visit":[null,4]}\n',
+        )
+
+
+class TestParquetWriter(_WriterTestBase):
+    def test_wo_pyarrow(self):
+        from google.cloud.spanner_v1.writers import ParquetWriter
+
+        with mock.patch("google.cloud.spanner_v1.writers.pyarrow", new=None):
+            with self.assertRaises(ImportError):
+                ParquetWriter(self.path, _make_fields())
+
+    def test_write(self):
+        from google.cloud.spanner_v1.writers import ParquetWriter
+
+        pyarrow = mock.Mock()
+
+        with mock.patch("google.cloud.spanner_v1.writers.pyarrow", new=pyarrow):
+            fields = _make_fields()
+            writer = ParquetWriter(self.path, fields)
+            writer.write(_make_columns())
+            writer.close()
+
+        pyarrow.list_.assert_called_once_with(pyarrow.date32.return_value)
+        pyarrow.timestamp.assert_called_once_with("ns", tz="UTC")
+        pyarrow.decimal128.assert_called_once_with(38, 9)
+        pyarrow.parquet.ParquetWriter.assert_called_once_with(
+            self.path, pyarrow.schema.return_value
+        )
+        self.assertEqual(pyarrow.array.call_count, len(fields))
+        parquet_writer = pyarrow.parquet.ParquetWriter.return_value
+        parquet_writer.write_table.assert_called_once_with(
+            pyarrow.Table.from_arrays.return_value
+        )
+        parquet_writer.close.assert_called_once_with()
+
+    def test_w_struct(self):
+        from google.cloud.spanner_v1 import StructType
+        from google.cloud.spanner_v1 import Type
+        from google.cloud.spanner_v1 import TypeCode
+        from google.cloud.spanner_v1.writers import ParquetWriter
+
+        fields = [
+            StructType.Field(
+                name="visit",
+                type_=Type(code=TypeCode.STRUCT, struct_type=StructType()),
+            )
+        ]
+
+        with mock.patch("google.cloud.spanner_v1.writers.pyarrow"):
+            with self.assertRaises(ValueError):
+                ParquetWriter(self.path, fields)
+
+
+class Test_get_writer_class(unittest.TestCase):
+    def _call_fut(self, format_):
+        from google.cloud.spanner_v1.writers import get_writer_class
+
+        return get_writer_class(format_)
+
+    def test_known_formats(self):
+        from google.cloud.spanner_v1 import writers
+
+        self.assertIs(self._call_fut(writers.FORMAT_CSV), writers.CSVWriter)
+        self.assertIs(self._call_fut(writers.FORMAT_NDJSON), writers.NDJSONWriter)
+
+        with mock.patch("google.cloud.spanner_v1.writers.pyarrow"):
+            self.assertIs(
+                self._call_fut(writers.FORMAT_PARQUET), writers.ParquetWriter
+            )
+
+    def test_parquet_wo_pyarrow(self):
+        with mock.patch("google.cloud.spanner_v1.writers.pyarrow", new=None):
+            with self.assertRaises(ImportError):
+                self._call_fut("parquet")
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            self._call_fut("xml")